@@ -8,6 +8,8 @@ import async_timeout
 
 import homeassistant.util.dt as dt_util
 from homeassistant.const import MATCH_ALL, STATE_ON
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
 
 from .const import API_CHANGE, Cause
 from .entities import ENTITY_ADAPTERS
@@ -16,17 +18,82 @@ from .messages import AlexaResponse
 _LOGGER = logging.getLogger(__name__)
 DEFAULT_TIMEOUT = 10
 
+# Seconds to collect state changes before sending change reports
+REPORT_STATE_WINDOW = 1
+
+# Minimum seconds between two change reports for the same entity
+ENTITY_REPORT_INTERVAL = 3
+
+
+def _reported_values(properties):
+    """Return the values of serialized properties, without sample times."""
+    return [
+        (prop["namespace"], prop["name"], prop.get("instance"), prop["value"])
+        for prop in properties
+    ]
+
 
 async def async_enable_proactive_mode(hass, smart_home_config):
     """Enable the proactive mode.
 
     Proactive mode makes this component report state changes to Alexa.
+    Changes are collected for REPORT_STATE_WINDOW seconds and the latest one
+    per entity is sent, skipping entities whose reported properties did not
+    change. An entity is reported at most once every ENTITY_REPORT_INTERVAL
+    seconds. Doorbell presses are sent right away.
     """
     # Validate we can get access token.
     await smart_home_config.async_get_access_token()
 
+    # entity_id -> property values last sent to Alexa
+    reported = {}
+    # entity_id -> time of the last report
+    reported_at = {}
+    # entity_id -> (alexa entity, properties) waiting to be sent
+    pending = {}
+    unsub_flush = None
+
+    @callback
+    def async_schedule_flush(delay):
+        """Schedule sending the pending change reports."""
+        nonlocal unsub_flush
+        if unsub_flush is None:
+            unsub_flush = async_call_later(hass, delay, async_flush)
+
+    async def async_flush(_now):
+        """Send the pending change reports that are not rate limited."""
+        nonlocal unsub_flush
+        unsub_flush = None
+
+        now = dt_util.utcnow().timestamp()
+        reports = []
+        next_due = None
+
+        for entity_id in list(pending):
+            due = reported_at.get(entity_id, 0) + ENTITY_REPORT_INTERVAL
+            if due > now:
+                next_due = due if next_due is None else min(next_due, due)
+                continue
+            alexa_entity, properties = pending.pop(entity_id)
+            reported[entity_id] = _reported_values(properties)
+            reported_at[entity_id] = now
+            reports.append(
+                async_send_changereport_message(
+                    hass, smart_home_config, alexa_entity, properties=properties
+                )
+            )
+
+        if next_due is not None:
+            async_schedule_flush(max(next_due - now, REPORT_STATE_WINDOW))
+
+        if reports:
+            await asyncio.gather(*reports)
+
     async def async_entity_state_listener(changed_entity, old_state, new_state):
         if not new_state:
+            pending.pop(changed_entity, None)
+            reported.pop(changed_entity, None)
+            reported_at.pop(changed_entity, None)
             return
 
         if new_state.domain not in ENTITY_ADAPTERS:
@@ -42,9 +109,12 @@ async def async_enable_proactive_mode(hass, smart_home_config):
 
         for interface in alexa_changed_entity.interfaces():
             if interface.properties_proactively_reported():
-                await async_send_changereport_message(
-                    hass, smart_home_config, alexa_changed_entity
-                )
+                properties = list(alexa_changed_entity.serialize_properties())
+                if _reported_values(properties) == reported.get(changed_entity):
+                    pending.pop(changed_entity, None)
+                    return
+                pending[changed_entity] = (alexa_changed_entity, properties)
+                async_schedule_flush(REPORT_STATE_WINDOW)
                 return
             if (
                 interface.name() == "Alexa.DoorbellEventSource"
@@ -55,16 +125,27 @@ async def async_enable_proactive_mode(hass, smart_home_config):
                 )
                 return
 
-    return hass.helpers.event.async_track_state_change(
+    unsub_track = hass.helpers.event.async_track_state_change(
         MATCH_ALL, async_entity_state_listener
     )
 
+    @callback
+    def unsub():
+        """Stop reporting state changes."""
+        unsub_track()
+        if unsub_flush is not None:
+            unsub_flush()
+
+    return unsub
+
 
 async def async_send_changereport_message(
-    hass, config, alexa_entity, *, invalidate_access_token=True
+    hass, config, alexa_entity, *, invalidate_access_token=True, properties=None
 ):
     """Send a ChangeReport message for an Alexa entity.
 
+    Pass the already serialized properties to avoid serializing them again.
+
     https://developer.amazon.com/docs/smarthome/state-reporting-for-a-smart-home-skill.html#report-state-with-changereport-events
     """
     token = await config.async_get_access_token()
@@ -76,7 +157,8 @@ async def async_send_changereport_message(
     # this sends all the properties of the Alexa Entity, whether they have
     # changed or not. this should be improved, and properties that have not
     # changed should be moved to the 'context' object
-    properties = list(alexa_entity.serialize_properties())
+    if properties is None:
+        properties = list(alexa_entity.serialize_properties())
 
     payload = {
         API_CHANGE: {"cause": {"type": Cause.APP_INTERACTION}, "properties": properties}
@@ -117,7 +199,11 @@ async def async_send_changereport_message(
     ):
         config.async_invalidate_access_token()
         return await async_send_changereport_message(
-            hass, config, alexa_entity, invalidate_access_token=False
+            hass,
+            config,
+            alexa_entity,
+            invalidate_access_token=False,
+            properties=properties,
         )
 
     _LOGGER.error(
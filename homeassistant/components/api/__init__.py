@@ -1,9 +1,11 @@
 """Rest API for Home Assistant."""
 import asyncio
+import hashlib
 import json
 import logging
+import uuid
 
-from aiohttp import web
+from aiohttp import hdrs, web
 from aiohttp.web_exceptions import HTTPBadRequest
 import async_timeout
 import voluptuous as vol
@@ -11,12 +13,12 @@ import voluptuous as vol
 from homeassistant.bootstrap import DATA_LOGGING
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.const import (
+    CONTENT_TYPE_JSON,
     EVENT_HOMEASSISTANT_STOP,
-    EVENT_TIME_CHANGED,
+    EVENT_STATE_CHANGED,
     HTTP_BAD_REQUEST,
     HTTP_CREATED,
     HTTP_NOT_FOUND,
-    MATCH_ALL,
     URL_API,
     URL_API_COMPONENTS,
     URL_API_CONFIG,
@@ -26,7 +28,9 @@ from homeassistant.const import (
     URL_API_SERVICES,
     URL_API_STATES,
     URL_API_STATES_ENTITY,
+    URL_API_STATES_SNAPSHOT,
     URL_API_STREAM,
+    URL_API_STREAM_STATS,
     URL_API_TEMPLATE,
     __version__,
 )
@@ -34,9 +38,16 @@ import homeassistant.core as ha
 from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.exceptions import TemplateError, Unauthorized, ServiceNotFound
 from homeassistant.helpers import template
+from homeassistant.helpers.event_fanout import (
+    POLICY_DISCONNECT,
+    POLICY_DROP_OLDEST,
+    EventBuffer,
+    async_get_fanout,
+)
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.helpers.state import AsyncTrackStates
 from homeassistant.helpers.json import JSONEncoder
+import homeassistant.util.dt as dt_util
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,15 +60,22 @@ DOMAIN = "api"
 STREAM_PING_PAYLOAD = "ping"
 STREAM_PING_INTERVAL = 50  # seconds
 
+# Number of states encoded at once by the states snapshot view
+SNAPSHOT_CHUNK_SIZE = 250
+# Removals to remember for deltas, older versions get a full snapshot
+SNAPSHOT_MAX_REMOVED = 1000
+
 
 def setup(hass, config):
     """Register the API with the HTTP interface."""
     hass.http.register_view(APIStatusView)
     hass.http.register_view(APIEventStream)
+    hass.http.register_view(APIEventStreamStatsView)
     hass.http.register_view(APIConfigView)
     hass.http.register_view(APIDiscoveryView)
     hass.http.register_view(APIStatesView)
     hass.http.register_view(APIEntityStateView)
+    hass.http.register_view(APIStatesSnapshotView(StateVersionTracker(hass)))
     hass.http.register_view(APIEventListenersView)
     hass.http.register_view(APIEventView)
     hass.http.register_view(APIServicesView)
@@ -90,70 +108,98 @@ class APIEventStream(HomeAssistantView):
     name = "api:stream"
 
     async def get(self, request):
-        """Provide a streaming interface for the event bus."""
+        """Provide a streaming interface for the event bus.
+
+        Query parameters:
+          restrict: comma separated event types to forward
+          entity_id: comma separated entity ids the events must refer to
+          overflow: drop_oldest (default) or disconnect when the client lags
+        """
         if not request["hass_user"].is_admin:
             raise Unauthorized()
         hass = request.app["hass"]
-        stop_obj = object()
-        to_write = asyncio.Queue()
 
         restrict = request.query.get("restrict")
         if restrict:
             restrict = restrict.split(",") + [EVENT_HOMEASSISTANT_STOP]
+        entity_ids = request.query.get("entity_id")
+        if entity_ids:
+            entity_ids = entity_ids.split(",")
+        policy = request.query.get("overflow", POLICY_DROP_OLDEST)
+        if policy not in (POLICY_DROP_OLDEST, POLICY_DISCONNECT):
+            return self.json_message("Invalid overflow policy.", HTTP_BAD_REQUEST)
 
-        async def forward_events(event):
-            """Forward events to the open request."""
-            if event.event_type == EVENT_TIME_CHANGED:
-                return
-
-            if restrict and event.event_type not in restrict:
-                return
-
-            _LOGGER.debug("STREAM %s FORWARDING %s", id(stop_obj), event)
+        to_write = EventBuffer(policy=policy)
 
+        @ha.callback
+        def forward_events(event, encoded):
+            """Forward events to the open request."""
             if event.event_type == EVENT_HOMEASSISTANT_STOP:
-                data = stop_obj
-            else:
-                data = json.dumps(event, cls=JSONEncoder)
+                to_write.async_close()
+                return
 
-            await to_write.put(data)
+            _LOGGER.debug("STREAM %s FORWARDING %s", id(to_write), event)
+            to_write.async_put(event, encoded)
 
         response = web.StreamResponse()
         response.content_type = "text/event-stream"
         await response.prepare(request)
 
-        unsub_stream = hass.bus.async_listen(MATCH_ALL, forward_events)
+        fanout = async_get_fanout(hass)
+        unsub_stream = fanout.async_subscribe(
+            forward_events,
+            event_types=restrict or None,
+            event_filter=(
+                None
+                if not entity_ids
+                else lambda event: event.event_type == EVENT_HOMEASSISTANT_STOP
+                or event.data.get("entity_id") in entity_ids
+            ),
+        )
+        fanout.async_track_buffer(to_write)
 
         try:
-            _LOGGER.debug("STREAM %s ATTACHED", id(stop_obj))
+            _LOGGER.debug("STREAM %s ATTACHED", id(to_write))
 
             # Fire off one message so browsers fire open event right away
-            await to_write.put(STREAM_PING_PAYLOAD)
+            payload = STREAM_PING_PAYLOAD
+
+            while payload is not None:
+                msg = f"data: {payload}\n\n"
+                _LOGGER.debug("STREAM %s WRITING %s", id(to_write), msg.strip())
+                await response.write(msg.encode("UTF-8"))
 
-            while True:
                 try:
                     with async_timeout.timeout(STREAM_PING_INTERVAL):
-                        payload = await to_write.get()
-
-                    if payload is stop_obj:
-                        break
-
-                    msg = f"data: {payload}\n\n"
-                    _LOGGER.debug("STREAM %s WRITING %s", id(stop_obj), msg.strip())
-                    await response.write(msg.encode("UTF-8"))
+                        payload = await to_write.async_get()
                 except asyncio.TimeoutError:
-                    await to_write.put(STREAM_PING_PAYLOAD)
+                    payload = STREAM_PING_PAYLOAD
 
         except asyncio.CancelledError:
-            _LOGGER.debug("STREAM %s ABORT", id(stop_obj))
+            _LOGGER.debug("STREAM %s ABORT", id(to_write))
 
         finally:
-            _LOGGER.debug("STREAM %s RESPONSE CLOSED", id(stop_obj))
+            _LOGGER.debug("STREAM %s RESPONSE CLOSED", id(to_write))
             unsub_stream()
+            fanout.async_untrack_buffer(to_write)
 
         return response
 
 
+class APIEventStreamStatsView(HomeAssistantView):
+    """View to report the lag of EventStream clients."""
+
+    url = URL_API_STREAM_STATS
+    name = "api:stream:stats"
+
+    @ha.callback
+    def get(self, request):
+        """Return the counters of the event fanout."""
+        if not request["hass_user"].is_admin:
+            raise Unauthorized()
+        return self.json(async_get_fanout(request.app["hass"]).async_stats())
+
+
 class APIConfigView(HomeAssistantView):
     """View to handle Configuration requests."""
 
@@ -207,6 +253,203 @@ class APIStatesView(HomeAssistantView):
         return self.json(states)
 
 
+class StateVersionTracker:
+    """Track a version number of the state machine and of each entity."""
+
+    def __init__(self, hass):
+        """Initialize the tracker and start listening for state changes."""
+        # The instance makes versions of previous runs invalid
+        self.instance = uuid.uuid4().hex[:8]
+        self.version = 0
+        # entity_id -> version of the last change
+        self.changed = {}
+        # entity_id -> (version, time) of the removal, oldest first
+        self.removed = {}
+        # Deltas are only exact since this version and time
+        self.oldest_version = 0
+        self.oldest_time = None
+        hass.bus.listen(EVENT_STATE_CHANGED, self._async_state_changed)
+
+    @property
+    def token(self):
+        """Return the current version token."""
+        return f"{self.instance}-{self.version}"
+
+    def parse_token(self, token):
+        """Return the version of a token, or None if it is not ours."""
+        instance, _, version = token.partition("-")
+        if instance != self.instance or not version.isdigit():
+            return None
+        if int(version) < self.oldest_version:
+            return None
+        return int(version)
+
+    def _prune(self):
+        """Forget the oldest half of the removals and older versions."""
+        removed = list(self.removed.items())
+        keep = len(removed) // 2
+        self.oldest_version, self.oldest_time = removed[-keep - 1][1]
+        self.removed = dict(removed[-keep:])
+        # Changes at or before the oldest version never make it into a delta
+        self.changed = {
+            entity_id: version
+            for entity_id, version in self.changed.items()
+            if version > self.oldest_version
+        }
+
+    @ha.callback
+    def _async_state_changed(self, event):
+        """Record the version of a state change."""
+        self.version += 1
+        entity_id = event.data["entity_id"]
+        if event.data.get("new_state") is None:
+            self.changed.pop(entity_id, None)
+            self.removed.pop(entity_id, None)
+            self.removed[entity_id] = (self.version, event.time_fired)
+            if len(self.removed) > SNAPSHOT_MAX_REMOVED:
+                self._prune()
+        else:
+            self.changed[entity_id] = self.version
+            self.removed.pop(entity_id, None)
+
+
+def _encode_states(states, attributes):
+    """Encode states as comma separated JSON objects.
+
+    Runs in the executor.
+    """
+    if attributes is None:
+        items = states
+    else:
+        items = []
+        for state in states:
+            item = state.as_dict()
+            item["attributes"] = {
+                key: value
+                for key, value in state.attributes.items()
+                if key in attributes
+            }
+            items.append(item)
+    return json.dumps(items, cls=JSONEncoder)[1:-1].encode("UTF-8")
+
+
+class APIStatesSnapshotView(HomeAssistantView):
+    """View to stream a snapshot of the states.
+
+    Query parameters:
+      entity_id: comma separated entity ids to include
+      domain: comma separated domains to include
+      attributes: comma separated attributes to include, empty for none
+      since_version: only return changes since this version token
+      since: only return changes since this ISO 8601 time
+    """
+
+    url = URL_API_STATES_SNAPSHOT
+    name = "api:states-snapshot"
+
+    def __init__(self, tracker):
+        """Initialize the view."""
+        self.tracker = tracker
+
+    async def get(self, request):
+        """Stream the current states."""
+        hass = request.app["hass"]
+        user = request["hass_user"]
+        query = request.query
+        tracker = self.tracker
+
+        entity_ids = set(filter(None, query.get("entity_id", "").split(",")))
+        domains = set(filter(None, query.get("domain", "").split(",")))
+        attributes = None
+        if "attributes" in query:
+            attributes = set(filter(None, query["attributes"].split(",")))
+
+        since_version = None
+        if "since_version" in query:
+            since_version = tracker.parse_token(query["since_version"])
+        since = None
+        if "since" in query:
+            since = dt_util.parse_datetime(query["since"])
+            if since is None:
+                return self.json_message("Invalid since time.", HTTP_BAD_REQUEST)
+            # Naive times are in the configured time zone
+            since = dt_util.as_utc(since)
+            if tracker.oldest_time is not None and since < tracker.oldest_time:
+                since = None
+
+        # The body depends on the user and the filters as well as the states
+        token = tracker.token
+        variant = repr(
+            (
+                user.id,
+                sorted(entity_ids),
+                sorted(domains),
+                None if attributes is None else sorted(attributes),
+                since_version,
+                since and since.isoformat(),
+            )
+        )
+        digest = hashlib.sha1(variant.encode("UTF-8")).hexdigest()[:12]
+        etag = f'"{token}-{digest}"'
+        if request.headers.get(hdrs.IF_NONE_MATCH) == etag:
+            return web.Response(status=304, headers={hdrs.ETAG: etag})
+
+        def include(entity_id):
+            """Return if the entity_id matches the filters."""
+            if not entity_ids and not domains:
+                return True
+            return (
+                entity_id in entity_ids or ha.split_entity_id(entity_id)[0] in domains
+            )
+
+        entity_perm = user.permissions.check_entity
+        states = [
+            state
+            for state in hass.states.async_all()
+            if include(state.entity_id)
+            and (
+                since_version is None
+                or tracker.changed.get(state.entity_id, 0) > since_version
+            )
+            and (since is None or state.last_updated > since)
+            and entity_perm(state.entity_id, POLICY_READ)
+        ]
+        removed = []
+        if since_version is not None or since is not None:
+            removed = [
+                entity_id
+                for entity_id, (version, time_fired) in tracker.removed.items()
+                if include(entity_id)
+                and (since_version is None or version > since_version)
+                and (since is None or time_fired > since)
+                and entity_perm(entity_id, POLICY_READ)
+            ]
+
+        response = web.StreamResponse(headers={hdrs.ETAG: etag})
+        response.content_type = CONTENT_TYPE_JSON
+        response.enable_compression()
+        await response.prepare(request)
+
+        await response.write(
+            '{{"version": {}, "delta": {}, "states": ['.format(
+                json.dumps(token),
+                json.dumps(since_version is not None or since is not None),
+            ).encode("UTF-8")
+        )
+        for start in range(0, len(states), SNAPSHOT_CHUNK_SIZE):
+            chunk = await hass.async_add_executor_job(
+                _encode_states, states[start : start + SNAPSHOT_CHUNK_SIZE], attributes
+            )
+            if start:
+                await response.write(b",")
+            await response.write(chunk)
+        await response.write(
+            '], "removed": {}}}'.format(json.dumps(removed)).encode("UTF-8")
+        )
+
+        return response
+
+
 class APIEntityStateView(HomeAssistantView):
     """View to handle EntityState requests."""
 
@@ -3,6 +3,7 @@ import asyncio
 from functools import partial
 import importlib
 import logging
+from time import monotonic
 from typing import Any, Awaitable, Callable
 
 import voluptuous as vol
@@ -20,7 +21,8 @@ from homeassistant.const import (
     SERVICE_TURN_ON,
     STATE_ON,
 )
-from homeassistant.core import Context, CoreState, HomeAssistant
+from homeassistant.components import websocket_api
+from homeassistant.core import Context, CoreState, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import condition, extract_domain_configs, script
 import homeassistant.helpers.config_validation as cv
@@ -31,6 +33,7 @@ from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.typing import TemplateVarsType
 from homeassistant.loader import bind_hass
 from homeassistant.util.dt import parse_datetime, utcnow
+from homeassistant.util.metrics import Timing
 
 
 # mypy: allow-untyped-calls, allow-untyped-defs
@@ -125,7 +128,7 @@ def is_on(hass, entity_id):
 
 async def async_setup(hass, config):
     """Set up the automation."""
-    component = EntityComponent(
+    component = hass.data[DOMAIN] = EntityComponent(
         _LOGGER, DOMAIN, hass, group_name=GROUP_NAME_ALL_AUTOMATIONS
     )
 
@@ -192,9 +195,20 @@ async def async_setup(hass, config):
             DOMAIN, service, turn_onoff_service_handler, schema=ENTITY_SERVICE_SCHEMA
         )
 
+    hass.components.websocket_api.async_register_command(websocket_metrics)
+
     return True
 
 
+@callback
+@websocket_api.websocket_command({vol.Required("type"): "automation/metrics"})
+def websocket_metrics(hass, connection, msg):
+    """Return the execution metrics of all automations."""
+    connection.send_result(
+        msg["id"], [entity.async_metrics() for entity in hass.data[DOMAIN].entities],
+    )
+
+
 class AutomationEntity(ToggleEntity, RestoreEntity):
     """Entity to show status of entity."""
 
@@ -207,6 +221,7 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         async_action,
         hidden,
         initial_state,
+        action_script=None,
     ):
         """Initialize an automation entity."""
         self._id = automation_id
@@ -215,10 +230,14 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         self._async_detach_triggers = None
         self._cond_func = cond_func
         self._async_action = async_action
+        self._action_script = action_script
         self._last_triggered = None
         self._hidden = hidden
         self._initial_state = initial_state
         self._is_enabled = False
+        self.triggers = 0
+        self.condition_timing = Timing()
+        self._action_timing = Timing()
 
     @property
     def name(self):
@@ -295,8 +314,13 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
 
         This method is a coroutine.
         """
-        if not skip_condition and not self._cond_func(variables):
-            return
+        self.triggers += 1
+        if not skip_condition:
+            started = monotonic()
+            passed = self._cond_func(variables)
+            self.condition_timing.add(monotonic() - started)
+            if not passed:
+                return
 
         # Create a new context referring to the old context.
         parent_id = None if context is None else context.id
@@ -308,10 +332,45 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
             {ATTR_NAME: self._name, ATTR_ENTITY_ID: self.entity_id},
             context=trigger_context,
         )
+        started = monotonic()
         await self._async_action(self.entity_id, variables, trigger_context)
+        self._action_timing.add(monotonic() - started)
         self._last_triggered = utcnow()
         await self.async_update_ha_state()
 
+    @property
+    def action_timing(self):
+        """Return the timing of the action runs.
+
+        Runs of an action script are timed until they finish, including the
+        delays and waits that suspended them.
+        """
+        if self._action_script is None:
+            return self._action_timing
+        return self._action_script.run_timing
+
+    @property
+    def action_errors(self):
+        """Return how many runs of the action failed."""
+        if self._action_script is None:
+            return 0
+        return self._action_script.run_timing.errors
+
+    @callback
+    def async_metrics(self):
+        """Return trigger counts and the timing of conditions and actions."""
+        metrics = {
+            "entity_id": self.entity_id,
+            "name": self._name,
+            "triggers": self.triggers,
+            "condition": self.condition_timing.as_dict(),
+            "action": self.action_timing.as_dict(),
+            "action_errors": self.action_errors,
+        }
+        if self._action_script is not None:
+            metrics["steps"] = self._action_script.async_metrics()["steps"]
+        return metrics
+
     async def async_will_remove_from_hass(self):
         """Remove listeners when removing automation from HASS."""
         await super().async_will_remove_from_hass()
@@ -389,7 +448,8 @@ async def _async_process_config(hass, config, component):
             hidden = config_block[CONF_HIDE_ENTITY]
             initial_state = config_block.get(CONF_INITIAL_STATE)
 
-            action = _async_get_action(hass, config_block.get(CONF_ACTION, {}), name)
+            action_script = script.Script(hass, config_block.get(CONF_ACTION, {}), name)
+            action = _async_get_action(action_script, name)
 
             if CONF_CONDITION in config_block:
                 cond_func = await _async_process_if(hass, config, config_block)
@@ -417,6 +477,7 @@ async def _async_process_config(hass, config, component):
                 action,
                 hidden,
                 initial_state,
+                action_script,
             )
 
             entities.append(entity)
@@ -425,9 +486,8 @@ async def _async_process_config(hass, config, component):
         await component.async_add_entities(entities)
 
 
-def _async_get_action(hass, config, name):
-    """Return an action based on a configuration."""
-    script_obj = script.Script(hass, config, name)
+def _async_get_action(script_obj, name):
+    """Return an action running a script."""
 
     async def action(entity_id, variables, context):
         """Execute an action."""
@@ -447,17 +507,20 @@ async def _async_process_if(hass, config, p_config):
     """Process if checks."""
     if_configs = p_config.get(CONF_CONDITION)
 
-    checks = []
-    for if_config in if_configs:
-        try:
-            checks.append(await condition.async_from_config(hass, if_config, False))
-        except HomeAssistantError as ex:
-            _LOGGER.warning("Invalid condition: %s", ex)
-            return None
+    try:
+        check = await condition.async_and_from_config(
+            hass, {CONF_CONDITION: "and", "conditions": if_configs}, False
+        )
+    except HomeAssistantError as ex:
+        _LOGGER.warning("Invalid condition: %s", ex)
+        return None
 
     def if_action(variables=None):
         """AND all conditions."""
-        return all(check(hass, variables) for check in checks)
+        if check(hass, variables):
+            return True
+        _LOGGER.debug("Condition not met: %s", check.failed)
+        return False
 
     return if_action
 
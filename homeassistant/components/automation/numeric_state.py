@@ -13,9 +13,11 @@ from homeassistant.const import (
     CONF_ABOVE,
     CONF_FOR,
 )
-from homeassistant.helpers.event import async_track_state_change, async_track_same_state
+from homeassistant.helpers.event import async_track_same_state
 from homeassistant.helpers import condition, config_validation as cv, template
 
+from .state_dispatch import async_track_trigger
+
 
 # mypy: allow-incomplete-defs, allow-untyped-calls, allow-untyped-defs
 # mypy: no-check-untyped-defs
@@ -77,7 +79,7 @@ async def async_attach_trigger(
         )
 
     @callback
-    def state_automation_listener(entity, from_s, to_s):
+    def state_automation_listener(entity, from_s, to_s, matching):
         """Listen for state changes and calls action."""
 
         @callback
@@ -100,8 +102,6 @@ async def async_attach_trigger(
                 )
             )
 
-        matching = check_numeric_state(entity, from_s, to_s)
-
         if not matching:
             entities_triggered.discard(entity)
         elif entity not in entities_triggered:
@@ -151,7 +151,20 @@ async def async_attach_trigger(
             else:
                 call_action()
 
-    unsub = async_track_state_change(hass, entity_id, state_automation_listener)
+    # Triggers with the same thresholds share the check of each state change
+    unsub = async_track_trigger(
+        hass,
+        entity_id,
+        (
+            "numeric_state",
+            below,
+            above,
+            value_template.template if value_template is not None else None,
+        ),
+        check_numeric_state,
+        state_automation_listener,
+        notify_all=True,
+    )
 
     @callback
     def async_remove():
@@ -0,0 +1,103 @@
+"""Sensors with the execution metrics of automations."""
+from datetime import timedelta
+import logging
+
+import voluptuous as vol
+
+from homeassistant.components.sensor import PLATFORM_SCHEMA
+from homeassistant.const import CONF_ENTITIES
+from homeassistant.core import split_entity_id
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.entity import Entity
+
+from . import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+ATTR_ACTION_MAX = "action_max_ms"
+ATTR_ACTION_P90 = "action_p90_ms"
+ATTR_CONDITION_MEAN = "condition_mean_ms"
+ATTR_ERRORS = "errors"
+ATTR_RUNS = "runs"
+ATTR_TRIGGERS = "triggers"
+
+ICON = "mdi:timer"
+UNIT = "ms"
+
+SCAN_INTERVAL = timedelta(seconds=60)
+
+PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend({vol.Required(CONF_ENTITIES): cv.entity_ids})
+
+
+async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
+    """Set up the automation metrics sensors."""
+    async_add_entities(
+        [AutomationMetricsSensor(entity_id) for entity_id in config[CONF_ENTITIES]],
+        True,
+    )
+
+
+def _milliseconds(seconds):
+    """Convert seconds to rounded milliseconds."""
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+class AutomationMetricsSensor(Entity):
+    """Mean time the actions of an automation took in the recent window."""
+
+    def __init__(self, automation_id):
+        """Initialize the sensor."""
+        self._automation_id = automation_id
+        self._name = f"{split_entity_id(automation_id)[1]} action time"
+        self._state = None
+        self._attributes = {}
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return self._name
+
+    @property
+    def icon(self):
+        """Icon to display in the front end."""
+        return ICON
+
+    @property
+    def unit_of_measurement(self):
+        """Return the unit of measurement the value is expressed in."""
+        return UNIT
+
+    @property
+    def state(self):
+        """Return the state of the sensor."""
+        return self._state
+
+    @property
+    def device_state_attributes(self):
+        """Return the trigger counts and other timings."""
+        return self._attributes
+
+    async def async_update(self):
+        """Read the metrics of the automation."""
+        component = self.hass.data.get(DOMAIN)
+        automation = component and component.get_entity(self._automation_id)
+        if automation is None:
+            _LOGGER.debug("Automation %s not found", self._automation_id)
+            self._state = None
+            self._attributes = {}
+            return
+
+        action = automation.action_timing.as_dict()
+        condition = automation.condition_timing.as_dict()
+        recent = action["recent"]
+        self._state = (
+            _milliseconds(recent["sum"] / recent["count"]) if recent["count"] else None
+        )
+        self._attributes = {
+            ATTR_TRIGGERS: automation.triggers,
+            ATTR_RUNS: action["count"],
+            ATTR_ERRORS: automation.action_errors,
+            ATTR_ACTION_P90: _milliseconds(recent["p90"]),
+            ATTR_ACTION_MAX: _milliseconds(action["max"]),
+            ATTR_CONDITION_MEAN: _milliseconds(condition["mean"]),
+        }
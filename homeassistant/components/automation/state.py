@@ -9,7 +9,9 @@ from homeassistant import exceptions
 from homeassistant.core import HomeAssistant, CALLBACK_TYPE, callback
 from homeassistant.const import MATCH_ALL, CONF_PLATFORM, CONF_FOR
 from homeassistant.helpers import config_validation as cv, template
-from homeassistant.helpers.event import async_track_state_change, async_track_same_state
+from homeassistant.helpers.event import async_track_same_state
+
+from .state_dispatch import async_track_trigger
 
 
 # mypy: allow-incomplete-defs, allow-untyped-calls, allow-untyped-defs
@@ -59,7 +61,18 @@ async def async_attach_trigger(
     period: Dict[str, timedelta] = {}
 
     @callback
-    def state_automation_listener(entity, from_s, to_s):
+    def state_matches(entity, from_s, to_s):
+        """Return if a state change matches the from and to states."""
+        if from_state != MATCH_ALL and (from_s is None or from_s.state != from_state):
+            return False
+        if to_state != MATCH_ALL and (to_s is None or to_s.state != to_state):
+            return False
+
+        # Ignore changes to state attributes if from/to is in use
+        return match_all or from_s is None or to_s is None or from_s.state != to_s.state
+
+    @callback
+    def state_automation_listener(entity, from_s, to_s, matched):
         """Listen for state changes and calls action."""
 
         @callback
@@ -80,15 +93,6 @@ async def async_attach_trigger(
                 )
             )
 
-        # Ignore changes to state attributes if from/to is in use
-        if (
-            not match_all
-            and from_s is not None
-            and to_s is not None
-            and from_s.state == to_s.state
-        ):
-            return
-
         if not time_delta:
             call_action()
             return
@@ -129,8 +133,12 @@ async def async_attach_trigger(
             entity_ids=entity,
         )
 
-    unsub = async_track_state_change(
-        hass, entity_id, state_automation_listener, from_state, to_state
+    unsub = async_track_trigger(
+        hass,
+        entity_id,
+        (platform_type, from_state, to_state),
+        state_matches,
+        state_automation_listener,
     )
 
     @callback
@@ -0,0 +1,122 @@
+"""Dispatch state changes to the state based triggers of automations."""
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+
+# mypy: allow-untyped-calls, allow-untyped-defs
+
+DATA_STATE_DISPATCH = "automation_state_dispatch"
+
+PredicateType = Callable[[str, Optional[State], Optional[State]], Any]
+TriggerActionType = Callable[[str, Optional[State], Optional[State], Any], None]
+
+
+class _TriggerGroup:
+    """Triggers of an entity that share a predicate."""
+
+    __slots__ = ("predicate", "notify_all", "actions")
+
+    def __init__(self, predicate: PredicateType, notify_all: bool) -> None:
+        """Initialize the group."""
+        self.predicate = predicate
+        self.notify_all = notify_all
+        self.actions: Dict[object, TriggerActionType] = {}
+
+
+class StateDispatch:
+    """Table of triggers by entity id and predicate.
+
+    A single state_changed listener looks up the triggers of the changed
+    entity. Triggers of an entity with an equal predicate key form a group,
+    so the predicate is evaluated once per state change for all of them and
+    only the triggers of matching groups are run. Groups that ask to be
+    notified of every change also run their triggers when the predicate does
+    not match, to let them track when a threshold is crossed.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the table."""
+        self.hass = hass
+        self._entities: Dict[str, Dict[Hashable, _TriggerGroup]] = {}
+        self._unsub: Optional[CALLBACK_TYPE] = None
+
+    @callback
+    def async_add(
+        self,
+        entity_ids: Iterable[str],
+        key: Hashable,
+        predicate: PredicateType,
+        action: TriggerActionType,
+        notify_all: bool = False,
+    ) -> CALLBACK_TYPE:
+        """Run an action for changes of entities that match a predicate.
+
+        The action is called with the entity id, the old and new state and
+        the result of the predicate.
+        """
+        token = object()
+        entity_ids = {entity_id.lower() for entity_id in entity_ids}
+
+        for entity_id in entity_ids:
+            groups = self._entities.setdefault(entity_id, {})
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = _TriggerGroup(predicate, notify_all)
+            group.actions[token] = action
+
+        if self._unsub is None:
+            self._unsub = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_state_changed
+            )
+
+        @callback
+        def async_remove() -> None:
+            """Remove the action from the table."""
+            for entity_id in entity_ids:
+                groups = self._entities[entity_id]
+                group = groups[key]
+                del group.actions[token]
+                if not group.actions:
+                    del groups[key]
+                if not groups:
+                    del self._entities[entity_id]
+
+            if not self._entities and self._unsub is not None:
+                self._unsub()
+                self._unsub = None
+
+        return async_remove
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Run the triggers of the changed entity that match."""
+        entity_id = event.data["entity_id"]
+        groups = self._entities.get(entity_id)
+        if groups is None:
+            return
+
+        old_state = event.data.get("old_state")
+        new_state = event.data.get("new_state")
+        for group in list(groups.values()):
+            result = group.predicate(entity_id, old_state, new_state)
+            if not (result or group.notify_all):
+                continue
+            for action in list(group.actions.values()):
+                self.hass.async_run_job(action, entity_id, old_state, new_state, result)
+
+
+@callback
+def async_track_trigger(
+    hass: HomeAssistant,
+    entity_ids: Iterable[str],
+    key: Hashable,
+    predicate: PredicateType,
+    action: TriggerActionType,
+    notify_all: bool = False,
+) -> CALLBACK_TYPE:
+    """Add a trigger to the state dispatch table of automations."""
+    dispatch = hass.data.get(DATA_STATE_DISPATCH)
+    if dispatch is None:
+        dispatch = hass.data[DATA_STATE_DISPATCH] = StateDispatch(hass)
+    return dispatch.async_add(entity_ids, key, predicate, action, notify_all)
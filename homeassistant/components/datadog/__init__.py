@@ -13,6 +13,7 @@ from homeassistant.const import (
 )
 from homeassistant.helpers import state as state_helper
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.exporter import BatchingExporter, ExportError, Transport
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,6 +24,9 @@ DEFAULT_PREFIX = "hass"
 DEFAULT_RATE = 1
 DOMAIN = "datadog"
 
+# Metrics per packet sent to the agent
+BUFFER_SIZE = 50
+
 CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: vol.Schema(
@@ -40,6 +44,32 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 
+class DatadogTransport(Transport):
+    """Send metrics and events to the Datadog agent in buffered packets."""
+
+    def __init__(self, statsd, sample_rate):
+        """Initialize the transport."""
+        self._statsd = statsd
+        self._sample_rate = sample_rate
+
+    def send(self, batch):
+        """Send a batch through the DogStatsD buffer."""
+        self._statsd.open_buffer(BUFFER_SIZE)
+        try:
+            for kind, name, value, tags in batch:
+                if kind == "event":
+                    self._statsd.event(title=name, text=value, tags=tags)
+                else:
+                    self._statsd.gauge(
+                        name, value, sample_rate=self._sample_rate, tags=tags
+                    )
+        finally:
+            try:
+                self._statsd.close_buffer()
+            except OSError as err:
+                raise ExportError(f"Failed to send to Datadog: {err}") from err
+
+
 def setup(hass, config):
     """Set up the Datadog component."""
     from datadog import initialize, statsd
@@ -52,54 +82,66 @@ def setup(hass, config):
 
     initialize(statsd_host=host, statsd_port=port)
 
-    def logbook_entry_listener(event):
-        """Listen for logbook entries and send them as events."""
+    def logbook_entry_encoder(event):
+        """Encode a logbook entry as an event."""
         name = event.data.get("name")
         message = event.data.get("message")
 
-        statsd.event(
-            title="Home Assistant",
-            text=f"%%% \n **{name}** {message} \n %%%",
-            tags=[
-                "entity:{}".format(event.data.get("entity_id")),
-                "domain:{}".format(event.data.get("domain")),
-            ],
-        )
-
-        _LOGGER.debug("Sent event %s", event.data.get("entity_id"))
-
-    def state_changed_listener(event):
-        """Listen for new messages on the bus and sends them to Datadog."""
+        return [
+            (
+                "event",
+                "Home Assistant",
+                f"%%% \n **{name}** {message} \n %%%",
+                [
+                    "entity:{}".format(event.data.get("entity_id")),
+                    "domain:{}".format(event.data.get("domain")),
+                ],
+            )
+        ]
+
+    def state_changed_encoder(event):
+        """Encode a state change as gauges."""
         state = event.data.get("new_state")
 
         if state is None or state.state == STATE_UNKNOWN:
-            return
+            return None
 
         if state.attributes.get("hidden") is True:
-            return
+            return None
 
         states = dict(state.attributes)
         metric = f"{prefix}.{state.domain}"
         tags = [f"entity:{state.entity_id}"]
+        metrics = []
 
         for key, value in states.items():
             if isinstance(value, (float, int)):
                 attribute = "{}.{}".format(metric, key.replace(" ", "_"))
-                statsd.gauge(attribute, value, sample_rate=sample_rate, tags=tags)
-
-                _LOGGER.debug("Sent metric %s: %s (tags: %s)", attribute, value, tags)
+                metrics.append(("gauge", attribute, value, tags))
 
         try:
             value = state_helper.state_as_number(state)
         except ValueError:
             _LOGGER.debug("Error sending %s: %s (tags: %s)", metric, state.state, tags)
-            return
-
-        statsd.gauge(metric, value, sample_rate=sample_rate, tags=tags)
-
-        _LOGGER.debug("Sent metric %s: %s (tags: %s)", metric, value, tags)
-
-    hass.bus.listen(EVENT_LOGBOOK_ENTRY, logbook_entry_listener)
-    hass.bus.listen(EVENT_STATE_CHANGED, state_changed_listener)
+            return metrics
+
+        metrics.append(("gauge", metric, value, tags))
+
+        return metrics
+
+    def datadog_event_encoder(event):
+        """Encode an event for Datadog."""
+        if event.event_type == EVENT_LOGBOOK_ENTRY:
+            return logbook_entry_encoder(event)
+        return state_changed_encoder(event)
+
+    exporter = BatchingExporter(
+        hass,
+        "Datadog",
+        datadog_event_encoder,
+        DatadogTransport(statsd, sample_rate),
+        event_types=(EVENT_LOGBOOK_ENTRY, EVENT_STATE_CHANGED),
+    )
+    exporter.start()
 
     return True
@@ -1,16 +1,16 @@
 """Allows the creation of a sensor that filters state property."""
+import asyncio
+from bisect import bisect_left, insort
 import logging
-import statistics
 from collections import deque, Counter
 from numbers import Number
-from functools import partial
 from copy import copy
 from datetime import timedelta
 from typing import Optional
 
 import voluptuous as vol
 
-from homeassistant.core import callback
+from homeassistant.core import State, callback
 from homeassistant.components.sensor import PLATFORM_SCHEMA
 from homeassistant.const import (
     CONF_NAME,
@@ -58,6 +58,9 @@ DEFAULT_PRECISION = 2
 DEFAULT_FILTER_RADIUS = 2.0
 DEFAULT_FILTER_TIME_CONSTANT = 10
 
+# Replayed histories shorter than this are filtered state by state
+VECTORIZE_MIN_STATES = 16
+
 NAME_TEMPLATE = "{} filter"
 ICON = "mdi:chart-line-variant"
 
@@ -177,7 +180,7 @@ class SensorFilter(Entity):
         """Register callbacks."""
 
         @callback
-        def filter_sensor_state_listener(entity, old_state, new_state, update_ha=True):
+        def filter_sensor_state_listener(entity, old_state, new_state):
             """Handle device state changes."""
             if new_state.state in [STATE_UNKNOWN, STATE_UNAVAILABLE]:
                 return
@@ -201,21 +204,10 @@ class SensorFilter(Entity):
                 _LOGGER.error("Could not convert state: %s to number", self._state)
                 return
 
-            self._state = temp_state.state
-
-            if self._icon is None:
-                self._icon = new_state.attributes.get(ATTR_ICON, ICON)
-
-            if self._unit_of_measurement is None:
-                self._unit_of_measurement = new_state.attributes.get(
-                    ATTR_UNIT_OF_MEASUREMENT
-                )
-
-            if update_ha:
-                self.async_schedule_update_ha_state()
+            self._set_filtered_state(new_state, temp_state.state)
+            self.async_schedule_update_ha_state()
 
         if "recorder" in self.hass.config.components:
-            history_list = []
             largest_window_items = 0
             largest_window_time = timedelta(0)
 
@@ -233,51 +225,93 @@ class SensorFilter(Entity):
                     largest_window_time = filt.window_size
 
             # Retrieve the largest window_size of each type
+            requests = []
             if largest_window_items > 0:
-                filter_history = await self.hass.async_add_job(
-                    partial(
-                        history.get_last_state_changes,
-                        self.hass,
-                        largest_window_items,
-                        entity_id=self._entity,
+                requests.append(
+                    history.StatesRequest(
+                        self._entity,
+                        number_of_states=largest_window_items,
+                        changes_only=True,
                     )
                 )
-                if self._entity in filter_history:
-                    history_list.extend(filter_history[self._entity])
             if largest_window_time > timedelta(seconds=0):
-                start = dt_util.utcnow() - largest_window_time
-                filter_history = await self.hass.async_add_job(
-                    partial(
-                        history.state_changes_during_period,
-                        self.hass,
-                        start,
-                        entity_id=self._entity,
+                requests.append(
+                    history.StatesRequest(
+                        self._entity,
+                        start_time=dt_util.utcnow() - largest_window_time,
+                        changes_only=True,
                     )
                 )
-                if self._entity in filter_history:
-                    history_list.extend(
-                        [
-                            state
-                            for state in filter_history[self._entity]
-                            if state not in history_list
-                        ]
-                    )
 
-            # Sort the window states
-            history_list = sorted(history_list, key=lambda s: s.last_updated)
+            records = set()
+            for result in await asyncio.gather(
+                *(
+                    history.async_get_last_states(self.hass, request)
+                    for request in requests
+                )
+            ):
+                records.update(result)
+
+            # Only the state is recorded per sample, take the attributes from
+            # the source so the filters can copy them
+            source = self.hass.states.get(self._entity)
+            attributes = source.attributes if source is not None else {}
+            history_list = [
+                State(
+                    self._entity,
+                    state,
+                    attributes,
+                    last_changed=last_updated,
+                    last_updated=last_updated,
+                )
+                for last_updated, state in sorted(records)
+            ]
             _LOGGER.debug(
                 "Loading from history: %s",
                 [(s.state, s.last_updated) for s in history_list],
             )
 
             # Replay history through the filter chain
-            prev_state = None
-            for state in history_list:
-                filter_sensor_state_listener(self._entity, prev_state, state, False)
-                prev_state = state
+            self._replay(history_list)
 
         async_track_state_change(self.hass, self._entity, filter_sensor_state_listener)
 
+    def _set_filtered_state(self, new_state, filtered):
+        """Set the filtered state and take icon and unit from the source."""
+        self._state = filtered
+
+        if self._icon is None:
+            self._icon = new_state.attributes.get(ATTR_ICON, ICON)
+
+        if self._unit_of_measurement is None:
+            self._unit_of_measurement = new_state.attributes.get(
+                ATTR_UNIT_OF_MEASUREMENT
+            )
+
+    def _replay(self, states):
+        """Run states from history through the filter chain.
+
+        Each filter processes all states before passing the ones it did not
+        skip on to the next filter, which allows filters to vectorize.
+        """
+        states = [
+            state
+            for state in states
+            if state.state not in [STATE_UNKNOWN, STATE_UNAVAILABLE]
+        ]
+        for filt in self._filters:
+            if not states:
+                return
+            states = filt.filter_states(states)
+
+        if not states:
+            return
+        if states[-1].attributes:
+            self._set_filtered_state(states[-1], states[-1].state)
+        else:
+            # Leave icon and unit to the first live state of the source
+            self._state = states[-1].state
+
     @property
     def name(self):
         """Return the name of the sensor."""
@@ -394,6 +428,37 @@ class Filter:
         new_state.state = filtered.state
         return new_state
 
+    def filter_states(self, states):
+        """Filter a list of states, returning the states not skipped.
+
+        Used to replay history, filters that can process all states at once
+        override this.
+        """
+        filtered = []
+        for state in states:
+            try:
+                new_state = self.filter_state(copy(state))
+            except ValueError:
+                _LOGGER.error("Could not convert state: %s to number", state.state)
+                continue
+            if not self._skip_processing:
+                filtered.append(new_state)
+        return filtered
+
+    def _filtered_copy(self, state, value):
+        """Return a copy of a state with a filtered value."""
+        new_state = copy(state)
+        new_state.state = round(float(value), self.precision)
+        return new_state
+
+
+def _numeric_values(filter_states):
+    """Return the values of filter states, or None if any is not a number."""
+    values = [filter_state.state for filter_state in filter_states]
+    if all(isinstance(value, float) for value in values):
+        return values
+    return None
+
 
 @FILTERS.register(FILTER_NAME_RANGE)
 class RangeFilter(Filter):
@@ -465,10 +530,13 @@ class OutlierFilter(Filter):
         self._radius = radius
         self._stats_internal = Counter()
         self._store_raw = True
+        # Values of the window in sorted order
+        self._sorted = []
 
     def _filter_state(self, new_state):
         """Implement the outlier filter."""
-        median = statistics.median([s.state for s in self.states]) if self.states else 0
+        value = new_state.state
+        median = _sorted_median(self._sorted) if self.states else 0
         if (
             len(self.states) == self.states.maxlen
             and abs(new_state.state - median) > self._radius
@@ -483,8 +551,62 @@ class OutlierFilter(Filter):
                 new_state,
             )
             new_state.state = median
+
+        # The raw value is added to the window after this returns
+        if self.states.maxlen:
+            if len(self.states) == self.states.maxlen:
+                oldest = self.states[0].state
+                del self._sorted[bisect_left(self._sorted, oldest)]
+            insort(self._sorted, value)
         return new_state
 
+    def filter_states(self, states):
+        """Filter states as plain numbers.
+
+        A rolling median does not vectorize well, so this keeps the sorted
+        window of the live path but skips the per state bookkeeping.
+        """
+        window = self.states.maxlen
+        raw = [FilterState(state) for state in states]
+        values = _numeric_values(raw)
+        window_values = _numeric_values(self.states)
+        if not window or values is None or window_values is None:
+            return super().filter_states(states)
+
+        ring = deque(window_values, maxlen=window)
+        sorted_values = sorted(window_values)
+        filtered = []
+        erasures = 0
+        for value in values:
+            if len(ring) == window:
+                median = _sorted_median(sorted_values)
+                del sorted_values[bisect_left(sorted_values, ring[0])]
+                if abs(value - median) > self._radius:
+                    erasures += 1
+                    filtered.append(median)
+                else:
+                    filtered.append(value)
+            else:
+                filtered.append(value)
+            insort(sorted_values, value)
+            ring.append(value)
+
+        self._stats_internal["erasures"] += erasures
+        self.states.extend(raw[-window:])
+        self._sorted = sorted_values
+
+        return [
+            self._filtered_copy(state, value) for state, value in zip(states, filtered)
+        ]
+
+
+def _sorted_median(values):
+    """Return the median of a sorted list."""
+    half = len(values) // 2
+    if len(values) % 2:
+        return values[half]
+    return (values[half - 1] + values[half]) / 2
+
 
 @FILTERS.register(FILTER_NAME_LOWPASS)
 class LowPassFilter(Filter):
@@ -527,32 +649,107 @@ class TimeSMAFilter(Filter):
         self._time_window = window_size
         self.last_leak = None
         self.queue = deque()
+        # Sum of value * duration over the consecutive states in the queue
+        self._area = 0.0
+        self._leaks = 0
 
     def _leak(self, left_boundary):
         """Remove timeouted elements."""
         while self.queue:
             if self.queue[0].timestamp + self._time_window <= left_boundary:
                 self.last_leak = self.queue.popleft()
+                if self.queue:
+                    self._area -= (
+                        self.queue[0].timestamp - self.last_leak.timestamp
+                    ).total_seconds() * self.last_leak.state
+                self._leaks += 1
             else:
-                return
+                break
+
+        # Recompute the sum now and then so rounding errors don't add up
+        if self._leaks > len(self.queue):
+            self._reset_area()
+
+    def _reset_area(self):
+        """Recompute the sum over the queue."""
+        self._area = 0.0
+        prev_state = None
+        for state in self.queue:
+            if prev_state is not None:
+                self._area += (
+                    state.timestamp - prev_state.timestamp
+                ).total_seconds() * prev_state.state
+            prev_state = state
+        self._leaks = 0
 
     def _filter_state(self, new_state):
         """Implement the Simple Moving Average filter."""
         self._leak(new_state.timestamp)
+        if self.queue:
+            self._area += (
+                new_state.timestamp - self.queue[-1].timestamp
+            ).total_seconds() * self.queue[-1].state
         self.queue.append(copy(new_state))
 
-        moving_sum = 0
         start = new_state.timestamp - self._time_window
         prev_state = self.last_leak or self.queue[0]
-        for state in self.queue:
-            moving_sum += (state.timestamp - start).total_seconds() * prev_state.state
-            start = state.timestamp
-            prev_state = state
+        moving_sum = (
+            self.queue[0].timestamp - start
+        ).total_seconds() * prev_state.state + self._area
 
         new_state.state = moving_sum / self._time_window.total_seconds()
 
         return new_state
 
+    def filter_states(self, states):
+        """Filter states with the averages of all windows computed at once."""
+        new = [FilterState(state) for state in states]
+        known = ([self.last_leak] if self.last_leak else []) + list(self.queue)
+        values = _numeric_values(new)
+        known_values = _numeric_values(known)
+        if len(states) < VECTORIZE_MIN_STATES or values is None or known_values is None:
+            return super().filter_states(states)
+
+        import numpy as np
+
+        combined = known + new
+        base = combined[0].timestamp
+        times = np.array(
+            [(state.timestamp - base).total_seconds() for state in combined]
+        )
+        if np.any(np.diff(times) < 0):
+            return super().filter_states(states)
+        values = np.array(known_values + values)
+
+        # area[k] is the sum of value * duration from the first state to k
+        area = np.zeros(len(combined))
+        np.cumsum(np.diff(times) * values[:-1], out=area[1:])
+
+        window = self._time_window.total_seconds()
+        new_index = np.arange(len(known), len(combined))
+        start = times[new_index] - window
+        # The first state of the queue of each new state after leaking
+        first = np.searchsorted(times, start, side="right")
+        if self.last_leak is None:
+            prev = np.maximum(first - 1, 0)
+        else:
+            prev = first - 1
+        moving_sum = (times[first] - start) * values[prev] + (
+            area[new_index] - area[first]
+        )
+        filtered = moving_sum / window
+
+        last_first = int(first[-1])
+        if last_first > 0:
+            self.last_leak = combined[last_first - 1]
+        self.queue = deque(combined[last_first:])
+        self._reset_area()
+
+        return [
+            self._filtered_copy(state, value)
+            for state, value in zip(states, filtered.tolist())
+        ]
+
 
 @FILTERS.register(FILTER_NAME_THROTTLE)
 class ThrottleFilter(Filter):
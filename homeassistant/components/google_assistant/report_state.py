@@ -4,6 +4,7 @@ import logging
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.const import MATCH_ALL
 from homeassistant.helpers.event import async_call_later
+import homeassistant.util.dt as dt_util
 
 from .helpers import AbstractConfig, GoogleEntity, async_get_entities
 from .error import SmartHomeError
@@ -12,16 +13,71 @@ from .error import SmartHomeError
 # https://github.com/actions-on-google/smart-home-nodejs/issues/196#issuecomment-439156639
 INITIAL_REPORT_DELAY = 60
 
+# Seconds to collect state changes before sending them as one report
+REPORT_STATE_WINDOW = 1
+
+# Minimum seconds between two reports for the same entity
+ENTITY_REPORT_INTERVAL = 3
+
 
 _LOGGER = logging.getLogger(__name__)
 
 
 @callback
 def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig):
-    """Enable state reporting."""
+    """Enable state reporting.
+
+    Changes are collected for REPORT_STATE_WINDOW seconds and sent to Google
+    in a single report. The last reported payload of each entity is kept to
+    skip changes Google doesn't care about, and an entity is reported at most
+    once every ENTITY_REPORT_INTERVAL seconds; newer changes replace the
+    pending payload until then.
+    """
+    # entity_id -> last payload sent to Google
+    reported = {}
+    # entity_id -> time of the last report
+    reported_at = {}
+    # entity_id -> payload waiting to be sent
+    pending = {}
+    unsub_flush = None
+    unsub_initial = None
+
+    @callback
+    def async_schedule_flush(delay):
+        """Schedule sending the pending payloads."""
+        nonlocal unsub_flush
+        if unsub_flush is None:
+            unsub_flush = async_call_later(hass, delay, async_flush)
+
+    async def async_flush(_now):
+        """Send the pending payloads that are not rate limited."""
+        nonlocal unsub_flush
+        unsub_flush = None
+
+        now = dt_util.utcnow().timestamp()
+        states = {}
+        next_due = None
+
+        for entity_id in list(pending):
+            due = reported_at.get(entity_id, 0) + ENTITY_REPORT_INTERVAL
+            if due > now:
+                next_due = due if next_due is None else min(next_due, due)
+                continue
+            states[entity_id] = reported[entity_id] = pending.pop(entity_id)
+            reported_at[entity_id] = now
+
+        if next_due is not None:
+            async_schedule_flush(max(next_due - now, REPORT_STATE_WINDOW))
+
+        if states:
+            await google_config.async_report_state({"devices": {"states": states}})
 
-    async def async_entity_state_listener(changed_entity, old_state, new_state):
+    @callback
+    def async_entity_state_listener(changed_entity, old_state, new_state):
         if not new_state:
+            pending.pop(changed_entity, None)
+            reported.pop(changed_entity, None)
+            reported_at.pop(changed_entity, None)
             return
 
         if not google_config.should_expose(new_state):
@@ -38,19 +94,27 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
             _LOGGER.debug("Not reporting state for %s: %s", changed_entity, err.code)
             return
 
-        if old_state:
-            old_entity = GoogleEntity(hass, google_config, old_state)
+        if changed_entity not in reported and old_state:
+            # Never reported yet, compare against the previous state once
+            try:
+                reported[changed_entity] = GoogleEntity(
+                    hass, google_config, old_state
+                ).query_serialize()
+            except SmartHomeError:
+                pass
 
-            # Only report to Google if data that Google cares about has changed
-            if entity_data == old_entity.query_serialize():
-                return
+        # Only report to Google if data that Google cares about has changed
+        if entity_data == reported.get(changed_entity):
+            pending.pop(changed_entity, None)
+            return
 
-        await google_config.async_report_state(
-            {"devices": {"states": {changed_entity: entity_data}}}
-        )
+        pending[changed_entity] = entity_data
+        async_schedule_flush(REPORT_STATE_WINDOW)
 
     async def inital_report(_now):
         """Report initially all states."""
+        nonlocal unsub_initial
+        unsub_initial = None
         entities = {}
 
         for entity in async_get_entities(hass, google_config):
@@ -62,10 +126,22 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
             except SmartHomeError:
                 continue
 
+        reported.update(entities)
         await google_config.async_report_state({"devices": {"states": entities}})
 
-    async_call_later(hass, INITIAL_REPORT_DELAY, inital_report)
+    unsub_initial = async_call_later(hass, INITIAL_REPORT_DELAY, inital_report)
 
-    return hass.helpers.event.async_track_state_change(
+    unsub_track = hass.helpers.event.async_track_state_change(
         MATCH_ALL, async_entity_state_listener
     )
+
+    @callback
+    def unsub():
+        """Stop reporting state."""
+        unsub_track()
+        if unsub_initial is not None:
+            unsub_initial()
+        if unsub_flush is not None:
+            unsub_flush()
+
+    return unsub
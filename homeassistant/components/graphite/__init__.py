@@ -1,9 +1,6 @@
 """Support for sending data to a Graphite installation."""
 import logging
-import queue
 import socket
-import threading
-import time
 
 import voluptuous as vol
 
@@ -12,11 +9,9 @@ from homeassistant.const import (
     CONF_HOST,
     CONF_PORT,
     CONF_PREFIX,
-    EVENT_HOMEASSISTANT_START,
-    EVENT_HOMEASSISTANT_STOP,
-    EVENT_STATE_CHANGED,
 )
 from homeassistant.helpers import state
+from homeassistant.helpers.exporter import BatchingExporter, ExportError, Transport
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -55,103 +50,79 @@ def setup(hass, config):
         _LOGGER.error("Not able to connect to Graphite")
         return False
 
-    GraphiteFeeder(hass, host, port, prefix)
+    exporter = BatchingExporter(
+        hass, "Graphite", GraphiteEncoder(prefix), GraphiteTransport(host, port),
+    )
+    exporter.start()
+    _LOGGER.debug("Graphite feeding to %s:%i initialized", host, port)
     return True
 
 
-class GraphiteFeeder(threading.Thread):
-    """Feed data to Graphite."""
+class GraphiteEncoder:
+    """Encode state changes as Graphite plaintext lines."""
 
-    def __init__(self, hass, host, port, prefix):
-        """Initialize the feeder."""
-        super().__init__(daemon=True)
-        self._hass = hass
-        self._host = host
-        self._port = port
+    def __init__(self, prefix):
+        """Initialize the encoder."""
         # rstrip any trailing dots in case they think they need it
         self._prefix = prefix.rstrip(".")
-        self._queue = queue.Queue()
-        self._quit_object = object()
-        self._we_started = False
-
-        hass.bus.listen_once(EVENT_HOMEASSISTANT_START, self.start_listen)
-        hass.bus.listen_once(EVENT_HOMEASSISTANT_STOP, self.shutdown)
-        hass.bus.listen(EVENT_STATE_CHANGED, self.event_listener)
-        _LOGGER.debug("Graphite feeding to %s:%i initialized", self._host, self._port)
-
-    def start_listen(self, event):
-        """Start event-processing thread."""
-        _LOGGER.debug("Event processing thread started")
-        self._we_started = True
-        self.start()
-
-    def shutdown(self, event):
-        """Signal shutdown of processing event."""
-        _LOGGER.debug("Event processing signaled exit")
-        self._queue.put(self._quit_object)
-
-    def event_listener(self, event):
-        """Queue an event for processing."""
-        if self.is_alive() or not self._we_started:
-            _LOGGER.debug("Received event")
-            self._queue.put(event)
-        else:
-            _LOGGER.error("Graphite feeder thread has died, not queuing event")
-
-    def _send_to_graphite(self, data):
-        """Send data to Graphite."""
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(10)
-        sock.connect((self._host, self._port))
-        sock.sendall(data.encode("ascii"))
-        sock.send("\n".encode("ascii"))
-        sock.close()
-
-    def _report_attributes(self, entity_id, new_state):
-        """Report the attributes."""
-        now = time.time()
+
+    def __call__(self, event):
+        """Return the lines for the numeric state and attributes."""
+        new_state = event.data.get("new_state")
+        if new_state is None:
+            return None
+
+        timestamp = event.time_fired.timestamp()
         things = dict(new_state.attributes)
         try:
             things["state"] = state.state_as_number(new_state)
         except ValueError:
             pass
-        lines = [
+        return [
             "%s.%s.%s %f %i"
-            % (self._prefix, entity_id, key.replace(" ", "_"), value, now)
+            % (
+                self._prefix,
+                event.data["entity_id"],
+                key.replace(" ", "_"),
+                value,
+                timestamp,
+            )
             for key, value in things.items()
             if isinstance(value, (float, int))
         ]
-        if not lines:
+
+
+class GraphiteTransport(Transport):
+    """Send lines to Graphite over a persistent TCP connection."""
+
+    def __init__(self, host, port):
+        """Initialize the transport."""
+        self._host = host
+        self._port = port
+        self._sock = None
+
+    def send(self, batch):
+        """Send lines to Graphite, reconnecting if needed."""
+        data = ("\n".join(batch) + "\n").encode("ascii")
+        try:
+            if self._sock is None:
+                self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                self._sock.settimeout(10)
+                self._sock.connect((self._host, self._port))
+            self._sock.sendall(data)
+        except socket.gaierror as err:
+            self.close()
+            raise ExportError(f"Unable to connect to host {self._host}") from err
+        except socket.error as err:
+            self.close()
+            raise ExportError(f"Failed to send data to Graphite: {err}") from err
+
+    def close(self):
+        """Close the connection."""
+        if self._sock is None:
             return
-        _LOGGER.debug("Sending to graphite: %s", lines)
         try:
-            self._send_to_graphite("\n".join(lines))
-        except socket.gaierror:
-            _LOGGER.error("Unable to connect to host %s", self._host)
+            self._sock.close()
         except socket.error:
-            _LOGGER.exception("Failed to send data to graphite")
-
-    def run(self):
-        """Run the process to export the data."""
-        while True:
-            event = self._queue.get()
-            if event == self._quit_object:
-                _LOGGER.debug("Event processing thread stopped")
-                self._queue.task_done()
-                return
-            if event.event_type == EVENT_STATE_CHANGED and event.data.get("new_state"):
-                _LOGGER.debug(
-                    "Processing STATE_CHANGED event for %s", event.data["entity_id"]
-                )
-                try:
-                    self._report_attributes(
-                        event.data["entity_id"], event.data["new_state"]
-                    )
-                except Exception:  # pylint: disable=broad-except
-                    # Catch this so we can avoid the thread dying and
-                    # make it visible.
-                    _LOGGER.exception("Failed to process STATE_CHANGED event")
-            else:
-                _LOGGER.warning("Processing unexpected event type %s", event.event_type)
-
-            self._queue.task_done()
+            pass
+        self._sock = None
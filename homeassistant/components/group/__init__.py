@@ -1,7 +1,7 @@
 """Provide the functionality to group entities."""
 import asyncio
 import logging
-from typing import Any, Iterable, List, Optional, cast
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, cast
 
 import voluptuous as vol
 
@@ -42,6 +42,8 @@ DOMAIN = "group"
 
 ENTITY_ID_FORMAT = DOMAIN + ".{}"
 
+DATA_EXPANDED = "group_expanded"
+
 CONF_ENTITIES = "entities"
 CONF_VIEW = "view"
 CONF_CONTROL = "control"
@@ -151,7 +153,20 @@ def expand_entity_ids(hass: HomeAssistantType, entity_ids: Iterable[Any]) -> Lis
 
     Async friendly.
     """
+    return _expand_entity_ids(
+        hass, entity_ids, hass.data.setdefault(DATA_EXPANDED, {}), []
+    )
+
+
+def _expand_entity_ids(
+    hass: HomeAssistantType,
+    entity_ids: Iterable[Any],
+    expanded: Dict[str, Tuple[List[Tuple[str, Any]], List[str]]],
+    depends: List[Tuple[str, Any]],
+) -> List[str]:
+    """Expand entity ids, adding the groups read and their members to depends."""
     found_ids: List[str] = []
+    seen: Set[str] = set()
     for entity_id in entity_ids:
         if not isinstance(entity_id, str):
             continue
@@ -163,19 +178,14 @@ def expand_entity_ids(hass: HomeAssistantType, entity_ids: Iterable[Any]) -> Lis
             domain, _ = ha.split_entity_id(entity_id)
 
             if domain == DOMAIN:
-                child_entities = get_entity_ids(hass, entity_id)
-                if entity_id in child_entities:
-                    child_entities = list(child_entities)
-                    child_entities.remove(entity_id)
-                found_ids.extend(
-                    ent_id
-                    for ent_id in expand_entity_ids(hass, child_entities)
-                    if ent_id not in found_ids
-                )
-
-            else:
-                if entity_id not in found_ids:
-                    found_ids.append(entity_id)
+                for ent_id in _expand_group(hass, entity_id, expanded, depends):
+                    if ent_id not in seen:
+                        seen.add(ent_id)
+                        found_ids.append(ent_id)
+
+            elif entity_id not in seen:
+                seen.add(entity_id)
+                found_ids.append(entity_id)
 
         except AttributeError:
             # Raised by split_entity_id if entity_id is not a string
@@ -184,6 +194,44 @@ def expand_entity_ids(hass: HomeAssistantType, entity_ids: Iterable[Any]) -> Lis
     return found_ids
 
 
+def _expand_group(
+    hass: HomeAssistantType,
+    entity_id: str,
+    expanded: Dict[str, Tuple[List[Tuple[str, Any]], List[str]]],
+    depends: List[Tuple[str, Any]],
+) -> List[str]:
+    """Return the members of a group with nested groups expanded.
+
+    Expansions are cached with the member lists of the groups they read. A
+    group writes the same member tuple with every state update, so a cached
+    expansion is valid as long as all of those are still the same objects.
+    """
+    cached = expanded.get(entity_id)
+    if cached is not None and all(
+        _get_members(hass, group_id) is members for group_id, members in cached[0]
+    ):
+        depends.extend(cached[0])
+        return cached[1]
+
+    group_depends = [(entity_id, _get_members(hass, entity_id))]
+    child_entities = get_entity_ids(hass, entity_id)
+    if entity_id in child_entities:
+        child_entities = list(child_entities)
+        child_entities.remove(entity_id)
+    found_ids = _expand_entity_ids(hass, child_entities, expanded, group_depends)
+    expanded[entity_id] = (group_depends, found_ids)
+    depends.extend(group_depends)
+    return found_ids
+
+
+def _get_members(hass: HomeAssistantType, entity_id: str) -> Any:
+    """Return the member attribute of a group state."""
+    state = hass.states.get(entity_id)
+    if state is None:
+        return None
+    return state.attributes.get(ATTR_ENTITY_ID)
+
+
 @bind_hass
 def get_entity_ids(
     hass: HomeAssistantType, entity_id: str, domain_filter: Optional[str] = None
@@ -414,6 +462,11 @@ class Group(Entity):
         self._order = order
         self._assumed_state = False
         self._async_unsub_state_changed = None
+        # State and assumed state of the members, with the number of members
+        # in the on state and with an assumed state
+        self._members: Dict[str, Tuple[str, bool]] = {}
+        self._on_count = 0
+        self._assumed_count = 0
 
     @staticmethod
     def create_group(
@@ -622,6 +675,22 @@ class Group(Entity):
 
         return states
 
+    @callback
+    def _async_set_member(self, entity_id, state):
+        """Update the counters with the state of a member, None if removed."""
+        old = self._members.pop(entity_id, None)
+        if old is not None:
+            self._on_count -= old[0] == self.group_on
+            self._assumed_count -= old[1]
+
+        if state is None:
+            return
+
+        new = (state.state, bool(state.attributes.get(ATTR_ASSUMED_STATE)))
+        self._members[entity_id] = new
+        self._on_count += new[0] == self.group_on
+        self._assumed_count += new[1]
+
     @callback
     def _async_update_group_state(self, tr_state=None):
         """Update group state.
@@ -631,59 +700,34 @@ class Group(Entity):
 
         This method must be run in the event loop.
         """
-        # To store current states of group entities. Might not be needed.
-        states = None
-        gr_state = self._state
-        gr_on = self.group_on
-        gr_off = self.group_off
+        if tr_state is None:
+            # Count the states of all members again
+            self._members = {}
+            self._on_count = self._assumed_count = 0
+            for state in self._tracking_states:
+                self._async_set_member(state.entity_id, state)
+        else:
+            self._async_set_member(tr_state.entity_id, tr_state)
 
         # We have not determined type of group yet
-        if gr_on is None:
-            if tr_state is None:
-                states = self._tracking_states
-
-                for state in states:
-                    gr_on, gr_off = _get_group_on_off(state.state)
-                    if gr_on is not None:
-                        break
-            else:
-                gr_on, gr_off = _get_group_on_off(tr_state.state)
-
-            if gr_on is not None:
-                self.group_on, self.group_off = gr_on, gr_off
+        if self.group_on is None:
+            for state, _ in self._members.values():
+                gr_on, gr_off = _get_group_on_off(state)
+                if gr_on is not None:
+                    self.group_on, self.group_off = gr_on, gr_off
+                    self._on_count = sum(
+                        state == gr_on for state, _ in self._members.values()
+                    )
+                    break
 
         # We cannot determine state of the group
-        if gr_on is None:
+        if self.group_on is None:
             return
 
-        # pylint: disable=too-many-boolean-expressions
-        if tr_state is None or (
-            (gr_state == gr_on and tr_state.state == gr_off)
-            or (gr_state == gr_off and tr_state.state == gr_on)
-            or tr_state.state not in (gr_on, gr_off)
-        ):
-            if states is None:
-                states = self._tracking_states
-
-            if self.mode(state.state == gr_on for state in states):
-                self._state = gr_on
-            else:
-                self._state = gr_off
-
-        elif tr_state.state in (gr_on, gr_off):
-            self._state = tr_state.state
-
-        if (
-            tr_state is None
-            or self._assumed_state
-            and not tr_state.attributes.get(ATTR_ASSUMED_STATE)
-        ):
-            if states is None:
-                states = self._tracking_states
-
-            self._assumed_state = self.mode(
-                state.attributes.get(ATTR_ASSUMED_STATE) for state in states
-            )
-
-        elif tr_state.attributes.get(ATTR_ASSUMED_STATE):
-            self._assumed_state = True
+        count = len(self._members)
+        if self.mode is all:
+            self._state = self.group_on if self._on_count == count else self.group_off
+            self._assumed_state = self._assumed_count == count
+        else:
+            self._state = self.group_on if self._on_count else self.group_off
+            self._assumed_state = self._assumed_count > 0
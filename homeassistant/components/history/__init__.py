@@ -1,10 +1,12 @@
 """Provide pre-made queries on top of the recorder component."""
 from collections import defaultdict
-from datetime import timedelta
+from datetime import datetime, timedelta
 from itertools import groupby
 import logging
 import time
+from typing import Optional
 
+import attr
 import voluptuous as vol
 
 from homeassistant.const import (
@@ -20,6 +22,7 @@ from homeassistant.components.http import HomeAssistantView
 from homeassistant.const import ATTR_HIDDEN
 from homeassistant.components.recorder.util import session_scope, execute
 import homeassistant.helpers.config_validation as cv
+from homeassistant.loader import bind_hass
 
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -41,6 +44,11 @@ CONFIG_SCHEMA = vol.Schema(
 SIGNIFICANT_DOMAINS = ("thermostat", "climate", "water_heater")
 IGNORE_DOMAINS = ("zone", "scene")
 
+DATA_PRELOADER = "history_preloader"
+
+# SQLite limits the number of members of a compound select to 500
+MAX_UNION_SELECTS = 100
+
 
 def get_significant_states(
     hass,
@@ -140,6 +148,131 @@ def get_last_state_changes(hass, number_of_states, entity_id):
     )
 
 
+@attr.s(slots=True, frozen=True)
+class StatesRequest:
+    """The recorded states of an entity to preload.
+
+    Selects the last number_of_states states, the states from start_time on or
+    both, optionally only the states where the state itself changed.
+    """
+
+    entity_id = attr.ib(type=str)
+    number_of_states = attr.ib(type=Optional[int], default=None)
+    start_time = attr.ib(type=Optional[datetime], default=None)
+    changes_only = attr.ib(type=bool, default=False)
+
+
+def get_last_states(hass, requests):
+    """Return the last states of several entities with a single query.
+
+    Returns a list per request of (last_updated, state) tuples, oldest first.
+    No State objects are built, only the two columns are read.
+    """
+    from sqlalchemy import literal, select, union_all
+    from homeassistant.components.recorder.models import States
+
+    results = [[] for _ in requests]
+    if not requests:
+        return results
+
+    selects = []
+    for index, request in enumerate(requests):
+        query = select(
+            [literal(index).label("request"), States.last_updated, States.state]
+        ).where(States.entity_id == request.entity_id.lower())
+
+        if request.changes_only:
+            query = query.where(States.last_changed == States.last_updated)
+
+        if request.start_time is not None:
+            query = query.where(States.last_updated >= request.start_time)
+
+        query = query.order_by(States.last_updated.desc())
+
+        if request.number_of_states is not None:
+            query = query.limit(request.number_of_states)
+
+        # Wrapped so the ordering and limit apply to each member of the union
+        selects.append(select([query.alias()]))
+
+    with session_scope(hass=hass) as session:
+        for offset in range(0, len(selects), MAX_UNION_SELECTS):
+            chunk = selects[offset : offset + MAX_UNION_SELECTS]
+            statement = chunk[0] if len(chunk) == 1 else union_all(*chunk)
+            for index, last_updated, state in session.execute(statement):
+                results[index].append((_process_timestamp(last_updated), state))
+
+    for result in results:
+        result.reverse()
+
+    return results
+
+
+@bind_hass
+async def async_get_last_states(hass, request):
+    """Return the last states of an entity as (last_updated, state) tuples.
+
+    Requests made while the event loop is busy, like when many sensors warm
+    up at startup, are batched into a single query.
+    """
+    preloader = hass.data.get(DATA_PRELOADER)
+    if preloader is None:
+        preloader = hass.data[DATA_PRELOADER] = StatesPreloader(hass)
+    return await preloader.async_request(request)
+
+
+class StatesPreloader:
+    """Batch concurrent requests for recorded states into one query."""
+
+    def __init__(self, hass):
+        """Initialize the preloader."""
+        self.hass = hass
+        self.queries = 0
+        self._pending = []
+        self._running = False
+
+    async def async_request(self, request):
+        """Queue a request and wait for its states."""
+        future = self.hass.loop.create_future()
+        self._pending.append((request, future))
+        if not self._running:
+            self._running = True
+            self.hass.async_create_task(self._async_process())
+        return await future
+
+    async def _async_process(self):
+        """Run the queued requests until there are none left.
+
+        Requests made while a query runs are batched into the next one.
+        """
+        try:
+            while self._pending:
+                batch, self._pending = self._pending, []
+                self.queries += 1
+                try:
+                    results = await self.hass.async_add_executor_job(
+                        get_last_states, self.hass, [request for request, _ in batch]
+                    )
+                except Exception as err:  # pylint: disable=broad-except
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(err)
+                    continue
+
+                for (_, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+        finally:
+            self._running = False
+
+
+def _process_timestamp(timestamp):
+    """Return a timestamp read from the database as an aware UTC datetime."""
+    if timestamp.tzinfo is None:
+        return dt_util.UTC.localize(timestamp)
+    return dt_util.as_utc(timestamp)
+
+
 def get_states(hass, utc_point_in_time, entity_ids=None, run=None, filters=None):
     """Return the states at a specific point in time."""
     from homeassistant.components.recorder.models import States
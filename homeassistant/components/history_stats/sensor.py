@@ -1,4 +1,6 @@
 """Component to make instant statistics about your history."""
+from bisect import bisect_right
+from collections import deque
 import datetime
 import logging
 import math
@@ -112,6 +114,11 @@ class HistoryStatsSensor(Entity):
         self.value = None
         self.count = None
 
+        # Loaded from the database and kept up to date once tracking
+        self._timeline = None
+        self._tracking = False
+        self._changes = deque()
+
         @callback
         def start_refresh(*args):
             """Register state tracking."""
@@ -121,8 +128,23 @@ class HistoryStatsSensor(Entity):
                 """Force the component to refresh."""
                 self.async_schedule_update_ha_state(True)
 
+            @callback
+            def state_changed(entity_id, old_state, new_state):
+                """Record the state change and refresh."""
+                if new_state is not None:
+                    self._changes.append(
+                        (
+                            new_state.last_changed.timestamp(),
+                            new_state.state == self._entity_state,
+                        )
+                    )
+                force_refresh()
+
+            async_track_state_change(self.hass, self._entity_id, state_changed)
+            # Changes from now on are recorded, reload what came before
+            self._timeline = None
+            self._tracking = True
             force_refresh()
-            async_track_state_change(self.hass, self._entity_id, force_refresh)
 
         # Delay first refresh to keep startup fast
         hass.bus.listen_once(EVENT_HOMEASSISTANT_START, start_refresh)
@@ -185,7 +207,7 @@ class HistoryStatsSensor(Entity):
         end = dt_util.as_utc(end)
         p_start = dt_util.as_utc(p_start)
         p_end = dt_util.as_utc(p_end)
-        now = datetime.datetime.now()
+        now = dt_util.utcnow()
 
         # Compute integer timestamps
         start_timestamp = math.floor(dt_util.as_timestamp(start))
@@ -194,53 +216,72 @@ class HistoryStatsSensor(Entity):
         p_end_timestamp = math.floor(dt_util.as_timestamp(p_end))
         now_timestamp = math.floor(dt_util.as_timestamp(now))
 
-        # If period has not changed and current time after the period end...
+        timeline = self._timeline
+        changed = False
+        while timeline is not None and self._changes:
+            timeline.add(*self._changes.popleft())
+            changed = True
+
+        # If period and state have not changed and current time after the
+        # period end...
         if (
-            start_timestamp == p_start_timestamp
+            not changed
+            and start_timestamp == p_start_timestamp
             and end_timestamp == p_end_timestamp
             and end_timestamp <= now_timestamp
         ):
             # Don't compute anything as the value cannot have changed
             return
 
-        # Get history between start and end
+        # Only go to the database if changes are not tracked or the period
+        # starts before the loaded history
+        if timeline is None or not self._tracking or start_timestamp < timeline.origin:
+            timeline = self._load_timeline(start, start_timestamp)
+            if timeline is None:
+                return
+
+        timeline.forget_before(start_timestamp)
+        # The part of the period that is still in the future has not happened
+        measure_end = min(dt_util.as_timestamp(end), dt_util.as_timestamp(now))
+        elapsed, count = timeline.measure(start_timestamp, measure_end)
+
+        # Save value in hours
+        self.value = elapsed / 3600
+
+        # Save counter
+        self.count = count
+
+    def _load_timeline(self, start, start_timestamp):
+        """Load the state changes from the start of the period until now."""
+        tracking = self._tracking
         history_list = history.state_changes_during_period(
-            self.hass, start, end, str(self._entity_id)
+            self.hass, start, None, str(self._entity_id)
         )
 
         if self._entity_id not in history_list.keys():
-            return
+            return None
 
         # Get the first state
-        last_state = history.get_state(self.hass, start, self._entity_id)
-        last_state = last_state is not None and last_state == self._entity_state
-        last_time = start_timestamp
-        elapsed = 0
-        count = 0
+        first_state = history.get_state(self.hass, start, self._entity_id)
+        timeline = StateTimeline(
+            start_timestamp,
+            first_state is not None and first_state.state == self._entity_state,
+        )
 
-        # Make calculations
+        loaded_until = start_timestamp
         for item in history_list.get(self._entity_id):
-            current_state = item.state == self._entity_state
-            current_time = item.last_changed.timestamp()
+            loaded_until = item.last_changed.timestamp()
+            timeline.add(loaded_until, item.state == self._entity_state)
 
-            if last_state:
-                elapsed += current_time - last_time
-            if current_state and not last_state:
-                count += 1
+        # Skip recorded changes that were already in the history
+        while self._changes:
+            timestamp, matched = self._changes.popleft()
+            if timestamp > loaded_until:
+                timeline.add(timestamp, matched)
 
-            last_state = current_state
-            last_time = current_time
-
-        # Count time elapsed between last history state and end of measure
-        if last_state:
-            measure_end = min(end_timestamp, now_timestamp)
-            elapsed += measure_end - last_time
-
-        # Save value in hours
-        self.value = elapsed / 3600
-
-        # Save counter
-        self.count = count
+        if tracking:
+            self._timeline = timeline
+        return timeline
 
     def update_period(self):
         """Parse the templates and store a datetime tuple in _period."""
@@ -301,6 +342,64 @@ class HistoryStatsSensor(Entity):
         self._period = start, end
 
 
+class StateTimeline:
+    """Changes between matching and not matching a state since a start time.
+
+    The time spent matching and the number of times the state was entered
+    are accumulated at every change, so measuring a period is two bisects.
+    """
+
+    def __init__(self, origin, matched):
+        """Initialize the timeline with the state at its start."""
+        self.times = [origin]
+        self.matched = [matched]
+        self.elapsed = [0.0]
+        self.counts = [0]
+
+    @property
+    def origin(self):
+        """Return the start of the timeline."""
+        return self.times[0]
+
+    def add(self, timestamp, matched):
+        """Add a state change."""
+        if matched == self.matched[-1]:
+            return
+
+        timestamp = max(timestamp, self.times[-1])
+        elapsed = self.elapsed[-1]
+        if self.matched[-1]:
+            elapsed += timestamp - self.times[-1]
+
+        self.times.append(timestamp)
+        self.matched.append(matched)
+        self.elapsed.append(elapsed)
+        self.counts.append(self.counts[-1] + matched)
+
+    def _accumulated(self, timestamp):
+        """Return time matched and times entered up to a point in time."""
+        index = max(bisect_right(self.times, timestamp) - 1, 0)
+        elapsed = self.elapsed[index]
+        if self.matched[index]:
+            elapsed += max(timestamp - self.times[index], 0)
+        return elapsed, self.counts[index]
+
+    def measure(self, start, end):
+        """Return time matched and times entered during a period."""
+        start_elapsed, start_count = self._accumulated(start)
+        end_elapsed, end_count = self._accumulated(end)
+        return end_elapsed - start_elapsed, end_count - start_count
+
+    def forget_before(self, timestamp):
+        """Drop the changes before the one in effect at a point in time."""
+        index = bisect_right(self.times, timestamp) - 1
+        if index > 0:
+            del self.times[:index]
+            del self.matched[:index]
+            del self.elapsed[:index]
+            del self.counts[:index]
+
+
 class HistoryStatsHelper:
     """Static methods to make the HistoryStatsSensor code lighter."""
 
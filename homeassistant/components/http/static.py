@@ -1,10 +1,16 @@
 """Static file handling for HTTP component."""
+import asyncio
+from collections import OrderedDict
+import mimetypes
+import os
 from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
 
 from aiohttp import hdrs
-from aiohttp.web import FileResponse
+from aiohttp.web import FileResponse, Response
 from aiohttp.web_exceptions import HTTPNotFound, HTTPForbidden
 from aiohttp.web_urldispatcher import StaticResource
+import attr
 
 
 # mypy: allow-untyped-defs
@@ -12,40 +18,171 @@ from aiohttp.web_urldispatcher import StaticResource
 CACHE_TIME = 31 * 86400  # = 1 month
 CACHE_HEADERS = {hdrs.CACHE_CONTROL: f"public, max-age={CACHE_TIME}"}
 
+# Precompressed siblings in order of preference
+PRECOMPRESSED = (("br", ".br"), ("gzip", ".gz"))
+# Number of resolved files kept in memory per resource
+MAX_STATIC_FILES = 512
+
+
+@attr.s(slots=True, frozen=True)
+class StaticFile:
+    """Resolved static file with its precompressed variants."""
+
+    content_type: str = attr.ib()
+    # Content-Encoding -> (path, etag); None is the file itself
+    variants: Dict[Optional[str], Tuple[Path, str]] = attr.ib()
+
+    def select(self, accepted: Set[str]) -> Tuple[Optional[str], Path, str]:
+        """Return encoding, path and etag of the best variant for a client."""
+        for encoding, _ in PRECOMPRESSED:
+            if encoding in accepted and encoding in self.variants:
+                return (encoding, *self.variants[encoding])
+        return (None, *self.variants[None])
+
+
+def _etag(path: Path) -> str:
+    """Return a strong ETag for a file."""
+    stat = path.stat()
+    return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+
+def load_static_file(filepath: Path) -> StaticFile:
+    """Stat a file and its precompressed siblings.
+
+    Not async friendly.
+    """
+    content_type, _ = mimetypes.guess_type(str(filepath))
+    variants = {None: (filepath, _etag(filepath))}
+    for encoding, suffix in PRECOMPRESSED:
+        variant = filepath.with_name(filepath.name + suffix)
+        if variant.is_file():
+            variants[encoding] = (variant, _etag(variant))
+    return StaticFile(content_type or "application/octet-stream", variants)
+
+
+def accepted_encodings(request) -> Set[str]:
+    """Return the content codings a client accepts."""
+    accepted = set()
+    for part in request.headers.get(hdrs.ACCEPT_ENCODING, "").split(","):
+        coding, _, params = part.partition(";")
+        params = params.replace(" ", "")
+        if params.startswith("q="):
+            try:
+                if float(params[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """Return if an If-None-Match header matches an ETag."""
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
 
 # https://github.com/PyCQA/astroid/issues/633
 # pylint: disable=duplicate-bases
 class CachingStaticResource(StaticResource):
-    """Static Resource handler that will add cache headers."""
+    """Static Resource handler that will add cache headers.
 
-    async def _handle(self, request):
-        rel_url = request.match_info["filename"]
-        try:
-            filename = Path(rel_url)
-            if filename.anchor:
-                # rel_url is an absolute name like
-                # /static/\\machine_name\c$ or /static/D:\path
-                # where the static dir is totally different
-                raise HTTPForbidden()
-            filepath = self._directory.joinpath(filename).resolve()
-            if not self._follow_symlinks:
-                filepath.relative_to(self._directory)
-        except (ValueError, FileNotFoundError) as error:
-            # relatively safe
-            raise HTTPNotFound() from error
-        except Exception as error:
-            # perm error or other kind!
-            request.app.logger.exception(error)
-            raise HTTPNotFound() from error
+    Resolved paths and file stats of the most recently served files are kept
+    in memory, as files served with a month of cache time are not expected to
+    change while Home Assistant is running.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the static resource."""
+        super().__init__(*args, **kwargs)
+        # Normalized relative path -> file, least recently used first
+        self._static_files: "OrderedDict[str, StaticFile]" = OrderedDict()
+
+    def _resolve(self, rel_url: str) -> Optional[StaticFile]:
+        """Resolve a relative url, returning None for directories.
+
+        Not async friendly.
+        """
+        filename = Path(rel_url)
+        if filename.anchor:
+            # rel_url is an absolute name like
+            # /static/\\machine_name\c$ or /static/D:\path
+            # where the static dir is totally different
+            raise HTTPForbidden()
+        filepath = self._directory.joinpath(filename).resolve()
+        if not self._follow_symlinks:
+            filepath.relative_to(self._directory)
 
         # on opening a dir, load its contents if allowed
         if filepath.is_dir():
-            return await super()._handle(request)
+            return None
         if filepath.is_file():
-            return FileResponse(
-                filepath,
-                chunk_size=self._chunk_size,
-                # type ignore: https://github.com/aio-libs/aiohttp/pull/3976
-                headers=CACHE_HEADERS,  # type: ignore
-            )
+            return load_static_file(filepath)
         raise HTTPNotFound
+
+    async def _handle(self, request):
+        rel_url = request.match_info["filename"]
+        # Spellings of the same path like a//b and a/b share an entry
+        key = os.path.normpath(rel_url)
+        static_file = self._static_files.get(key)
+
+        if static_file is not None:
+            self._static_files.move_to_end(key)
+        else:
+            try:
+                static_file = await asyncio.get_event_loop().run_in_executor(
+                    None, self._resolve, rel_url
+                )
+            except (HTTPForbidden, HTTPNotFound):
+                raise
+            except (ValueError, FileNotFoundError) as error:
+                # relatively safe
+                raise HTTPNotFound() from error
+            except Exception as error:
+                # perm error or other kind!
+                request.app.logger.exception(error)
+                raise HTTPNotFound() from error
+
+            if static_file is None:
+                return await super()._handle(request)
+            self._static_files[key] = static_file
+            if len(self._static_files) > MAX_STATIC_FILES:
+                self._static_files.popitem(last=False)
+
+        encoding, filepath, etag = static_file.select(accepted_encodings(request))
+        headers = {**CACHE_HEADERS, hdrs.ETAG: etag}
+        if len(static_file.variants) > 1:
+            headers[hdrs.VARY] = hdrs.ACCEPT_ENCODING
+
+        if etag_matches(etag, request.headers.get(hdrs.IF_NONE_MATCH)):
+            return Response(status=304, headers=headers)
+
+        if encoding is not None:
+            headers[hdrs.CONTENT_TYPE] = static_file.content_type
+            headers[hdrs.CONTENT_ENCODING] = encoding
+        elif "gzip" in static_file.variants and "gzip" in request.headers.get(
+            hdrs.ACCEPT_ENCODING, ""
+        ):
+            # The client refused gzip, but FileResponse would still swap in
+            # the .gz sibling because the header mentions it
+            headers[hdrs.CONTENT_TYPE] = static_file.content_type
+            body = await asyncio.get_event_loop().run_in_executor(
+                None, filepath.read_bytes
+            )
+            return Response(body=body, headers=headers)
+
+        return FileResponse(
+            filepath,
+            chunk_size=self._chunk_size,
+            # type ignore: https://github.com/aio-libs/aiohttp/pull/3976
+            headers=headers,  # type: ignore
+        )
@@ -29,6 +29,8 @@ from homeassistant.helpers import state as state_helper, event as event_helper
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_values import EntityValues
 
+from .spool import Spool
+
 _LOGGER = logging.getLogger(__name__)
 
 CONF_DB_NAME = "database"
@@ -40,6 +42,7 @@ CONF_COMPONENT_CONFIG = "component_config"
 CONF_COMPONENT_CONFIG_GLOB = "component_config_glob"
 CONF_COMPONENT_CONFIG_DOMAIN = "component_config_domain"
 CONF_RETRY_COUNT = "max_retries"
+CONF_SPOOL_SIZE = "spool_size"
 
 DEFAULT_DATABASE = "home_assistant"
 DEFAULT_VERIFY_SSL = True
@@ -52,6 +55,11 @@ RETRY_INTERVAL = 60  # seconds
 
 BATCH_TIMEOUT = 1
 BATCH_BUFFER_SIZE = 100
+MAX_BATCH_SIZE = 5000
+# Seconds a write may take before batches shrink again
+TARGET_WRITE_TIME = 1
+
+SPOOL_DIR = ".influxdb_spool"
 
 COMPONENT_CONFIG_SCHEMA_ENTRY = vol.Schema(
     {vol.Optional(CONF_OVERRIDE_MEASUREMENT): cv.string}
@@ -85,6 +93,7 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(CONF_PORT): cv.port,
                     vol.Optional(CONF_SSL): cv.boolean,
                     vol.Optional(CONF_RETRY_COUNT, default=0): cv.positive_int,
+                    vol.Optional(CONF_SPOOL_SIZE, default=0): cv.positive_int,
                     vol.Optional(CONF_DEFAULT_MEASUREMENT): cv.string,
                     vol.Optional(CONF_OVERRIDE_MEASUREMENT): cv.string,
                     vol.Optional(CONF_TAGS, default={}): vol.Schema(
@@ -159,21 +168,29 @@ def setup(hass, config):
         conf[CONF_COMPONENT_CONFIG_GLOB],
     )
     max_tries = conf.get(CONF_RETRY_COUNT)
+    spool_size = conf[CONF_SPOOL_SIZE]
 
     try:
         influx = InfluxDBClient(**kwargs)
         influx.write_points([])
     except (exceptions.InfluxDBClientError, requests.exceptions.ConnectionError) as exc:
-        _LOGGER.warning(
-            "Database host is not accessible due to '%s', please "
-            "check your entries in the configuration file (host, "
-            "port, etc.) and verify that the database exists and is "
-            "READ/WRITE. Retrying again in %s seconds.",
-            exc,
-            RETRY_INTERVAL,
-        )
-        event_helper.call_later(hass, RETRY_INTERVAL, lambda _: setup(hass, config))
-        return True
+        if spool_size:
+            _LOGGER.warning(
+                "Database host is not accessible due to '%s', spooling "
+                "events until it is",
+                exc,
+            )
+        else:
+            _LOGGER.warning(
+                "Database host is not accessible due to '%s', please "
+                "check your entries in the configuration file (host, "
+                "port, etc.) and verify that the database exists and is "
+                "READ/WRITE. Retrying again in %s seconds.",
+                exc,
+                RETRY_INTERVAL,
+            )
+            event_helper.call_later(hass, RETRY_INTERVAL, lambda _: setup(hass, config))
+            return True
 
     def event_to_json(event):
         """Add an event to the outgoing Influx list."""
@@ -265,7 +282,13 @@ def setup(hass, config):
 
         return json
 
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    spool = None
+    if spool_size:
+        spool = Spool(hass.config.path(SPOOL_DIR), spool_size * 1024 * 1024)
+
+    instance = hass.data[DOMAIN] = InfluxThread(
+        hass, influx, event_to_json, max_tries, spool
+    )
     instance.start()
 
     def shutdown(event):
@@ -280,19 +303,48 @@ def setup(hass, config):
 
 
 class InfluxThread(threading.Thread):
-    """A threaded event handler class."""
+    """A threaded event handler class.
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    Batches grow up to MAX_BATCH_SIZE points while writes stay fast, so a
+    backlog is written in few requests. With a spool, points that could not
+    be written are kept on disk and written again once the database is back.
+    """
+
+    def __init__(self, hass, influx, event_to_json, max_tries, spool=None):
         """Initialize the listener."""
         threading.Thread.__init__(self, name="InfluxDB")
         self.queue = queue.Queue()
         self.influx = influx
         self.event_to_json = event_to_json
         self.max_tries = max_tries
+        self.spool = spool
+        self.batch_size = BATCH_BUFFER_SIZE
         self.write_errors = 0
+        self.written = 0
+        self.rejected = 0
+        self.catch_up_rate = None
         self.shutdown = False
+        self._retry_at = 0
+        self._catch_up_start = None
+        self._catch_up_points = 0
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
 
+    @property
+    def stats(self):
+        """Return write and catch-up counters."""
+        stats = {
+            "queued": self.queue.qsize(),
+            "written": self.written,
+            "rejected": self.rejected,
+            "batch_size": self.batch_size,
+            "catch_up_rate": self.catch_up_rate,
+        }
+        if self.spool is not None:
+            stats["spooled"] = self.spool.pending
+            stats["spool_size"] = self.spool.size
+            stats["spool_dropped"] = self.spool.dropped
+        return stats
+
     def _event_listener(self, event):
         """Listen for new messages on the bus and queue them for Influx."""
         item = (time.monotonic(), event)
@@ -303,6 +355,12 @@ class InfluxThread(threading.Thread):
         """Return number of seconds to wait for more events."""
         return BATCH_TIMEOUT
 
+    def _first_timeout(self):
+        """Return how long to wait for the first event of a batch."""
+        if self.spool is None or not self.spool.pending:
+            return None
+        return max(self._retry_at - time.monotonic(), 0)
+
     def get_events_json(self):
         """Return a batch of events formatted for writing."""
         queue_seconds = QUEUE_BACKLOG_SECONDS + self.max_tries * RETRY_DELAY
@@ -313,8 +371,8 @@ class InfluxThread(threading.Thread):
         dropped = 0
 
         try:
-            while len(json) < BATCH_BUFFER_SIZE and not self.shutdown:
-                timeout = None if count == 0 else self.batch_timeout()
+            while len(json) < self.batch_size and not self.shutdown:
+                timeout = self._first_timeout() if count == 0 else self.batch_timeout()
                 item = self.queue.get(timeout=timeout)
                 count += 1
 
@@ -324,7 +382,8 @@ class InfluxThread(threading.Thread):
                     timestamp, event = item
                     age = time.monotonic() - timestamp
 
-                    if age < queue_seconds:
+                    # Events are never too old when they can be spooled
+                    if age < queue_seconds or self.spool is not None:
                         event_json = self.event_to_json(event)
                         if event_json:
                             json.append(event_json)
@@ -339,40 +398,126 @@ class InfluxThread(threading.Thread):
 
         return count, json
 
+    def _adapt_batch_size(self, points, duration):
+        """Grow full batches while writes are fast, shrink them when slow."""
+        if duration > 2 * TARGET_WRITE_TIME:
+            self.batch_size = max(self.batch_size // 2, BATCH_BUFFER_SIZE)
+        elif points >= self.batch_size and duration < TARGET_WRITE_TIME:
+            self.batch_size = min(self.batch_size * 2, MAX_BATCH_SIZE)
+
+    def _reject(self, points, err):
+        """Drop points the database refused, writing them again won't help."""
+        _LOGGER.error("Database rejected %d events: %s", len(points), err)
+        self.rejected += len(points)
+
     def write_to_influxdb(self, json):
-        """Write preprocessed events to influxdb, with retry."""
+        """Write preprocessed events to influxdb, with retry.
+
+        Return False if the events could not be written now but may be later.
+        """
         from influxdb import exceptions
 
         for retry in range(self.max_tries + 1):
             try:
+                start = time.monotonic()
                 self.influx.write_points(json)
+                self._adapt_batch_size(len(json), time.monotonic() - start)
 
                 if self.write_errors:
                     _LOGGER.error("Resumed, lost %d events", self.write_errors)
                     self.write_errors = 0
 
+                self.written += len(json)
                 _LOGGER.debug("Wrote %d events", len(json))
-                break
+                return True
             except (
                 exceptions.InfluxDBClientError,
                 exceptions.InfluxDBServerError,
                 IOError,
             ) as err:
+                if self.spool is not None and isinstance(
+                    err, exceptions.InfluxDBClientError
+                ):
+                    # Spooled events the database refuses would block the spool
+                    self._reject(json, err)
+                    return True
                 if retry < self.max_tries:
                     time.sleep(RETRY_DELAY)
+                elif self.spool is not None:
+                    _LOGGER.error("Write error: %s, spooling events to disk", err)
                 else:
                     if not self.write_errors:
                         _LOGGER.error("Write error: %s", err)
                     self.write_errors += len(json)
 
+        self.batch_size = BATCH_BUFFER_SIZE
+        return False
+
+    def spool_events(self, json):
+        """Append events to the spool and delay the next write attempt."""
+        self.spool.append(json)
+        self._retry_at = time.monotonic() + RETRY_DELAY
+
+    def write_spooled(self):
+        """Write a batch of spooled points."""
+        from influxdb import exceptions
+
+        if self._catch_up_start is None:
+            self._catch_up_start = time.monotonic()
+            self._catch_up_points = 0
+
+        points = self.spool.read(self.batch_size)
+        start = time.monotonic()
+        try:
+            if points:
+                self.influx.write_points(points)
+        except exceptions.InfluxDBClientError as err:
+            # Commit past the batch so it does not block the rest of the spool
+            self._reject(points, err)
+            points = []
+        except (exceptions.InfluxDBServerError, IOError) as err:
+            _LOGGER.debug("Unable to write spooled points: %s", err)
+            self.batch_size = BATCH_BUFFER_SIZE
+            self._retry_at = time.monotonic() + RETRY_DELAY
+            return
+        else:
+            self._adapt_batch_size(len(points), time.monotonic() - start)
+
+        self.spool.commit()
+        self.written += len(points)
+        self._catch_up_points += len(points)
+
+        if not self.spool.pending:
+            elapsed = max(time.monotonic() - self._catch_up_start, 0.001)
+            self.catch_up_rate = round(self._catch_up_points / elapsed, 1)
+            _LOGGER.info(
+                "Wrote %d spooled points in %.1f seconds (%s points/s)",
+                self._catch_up_points,
+                elapsed,
+                self.catch_up_rate,
+            )
+            self._catch_up_start = None
+
     def run(self):
         """Process incoming events."""
         while not self.shutdown:
             count, json = self.get_events_json()
             if json:
-                self.write_to_influxdb(json)
+                if self.spool is not None and self.spool.pending:
+                    # Keep points in order behind the spooled ones
+                    self.spool_events(json)
+                elif not self.write_to_influxdb(json) and self.spool is not None:
+                    self.spool_events(json)
+            if (
+                self.spool is not None
+                and self.spool.pending
+                and time.monotonic() >= self._retry_at
+            ):
+                self.write_spooled()
             for _ in range(count):
                 self.queue.task_done()
+        if self.spool is not None:
+            self.spool.close()
 
     def block_till_done(self):
         """Block till all events processed."""
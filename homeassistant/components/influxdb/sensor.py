@@ -1,7 +1,10 @@
 """InfluxDB component which allows you to get data from an Influx database."""
 from datetime import timedelta
 import logging
+import threading
+import time
 
+import requests.exceptions
 import voluptuous as vol
 
 from homeassistant.components.sensor import PLATFORM_SCHEMA
@@ -20,7 +23,6 @@ from homeassistant.const import (
 from homeassistant.exceptions import TemplateError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import Entity
-from homeassistant.util import Throttle
 
 from . import CONF_DB_NAME
 
@@ -42,6 +44,8 @@ CONF_WHERE = "where"
 
 MIN_TIME_BETWEEN_UPDATES = timedelta(seconds=60)
 
+DATA_INFLUX_CLIENTS = "influxdb_sensor_clients"
+
 _QUERY_SCHEME = vol.Schema(
     {
         vol.Required(CONF_NAME): cv.string,
@@ -80,22 +84,59 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
     }
 
     dev = []
+    groups = {}
 
     for query in config.get(CONF_QUERIES):
-        sensor = InfluxSensor(hass, influx_conf, query)
-        if sensor.connected:
-            dev.append(sensor)
+        database = query.get(CONF_DB_NAME)
+        if database not in groups:
+            influx = get_client(hass, influx_conf, database)
+            groups[database] = InfluxQueryGroup(influx) if influx else None
+
+        if groups[database] is not None:
+            dev.append(InfluxSensor(hass, groups[database], query))
 
     add_entities(dev, True)
 
 
+def get_client(hass, influx_conf, database):
+    """Return the client shared by all sensors of a server and database."""
+    from influxdb import InfluxDBClient, exceptions
+
+    clients = hass.data.setdefault(DATA_INFLUX_CLIENTS, {})
+    key = (database,) + tuple(sorted(influx_conf.items()))
+    influx = clients.get(key)
+    if influx is not None:
+        return influx
+
+    influx = InfluxDBClient(
+        host=influx_conf["host"],
+        port=influx_conf["port"],
+        username=influx_conf["username"],
+        password=influx_conf["password"],
+        database=database,
+        ssl=influx_conf["ssl"],
+        verify_ssl=influx_conf["verify_ssl"],
+    )
+    try:
+        influx.query("SHOW SERIES LIMIT 1;")
+    except exceptions.InfluxDBClientError as exc:
+        _LOGGER.error(
+            "Database host is not accessible due to '%s', please"
+            " check your entries in the configuration file and"
+            " that the database exists and is READ/WRITE",
+            exc,
+        )
+        return None
+
+    clients[key] = influx
+    return influx
+
+
 class InfluxSensor(Entity):
     """Implementation of a Influxdb sensor."""
 
-    def __init__(self, hass, influx_conf, query):
+    def __init__(self, hass, query_group, query):
         """Initialize the sensor."""
-        from influxdb import InfluxDBClient, exceptions
-
         self._name = query.get(CONF_NAME)
         self._unit_of_measurement = query.get(CONF_UNIT_OF_MEASUREMENT)
         value_template = query.get(CONF_VALUE_TEMPLATE)
@@ -104,40 +145,19 @@ class InfluxSensor(Entity):
             self._value_template.hass = hass
         else:
             self._value_template = None
-        database = query.get(CONF_DB_NAME)
         self._state = None
         self._hass = hass
 
         where_clause = query.get(CONF_WHERE)
         where_clause.hass = hass
 
-        influx = InfluxDBClient(
-            host=influx_conf["host"],
-            port=influx_conf["port"],
-            username=influx_conf["username"],
-            password=influx_conf["password"],
-            database=database,
-            ssl=influx_conf["ssl"],
-            verify_ssl=influx_conf["verify_ssl"],
+        self.data = InfluxSensorData(
+            query_group,
+            query.get(CONF_GROUP_FUNCTION),
+            query.get(CONF_FIELD),
+            query.get(CONF_MEASUREMENT_NAME),
+            where_clause,
         )
-        try:
-            influx.query("SHOW SERIES LIMIT 1;")
-            self.connected = True
-            self.data = InfluxSensorData(
-                influx,
-                query.get(CONF_GROUP_FUNCTION),
-                query.get(CONF_FIELD),
-                query.get(CONF_MEASUREMENT_NAME),
-                where_clause,
-            )
-        except exceptions.InfluxDBClientError as exc:
-            _LOGGER.error(
-                "Database host is not accessible due to '%s', please"
-                " check your entries in the configuration file and"
-                " that the database exists and is READ/WRITE",
-                exc,
-            )
-            self.connected = False
 
     @property
     def name(self):
@@ -173,36 +193,111 @@ class InfluxSensor(Entity):
         self._state = value
 
 
+class InfluxQueryGroup:
+    """Run the queries of the sensors sharing a client in a single request.
+
+    InfluxDB accepts several statements separated by semicolons and returns a
+    result per statement. The first sensor to update in an interval runs the
+    queries of all sensors, the others pick up the result waiting for them.
+    """
+
+    def __init__(self, influx):
+        """Initialize the query group."""
+        self.influx = influx
+        self.members = []
+        self.requests = 0
+        self._results = {}
+        self._last_run = None
+        self._lock = threading.Lock()
+
+    def add(self, data):
+        """Add the data object of a sensor to the group."""
+        self.members.append(data)
+
+    def update(self, data):
+        """Pass its result to a data object, querying if none is waiting."""
+        with self._lock:
+            if data not in self._results and not self._throttled():
+                self._run()
+            result = self._results.pop(data, None)
+
+        if result is not None:
+            data.set_result(result)
+
+    def _throttled(self):
+        """Return if the queries ran less than the minimum time ago."""
+        return (
+            self._last_run is not None
+            and time.monotonic() - self._last_run
+            < MIN_TIME_BETWEEN_UPDATES.total_seconds()
+        )
+
+    def _run(self):
+        """Run the queries of all members."""
+        from influxdb import exceptions
+
+        members = [data for data in self.members if data.render_query()]
+        if not members:
+            return
+
+        statements = ";".join(data.query for data in members)
+        _LOGGER.info("Running queries: %s", statements)
+        self._last_run = time.monotonic()
+        self.requests += 1
+        try:
+            results = self.influx.query(statements, raise_errors=False)
+        except (
+            exceptions.InfluxDBClientError,
+            exceptions.InfluxDBServerError,
+            requests.exceptions.RequestException,
+        ) as exc:
+            _LOGGER.error("Could not run queries: %s", exc)
+            return
+
+        if not isinstance(results, list):
+            results = [results]
+        self._results = dict(zip(members, results))
+
+
 class InfluxSensorData:
     """Class for handling the data retrieval."""
 
-    def __init__(self, influx, group, field, measurement, where):
+    def __init__(self, query_group, group, field, measurement, where):
         """Initialize the data object."""
-        self.influx = influx
+        self.query_group = query_group
         self.group = group
         self.field = field
         self.measurement = measurement
         self.where = where
         self.value = None
         self.query = None
+        query_group.add(self)
 
-    @Throttle(MIN_TIME_BETWEEN_UPDATES)
     def update(self):
-        """Get the latest data with a shell command."""
+        """Get the latest data from the query group."""
+        self.query_group.update(self)
+
+    def render_query(self):
+        """Render the where clause and return the query."""
         _LOGGER.info("Rendering where: %s", self.where)
         try:
             where_clause = self.where.render()
         except TemplateError as ex:
             _LOGGER.error("Could not render where clause template: %s", ex)
-            return
+            return None
 
         self.query = "select {}({}) as value from {} where {}".format(
             self.group, self.field, self.measurement, where_clause
         )
+        return self.query
 
-        _LOGGER.info("Running query: %s", self.query)
+    def set_result(self, result):
+        """Set the value from the result of the query."""
+        if result.error is not None:
+            _LOGGER.error("Query failed: %s: %s", self.query, result.error)
+            return
 
-        points = list(self.influx.query(self.query).get_points())
+        points = list(result.get_points())
         if not points:
             _LOGGER.warning(
                 "Query returned no points, sensor state set " "to UNKNOWN: %s",
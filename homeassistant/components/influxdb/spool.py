@@ -0,0 +1,174 @@
+"""On-disk spool for InfluxDB points that could not be written."""
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import attr
+
+from homeassistant.helpers.json import JSONEncoder
+
+_LOGGER = logging.getLogger(__name__)
+
+SEGMENT_SUFFIX = ".seg"
+DEFAULT_SEGMENT_SIZE = 4 * 1024 * 1024
+
+
+@attr.s(slots=True)
+class Segment:
+    """A spool file with the size and number of points it holds."""
+
+    seq: int = attr.ib()
+    path: str = attr.ib()
+    size: int = attr.ib(default=0)
+    count: int = attr.ib(default=0)
+
+
+class Spool:
+    """Append-only segment files of points, one JSON document per line.
+
+    Segments are deleted once all of their points are written and the oldest
+    segments are dropped when the spool grows beyond max_size bytes. After a
+    restart the points of a partially written segment are written again,
+    which InfluxDB treats as overwrites of the same points.
+
+    Not thread safe, it is only used from the InfluxDB thread.
+    """
+
+    def __init__(
+        self, directory: str, max_size: int, segment_size: int = DEFAULT_SEGMENT_SIZE
+    ) -> None:
+        """Initialize the spool and load existing segments."""
+        self.directory = directory
+        self.max_size = max_size
+        self.segment_size = min(segment_size, max(max_size // 4, 1))
+        self.dropped = 0
+        self._segments: List[Segment] = []
+        self._writer = None
+        self._read_offset = 0
+        self._cursor: Optional[Tuple[Segment, int, int]] = None
+        self._load()
+
+    @property
+    def pending(self) -> int:
+        """Return the number of spooled points."""
+        return sum(segment.count for segment in self._segments)
+
+    @property
+    def size(self) -> int:
+        """Return the size of the spool in bytes."""
+        return sum(segment.size for segment in self._segments)
+
+    def _load(self) -> None:
+        """Load the segments left by a previous run."""
+        os.makedirs(self.directory, exist_ok=True)
+        for name in sorted(os.listdir(self.directory)):
+            if not name.endswith(SEGMENT_SUFFIX):
+                continue
+            try:
+                seq = int(name[: -len(SEGMENT_SUFFIX)])
+            except ValueError:
+                continue
+            path = os.path.join(self.directory, name)
+            with open(path, "rb") as fil:
+                count = sum(1 for _ in fil)
+            self._segments.append(Segment(seq, path, os.path.getsize(path), count))
+
+        if self._segments:
+            _LOGGER.info("Loaded %d spooled points", self.pending)
+
+    def _open_segment(self) -> None:
+        """Start a new segment for appending."""
+        self._close_writer()
+        seq = self._segments[-1].seq + 1 if self._segments else 0
+        path = os.path.join(self.directory, f"{seq:010d}{SEGMENT_SUFFIX}")
+        self._writer = open(path, "ab")
+        self._segments.append(Segment(seq, path))
+
+    def _close_writer(self) -> None:
+        """Close the segment being appended to."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def _remove_oldest(self) -> Segment:
+        """Delete the oldest segment."""
+        segment = self._segments.pop(0)
+        if not self._segments:
+            self._close_writer()
+        self._read_offset = 0
+        try:
+            os.remove(segment.path)
+        except OSError as err:
+            _LOGGER.warning("Unable to remove %s: %s", segment.path, err)
+        return segment
+
+    def append(self, points: List[Dict[str, Any]]) -> None:
+        """Append points, dropping the oldest segments if over the size bound."""
+        if self._writer is None or self._segments[-1].size >= self.segment_size:
+            self._open_segment()
+
+        data = "".join(
+            json.dumps(point, cls=JSONEncoder) + "\n" for point in points
+        ).encode()
+        self._writer.write(data)
+        self._writer.flush()
+
+        segment = self._segments[-1]
+        segment.size += len(data)
+        segment.count += len(points)
+
+        while self.size > self.max_size and len(self._segments) > 1:
+            segment = self._remove_oldest()
+            self.dropped += segment.count
+            _LOGGER.warning("Spool is full, dropped %d points", segment.count)
+
+    def read(self, max_points: int) -> List[Dict[str, Any]]:
+        """Return up to max_points of the oldest points.
+
+        The points stay in the spool until commit is called.
+        """
+        if not self._segments:
+            return []
+
+        segment = self._segments[0]
+        points = []
+        lines = 0
+        offset = self._read_offset
+
+        with open(segment.path, "rb") as fil:
+            fil.seek(offset)
+            for line in fil:
+                offset += len(line)
+                lines += 1
+                try:
+                    points.append(json.loads(line))
+                except ValueError:
+                    _LOGGER.warning("Skipping corrupt point in %s", segment.path)
+                if len(points) >= max_points:
+                    break
+
+        self._cursor = (segment, offset, lines)
+        return points
+
+    def commit(self) -> None:
+        """Remove the points returned by the last read."""
+        if self._cursor is None:
+            return
+
+        segment, offset, lines = self._cursor
+        self._cursor = None
+        if not self._segments or self._segments[0] is not segment:
+            return
+
+        segment.count -= lines
+        if offset >= segment.size:
+            if self._segments[-1] is segment:
+                self._close_writer()
+            self._remove_oldest()
+        else:
+            self._read_offset = offset
+
+    def close(self) -> None:
+        """Close the open segment."""
+        self._close_writer()
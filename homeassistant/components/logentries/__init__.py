@@ -6,8 +6,10 @@ import requests
 import voluptuous as vol
 
 import homeassistant.helpers.config_validation as cv
-from homeassistant.const import CONF_TOKEN, EVENT_STATE_CHANGED
+from homeassistant.const import CONF_TOKEN
 from homeassistant.helpers import state as state_helper
+from homeassistant.helpers.exporter import BatchingExporter, ExportError, Transport
+from homeassistant.helpers.json import JSONEncoder
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,17 +22,40 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 
+class LogentriesTransport(Transport):
+    """Post log lines to the Logentries webhook."""
+
+    def __init__(self, webhook):
+        """Initialize the transport."""
+        self._webhook = webhook
+        self._session = requests.Session()
+
+    def send(self, batch):
+        """Post a batch of log lines in a single request."""
+        try:
+            response = self._session.post(
+                self._webhook, data="\n".join(batch), timeout=10
+            )
+            response.raise_for_status()
+        except requests.exceptions.RequestException as error:
+            raise ExportError(f"Error sending to Logentries: {error}") from error
+
+    def close(self):
+        """Close the connections of the session."""
+        self._session.close()
+
+
 def setup(hass, config):
     """Set up the Logentries component."""
     conf = config[DOMAIN]
     token = conf.get(CONF_TOKEN)
     le_wh = f"{DEFAULT_HOST}{token}"
 
-    def logentries_event_listener(event):
-        """Listen for new messages on the bus and sends them to Logentries."""
+    def logentries_event_encoder(event):
+        """Encode a state change as a log line."""
         state = event.data.get("new_state")
         if state is None:
-            return
+            return None
         try:
             _state = state_helper.state_as_number(state)
         except ValueError:
@@ -44,12 +69,12 @@ def setup(hass, config):
                 "value": _state,
             }
         ]
-        try:
-            payload = {"host": le_wh, "event": json_body}
-            requests.post(le_wh, data=json.dumps(payload), timeout=10)
-        except requests.exceptions.RequestException as error:
-            _LOGGER.exception("Error sending to Logentries: %s", error)
+        payload = {"host": le_wh, "event": json_body}
+        return [json.dumps(payload, cls=JSONEncoder)]
 
-    hass.bus.listen(EVENT_STATE_CHANGED, logentries_event_listener)
+    exporter = BatchingExporter(
+        hass, "Logentries", logentries_event_encoder, LogentriesTransport(le_wh)
+    )
+    exporter.start()
 
     return True
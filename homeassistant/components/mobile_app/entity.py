@@ -42,7 +42,7 @@ class MobileAppEntity(Entity):
     async def async_added_to_hass(self):
         """Register callbacks."""
         self.unsub_dispatcher = async_dispatcher_connect(
-            self.hass, SIGNAL_SENSOR_UPDATE, self._handle_update
+            self.hass, (SIGNAL_SENSOR_UPDATE, self._sensor_id), self._handle_update
         )
 
     async def async_will_remove_from_hass(self):
@@ -96,9 +96,5 @@ class MobileAppEntity(Entity):
     @callback
     def _handle_update(self, data):
         """Handle async event updates."""
-        incoming_id = sensor_id(data[CONF_WEBHOOK_ID], data[ATTR_SENSOR_UNIQUE_ID])
-        if incoming_id != self._sensor_id:
-            return
-
         self._config = data
         self.async_schedule_update_ha_state()
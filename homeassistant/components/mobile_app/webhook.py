@@ -18,7 +18,10 @@ from homeassistant.const import (
 from homeassistant.core import EventOrigin
 from homeassistant.exceptions import HomeAssistantError, ServiceNotFound, TemplateError
 from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_send,
+    async_dispatcher_send_many,
+)
 from homeassistant.helpers.template import attach
 from homeassistant.helpers.typing import HomeAssistantType
 
@@ -248,6 +251,7 @@ async def handle_webhook(
 
     if webhook_type == WEBHOOK_TYPE_UPDATE_SENSOR_STATES:
         resp = {}
+        updates = []
         for sensor in data:
             entity_type = sensor[ATTR_SENSOR_TYPE]
 
@@ -272,6 +276,11 @@ async def handle_webhook(
 
             hass.data[DOMAIN][entity_type][unique_store_key] = new_state
 
+            updates.append(((SIGNAL_SENSOR_UPDATE, unique_store_key), (new_state,)))
+
+            resp[unique_id] = {"success": True}
+
+        if updates:
             safe = savable_state(hass)
 
             try:
@@ -280,9 +289,7 @@ async def handle_webhook(
                 _LOGGER.error("Error updating mobile_app registration: %s", ex)
                 return empty_okay_response()
 
-            async_dispatcher_send(hass, SIGNAL_SENSOR_UPDATE, new_state)
-
-            resp[unique_id] = {"success": True}
+            async_dispatcher_send_many(hass, updates)
 
         return webhook_response(resp, registration=registration, headers=headers)
 
@@ -65,8 +65,6 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass, config):
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(prometheus_client))
-
     conf = config[DOMAIN]
     entity_filter = conf[CONF_FILTER]
     namespace = conf.get(CONF_PROM_NAMESPACE)
@@ -89,12 +87,17 @@ def setup(hass, config):
         default_metric,
     )
 
+    hass.http.register_view(PrometheusView(prometheus_client, metrics))
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_event)
     return True
 
 
 class PrometheusMetrics:
-    """Model all of the metrics which should be exposed to Prometheus."""
+    """Model all of the metrics which should be exposed to Prometheus.
+
+    The metrics live in their own registry. The exposition of each metric
+    family is cached and only rendered again after one of its series changed.
+    """
 
     def __init__(
         self,
@@ -126,11 +129,18 @@ class PrometheusMetrics:
             self.metrics_prefix = ""
         self._metrics = {}
         self._climate_units = climate_units
+        self.registry = prometheus_cli.CollectorRegistry(auto_describe=True)
+        # entity_id -> {metric: label values}
+        self._entity_series = {}
+        self._rendered = {}
+        self._dirty = set()
 
+    @hacore.callback
     def handle_event(self, event):
         """Listen for new messages on the bus, and add them to Prometheus."""
         state = event.data.get("new_state")
         if state is None:
+            self._remove_entity(event.data["entity_id"])
             return
 
         entity_id = state.entity_id
@@ -148,7 +158,7 @@ class PrometheusMetrics:
         metric = self._metric(
             "state_change", self.prometheus_cli.Counter, "The number of state changes"
         )
-        metric.labels(**self._labels(state)).inc()
+        self._series(metric, state).inc()
 
     def _metric(self, metric, factory, documentation, labels=None):
         if labels is None:
@@ -160,9 +170,42 @@ class PrometheusMetrics:
             full_metric_name = self._sanitize_metric_name(
                 f"{self.metrics_prefix}{metric}"
             )
-            self._metrics[metric] = factory(full_metric_name, documentation, labels)
+            self._metrics[metric] = factory(
+                full_metric_name, documentation, labels, registry=self.registry
+            )
             return self._metrics[metric]
 
+    def _series(self, metric, state):
+        """Return the series of an entity, replacing it if its labels changed."""
+        labels = self._labels(state)
+        label_values = (
+            str(labels["entity"]),
+            str(labels["friendly_name"]),
+            str(labels["domain"]),
+        )
+        series = self._entity_series.setdefault(state.entity_id, {})
+        old_values = series.get(metric)
+        if old_values is not None and old_values != label_values:
+            metric.remove(*old_values)
+        series[metric] = label_values
+        self._dirty.add(metric)
+        return metric.labels(*label_values)
+
+    def _remove_entity(self, entity_id):
+        """Drop all series of a removed entity."""
+        for metric, label_values in self._entity_series.pop(entity_id, {}).items():
+            metric.remove(*label_values)
+            self._dirty.add(metric)
+
+    @hacore.callback
+    def render(self):
+        """Return the exposition of the metrics, rendering changed families."""
+        for key, metric in self._metrics.items():
+            if metric in self._dirty or key not in self._rendered:
+                self._rendered[key] = self.prometheus_cli.generate_latest(metric)
+        self._dirty.clear()
+        return b"".join(self._rendered[key] for key in self._metrics)
+
     @staticmethod
     def _sanitize_metric_name(metric: str) -> str:
         return "".join(
@@ -201,7 +244,7 @@ class PrometheusMetrics:
             )
             try:
                 value = float(state.attributes["battery_level"])
-                metric.labels(**self._labels(state)).set(value)
+                self._series(metric, state).set(value)
             except ValueError:
                 pass
 
@@ -212,7 +255,7 @@ class PrometheusMetrics:
             "State of the binary sensor (0/1)",
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        self._series(metric, state).set(value)
 
     def _handle_input_boolean(self, state):
         metric = self._metric(
@@ -221,7 +264,7 @@ class PrometheusMetrics:
             "State of the input boolean (0/1)",
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        self._series(metric, state).set(value)
 
     def _handle_device_tracker(self, state):
         metric = self._metric(
@@ -230,14 +273,14 @@ class PrometheusMetrics:
             "State of the device tracker (0/1)",
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        self._series(metric, state).set(value)
 
     def _handle_person(self, state):
         metric = self._metric(
             "person_state", self.prometheus_cli.Gauge, "State of the person (0/1)"
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        self._series(metric, state).set(value)
 
     def _handle_light(self, state):
         metric = self._metric(
@@ -250,7 +293,7 @@ class PrometheusMetrics:
             else:
                 value = self.state_as_number(state)
             value = value * 100
-            metric.labels(**self._labels(state)).set(value)
+            self._series(metric, state).set(value)
         except ValueError:
             pass
 
@@ -259,7 +302,7 @@ class PrometheusMetrics:
             "lock_state", self.prometheus_cli.Gauge, "State of the lock (0/1)"
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        self._series(metric, state).set(value)
 
     def _handle_climate(self, state):
         temp = state.attributes.get(ATTR_TEMPERATURE)
@@ -271,7 +314,7 @@ class PrometheusMetrics:
                 self.prometheus_cli.Gauge,
                 "Temperature in degrees Celsius",
             )
-            metric.labels(**self._labels(state)).set(temp)
+            self._series(metric, state).set(temp)
 
         current_temp = state.attributes.get(ATTR_CURRENT_TEMPERATURE)
         if current_temp:
@@ -282,14 +325,14 @@ class PrometheusMetrics:
                 self.prometheus_cli.Gauge,
                 "Current Temperature in degrees Celsius",
             )
-            metric.labels(**self._labels(state)).set(current_temp)
+            self._series(metric, state).set(current_temp)
 
         metric = self._metric(
             "climate_state", self.prometheus_cli.Gauge, "State of the thermostat (0/1)"
         )
         try:
             value = self.state_as_number(state)
-            metric.labels(**self._labels(state)).set(value)
+            self._series(metric, state).set(value)
         except ValueError:
             pass
 
@@ -310,7 +353,7 @@ class PrometheusMetrics:
                 value = self.state_as_number(state)
                 if unit == TEMP_FAHRENHEIT:
                     value = fahrenheit_to_celsius(value)
-                _metric.labels(**self._labels(state)).set(value)
+                self._series(_metric, state).set(value)
             except ValueError:
                 pass
 
@@ -368,7 +411,7 @@ class PrometheusMetrics:
 
         try:
             value = self.state_as_number(state)
-            metric.labels(**self._labels(state)).set(value)
+            self._series(metric, state).set(value)
         except ValueError:
             pass
 
@@ -382,7 +425,7 @@ class PrometheusMetrics:
             "Count of times an automation has been triggered",
         )
 
-        metric.labels(**self._labels(state)).inc()
+        self._series(metric, state).inc()
 
 
 class PrometheusView(HomeAssistantView):
@@ -391,15 +434,18 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, prometheus_cli):
+    def __init__(self, prometheus_cli, metrics):
         """Initialize Prometheus view."""
         self.prometheus_cli = prometheus_cli
+        self.metrics = metrics
 
     async def get(self, request):
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
 
-        return web.Response(
-            body=self.prometheus_cli.generate_latest(),
+        response = web.Response(
+            body=self.prometheus_cli.generate_latest() + self.metrics.render(),
             content_type=CONTENT_TYPE_TEXT_PLAIN,
         )
+        response.enable_compression()
+        return response
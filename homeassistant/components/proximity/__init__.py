@@ -1,4 +1,5 @@
 """Support for tracking the proximity of a device."""
+from functools import lru_cache
 import logging
 
 import voluptuous as vol
@@ -8,7 +9,7 @@ import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.event import track_state_change
 from homeassistant.util.distance import convert
-from homeassistant.util.location import distance
+from homeassistant.util.location import distance as location_distance
 
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -31,6 +32,10 @@ DOMAIN = "proximity"
 
 UNITS = ["km", "m", "mi", "ft"]
 
+# Distances of devices that did not move since the last update are reused
+DISTANCE_CACHE_SIZE = 256
+distance = lru_cache(maxsize=DISTANCE_CACHE_SIZE)(location_distance)
+
 ZONE_SCHEMA = vol.Schema(
     {
         vol.Optional(CONF_ZONE, default=DEFAULT_PROXIMITY_ZONE): cv.string,
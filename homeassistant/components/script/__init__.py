@@ -4,6 +4,7 @@ import logging
 
 import voluptuous as vol
 
+from homeassistant.components import websocket_api
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     SERVICE_TURN_OFF,
@@ -15,6 +16,7 @@ from homeassistant.const import (
     EVENT_SCRIPT_STARTED,
     ATTR_NAME,
 )
+from homeassistant.core import callback
 from homeassistant.loader import bind_hass
 from homeassistant.helpers.entity import ToggleEntity
 from homeassistant.helpers.entity_component import EntityComponent
@@ -74,7 +76,7 @@ def is_on(hass, entity_id):
 
 async def async_setup(hass, config):
     """Load the scripts from the configuration."""
-    component = EntityComponent(
+    component = hass.data[DOMAIN] = EntityComponent(
         _LOGGER, DOMAIN, hass, group_name=GROUP_NAME_ALL_SCRIPTS
     )
 
@@ -126,9 +128,28 @@ async def async_setup(hass, config):
         DOMAIN, SERVICE_TOGGLE, toggle_service, schema=SCRIPT_TURN_ONOFF_SCHEMA
     )
 
+    hass.components.websocket_api.async_register_command(websocket_metrics)
+
     return True
 
 
+@callback
+@websocket_api.websocket_command({vol.Required("type"): "script/metrics"})
+def websocket_metrics(hass, connection, msg):
+    """Return the execution metrics of all scripts."""
+    connection.send_result(
+        msg["id"],
+        [
+            {
+                "entity_id": entity.entity_id,
+                "name": entity.name,
+                **entity.script.async_metrics(),
+            }
+            for entity in hass.data[DOMAIN].entities
+        ],
+    )
+
+
 async def _async_process_config(hass, config, component):
     """Process script configuration."""
 
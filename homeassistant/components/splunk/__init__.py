@@ -13,11 +13,11 @@ from homeassistant.const import (
     CONF_NAME,
     CONF_PORT,
     CONF_TOKEN,
-    EVENT_STATE_CHANGED,
 )
 from homeassistant.helpers import state as state_helper
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import FILTER_SCHEMA
+from homeassistant.helpers.exporter import BatchingExporter, ExportError, Transport
 from homeassistant.helpers.json import JSONEncoder
 
 _LOGGER = logging.getLogger(__name__)
@@ -48,20 +48,32 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 
-def post_request(event_collector, body, headers, verify_ssl):
-    """Post request to Splunk."""
-    try:
-        payload = {"host": event_collector, "event": body}
-        requests.post(
-            event_collector,
-            data=json.dumps(payload, cls=JSONEncoder),
-            headers=headers,
-            timeout=10,
-            verify=verify_ssl,
-        )
+class SplunkTransport(Transport):
+    """Send events to the Splunk HTTP event collector."""
+
+    def __init__(self, event_collector, headers, verify_ssl):
+        """Initialize the transport."""
+        self._event_collector = event_collector
+        self._verify_ssl = verify_ssl
+        self._session = requests.Session()
+        self._session.headers.update(headers)
+
+    def send(self, batch):
+        """Post a batch of events in a single request."""
+        try:
+            response = self._session.post(
+                self._event_collector,
+                data="\n".join(batch),
+                timeout=10,
+                verify=self._verify_ssl,
+            )
+            response.raise_for_status()
+        except requests.exceptions.RequestException as error:
+            raise ExportError(f"Error saving events to Splunk: {error}") from error
 
-    except requests.exceptions.RequestException as error:
-        _LOGGER.exception("Error saving event to Splunk: %s", error)
+    def close(self):
+        """Close the connections of the session."""
+        self._session.close()
 
 
 def setup(hass, config):
@@ -83,12 +95,12 @@ def setup(hass, config):
     event_collector = "{}{}:{}/services/collector/event".format(uri_scheme, host, port)
     headers = {AUTHORIZATION: "Splunk {}".format(token)}
 
-    def splunk_event_listener(event):
-        """Listen for new messages on the bus and sends them to Splunk."""
+    def splunk_event_encoder(event):
+        """Encode a state change as a Splunk event."""
         state = event.data.get("new_state")
 
         if state is None or not entity_filter(state.entity_id):
-            return
+            return None
 
         try:
             _state = state_helper.state_as_number(state)
@@ -105,9 +117,16 @@ def setup(hass, config):
                 "host": name,
             }
         ]
+        payload = {"host": event_collector, "event": json_body}
 
-        post_request(event_collector, json_body, headers, verify_ssl)
+        return [json.dumps(payload, cls=JSONEncoder)]
 
-    hass.bus.listen(EVENT_STATE_CHANGED, splunk_event_listener)
+    exporter = BatchingExporter(
+        hass,
+        "Splunk",
+        splunk_event_encoder,
+        SplunkTransport(event_collector, headers, verify_ssl),
+    )
+    exporter.start()
 
     return True
@@ -2,6 +2,7 @@
 import datetime
 import decimal
 import logging
+import threading
 
 import sqlalchemy
 from sqlalchemy.orm import scoped_session, sessionmaker
@@ -19,6 +20,8 @@ CONF_COLUMN_NAME = "column"
 CONF_QUERIES = "queries"
 CONF_QUERY = "query"
 
+DATA_SQL_SESSIONMAKERS = "sql_sessionmakers"
+
 
 def validate_sql_select(value):
     """Validate that value is a SQL SELECT query."""
@@ -48,20 +51,11 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
     if not db_url:
         db_url = DEFAULT_URL.format(hass_config_path=hass.config.path(DEFAULT_DB_FILE))
 
-    try:
-        engine = sqlalchemy.create_engine(db_url)
-        sessmaker = scoped_session(sessionmaker(bind=engine))
-
-        # Run a dummy query just to test the db_url
-        sess = sessmaker()
-        sess.execute("SELECT 1;")
-
-    except sqlalchemy.exc.SQLAlchemyError as err:
-        _LOGGER.error("Couldn't connect using %s DB_URL: %s", db_url, err)
+    sessmaker = get_sessionmaker(hass, db_url)
+    if sessmaker is None:
         return
-    finally:
-        sess.close()
 
+    query_group = SQLQueryGroup(sessmaker)
     queries = []
 
     for query in config.get(CONF_QUERIES):
@@ -75,29 +69,104 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
             value_template.hass = hass
 
         sensor = SQLSensor(
-            name, sessmaker, query_str, column_name, unit, value_template
+            name, query_group, query_str, column_name, unit, value_template
         )
         queries.append(sensor)
 
     add_entities(queries, True)
 
 
+def get_sessionmaker(hass, db_url):
+    """Return the session maker shared by all sensors of a database."""
+    sessmakers = hass.data.setdefault(DATA_SQL_SESSIONMAKERS, {})
+    sessmaker = sessmakers.get(db_url)
+    if sessmaker is not None:
+        return sessmaker
+
+    sess = None
+    try:
+        engine = sqlalchemy.create_engine(db_url)
+        sessmaker = scoped_session(sessionmaker(bind=engine))
+
+        # Run a dummy query just to test the db_url
+        sess = sessmaker()
+        sess.execute("SELECT 1;")
+
+    except sqlalchemy.exc.SQLAlchemyError as err:
+        _LOGGER.error("Couldn't connect using %s DB_URL: %s", db_url, err)
+        return None
+    finally:
+        if sess is not None:
+            sess.close()
+
+    sessmakers[db_url] = sessmaker
+    return sessmaker
+
+
+class SQLQueryGroup:
+    """Run the queries of the sensors of a platform in one session.
+
+    The first sensor to update in an interval runs the queries of all
+    sensors, the others pick up the result waiting for them.
+    """
+
+    def __init__(self, sessmaker):
+        """Initialize the query group."""
+        self.sessionmaker = sessmaker
+        self.sensors = []
+        self.runs = 0
+        self._results = {}
+        self._lock = threading.Lock()
+
+    def add(self, sensor):
+        """Add a sensor to the group."""
+        self.sensors.append(sensor)
+
+    def result(self, sensor):
+        """Return the result for a sensor, querying if none is waiting.
+
+        Returns None if the query of the sensor failed.
+        """
+        with self._lock:
+            if id(sensor) not in self._results:
+                self._run()
+            return self._results.pop(id(sensor), None)
+
+    def _run(self):
+        """Run the queries of all sensors."""
+        self.runs += 1
+        results = {}
+        sess = self.sessionmaker()
+        try:
+            for sensor in self.sensors:
+                try:
+                    results[id(sensor)] = sensor.fetch(sess)
+                except sqlalchemy.exc.SQLAlchemyError as err:
+                    _LOGGER.error("Error executing query %s: %s", sensor.query, err)
+                    results[id(sensor)] = None
+                    sess.rollback()
+        finally:
+            sess.close()
+        self._results = results
+
+
 class SQLSensor(Entity):
     """Representation of an SQL sensor."""
 
-    def __init__(self, name, sessmaker, query, column, unit, value_template):
+    def __init__(self, name, query_group, query, column, unit, value_template):
         """Initialize the SQL sensor."""
         self._name = name
         if "LIMIT" in query:
-            self._query = query
+            self.query = query
         else:
-            self._query = query.replace(";", " LIMIT 1;")
+            self.query = query.replace(";", " LIMIT 1;")
         self._unit_of_measurement = unit
         self._template = value_template
         self._column_name = column
-        self.sessionmaker = sessmaker
+        self._query_group = query_group
         self._state = None
         self._attributes = None
+        query_group.add(self)
 
     @property
     def name(self):
@@ -119,35 +188,38 @@ class SQLSensor(Entity):
         """Return the state attributes."""
         return self._attributes
 
+    def fetch(self, sess):
+        """Run the query and return the column value and the row."""
+        result = sess.execute(self.query)
+        attributes = {}
+
+        if not result.returns_rows or result.rowcount == 0:
+            _LOGGER.warning("%s returned no results", self.query)
+            return None, attributes
+
+        data = None
+        for res in result:
+            _LOGGER.debug("result = %s", res.items())
+            data = res[self._column_name]
+            for key, value in res.items():
+                if isinstance(value, decimal.Decimal):
+                    value = float(value)
+                if isinstance(value, datetime.date):
+                    value = str(value)
+                attributes[key] = value
+
+        return data, attributes
+
     def update(self):
         """Retrieve sensor data from the query."""
-
-        try:
-            sess = self.sessionmaker()
-            result = sess.execute(self._query)
-            self._attributes = {}
-
-            if not result.returns_rows or result.rowcount == 0:
-                _LOGGER.warning("%s returned no results", self._query)
-                self._state = None
-                return
-
-            for res in result:
-                _LOGGER.debug("result = %s", res.items())
-                data = res[self._column_name]
-                for key, value in res.items():
-                    if isinstance(value, decimal.Decimal):
-                        value = float(value)
-                    if isinstance(value, datetime.date):
-                        value = str(value)
-                    self._attributes[key] = value
-        except sqlalchemy.exc.SQLAlchemyError as err:
-            _LOGGER.error("Error executing query %s: %s", self._query, err)
+        result = self._query_group.result(self)
+        if result is None:
             return
-        finally:
-            sess.close()
 
-        if self._template is not None:
+        data, self._attributes = result
+        if data is None:
+            self._state = None
+        elif self._template is not None:
             self._state = self._template.async_render_with_possible_json_value(
                 data, None
             )
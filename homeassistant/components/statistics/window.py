@@ -0,0 +1,187 @@
+"""Sliding window of samples with incrementally updated statistics."""
+from array import array
+from bisect import bisect_left, insort
+from collections import deque
+from datetime import datetime
+import math
+from typing import Deque, List, Optional, Tuple
+
+
+class SampleWindow:
+    """Keep the last samples of a sensor and statistics over them.
+
+    Values are stored in a ring buffer of doubles. Adding or removing a sample
+    updates a running sum, the mean and sum of squared deviations (Welford),
+    monotonic queues for the minimum and maximum and a sorted list for the
+    median, so reading any statistic does not walk the window.
+
+    The running sums are recomputed from the buffer every time as many
+    samples as fit in the window have been removed, to keep rounding errors
+    from adding up.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialize the window."""
+        self.size = size
+        self._values = array("d", bytes(8 * size))
+        self._ages: List[Optional[datetime]] = [None] * size
+        self._start = 0
+        self._count = 0
+        self._seq = 0
+        self._removed = 0
+        self._sum = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._sorted: List[float] = []
+        # (sequence number, value) of candidates for the minimum and maximum
+        self._min: Deque[Tuple[int, float]] = deque()
+        self._max: Deque[Tuple[int, float]] = deque()
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return self._count
+
+    def append(self, value: float, age: datetime) -> None:
+        """Add a sample, removing the oldest one if the window is full."""
+        if self._count == self.size:
+            self.popleft()
+
+        index = (self._start + self._count) % self.size
+        self._values[index] = value
+        self._ages[index] = age
+        self._count += 1
+        seq = self._seq
+        self._seq += 1
+
+        self._sum += value
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
+
+        insort(self._sorted, value)
+
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((seq, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((seq, value))
+
+    def popleft(self) -> Tuple[float, datetime]:
+        """Remove and return the oldest sample."""
+        if not self._count:
+            raise IndexError("pop from an empty window")
+
+        value = self._values[self._start]
+        age = self._ages[self._start]
+        self._ages[self._start] = None
+        oldest_seq = self._seq - self._count
+        self._start = (self._start + 1) % self.size
+        self._count -= 1
+
+        del self._sorted[bisect_left(self._sorted, value)]
+        if self._min[0][0] == oldest_seq:
+            self._min.popleft()
+        if self._max[0][0] == oldest_seq:
+            self._max.popleft()
+
+        self._removed += 1
+        if not self._count:
+            self._sum = self._mean = self._m2 = 0.0
+            self._removed = 0
+        elif self._removed >= self.size:
+            self._resync()
+        else:
+            self._sum -= value
+            delta = value - self._mean
+            self._mean -= delta / self._count
+            self._m2 -= delta * (value - self._mean)
+
+        return value, age  # type: ignore
+
+    def purge(self, oldest: datetime) -> None:
+        """Remove the samples older than a point in time."""
+        while self._count and self._ages[self._start] < oldest:  # type: ignore
+            self.popleft()
+
+    def _resync(self) -> None:
+        """Recompute the running sums from the buffer."""
+        values = self.values()
+        self._sum = math.fsum(values)
+        self._mean = self._sum / self._count
+        self._m2 = math.fsum((value - self._mean) ** 2 for value in values)
+        self._removed = 0
+
+    def values(self) -> List[float]:
+        """Return the values from oldest to newest."""
+        end = self._start + self._count
+        if end <= self.size:
+            return self._values[self._start : end].tolist()
+        return (
+            self._values[self._start :].tolist()
+            + self._values[: end - self.size].tolist()
+        )
+
+    @property
+    def total(self) -> float:
+        """Return the sum of the values."""
+        return self._sum
+
+    @property
+    def mean(self) -> float:
+        """Return the mean of the values."""
+        if not self._count:
+            raise ValueError("mean requires at least one sample")
+        return self._sum / self._count
+
+    @property
+    def median(self) -> float:
+        """Return the median of the values."""
+        if not self._count:
+            raise ValueError("median requires at least one sample")
+        half = self._count // 2
+        if self._count % 2:
+            return self._sorted[half]
+        return (self._sorted[half - 1] + self._sorted[half]) / 2
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance of the values."""
+        if self._count < 2:
+            raise ValueError("variance requires at least two samples")
+        return max(self._m2, 0.0) / (self._count - 1)
+
+    @property
+    def stdev(self) -> float:
+        """Return the sample standard deviation of the values."""
+        return math.sqrt(self.variance)
+
+    @property
+    def min(self) -> float:
+        """Return the smallest value."""
+        return self._min[0][1]
+
+    @property
+    def max(self) -> float:
+        """Return the largest value."""
+        return self._max[0][1]
+
+    @property
+    def first(self) -> float:
+        """Return the oldest value."""
+        return self._values[self._start]
+
+    @property
+    def last(self) -> float:
+        """Return the newest value."""
+        return self._values[(self._start + self._count - 1) % self.size]
+
+    @property
+    def min_age(self) -> datetime:
+        """Return the time of the oldest sample."""
+        return self._ages[self._start]  # type: ignore
+
+    @property
+    def max_age(self) -> datetime:
+        """Return the time of the newest sample."""
+        return self._ages[(self._start + self._count - 1) % self.size]  # type: ignore
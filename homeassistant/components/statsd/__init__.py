@@ -4,9 +4,10 @@ import logging
 import statsd
 import voluptuous as vol
 
-from homeassistant.const import CONF_HOST, CONF_PORT, CONF_PREFIX, EVENT_STATE_CHANGED
+from homeassistant.const import CONF_HOST, CONF_PORT, CONF_PREFIX
 from homeassistant.helpers import state as state_helper
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.exporter import BatchingExporter, ExportError, Transport
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,6 +40,28 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 
+class StatsdTransport(Transport):
+    """Send metrics to StatsD, packing a batch into as few packets as possible."""
+
+    def __init__(self, client, sample_rate):
+        """Initialize the transport."""
+        self._client = client
+        self._sample_rate = sample_rate
+
+    def send(self, batch):
+        """Send gauges and counters through a pipeline."""
+        pipe = self._client.pipeline()
+        for kind, stat, value in batch:
+            if kind == "incr":
+                pipe.incr(stat, rate=self._sample_rate)
+            else:
+                pipe.gauge(stat, value, self._sample_rate)
+        try:
+            pipe.send()
+        except OSError as err:
+            raise ExportError(f"Failed to send to StatsD: {err}") from err
+
+
 def setup(hass, config):
     """Set up the StatsD component."""
 
@@ -52,12 +75,12 @@ def setup(hass, config):
 
     statsd_client = statsd.StatsClient(host=host, port=port, prefix=prefix)
 
-    def statsd_event_listener(event):
-        """Listen for new messages on the bus and sends them to StatsD."""
+    def statsd_event_encoder(event):
+        """Encode a state change as StatsD gauges and a counter."""
         state = event.data.get("new_state")
 
         if state is None:
-            return
+            return None
 
         try:
             if value_mapping and state.state in value_mapping:
@@ -69,26 +92,33 @@ def setup(hass, config):
             _state = None
 
         states = dict(state.attributes)
-
-        _LOGGER.debug("Sending %s", state.entity_id)
+        metrics = []
 
         if show_attribute_flag is True:
             if isinstance(_state, (float, int)):
-                statsd_client.gauge("%s.state" % state.entity_id, _state, sample_rate)
+                metrics.append(("gauge", "%s.state" % state.entity_id, _state))
 
             # Send attribute values
             for key, value in states.items():
                 if isinstance(value, (float, int)):
                     stat = "%s.%s" % (state.entity_id, key.replace(" ", "_"))
-                    statsd_client.gauge(stat, value, sample_rate)
+                    metrics.append(("gauge", stat, value))
 
         else:
             if isinstance(_state, (float, int)):
-                statsd_client.gauge(state.entity_id, _state, sample_rate)
+                metrics.append(("gauge", state.entity_id, _state))
 
         # Increment the count
-        statsd_client.incr(state.entity_id, rate=sample_rate)
+        metrics.append(("incr", state.entity_id, 1))
+
+        return metrics
 
-    hass.bus.listen(EVENT_STATE_CHANGED, statsd_event_listener)
+    exporter = BatchingExporter(
+        hass,
+        "StatsD",
+        statsd_event_encoder,
+        StatsdTransport(statsd_client, sample_rate),
+    )
+    exporter.start()
 
     return True
@@ -25,7 +25,11 @@ from homeassistant.const import (
 from homeassistant.exceptions import TemplateError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import async_generate_entity_id
-from homeassistant.helpers.event import async_track_state_change, async_track_same_state
+from homeassistant.helpers.event import (
+    TrackRenderInfo,
+    async_track_state_change,
+    async_track_same_state,
+)
 from .const import CONF_AVAILABILITY_TEMPLATE
 
 _LOGGER = logging.getLogger(__name__)
@@ -63,49 +67,20 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
         icon_template = device_config.get(CONF_ICON_TEMPLATE)
         entity_picture_template = device_config.get(CONF_ENTITY_PICTURE_TEMPLATE)
         availability_template = device_config.get(CONF_AVAILABILITY_TEMPLATE)
-        entity_ids = set()
-        manual_entity_ids = device_config.get(ATTR_ENTITY_ID)
+        entity_ids = device_config.get(ATTR_ENTITY_ID)
         attribute_templates = device_config.get(CONF_ATTRIBUTE_TEMPLATES, {})
 
-        invalid_templates = []
-
-        templates = {
-            CONF_VALUE_TEMPLATE: value_template,
-            CONF_ICON_TEMPLATE: icon_template,
-            CONF_ENTITY_PICTURE_TEMPLATE: entity_picture_template,
-            CONF_AVAILABILITY_TEMPLATE: availability_template,
-        }
-
-        for tpl_name, template in chain(templates.items(), attribute_templates.items()):
-            if template is None:
-                continue
-            template.hass = hass
-
-            if manual_entity_ids is not None:
-                continue
-
-            template_entity_ids = template.extract_entities()
-            if template_entity_ids == MATCH_ALL:
-                entity_ids = MATCH_ALL
-                # Cut off _template from name
-                invalid_templates.append(tpl_name.replace("_template", ""))
-            elif entity_ids != MATCH_ALL:
-                entity_ids |= set(template_entity_ids)
-
-        if manual_entity_ids is not None:
-            entity_ids = manual_entity_ids
-        elif entity_ids != MATCH_ALL:
-            entity_ids = list(entity_ids)
-
-        if invalid_templates:
-            _LOGGER.warning(
-                "Template binary sensor %s has no entity ids configured to"
-                " track nor were we able to extract the entities to track"
-                " from the %s template(s). This entity will only be able"
-                " to be updated manually.",
-                device,
-                ", ".join(invalid_templates),
-            )
+        for template in chain(
+            (
+                value_template,
+                icon_template,
+                entity_picture_template,
+                availability_template,
+            ),
+            attribute_templates.values(),
+        ):
+            if template is not None:
+                template.hass = hass
 
         friendly_name = device_config.get(ATTR_FRIENDLY_NAME, device)
         device_class = device_config.get(CONF_DEVICE_CLASS)
@@ -172,6 +147,8 @@ class BinarySensorTemplate(BinarySensorDevice):
         self._available = True
         self._attribute_templates = attribute_templates
         self._attributes = {}
+        self._tracker = None
+        self._render_infos = []
 
     async def async_added_to_hass(self):
         """Register callbacks."""
@@ -181,14 +158,26 @@ class BinarySensorTemplate(BinarySensorDevice):
             """Handle the target device state changes."""
             self.async_check_state()
 
+        @callback
+        def template_bsensor_event_listener(event):
+            """Handle state changes the templates depend on."""
+            self.async_check_state()
+
         @callback
         def template_bsensor_startup(event):
             """Update template on startup."""
-            if self._entities != MATCH_ALL:
-                # Track state change only for valid templates
-                async_track_state_change(
-                    self.hass, self._entities, template_bsensor_state_listener
+            if self._entities is not None:
+                self.async_on_remove(
+                    async_track_state_change(
+                        self.hass, self._entities, template_bsensor_state_listener
+                    )
                 )
+            else:
+                # Follow the states accessed by the last render
+                self._tracker = TrackRenderInfo(
+                    self.hass, template_bsensor_event_listener
+                )
+                self.async_on_remove(self._tracker.async_remove)
 
             self.async_check_state()
 
@@ -236,12 +225,38 @@ class BinarySensorTemplate(BinarySensorDevice):
         """Availability indicator."""
         return self._available
 
+    def _render(self, template):
+        """Render a template and remember the states it accessed."""
+        info = template.async_render_to_info()
+        self._render_infos.append(info)
+        return info.result
+
+    def _tracked_entity_ids(self):
+        """Return the entities the state depends on, for delayed changes."""
+        if self._entities is not None:
+            return self._entities
+
+        entity_ids = set()
+        for info in self._render_infos:
+            if info.domains or info.all_states:
+                return MATCH_ALL
+            entity_ids |= info.entities
+        return list(entity_ids)
+
     @callback
     def _async_render(self):
         """Get the state of template."""
+        self._render_infos = []
+        state = self._async_render_templates()
+        if self._tracker is not None:
+            self._tracker.async_set_render_infos(self._render_infos)
+        return state
+
+    def _async_render_templates(self):
+        """Render the templates and return the state."""
         state = None
         try:
-            state = self._template.async_render().lower() == "true"
+            state = self._render(self._template).lower() == "true"
         except TemplateError as ex:
             if ex.args and ex.args[0].startswith(
                 "UndefinedError: 'None' has no attribute"
@@ -257,7 +272,7 @@ class BinarySensorTemplate(BinarySensorDevice):
         if self._attribute_templates is not None:
             for key, value in self._attribute_templates.items():
                 try:
-                    attrs[key] = value.async_render()
+                    attrs[key] = self._render(value)
                 except TemplateError as err:
                     _LOGGER.error("Error rendering attribute %s: %s", key, err)
             self._attributes = attrs
@@ -273,7 +288,7 @@ class BinarySensorTemplate(BinarySensorDevice):
                 continue
 
             try:
-                value = template.async_render()
+                value = self._render(template)
                 if property_name == "_available":
                     value = value.lower() == "true"
                 setattr(self, property_name, value)
@@ -324,7 +339,7 @@ class BinarySensorTemplate(BinarySensorDevice):
             self.hass,
             period,
             set_state,
-            entity_ids=self._entities,
+            entity_ids=self._tracked_entity_ids(),
             async_check_same_func=lambda *args: self._async_render() == state,
         )
 
@@ -21,14 +21,13 @@ from homeassistant.const import (
     CONF_SENSORS,
     EVENT_HOMEASSISTANT_START,
     CONF_FRIENDLY_NAME_TEMPLATE,
-    MATCH_ALL,
     CONF_DEVICE_CLASS,
 )
 
 from homeassistant.exceptions import TemplateError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import Entity, async_generate_entity_id
-from homeassistant.helpers.event import async_track_state_change
+from homeassistant.helpers.event import TrackRenderInfo, async_track_state_change
 from .const import CONF_AVAILABILITY_TEMPLATE
 
 CONF_ATTRIBUTE_TEMPLATES = "attribute_templates"
@@ -72,48 +71,20 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
         device_class = device_config.get(CONF_DEVICE_CLASS)
         attribute_templates = device_config[CONF_ATTRIBUTE_TEMPLATES]
 
-        entity_ids = set()
-        manual_entity_ids = device_config.get(ATTR_ENTITY_ID)
-        invalid_templates = []
+        entity_ids = device_config.get(ATTR_ENTITY_ID)
 
-        templates = {
-            CONF_VALUE_TEMPLATE: state_template,
-            CONF_ICON_TEMPLATE: icon_template,
-            CONF_ENTITY_PICTURE_TEMPLATE: entity_picture_template,
-            CONF_FRIENDLY_NAME_TEMPLATE: friendly_name_template,
-            CONF_AVAILABILITY_TEMPLATE: availability_template,
-        }
-
-        for tpl_name, template in chain(templates.items(), attribute_templates.items()):
-            if template is None:
-                continue
-            template.hass = hass
-
-            if manual_entity_ids is not None:
-                continue
-
-            template_entity_ids = template.extract_entities()
-            if template_entity_ids == MATCH_ALL:
-                entity_ids = MATCH_ALL
-                # Cut off _template from name
-                invalid_templates.append(tpl_name.replace("_template", ""))
-            elif entity_ids != MATCH_ALL:
-                entity_ids |= set(template_entity_ids)
-
-        if invalid_templates:
-            _LOGGER.warning(
-                "Template sensor %s has no entity ids configured to track nor"
-                " were we able to extract the entities to track from the %s "
-                "template(s). This entity will only be able to be updated "
-                "manually.",
-                device,
-                ", ".join(invalid_templates),
-            )
-
-        if manual_entity_ids is not None:
-            entity_ids = manual_entity_ids
-        elif entity_ids != MATCH_ALL:
-            entity_ids = list(entity_ids)
+        for template in chain(
+            (
+                state_template,
+                icon_template,
+                entity_picture_template,
+                friendly_name_template,
+                availability_template,
+            ),
+            attribute_templates.values(),
+        ):
+            if template is not None:
+                template.hass = hass
 
         sensors.append(
             SensorTemplate(
@@ -173,6 +144,8 @@ class SensorTemplate(Entity):
         self._available = True
         self._attribute_templates = attribute_templates
         self._attributes = {}
+        self._tracker = None
+        self._render_infos = []
 
     async def async_added_to_hass(self):
         """Register callbacks."""
@@ -182,14 +155,26 @@ class SensorTemplate(Entity):
             """Handle device state changes."""
             self.async_schedule_update_ha_state(True)
 
+        @callback
+        def template_sensor_event_listener(event):
+            """Handle state changes the templates depend on."""
+            self.async_schedule_update_ha_state(True)
+
         @callback
         def template_sensor_startup(event):
             """Update template on startup."""
-            if self._entities != MATCH_ALL:
-                # Track state change only for valid templates
-                async_track_state_change(
-                    self.hass, self._entities, template_sensor_state_listener
+            if self._entities is not None:
+                self.async_on_remove(
+                    async_track_state_change(
+                        self.hass, self._entities, template_sensor_state_listener
+                    )
+                )
+            else:
+                # Follow the states accessed by the last render
+                self._tracker = TrackRenderInfo(
+                    self.hass, template_sensor_event_listener
                 )
+                self.async_on_remove(self._tracker.async_remove)
 
             self.async_schedule_update_ha_state(True)
 
@@ -242,10 +227,17 @@ class SensorTemplate(Entity):
         """No polling needed."""
         return False
 
+    def _render(self, template):
+        """Render a template and remember the states it accessed."""
+        info = template.async_render_to_info()
+        self._render_infos.append(info)
+        return info.result
+
     async def async_update(self):
         """Update the state from the template."""
+        self._render_infos = []
         try:
-            self._state = self._template.async_render()
+            self._state = self._render(self._template)
             self._available = True
         except TemplateError as ex:
             self._available = False
@@ -263,7 +255,7 @@ class SensorTemplate(Entity):
         attrs = {}
         for key, value in self._attribute_templates.items():
             try:
-                attrs[key] = value.async_render()
+                attrs[key] = self._render(value)
             except TemplateError as err:
                 _LOGGER.error("Error rendering attribute %s: %s", key, err)
 
@@ -281,7 +273,7 @@ class SensorTemplate(Entity):
                 continue
 
             try:
-                value = template.async_render()
+                value = self._render(template)
                 if property_name == "_available":
                     value = value.lower() == "true"
                 setattr(self, property_name, value)
@@ -307,3 +299,6 @@ class SensorTemplate(Entity):
                         self._name,
                         ex,
                     )
+
+        if self._tracker is not None:
+            self._tracker.async_set_render_infos(self._render_infos)
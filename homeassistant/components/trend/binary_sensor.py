@@ -1,9 +1,7 @@
 """A sensor that monitors trends in other components."""
-from collections import deque
 import logging
 import math
 
-import numpy as np
 import voluptuous as vol
 
 from homeassistant.components.binary_sensor import (
@@ -27,6 +25,7 @@ import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import generate_entity_id
 from homeassistant.helpers.event import async_track_state_change
 from homeassistant.util import utcnow
+from homeassistant.util.regression import RollingRegression
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -123,7 +122,7 @@ class SensorTrend(BinarySensorDevice):
         self._min_gradient = min_gradient
         self._gradient = None
         self._state = None
-        self.samples = deque(maxlen=max_samples)
+        self.samples = RollingRegression(max_samples)
 
     @property
     def name(self):
@@ -184,15 +183,13 @@ class SensorTrend(BinarySensorDevice):
         """Get the latest data and update the states."""
         # Remove outdated samples
         if self._sample_duration > 0:
-            cutoff = utcnow().timestamp() - self._sample_duration
-            while self.samples and self.samples[0][0] < cutoff:
-                self.samples.popleft()
-
-        if len(self.samples) < 2:
-            return
+            self.samples.purge(utcnow().timestamp() - self._sample_duration)
 
         # Calculate gradient of linear trend
-        await self.hass.async_add_job(self._calculate_gradient)
+        gradient = self.samples.slope
+        if gradient is None:
+            return
+        self._gradient = gradient
 
         # Update state
         self._state = (
@@ -202,13 +199,3 @@ class SensorTrend(BinarySensorDevice):
 
         if self._invert:
             self._state = not self._state
-
-    def _calculate_gradient(self):
-        """Compute the linear trend gradient of the current samples.
-
-        This need run inside executor.
-        """
-        timestamps = np.array([t for t, _ in self.samples])
-        values = np.array([s for _, s in self.samples])
-        coeffs = np.polyfit(timestamps, values, 1)
-        self._gradient = coeffs[0]
@@ -22,13 +22,22 @@ from homeassistant.components.media_player.const import (
     MEDIA_TYPE_MUSIC,
     SERVICE_PLAY_MEDIA,
 )
-from homeassistant.const import ATTR_ENTITY_ID, CONF_PLATFORM, ENTITY_MATCH_ALL
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    CONF_PLATFORM,
+    ENTITY_MATCH_ALL,
+    EVENT_HOMEASSISTANT_STOP,
+)
 from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_per_platform
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.typing import HomeAssistantType
 from homeassistant.setup import async_prepare_setup_platform
+from homeassistant.util.json import load_json, save_json
+
+from .cache import FileCache, MemoryCache
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
 
@@ -43,17 +52,24 @@ ATTR_PLATFORM = "platform"
 CONF_BASE_URL = "base_url"
 CONF_CACHE = "cache"
 CONF_CACHE_DIR = "cache_dir"
+CONF_CACHE_SIZE = "cache_size"
 CONF_LANG = "language"
+CONF_MEMORY_SIZE = "memory_size"
+CONF_PRELOAD = "preload"
 CONF_SERVICE_NAME = "service_name"
 CONF_TIME_MEMORY = "time_memory"
 
 DEFAULT_CACHE = True
 DEFAULT_CACHE_DIR = "tts"
+DEFAULT_CACHE_SIZE = 0
+DEFAULT_MEMORY_SIZE = 0
+DEFAULT_PRELOAD = 0
 DEFAULT_TIME_MEMORY = 300
 DOMAIN = "tts"
 
-MEM_CACHE_FILENAME = "filename"
-MEM_CACHE_VOICE = "voice"
+INDEX_FILENAME = "tts_cache_index.json"
+INDEX_SAVE_DELAY = 30
+INDEX_VERSION = 1
 
 SERVICE_CLEAR_CACHE = "clear_cache"
 SERVICE_SAY = "say"
@@ -80,6 +96,9 @@ PLATFORM_SCHEMA = cv.PLATFORM_SCHEMA.extend(
         vol.Optional(CONF_TIME_MEMORY, default=DEFAULT_TIME_MEMORY): vol.All(
             vol.Coerce(int), vol.Range(min=60, max=57600)
         ),
+        vol.Optional(CONF_CACHE_SIZE, default=DEFAULT_CACHE_SIZE): cv.positive_int,
+        vol.Optional(CONF_MEMORY_SIZE, default=DEFAULT_MEMORY_SIZE): cv.positive_int,
+        vol.Optional(CONF_PRELOAD, default=DEFAULT_PRELOAD): cv.positive_int,
         vol.Optional(CONF_BASE_URL): cv.string,
         vol.Optional(CONF_SERVICE_NAME): cv.string,
     }
@@ -109,14 +128,26 @@ async def async_setup(hass, config):
         cache_dir = conf.get(CONF_CACHE_DIR, DEFAULT_CACHE_DIR)
         time_memory = conf.get(CONF_TIME_MEMORY, DEFAULT_TIME_MEMORY)
         base_url = conf.get(CONF_BASE_URL) or hass.config.api.base_url
-
-        await tts.async_init_cache(use_cache, cache_dir, time_memory, base_url)
+        cache_size = conf.get(CONF_CACHE_SIZE, DEFAULT_CACHE_SIZE)
+        memory_size = conf.get(CONF_MEMORY_SIZE, DEFAULT_MEMORY_SIZE)
+        preload = conf.get(CONF_PRELOAD, DEFAULT_PRELOAD)
+
+        await tts.async_init_cache(
+            use_cache,
+            cache_dir,
+            time_memory,
+            base_url,
+            cache_size=cache_size,
+            memory_size=memory_size,
+            preload=preload,
+        )
     except (HomeAssistantError, KeyError) as err:
         _LOGGER.error("Error on cache init %s", err)
         return False
 
     hass.http.register_view(TextToSpeechView(tts))
     hass.http.register_view(TextToSpeechUrlView(tts))
+    hass.http.register_view(TextToSpeechCacheView(tts))
 
     async def async_setup_platform(p_type, p_config, disc_info=None):
         """Set up a TTS platform."""
@@ -204,14 +235,27 @@ class SpeechManager:
         self.cache_dir = DEFAULT_CACHE_DIR
         self.time_memory = DEFAULT_TIME_MEMORY
         self.base_url = None
-        self.file_cache = {}
-        self.mem_cache = {}
-
-    async def async_init_cache(self, use_cache, cache_dir, time_memory, base_url):
+        self.file_cache = FileCache()
+        self.mem_cache = MemoryCache()
+        self._mem_timers = {}
+        self._unsub_index_save = None
+
+    async def async_init_cache(
+        self,
+        use_cache,
+        cache_dir,
+        time_memory,
+        base_url,
+        cache_size=DEFAULT_CACHE_SIZE,
+        memory_size=DEFAULT_MEMORY_SIZE,
+        preload=DEFAULT_PRELOAD,
+    ):
         """Init config folder and load file cache."""
         self.use_cache = use_cache
         self.time_memory = time_memory
         self.base_url = base_url
+        self.file_cache.max_size = cache_size
+        self.mem_cache.max_size = memory_size
 
         def init_tts_cache_dir(cache_dir):
             """Init cache folder."""
@@ -230,44 +274,134 @@ class SpeechManager:
             raise HomeAssistantError(f"Can't init cache dir {err}")
 
         def get_cache_files():
-            """Return a dict of given engine files."""
-            cache = {}
-
-            folder_data = os.listdir(self.cache_dir)
-            for file_data in folder_data:
+            """Return the cache index reconciled with the cache folder."""
+            try:
+                index = load_json(os.path.join(self.cache_dir, INDEX_FILENAME))
+            except HomeAssistantError:
+                index = {}
+            indexed = []
+            if index.get("version") == INDEX_VERSION:
+                indexed = index["entries"]
+
+            files = {}
+            for file_data in os.listdir(self.cache_dir):
                 record = _RE_VOICE_FILE.match(file_data)
                 if record:
-                    key = KEY_PATTERN.format(
-                        record.group(1),
-                        record.group(2),
-                        record.group(3),
-                        record.group(4),
-                    )
-                    cache[key.lower()] = file_data.lower()
-            return cache
+                    files[file_data.lower()] = (file_data, record)
+
+            # Drop entries of removed files, keep the order of the others
+            entries = [entry for entry in indexed if files.pop(entry["filename"], None)]
+            changed = len(entries) != len(indexed) or bool(files)
+
+            # Files missing from the index are the least recently used, only
+            # their size has to be read from the disk
+            unindexed = []
+            for filename, (file_data, record) in files.items():
+                key = KEY_PATTERN.format(
+                    record.group(1), record.group(2), record.group(3), record.group(4)
+                )
+                size = os.path.getsize(os.path.join(self.cache_dir, file_data))
+                unindexed.append(
+                    {"key": key.lower(), "filename": filename, "size": size}
+                )
+            return unindexed + entries, changed
 
         try:
-            cache_files = await self.hass.async_add_job(get_cache_files)
+            cache_files, changed = await self.hass.async_add_job(get_cache_files)
         except OSError as err:
             raise HomeAssistantError(f"Can't read cache dir {err}")
 
-        if cache_files:
-            self.file_cache.update(cache_files)
+        evicted = self.file_cache.load_list(cache_files)
+        if evicted:
+            self.hass.async_create_task(self._async_remove_files(evicted))
+        if changed or evicted:
+            self._async_schedule_save_index()
+
+        self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, self._async_handle_stop
+        )
+
+        if use_cache and preload:
+            self.hass.async_create_task(self.async_preload(preload))
+
+    async def async_preload(self, count):
+        """Pin the most frequently used voices of the file cache in memory.
+
+        This method is a coroutine.
+        """
+        for key in self.file_cache.most_used(count):
+            try:
+                await self.async_file_to_mem(key, expire=False)
+            except HomeAssistantError as err:
+                _LOGGER.warning("Can't preload %s: %s", key, err)
 
     async def async_clear_cache(self):
         """Read file cache and delete files."""
-        self.mem_cache = {}
+        for unsub in self._mem_timers.values():
+            unsub.cancel()
+        self._mem_timers = {}
+        self.mem_cache.clear()
+
+        await self._async_remove_files(self.file_cache.clear())
+        await self.async_save_index()
+
+    async def _async_remove_files(self, filenames):
+        """Remove files from the cache folder.
+
+        This method is a coroutine.
+        """
 
         def remove_files():
             """Remove files from filesystem."""
-            for _, filename in self.file_cache.items():
+            for filename in filenames:
                 try:
                     os.remove(os.path.join(self.cache_dir, filename))
                 except OSError as err:
                     _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
 
         await self.hass.async_add_job(remove_files)
-        self.file_cache = {}
+
+    @callback
+    def _async_schedule_save_index(self):
+        """Save the file cache index after a delay."""
+        if self._unsub_index_save is not None:
+            return
+
+        async def async_save(_now):
+            """Save the index."""
+            self._unsub_index_save = None
+            await self.async_save_index()
+
+        self._unsub_index_save = async_call_later(
+            self.hass, INDEX_SAVE_DELAY, async_save
+        )
+
+    async def async_save_index(self):
+        """Write the file cache index to the cache folder.
+
+        This method is a coroutine.
+        """
+        if self._unsub_index_save is not None:
+            self._unsub_index_save()
+            self._unsub_index_save = None
+
+        data = {"version": INDEX_VERSION, "entries": self.file_cache.as_list()}
+        try:
+            await self.hass.async_add_executor_job(
+                save_json, os.path.join(self.cache_dir, INDEX_FILENAME), data
+            )
+        except HomeAssistantError as err:
+            _LOGGER.warning("Can't write cache index: %s", err)
+
+    async def _async_handle_stop(self, event):
+        """Flush a pending index save on shutdown."""
+        if self._unsub_index_save is not None:
+            await self.async_save_index()
+
+    @property
+    def cache_stats(self):
+        """Return hit and miss counters of the memory and file cache."""
+        return {"memory": self.mem_cache.stats, "file": self.file_cache.stats}
 
     @callback
     def async_register_engine(self, engine, provider, config):
@@ -314,11 +448,16 @@ class SpeechManager:
         key = KEY_PATTERN.format(msg_hash, language, options_key, engine).lower()
 
         # Is speech already in memory
-        if key in self.mem_cache:
-            filename = self.mem_cache[key][MEM_CACHE_FILENAME]
+        mem_entry = self.mem_cache.get(key)
+        if mem_entry is not None:
+            filename = mem_entry[0]
+            if key in self.file_cache:
+                self.file_cache.touch(key)
+                self._async_schedule_save_index()
         # Is file store in file cache
-        elif use_cache and key in self.file_cache:
-            filename = self.file_cache[key]
+        elif use_cache and self.file_cache.get(key) is not None:
+            filename = self.file_cache.peek(key)
+            self._async_schedule_save_index()
             self.hass.async_create_task(self.async_file_to_mem(key))
         # Load speech from provider into memory
         else:
@@ -366,16 +505,21 @@ class SpeechManager:
 
         try:
             await self.hass.async_add_job(save_speech)
-            self.file_cache[key] = filename
         except OSError:
             _LOGGER.error("Can't write %s", filename)
+            return
+
+        evicted = self.file_cache.add(key, filename, len(data))
+        self._async_schedule_save_index()
+        if evicted:
+            await self._async_remove_files(evicted)
 
-    async def async_file_to_mem(self, key):
-        """Load voice from file cache into memory.
+    async def async_file_to_mem(self, key, expire=True):
+        """Load voice from file cache into memory and return it.
 
         This method is a coroutine.
         """
-        filename = self.file_cache.get(key)
+        filename = self.file_cache.peek(key)
         if not filename:
             raise HomeAssistantError(f"Key {key} not in file cache!")
 
@@ -389,22 +533,37 @@ class SpeechManager:
         try:
             data = await self.hass.async_add_job(load_speech)
         except OSError:
-            del self.file_cache[key]
+            self.file_cache.pop(key)
+            self._async_schedule_save_index()
             raise HomeAssistantError(f"Can't read {voice_file}")
 
-        self._async_store_to_memcache(key, filename, data)
+        self._async_store_to_memcache(key, filename, data, expire)
+        return data
 
     @callback
-    def _async_store_to_memcache(self, key, filename, data):
+    def _async_store_to_memcache(self, key, filename, data, expire=True):
         """Store data to memcache and set timer to remove it."""
-        self.mem_cache[key] = {MEM_CACHE_FILENAME: filename, MEM_CACHE_VOICE: data}
+        for evicted_key in self.mem_cache.set(key, filename, data):
+            timer = self._mem_timers.pop(evicted_key, None)
+            if timer is not None:
+                timer.cancel()
+
+        timer = self._mem_timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+
+        if not expire:
+            return
 
         @callback
         def async_remove_from_mem():
             """Cleanup memcache."""
+            self._mem_timers.pop(key, None)
             self.mem_cache.pop(key)
 
-        self.hass.loop.call_later(self.time_memory, async_remove_from_mem)
+        self._mem_timers[key] = self.hass.loop.call_later(
+            self.time_memory, async_remove_from_mem
+        )
 
     async def async_read_tts(self, filename):
         """Read a voice file and return binary.
@@ -419,13 +578,17 @@ class SpeechManager:
             record.group(1), record.group(2), record.group(3), record.group(4)
         )
 
-        if key not in self.mem_cache:
-            if key not in self.file_cache:
+        mem_entry = self.mem_cache.get(key)
+        if mem_entry is not None:
+            data = mem_entry[1]
+        else:
+            if self.file_cache.get(key) is None:
                 raise HomeAssistantError(f"{key} not in cache!")
-            await self.async_file_to_mem(key)
+            self._async_schedule_save_index()
+            data = await self.async_file_to_mem(key)
 
         content, _ = mimetypes.guess_type(filename)
-        return (content, self.mem_cache[key][MEM_CACHE_VOICE])
+        return (content, data)
 
     @staticmethod
     def write_tags(filename, data, provider, message, language, options):
@@ -558,3 +721,19 @@ class TextToSpeechView(HomeAssistantView):
             return web.Response(status=404)
 
         return web.Response(body=data, content_type=content)
+
+
+class TextToSpeechCacheView(HomeAssistantView):
+    """TTS view to report cache counters."""
+
+    requires_auth = True
+    url = "/api/tts_cache"
+    name = "api:tts:cache"
+
+    def __init__(self, tts):
+        """Initialize a tts view."""
+        self.tts = tts
+
+    async def get(self, request):
+        """Return hit and miss counters of the caches."""
+        return self.json(self.tts.cache_stats)
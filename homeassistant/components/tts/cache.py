@@ -0,0 +1,194 @@
+"""Size bounded caches for text-to-speech audio."""
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class MemoryCache:
+    """Least recently used cache of voice data bounded in bytes.
+
+    A max_size of 0 disables the size bound. The most recently stored entry
+    is never evicted, so a single oversized voice is still served.
+    """
+
+    def __init__(self, max_size: int = 0) -> None:
+        """Initialize the memory cache."""
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[str, bytes]]" = OrderedDict()
+
+    def __contains__(self, key: str) -> bool:
+        """Return True if key is in the cache."""
+        return key in self._entries
+
+    def __len__(self) -> int:
+        """Return the number of cached voices."""
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Tuple[str, bytes]]:
+        """Return (filename, data) for key and mark it as recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, filename: str, data: bytes) -> List[str]:
+        """Store voice data and return the keys evicted to make room."""
+        self.pop(key)
+        self._entries[key] = (filename, data)
+        self.size += len(data)
+
+        evicted = []
+        while self.max_size and self.size > self.max_size and len(self._entries) > 1:
+            old_key, (_, old_data) = self._entries.popitem(last=False)
+            self.size -= len(old_data)
+            self.evictions += 1
+            evicted.append(old_key)
+        return evicted
+
+    def pop(self, key: str) -> Optional[Tuple[str, bytes]]:
+        """Remove key from the cache and return its entry."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry[1])
+        return entry
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self.size = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Return the cache counters."""
+        return {
+            "entries": len(self._entries),
+            "size": self.size,
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class FileCache:
+    """Least recently used index of voice files bounded in bytes.
+
+    The index only tracks files; reading, writing and removing them is left
+    to the caller so that all I/O can happen in the executor.
+    """
+
+    def __init__(self, max_size: int = 0) -> None:
+        """Initialize the file cache index."""
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def __contains__(self, key: str) -> bool:
+        """Return True if key is in the cache."""
+        return key in self._entries
+
+    def __len__(self) -> int:
+        """Return the number of cached files."""
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the filename for key and mark it as recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        entry["hits"] += 1
+        self._entries.move_to_end(key)
+        return entry["filename"]
+
+    def touch(self, key: str) -> None:
+        """Record a use of key that was served from another cache."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry["hits"] += 1
+            self._entries.move_to_end(key)
+
+    def peek(self, key: str) -> Optional[str]:
+        """Return the filename for key without touching counters."""
+        entry = self._entries.get(key)
+        return entry["filename"] if entry is not None else None
+
+    def add(self, key: str, filename: str, size: int, hits: int = 0) -> List[str]:
+        """Add a file and return the filenames evicted to make room."""
+        self.pop(key)
+        self._entries[key] = {"filename": filename, "size": size, "hits": hits}
+        self.size += size
+        return self.evict()
+
+    def evict(self) -> List[str]:
+        """Evict least recently used files until the size bound holds."""
+        evicted = []
+        while self.max_size and self.size > self.max_size and len(self._entries) > 1:
+            _, entry = self._entries.popitem(last=False)
+            self.size -= entry["size"]
+            self.evictions += 1
+            evicted.append(entry["filename"])
+        return evicted
+
+    def pop(self, key: str) -> Optional[str]:
+        """Remove key from the index and return its filename."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        self.size -= entry["size"]
+        return entry["filename"]
+
+    def clear(self) -> List[str]:
+        """Remove all entries and return their filenames."""
+        filenames = [entry["filename"] for entry in self._entries.values()]
+        self._entries.clear()
+        self.size = 0
+        return filenames
+
+    def most_used(self, count: int) -> List[str]:
+        """Return up to count keys ordered by hit count."""
+        ranked = sorted(
+            (key for key, entry in self._entries.items() if entry["hits"]),
+            key=lambda key: self._entries[key]["hits"],
+            reverse=True,
+        )
+        return ranked[:count]
+
+    def as_list(self) -> List[Dict[str, Any]]:
+        """Return the index in least to most recently used order."""
+        return [{"key": key, **entry} for key, entry in self._entries.items()]
+
+    def load_list(self, entries: List[Dict[str, Any]]) -> List[str]:
+        """Load an index produced by as_list and return evicted filenames."""
+        self.clear()
+        for entry in entries:
+            key = entry["key"]
+            self._entries[key] = {
+                "filename": entry["filename"],
+                "size": entry["size"],
+                "hits": entry.get("hits", 0),
+            }
+            self.size += entry["size"]
+        return self.evict()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Return the cache counters."""
+        return {
+            "entries": len(self._entries),
+            "size": self.size,
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
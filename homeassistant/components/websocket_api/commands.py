@@ -2,12 +2,14 @@
 import voluptuous as vol
 
 from homeassistant.auth.permissions.const import POLICY_READ
-from homeassistant.const import MATCH_ALL, EVENT_TIME_CHANGED, EVENT_STATE_CHANGED
+from homeassistant.const import MATCH_ALL, EVENT_STATE_CHANGED
 from homeassistant.core import callback, DOMAIN as HASS_DOMAIN
 from homeassistant.exceptions import Unauthorized, ServiceNotFound, HomeAssistantError
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_stats
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.helpers.event import async_track_state_change
+from homeassistant.helpers.event_fanout import async_get_fanout
 
 from . import const, decorators, messages
 
@@ -26,6 +28,7 @@ def async_register_commands(hass, async_reg):
     async_reg(hass, handle_get_config)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
+    async_reg(hass, handle_dispatcher_stats)
 
 
 def pong_message(iden):
@@ -38,6 +41,7 @@ def pong_message(iden):
     {
         vol.Required("type"): "subscribe_events",
         vol.Optional("event_type", default=MATCH_ALL): str,
+        vol.Optional("entity_id"): cv.entity_ids,
     }
 )
 def handle_subscribe_events(hass, connection, msg):
@@ -52,30 +56,28 @@ def handle_subscribe_events(hass, connection, msg):
     if event_type not in SUBSCRIBE_WHITELIST and not connection.user.is_admin:
         raise Unauthorized
 
+    event_filter = None
     if event_type == EVENT_STATE_CHANGED:
 
         @callback
-        def forward_events(event):
-            """Forward state changed events to websocket."""
-            if not connection.user.permissions.check_entity(
+        def event_filter(event):
+            """Filter state changed events the user cannot read."""
+            return connection.user.permissions.check_entity(
                 event.data["entity_id"], POLICY_READ
-            ):
-                return
-
-            connection.send_message(messages.event_message(msg["id"], event))
-
-    else:
-
-        @callback
-        def forward_events(event):
-            """Forward events to websocket."""
-            if event.event_type == EVENT_TIME_CHANGED:
-                return
+            )
 
-            connection.send_message(messages.event_message(msg["id"], event.as_dict()))
+    prefix = '{{"id": {}, "type": "event", "event": '.format(msg["id"])
 
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        event_type, forward_events
+    @callback
+    def forward_events(event, encoded):
+        """Forward events to websocket."""
+        connection.send_message(f"{prefix}{encoded}}}")
+
+    connection.subscriptions[msg["id"]] = async_get_fanout(hass).async_subscribe(
+        forward_events,
+        event_type,
+        entity_ids=msg.get("entity_id"),
+        event_filter=event_filter,
     )
 
     connection.send_message(messages.result_message(msg["id"]))
@@ -209,6 +211,20 @@ def handle_ping(hass, connection, msg):
     connection.send_message(pong_message(msg["id"]))
 
 
+@callback
+@decorators.require_admin
+@decorators.websocket_command({vol.Required("type"): "dispatcher_stats"})
+def handle_dispatcher_stats(hass, connection, msg):
+    """Handle dispatcher stats command.
+
+    Async friendly.
+    """
+    connection.send_result(
+        msg["id"],
+        {str(family): stats for family, stats in async_dispatcher_stats(hass).items()},
+    )
+
+
 @callback
 @decorators.websocket_command(
     {
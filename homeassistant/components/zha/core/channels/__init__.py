@@ -14,7 +14,6 @@ from random import uniform
 import zigpy.exceptions
 
 from homeassistant.core import callback
-from homeassistant.helpers.dispatcher import async_dispatcher_send
 
 from ..const import (
     CHANNEL_ATTRIBUTE,
@@ -93,6 +92,11 @@ class ZigbeeChannel(LogMixin):
         self._unique_id = "{}:{}:0x{:04x}".format(
             str(device.ieee), cluster.endpoint.endpoint_id, cluster.cluster_id
         )
+        self._signal_key = (
+            device.ieee,
+            cluster.endpoint.endpoint_id,
+            cluster.cluster_id,
+        )
         # this keeps logs consistent with zigpy logging
         self._log_id = "0x{:04x}:{}:0x{:04x}".format(
             device.nwk, cluster.endpoint.endpoint_id, cluster.cluster_id
@@ -113,6 +117,11 @@ class ZigbeeChannel(LogMixin):
         """Return the unique id for this channel."""
         return self._unique_id
 
+    @property
+    def signal_key(self):
+        """Return the key of the signals of this channel."""
+        return self._signal_key
+
     @property
     def cluster(self):
         """Return the zigpy cluster for this channel."""
@@ -228,6 +237,13 @@ class ZigbeeChannel(LogMixin):
         """Handle ZDO commands on this cluster."""
         pass
 
+    @callback
+    def async_send_signal(self, signal, *args):
+        """Send a signal to the entities of this channel."""
+        self._zha_device.gateway.async_send_channel_signal(
+            self._signal_key, signal, *args
+        )
+
     @callback
     def zha_send_event(self, cluster, command, args):
         """Relay events to hass."""
@@ -296,9 +312,7 @@ class AttributeListeningChannel(ZigbeeChannel):
     def attribute_updated(self, attrid, value):
         """Handle attribute updates on this cluster."""
         if attrid == self.value_attribute:
-            async_dispatcher_send(
-                self._zha_device.hass, f"{self.unique_id}_{SIGNAL_ATTR_UPDATED}", value
-            )
+            self.async_send_signal(SIGNAL_ATTR_UPDATED, value)
 
     async def async_initialize(self, from_cache):
         """Initialize listener."""
@@ -9,7 +9,6 @@ import logging
 import zigpy.zcl.clusters.hvac as hvac
 
 from homeassistant.core import callback
-from homeassistant.helpers.dispatcher import async_dispatcher_send
 
 from . import ZigbeeChannel
 from .. import registries
@@ -47,9 +46,7 @@ class FanChannel(ZigbeeChannel):
         """Retrieve latest state."""
         result = await self.get_attribute_value("fan_mode", from_cache=True)
 
-        async_dispatcher_send(
-            self._zha_device.hass, f"{self.unique_id}_{SIGNAL_ATTR_UPDATED}", result
-        )
+        self.async_send_signal(SIGNAL_ATTR_UPDATED, result)
 
     @callback
     def attribute_updated(self, attrid, value):
@@ -59,9 +56,7 @@ class FanChannel(ZigbeeChannel):
             "Attribute report '%s'[%s] = %s", self.cluster.name, attr_name, value
         )
         if attrid == self._value_attribute:
-            async_dispatcher_send(
-                self._zha_device.hass, f"{self.unique_id}_{SIGNAL_ATTR_UPDATED}", value
-            )
+            self.async_send_signal(SIGNAL_ATTR_UPDATED, value)
 
     async def async_initialize(self, from_cache):
         """Initialize channel."""
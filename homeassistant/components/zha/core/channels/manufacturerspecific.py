@@ -7,7 +7,6 @@ https://home-assistant.io/integrations/zha/
 import logging
 
 from homeassistant.core import callback
-from homeassistant.helpers.dispatcher import async_dispatcher_send
 
 from . import AttributeListeningChannel, ZigbeeChannel
 from .. import registries
@@ -59,9 +58,7 @@ class SmartThingsAcceleration(AttributeListeningChannel):
     def attribute_updated(self, attrid, value):
         """Handle attribute updates on this cluster."""
         if attrid == self.value_attribute:
-            async_dispatcher_send(
-                self._zha_device.hass, f"{self.unique_id}_{SIGNAL_ATTR_UPDATED}", value
-            )
+            self.async_send_signal(SIGNAL_ATTR_UPDATED, value)
         else:
             self.zha_send_event(
                 self._cluster,
@@ -7,7 +7,6 @@ https://home-assistant.io/integrations/zha/
 
 import asyncio
 import collections
-import itertools
 import logging
 import os
 import traceback
@@ -86,6 +85,8 @@ class ZHAGateway:
         self._config = config
         self._devices = {}
         self._device_registry = collections.defaultdict(list)
+        self._entity_references = {}
+        self._channel_signals = {}
         self.zha_storage = None
         self.ha_device_registry = None
         self.application_controller = None
@@ -201,6 +202,8 @@ class ZHAGateway:
         """Handle device being removed from the network."""
         zha_device = self._devices.pop(device.ieee, None)
         entity_refs = self._device_registry.pop(device.ieee, None)
+        for entity_ref in entity_refs or ():
+            self._entity_references.pop(entity_ref.reference_id, None)
         if zha_device is not None:
             device_info = async_get_device_info(self._hass, zha_device)
             zha_device.async_unsub_dispatcher()
@@ -224,18 +227,17 @@ class ZHAGateway:
 
     def get_entity_reference(self, entity_id):
         """Return entity reference for given entity_id if found."""
-        for entity_reference in itertools.chain.from_iterable(
-            self.device_registry.values()
-        ):
-            if entity_id == entity_reference.reference_id:
-                return entity_reference
+        return self._entity_references.get(entity_id)
 
     def remove_entity_reference(self, entity):
         """Remove entity reference for given entity_id if found."""
-        if entity.zha_device.ieee in self.device_registry:
-            entity_refs = self.device_registry.get(entity.zha_device.ieee)
-            self.device_registry[entity.zha_device.ieee] = [
-                e for e in entity_refs if e.reference_id != entity.entity_id
+        entity_ref = self._entity_references.pop(entity.entity_id, None)
+        if entity_ref is None:
+            return
+        entity_refs = self._device_registry.get(entity_ref.zha_device.ieee)
+        if entity_refs is not None:
+            self._device_registry[entity_ref.zha_device.ieee] = [
+                e for e in entity_refs if e is not entity_ref
             ]
 
     @property
@@ -258,15 +260,47 @@ class ZHAGateway:
         remove_future,
     ):
         """Record the creation of a hass entity associated with ieee."""
-        self._device_registry[ieee].append(
-            EntityReference(
-                reference_id=reference_id,
-                zha_device=zha_device,
-                cluster_channels=cluster_channels,
-                device_info=device_info,
-                remove_future=remove_future,
-            )
+        entity_ref = EntityReference(
+            reference_id=reference_id,
+            zha_device=zha_device,
+            cluster_channels=cluster_channels,
+            device_info=device_info,
+            remove_future=remove_future,
         )
+        self._device_registry[ieee].append(entity_ref)
+        self._entity_references[reference_id] = entity_ref
+
+    @callback
+    def async_connect_channel_signal(self, signal_key, signal, target):
+        """Connect a target to a signal of the channel with a signal key.
+
+        Signal keys are the (ieee, endpoint id, cluster id) of the channel.
+        """
+        targets = self._channel_signals.setdefault((signal_key, signal), [])
+        targets.append(target)
+
+        @callback
+        def async_disconnect():
+            """Disconnect the target from the signal."""
+            targets.remove(target)
+            if not targets:
+                del self._channel_signals[(signal_key, signal)]
+
+        return async_disconnect
+
+    @callback
+    def async_send_channel_signal(self, signal_key, signal, *args):
+        """Run the targets connected to a signal of a channel."""
+        targets = self._channel_signals.get((signal_key, signal))
+        if targets is None:
+            return
+        for target in list(targets):
+            try:
+                self._hass.async_run_job(target, *args)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error handling %s signal of %s: %s", signal, signal_key, args
+                )
 
     @callback
     def async_enable_debug_mode(self):
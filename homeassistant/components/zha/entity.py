@@ -48,6 +48,7 @@ class ZhaEntity(RestoreEntity, LogMixin, entity.Entity):
         self._available = False
         self._component = kwargs["component"]
         self._unsubs = []
+        self._write_scheduled = False
         self.remove_future = None
         for channel in channels:
             self.cluster_channels[channel.name] = channel
@@ -101,20 +102,44 @@ class ZhaEntity(RestoreEntity, LogMixin, entity.Entity):
         """Return entity availability."""
         return self._available
 
+    @callback
     def async_set_available(self, available):
         """Set entity availability."""
         self._available = available
         self.async_schedule_update_ha_state()
 
+    @callback
     def async_update_state_attribute(self, key, value):
         """Update a single device state attribute."""
         self._device_state_attributes.update({key: value})
         self.async_schedule_update_ha_state()
 
+    @callback
     def async_set_state(self, state):
         """Set the entity state."""
         pass
 
+    @callback
+    def async_schedule_update_ha_state(self, force_refresh=False):
+        """Schedule a write of the state.
+
+        Attribute reports often arrive in bursts, the state is written once
+        for all the reports that arrive in the same loop iteration.
+        """
+        if force_refresh:
+            super().async_schedule_update_ha_state(True)
+            return
+        if self._write_scheduled:
+            return
+        self._write_scheduled = True
+        self.hass.loop.call_soon(self._async_write_scheduled_state)
+
+    @callback
+    def _async_write_scheduled_state(self):
+        """Write the state of the reports of the last loop iteration."""
+        self._write_scheduled = False
+        self.async_write_ha_state()
+
     async def async_added_to_hass(self):
         """Run when about to be added to hass."""
         await super().async_added_to_hass()
@@ -180,8 +205,8 @@ class ZhaEntity(RestoreEntity, LogMixin, entity.Entity):
         if signal_override:
             unsub = async_dispatcher_connect(self.hass, signal, func)
         else:
-            unsub = async_dispatcher_connect(
-                self.hass, f"{channel.unique_id}_{signal}", func
+            unsub = self._zha_device.gateway.async_connect_channel_signal(
+                channel.signal_key, signal, func
             )
         self._unsubs.append(unsub)
 
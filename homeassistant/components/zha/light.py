@@ -132,6 +132,7 @@ class Light(ZhaEntity, light.Light):
         attributes = {"off_brightness": self._off_brightness}
         return attributes
 
+    @callback
     def set_level(self, value):
         """Set the brightness of this light between 0..254.
 
@@ -168,6 +169,7 @@ class Light(ZhaEntity, light.Light):
         """Flag supported features."""
         return self._supported_features
 
+    @callback
     def async_set_state(self, state):
         """Set the state."""
         self._state = bool(state)
@@ -269,6 +269,7 @@ class Sensor(ZhaEntity):
             return str(round(self._state, 2))
         return self._state
 
+    @callback
     def async_set_state(self, state):
         """Handle state update from channel."""
         # this is necessary because HA saves the unit based on what shows in
@@ -1,10 +1,10 @@
 """Support for the definition of zones."""
 import logging
-from typing import Set, cast
+from typing import Set
 
 import voluptuous as vol
 
-from homeassistant.core import callback, State
+from homeassistant.core import callback
 from homeassistant.loader import bind_hass
 import homeassistant.helpers.config_validation as cv
 from homeassistant.const import (
@@ -18,13 +18,11 @@ from homeassistant.const import (
 from homeassistant.helpers import config_per_platform
 from homeassistant.helpers.entity import async_generate_entity_id
 from homeassistant.util import slugify
-from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE
-from homeassistant.util.location import distance
 
 
 from .config_flow import configured_zones
-from .const import CONF_PASSIVE, DOMAIN, HOME_ZONE, ATTR_PASSIVE, ATTR_RADIUS
-from .zone import Zone
+from .const import CONF_PASSIVE, DOMAIN, HOME_ZONE
+from .zone import Zone, ZoneIndex
 
 
 # mypy: allow-untyped-calls, allow-untyped-defs
@@ -38,6 +36,8 @@ DEFAULT_RADIUS = 100
 ENTITY_ID_FORMAT = "zone.{}"
 ENTITY_ID_HOME = ENTITY_ID_FORMAT.format(HOME_ZONE)
 
+DATA_ZONE_INDEX = "zone_index"
+
 ICON_HOME = "mdi:home"
 ICON_IMPORT = "mdi:import"
 
@@ -61,39 +61,10 @@ def async_active_zone(hass, latitude, longitude, radius=0):
 
     This method must be run in the event loop.
     """
-    # Sort entity IDs so that we are deterministic if equal distance to 2 zones
-    zones = (
-        hass.states.get(entity_id)
-        for entity_id in sorted(hass.states.async_entity_ids(DOMAIN))
-    )
-
-    min_dist = None
-    closest = None
-
-    for zone in zones:
-        if zone.attributes.get(ATTR_PASSIVE):
-            continue
-
-        zone_dist = distance(
-            latitude,
-            longitude,
-            zone.attributes[ATTR_LATITUDE],
-            zone.attributes[ATTR_LONGITUDE],
-        )
-
-        within_zone = zone_dist - radius < zone.attributes[ATTR_RADIUS]
-        closer_zone = closest is None or zone_dist < min_dist  # type: ignore
-        smaller_zone = (
-            zone_dist == min_dist
-            and zone.attributes[ATTR_RADIUS]
-            < cast(State, closest).attributes[ATTR_RADIUS]
-        )
-
-        if within_zone and (closer_zone or smaller_zone):
-            min_dist = zone_dist
-            closest = zone
-
-    return closest
+    index = hass.data.get(DATA_ZONE_INDEX)
+    if index is None:
+        index = hass.data[DATA_ZONE_INDEX] = ZoneIndex(hass)
+    return index.async_active_zone(latitude, longitude, radius)
 
 
 async def async_setup(hass, config):
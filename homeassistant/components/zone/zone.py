@@ -1,16 +1,35 @@
 """Zone entity and functionality."""
 
-from typing import cast
+from collections import OrderedDict
+import math
+from typing import Dict, Iterable, List, Optional, Set, Tuple, cast
 
-from homeassistant.const import ATTR_HIDDEN, ATTR_LATITUDE, ATTR_LONGITUDE
-from homeassistant.core import State
+from homeassistant.const import (
+    ATTR_HIDDEN,
+    ATTR_LATITUDE,
+    ATTR_LONGITUDE,
+    EVENT_STATE_CHANGED,
+)
+from homeassistant.core import Event, State, callback
 from homeassistant.helpers.entity import Entity
-from homeassistant.util.location import distance
+from homeassistant.helpers.typing import HomeAssistantType
+from homeassistant.util.location import HAVERSINE_ERROR, distance, haversine
 
-from .const import ATTR_PASSIVE, ATTR_RADIUS
+from .const import ATTR_PASSIVE, ATTR_RADIUS, DOMAIN
 
 STATE = "zoning"
 
+# Size of the cells of the zone index in degrees
+CELL_SIZE = 0.25
+# Zones and searches covering more cells than this skip the grid
+MAX_CELLS = 64
+# Number of recent point to zone results to remember
+RESULT_CACHE_SIZE = 128
+
+# Meters per degree of latitude or longitude at the equator, rounded down so
+# boxes are never too small (a degree of latitude is 110574 m at the equator)
+METERS_PER_DEGREE = 110000
+
 
 # mypy: allow-untyped-defs
 
@@ -20,6 +39,16 @@ def in_zone(zone: State, latitude: float, longitude: float, radius: float = 0) -
 
     Async friendly.
     """
+    if zone.attributes[ATTR_RADIUS] is None:
+        return False
+
+    if (
+        latitude is not None
+        and longitude is not None
+        and is_outside(zone, latitude, longitude, radius)
+    ):
+        return False
+
     zone_dist = distance(
         latitude,
         longitude,
@@ -27,11 +56,196 @@ def in_zone(zone: State, latitude: float, longitude: float, radius: float = 0) -
         zone.attributes[ATTR_LONGITUDE],
     )
 
-    if zone_dist is None or zone.attributes[ATTR_RADIUS] is None:
+    if zone_dist is None:
         return False
     return zone_dist - radius < cast(float, zone.attributes[ATTR_RADIUS])
 
 
+def is_outside(zone: State, latitude: float, longitude: float, radius: float) -> bool:
+    """Return if a point is certainly outside a zone by great circle distance.
+
+    Async friendly.
+    """
+    approx = haversine(
+        latitude,
+        longitude,
+        zone.attributes[ATTR_LATITUDE],
+        zone.attributes[ATTR_LONGITUDE],
+    )
+    lower_bound = approx * (1 - HAVERSINE_ERROR) - 1
+    return lower_bound - radius >= zone.attributes[ATTR_RADIUS]
+
+
+def _cells(
+    latitude: float, longitude: float, radius: float
+) -> Optional[List[Tuple[int, int]]]:
+    """Return the grid cells of a bounding box around a circle.
+
+    Returns None if the box covers too many cells, a pole or the antimeridian.
+    """
+    delta_lat = radius * (1 + HAVERSINE_ERROR) / METERS_PER_DEGREE + 1e-6
+    if abs(latitude) + delta_lat >= 89:
+        return None
+    delta_lon = delta_lat / math.cos(math.radians(abs(latitude) + delta_lat))
+    if abs(longitude) + delta_lon >= 180:
+        return None
+
+    lat_range = range(
+        math.floor((latitude - delta_lat) / CELL_SIZE),
+        math.floor((latitude + delta_lat) / CELL_SIZE) + 1,
+    )
+    lon_range = range(
+        math.floor((longitude - delta_lon) / CELL_SIZE),
+        math.floor((longitude + delta_lon) / CELL_SIZE) + 1,
+    )
+    if len(lat_range) * len(lon_range) > MAX_CELLS:
+        return None
+    return [(lat, lon) for lat in lat_range for lon in lon_range]
+
+
+class ZoneIndex:
+    """Grid of the bounding boxes of the zones.
+
+    Kept up to date from state changed events of zones. Zones that do not
+    fit the grid are always candidates. Recent results of active_zone are
+    remembered until a zone changes.
+    """
+
+    def __init__(self, hass: HomeAssistantType) -> None:
+        """Initialize the index from the current zone states."""
+        self.hass = hass
+        self._grid: Dict[Tuple[int, int], Set[str]] = {}
+        self._zone_cells: Dict[str, List[Tuple[int, int]]] = {}
+        self._unbounded: Set[str] = set()
+        self._results: "OrderedDict[Tuple[float, float, float], Optional[str]]" = (
+            OrderedDict()
+        )
+        self.hits = 0
+
+        for entity_id in hass.states.async_entity_ids(DOMAIN):
+            self._add(cast(State, hass.states.get(entity_id)))
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed)
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Update the index when a zone changes."""
+        entity_id = event.data["entity_id"]
+        if not entity_id.startswith(DOMAIN + "."):
+            return
+
+        self._remove(entity_id)
+        new_state = event.data.get("new_state")
+        if new_state is not None:
+            self._add(new_state)
+        self._results.clear()
+
+    def _add(self, zone: State) -> None:
+        """Add a zone to the grid."""
+        try:
+            cells = _cells(
+                float(zone.attributes[ATTR_LATITUDE]),
+                float(zone.attributes[ATTR_LONGITUDE]),
+                float(zone.attributes[ATTR_RADIUS]),
+            )
+        except (KeyError, TypeError, ValueError):
+            cells = None
+
+        if cells is None:
+            self._unbounded.add(zone.entity_id)
+            return
+
+        self._zone_cells[zone.entity_id] = cells
+        for cell in cells:
+            self._grid.setdefault(cell, set()).add(zone.entity_id)
+
+    def _remove(self, entity_id: str) -> None:
+        """Remove a zone from the grid."""
+        self._unbounded.discard(entity_id)
+        for cell in self._zone_cells.pop(entity_id, ()):
+            zones = self._grid[cell]
+            zones.discard(entity_id)
+            if not zones:
+                del self._grid[cell]
+
+    def candidates(self, latitude: float, longitude: float, radius: float) -> Set[str]:
+        """Return the zones whose bounding box a circle around a point touches."""
+        cells = _cells(latitude, longitude, radius)
+        if cells is None:
+            return set(self._zone_cells) | self._unbounded
+
+        found = set(self._unbounded)
+        for cell in cells:
+            found.update(self._grid.get(cell, ()))
+        return found
+
+    @callback
+    def async_active_zone(
+        self, latitude: float, longitude: float, radius: float = 0
+    ) -> Optional[State]:
+        """Find the active zone for given latitude, longitude."""
+        key = (latitude, longitude, radius)
+        if key in self._results:
+            self._results.move_to_end(key)
+            self.hits += 1
+            entity_id = self._results[key]
+            return self.hass.states.get(entity_id) if entity_id else None
+
+        # Sort entity IDs so that we are deterministic if equal distance to 2 zones
+        zones = (
+            self.hass.states.get(entity_id)
+            for entity_id in sorted(self.candidates(latitude, longitude, radius))
+        )
+        closest = closest_zone(
+            (zone for zone in zones if zone is not None), latitude, longitude, radius
+        )
+
+        self._results[key] = closest.entity_id if closest else None
+        if len(self._results) > RESULT_CACHE_SIZE:
+            self._results.popitem(last=False)
+        return closest
+
+
+def closest_zone(
+    zones: Iterable[State], latitude: float, longitude: float, radius: float = 0
+) -> Optional[State]:
+    """Return the closest zone that contains a point.
+
+    Zones that the point is certainly outside of are skipped before the exact
+    distance is computed.
+    """
+    min_dist = None
+    closest = None
+
+    for zone in zones:
+        if zone.attributes.get(ATTR_PASSIVE):
+            continue
+
+        if is_outside(zone, latitude, longitude, radius):
+            continue
+
+        zone_dist = distance(
+            latitude,
+            longitude,
+            zone.attributes[ATTR_LATITUDE],
+            zone.attributes[ATTR_LONGITUDE],
+        )
+
+        within_zone = zone_dist - radius < zone.attributes[ATTR_RADIUS]
+        closer_zone = closest is None or zone_dist < min_dist  # type: ignore
+        smaller_zone = (
+            zone_dist == min_dist
+            and zone.attributes[ATTR_RADIUS]
+            < cast(State, closest).attributes[ATTR_RADIUS]
+        )
+
+        if within_zone and (closer_zone or smaller_zone):
+            min_dist = zone_dist
+            closest = zone
+
+    return closest
+
+
 class Zone(Entity):
     """Representation of a Zone."""
 
@@ -426,10 +426,12 @@ SERVER_PORT = 8123
 URL_ROOT = "/"
 URL_API = "/api/"
 URL_API_STREAM = "/api/stream"
+URL_API_STREAM_STATS = "/api/stream/stats"
 URL_API_CONFIG = "/api/config"
 URL_API_DISCOVERY_INFO = "/api/discovery_info"
 URL_API_STATES = "/api/states"
 URL_API_STATES_ENTITY = "/api/states/{}"
+URL_API_STATES_SNAPSHOT = "/api/states_snapshot"
 URL_API_EVENTS = "/api/events"
 URL_API_EVENTS_EVENT = "/api/events/{}"
 URL_API_SERVICES = "/api/services"
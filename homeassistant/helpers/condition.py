@@ -4,9 +4,9 @@ from datetime import datetime, timedelta
 import functools as ft
 import logging
 import sys
-from typing import Callable, Container, Optional, Union, cast
+from typing import Callable, Container, List, Optional, Sequence, Union, cast
 
-from homeassistant.helpers.template import Template
+from homeassistant.helpers.template import RenderInfo, Template
 from homeassistant.helpers.typing import ConfigType, TemplateVarsType
 from homeassistant.core import HomeAssistant, State
 from homeassistant.components import zone as zone_cmp
@@ -47,10 +47,85 @@ _LOGGER = logging.getLogger(__name__)
 
 ConditionCheckerType = Callable[[HomeAssistant, TemplateVarsType], bool]
 
+# Relative cost of testing conditions, and/or conditions test cheap ones first
+CONDITION_COSTS = {
+    "state": 1,
+    "numeric_state": 2,
+    "time": 2,
+    "zone": 3,
+    "sun": 4,
+    "template": 10,
+}
+DEFAULT_CONDITION_COST = 5
+
+
+class ConditionChecker:
+    """Compiled condition.
+
+    Besides the test, a checker knows the relative cost of the test and its
+    result if it does not depend on anything, so and/or conditions can drop
+    constant conditions and test the cheapest conditions first. After a test
+    of an and/or condition failed, failed describes the condition that made
+    it fail.
+    """
+
+    __slots__ = (
+        "test",
+        "cost",
+        "description",
+        "constant",
+        "operator",
+        "conditions",
+        "failed",
+    )
+
+    def __init__(
+        self,
+        test: ConditionCheckerType,
+        cost: int,
+        description: str,
+        constant: Optional[bool] = None,
+        operator: Optional[str] = None,
+        conditions: Sequence["ConditionChecker"] = (),
+    ) -> None:
+        """Initialize the checker."""
+        self.test = test
+        self.cost = cost
+        self.description = description
+        self.constant = constant
+        self.operator = operator
+        self.conditions = conditions
+        self.failed: Optional[str] = None
+
+    def __call__(self, hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
+        """Test the condition."""
+        return self.test(hass, variables)
+
+
+def _constant_checker(value: bool, description: str) -> ConditionChecker:
+    """Create a checker of a condition that is always or never met."""
+
+    def if_constant(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
+        """Return the constant result."""
+        return value
+
+    return ConditionChecker(if_constant, 0, description, constant=value)
+
+
+def _describe(config: ConfigType) -> str:
+    """Describe a condition configuration for logs."""
+    condition = config.get(CONF_CONDITION)
+    if CONF_ENTITY_ID in config:
+        return f"{condition} {config[CONF_ENTITY_ID]}"
+    if CONF_VALUE_TEMPLATE in config:
+        value_template = config[CONF_VALUE_TEMPLATE]
+        return f"{condition} {getattr(value_template, 'template', value_template)}"
+    return str(condition)
+
 
 async def async_from_config(
     hass: HomeAssistant, config: ConfigType, config_validation: bool = True
-) -> ConditionCheckerType:
+) -> ConditionChecker:
     """Turn a condition configuration into a method.
 
     Should be run on the event loop.
@@ -76,21 +151,59 @@ async def async_from_config(
         check_factory = check_factory.func
 
     if asyncio.iscoroutinefunction(check_factory):
-        return cast(
-            ConditionCheckerType, await factory(hass, config, config_validation)
-        )
-    return cast(ConditionCheckerType, factory(config, config_validation))
+        checker = await factory(hass, config, config_validation)
+    else:
+        checker = factory(config, config_validation)
+
+    if isinstance(checker, ConditionChecker):
+        return checker
+    return ConditionChecker(
+        checker,
+        CONDITION_COSTS.get(config[CONF_CONDITION], DEFAULT_CONDITION_COST),
+        _describe(config),
+    )
+
+
+async def _async_compile_conditions(
+    hass: HomeAssistant, operator: str, configs: List[ConfigType]
+) -> List[ConditionChecker]:
+    """Compile the conditions of an and/or condition.
+
+    Nested conditions with the same operator are merged into the list and
+    conditions that are constant are left out, or the list is replaced by
+    the single constant condition that decides the result. The conditions
+    are sorted cheapest first.
+    """
+    deciding = operator == "or"
+    checks: List[ConditionChecker] = []
+    for config in configs:
+        check = await async_from_config(hass, config, False)
+        if check.constant is deciding:
+            return [check]
+        if check.constant is not None:
+            continue
+        if check.operator == operator:
+            checks.extend(check.conditions)
+        else:
+            checks.append(check)
+
+    checks.sort(key=lambda check: check.cost)
+    return checks
 
 
 async def async_and_from_config(
     hass: HomeAssistant, config: ConfigType, config_validation: bool = True
-) -> ConditionCheckerType:
+) -> ConditionChecker:
     """Create multi condition matcher using 'AND'."""
     if config_validation:
         config = cv.AND_CONDITION_SCHEMA(config)
-    checks = [
-        await async_from_config(hass, entry, False) for entry in config["conditions"]
-    ]
+    checks = await _async_compile_conditions(hass, "and", config["conditions"])
+    description = "and ({})".format(", ".join(check.description for check in checks))
+
+    if not checks:
+        return _constant_checker(True, description)
+    if len(checks) == 1 and checks[0].constant is not None:
+        return checks[0]
 
     def if_and_condition(
         hass: HomeAssistant, variables: TemplateVarsType = None
@@ -98,41 +211,66 @@ async def async_and_from_config(
         """Test and condition."""
         try:
             for check in checks:
-                if not check(hass, variables):
+                if not check.test(hass, variables):
+                    checker.failed = check.failed or check.description
                     return False
         except Exception as ex:  # pylint: disable=broad-except
             _LOGGER.warning("Error during and-condition: %s", ex)
+            checker.failed = check.description
             return False
 
         return True
 
-    return if_and_condition
+    checker = ConditionChecker(
+        if_and_condition,
+        sum(check.cost for check in checks),
+        description,
+        operator="and",
+        conditions=checks,
+    )
+    return checker
 
 
 async def async_or_from_config(
     hass: HomeAssistant, config: ConfigType, config_validation: bool = True
-) -> ConditionCheckerType:
-    """Create multi condition matcher using 'OR'."""
+) -> ConditionChecker:
+    """Create multi condition matcher using 'OR'.
+
+    A condition that raises an error is not met, the other conditions are
+    still tested.
+    """
     if config_validation:
         config = cv.OR_CONDITION_SCHEMA(config)
-    checks = [
-        await async_from_config(hass, entry, False) for entry in config["conditions"]
-    ]
+    checks = await _async_compile_conditions(hass, "or", config["conditions"])
+    description = "or ({})".format(", ".join(check.description for check in checks))
+
+    if not checks:
+        return _constant_checker(False, description)
+    if len(checks) == 1 and checks[0].constant is not None:
+        return checks[0]
 
     def if_or_condition(
         hass: HomeAssistant, variables: TemplateVarsType = None
     ) -> bool:
-        """Test and condition."""
-        try:
-            for check in checks:
-                if check(hass, variables):
+        """Test or condition."""
+        for check in checks:
+            try:
+                if check.test(hass, variables):
                     return True
-        except Exception as ex:  # pylint: disable=broad-except
-            _LOGGER.warning("Error during or-condition: %s", ex)
+            except Exception as ex:  # pylint: disable=broad-except
+                _LOGGER.warning("Error during or-condition: %s", ex)
 
+        checker.failed = description
         return False
 
-    return if_or_condition
+    checker = ConditionChecker(
+        if_or_condition,
+        sum(check.cost for check in checks),
+        description,
+        operator="or",
+        conditions=checks,
+    )
+    return checker
 
 
 def numeric_state(
@@ -372,6 +510,17 @@ def async_template(
     return value.lower() == "true"
 
 
+def async_template_from_info(info: RenderInfo) -> bool:
+    """Test if the result of a template render matches."""
+    try:
+        value = info.result
+    except TemplateError as ex:
+        _LOGGER.error("Error during template condition: %s", ex)
+        return False
+
+    return value.lower() == "true"
+
+
 def async_template_from_config(
     config: ConfigType, config_validation: bool = True
 ) -> ConditionCheckerType:
@@ -380,6 +529,11 @@ def async_template_from_config(
         config = cv.TEMPLATE_CONDITION_SCHEMA(config)
     value_template = cast(Template, config.get(CONF_VALUE_TEMPLATE))
 
+    if value_template.is_static:
+        return _constant_checker(
+            value_template.template.strip().lower() == "true", _describe(config)
+        )
+
     def template_if(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
         """Validate template based if-condition."""
         value_template.hass = hass
@@ -2,13 +2,13 @@
 import logging
 import uuid
 from asyncio import Event
-from collections import OrderedDict
 from typing import List, Optional, cast
 
 import attr
 
 from homeassistant.core import callback
 from homeassistant.loader import bind_hass
+from homeassistant.util.indexed_dict import IndexedDict
 
 from .typing import HomeAssistantType
 
@@ -69,6 +69,18 @@ def format_mac(mac):
     return mac
 
 
+class DeviceRegistryItems(IndexedDict):
+    """Devices by ID, indexed by identifier, connection, config entry and area."""
+
+    INDEXES = ("identifiers", "connections", "config_entries", "area_id")
+
+    def index_keys(self, name, value):
+        """Return the keys of a device in an index."""
+        if name == "area_id":
+            return (value.area_id,)
+        return getattr(value, name)
+
+
 class DeviceRegistry:
     """Class to hold a registry of devices."""
 
@@ -88,12 +100,21 @@ class DeviceRegistry:
         self, identifiers: set, connections: set
     ) -> Optional[DeviceEntry]:
         """Check if device is registered."""
-        for device in self.devices.values():
-            if any(iden in device.identifiers for iden in identifiers) or any(
-                conn in device.connections for conn in connections
-            ):
-                return device
-        return None
+        device_ids = {}
+        for name, keys in (("identifiers", identifiers), ("connections", connections)):
+            for key in keys:
+                device_ids.update(dict.fromkeys(self.devices.lookup(name, key)))
+
+        if not device_ids:
+            return None
+
+        if len(device_ids) == 1:
+            return self.devices[next(iter(device_ids))]
+
+        # Return the matching device that was registered first
+        return next(
+            device for device in self.devices.values() if device.id in device_ids
+        )
 
     @callback
     def async_get_or_create(
@@ -273,7 +294,7 @@ class DeviceRegistry:
         """Load the device registry."""
         data = await self._store.async_load()
 
-        devices = OrderedDict()
+        devices = DeviceRegistryItems()
 
         if data is not None:
             for device in data["devices"]:
@@ -331,8 +352,8 @@ class DeviceRegistry:
     def async_clear_config_entry(self, config_entry_id):
         """Clear config entry from registry entries."""
         remove = []
-        for dev_id, device in self.devices.items():
-            if device.config_entries == {config_entry_id}:
+        for dev_id in self.devices.lookup("config_entries", config_entry_id):
+            if self.devices[dev_id].config_entries == {config_entry_id}:
                 remove.append(dev_id)
             else:
                 self._async_update_device(
@@ -344,9 +365,8 @@ class DeviceRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for dev_id, device in self.devices.items():
-            if area_id == device.area_id:
-                self._async_update_device(dev_id, area_id=None)
+        for dev_id in self.devices.lookup("area_id", area_id):
+            self._async_update_device(dev_id, area_id=None)
 
 
 @bind_hass
@@ -375,4 +395,12 @@ async def async_get_registry(hass: HomeAssistantType) -> DeviceRegistry:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> List[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    return registry.devices.lookup_values("area_id", area_id)
+
+
+@callback
+def async_entries_for_config_entry(
+    registry: DeviceRegistry, config_entry_id: str
+) -> List[DeviceEntry]:
+    """Return entries that match a config entry."""
+    return registry.devices.lookup_values("config_entries", config_entry_id)
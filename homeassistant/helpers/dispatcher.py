@@ -1,21 +1,38 @@
 """Helpers for Home Assistant dispatcher & internal component/platform."""
+import asyncio
+from functools import partial
 import logging
-from typing import Any, Callable
+from time import monotonic
+from typing import Any, Callable, Dict, Hashable, Iterable, Sequence, Tuple, Union
 
-from homeassistant.core import callback
+from homeassistant.core import callback, is_callback
 from homeassistant.loader import bind_hass
 from homeassistant.util.async_ import run_callback_threadsafe
 from homeassistant.util.logging import catch_log_exception
+from homeassistant.util.metrics import Timing
 from .typing import HomeAssistantType
 
 
 _LOGGER = logging.getLogger(__name__)
 DATA_DISPATCHER = "dispatcher"
+DATA_DISPATCHER_TIMINGS = "dispatcher_timings"
+DATA_DISPATCHER_LISTENERS = "dispatcher_listeners"
+
+# Signals are strings, or tuples of a family name and the ids of what they are
+# about, so no string has to be formatted to send them.
+SignalType = Union[str, Tuple[Hashable, ...]]
+
+
+def signal_family(signal: SignalType) -> Hashable:
+    """Return the family of a signal, the first item of tuple signals."""
+    if isinstance(signal, tuple):
+        return signal[0]
+    return signal
 
 
 @bind_hass
 def dispatcher_connect(
-    hass: HomeAssistantType, signal: str, target: Callable[..., None]
+    hass: HomeAssistantType, signal: SignalType, target: Callable[..., None]
 ) -> Callable[[], None]:
     """Connect a callable function to a signal."""
     async_unsub = run_callback_threadsafe(
@@ -29,10 +46,39 @@ def dispatcher_connect(
     return remove_dispatcher
 
 
+def _timed_target(timing: Timing, target: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a target to record the time between sending and running it.
+
+    The wrapper takes the time of the send as its first argument and is
+    scheduled the way the target would be.
+    """
+    check_target = target
+    while isinstance(check_target, partial):
+        check_target = check_target.func
+
+    if asyncio.iscoroutinefunction(check_target):
+
+        async def async_timed_target(sent: float, *args: Any) -> None:
+            """Record the latency and run the target."""
+            timing.add(monotonic() - sent)
+            await target(*args)
+
+        return async_timed_target
+
+    def timed_target(sent: float, *args: Any) -> None:
+        """Record the latency and run the target."""
+        timing.add(monotonic() - sent)
+        target(*args)
+
+    if is_callback(target):
+        return callback(timed_target)
+    return timed_target
+
+
 @callback
 @bind_hass
 def async_dispatcher_connect(
-    hass: HomeAssistantType, signal: str, target: Callable[..., Any]
+    hass: HomeAssistantType, signal: SignalType, target: Callable[..., Any]
 ) -> Callable[[], None]:
     """Connect a callable function to a signal.
 
@@ -40,13 +86,25 @@ def async_dispatcher_connect(
     """
     if DATA_DISPATCHER not in hass.data:
         hass.data[DATA_DISPATCHER] = {}
+        hass.data[DATA_DISPATCHER_TIMINGS] = {}
+        hass.data[DATA_DISPATCHER_LISTENERS] = {}
 
     if signal not in hass.data[DATA_DISPATCHER]:
         hass.data[DATA_DISPATCHER][signal] = []
 
+    # Timings are kept while a family has listeners, so families of string
+    # signals with ids in them do not pile up
+    family = signal_family(signal)
+    timings = hass.data[DATA_DISPATCHER_TIMINGS]
+    listeners = hass.data[DATA_DISPATCHER_LISTENERS]
+    timing = timings.get(family)
+    if timing is None:
+        timing = timings[family] = Timing()
+    listeners[family] = listeners.get(family, 0) + 1
+
     wrapped_target = catch_log_exception(
-        target,
-        lambda *args: "Exception in {} when dispatching '{}': {}".format(
+        _timed_target(timing, target),
+        lambda sent, *args: "Exception in {} when dispatching '{}': {}".format(
             target.__name__, signal, args
         ),
     )
@@ -62,24 +120,78 @@ def async_dispatcher_connect(
             # KeyError is key target listener did not exist
             # ValueError if listener did not exist within signal
             _LOGGER.warning("Unable to remove unknown dispatcher %s", target)
+            return
+
+        listeners[family] -= 1
+        if not listeners[family]:
+            del listeners[family]
+            timings.pop(family, None)
 
     return async_remove_dispatcher
 
 
 @bind_hass
-def dispatcher_send(hass: HomeAssistantType, signal: str, *args: Any) -> None:
+def dispatcher_send(hass: HomeAssistantType, signal: SignalType, *args: Any) -> None:
     """Send signal and data."""
     hass.loop.call_soon_threadsafe(async_dispatcher_send, hass, signal, *args)
 
 
 @callback
 @bind_hass
-def async_dispatcher_send(hass: HomeAssistantType, signal: str, *args: Any) -> None:
+def async_dispatcher_send(
+    hass: HomeAssistantType, signal: SignalType, *args: Any
+) -> None:
     """Send signal and data.
 
     This method must be run in the event loop.
     """
-    target_list = hass.data.get(DATA_DISPATCHER, {}).get(signal, [])
+    target_list = hass.data.get(DATA_DISPATCHER, {}).get(signal)
+    if not target_list:
+        return
 
+    sent = monotonic()
     for target in target_list:
-        hass.async_add_job(target, *args)
+        hass.async_add_job(target, sent, *args)
+
+
+@bind_hass
+def dispatcher_send_many(
+    hass: HomeAssistantType, signals: Iterable[Tuple[SignalType, Sequence[Any]]]
+) -> None:
+    """Send signals and their data in one call to the event loop."""
+    hass.loop.call_soon_threadsafe(async_dispatcher_send_many, hass, list(signals))
+
+
+@callback
+@bind_hass
+def async_dispatcher_send_many(
+    hass: HomeAssistantType, signals: Iterable[Tuple[SignalType, Sequence[Any]]]
+) -> None:
+    """Send signals and their data.
+
+    This method must be run in the event loop.
+    """
+    dispatchers = hass.data.get(DATA_DISPATCHER)
+    if not dispatchers:
+        return
+
+    sent = monotonic()
+    for signal, args in signals:
+        for target in dispatchers.get(signal, ()):
+            hass.async_add_job(target, sent, *args)
+
+
+@callback
+@bind_hass
+def async_dispatcher_stats(hass: HomeAssistantType) -> Dict[Hashable, Dict[str, Any]]:
+    """Return the listener count and dispatch latency of each signal family.
+
+    Only families with listeners are included.
+
+    This method must be run in the event loop.
+    """
+    listeners = hass.data.get(DATA_DISPATCHER_LISTENERS, {})
+    return {
+        family: {"listeners": listeners[family], "latency": timing.as_dict()}
+        for family, timing in hass.data.get(DATA_DISPATCHER_TIMINGS, {}).items()
+    }
@@ -8,7 +8,6 @@ registered. Registering a new entity while a timer is in progress resets the
 timer.
 """
 import asyncio
-from collections import OrderedDict
 from itertools import chain
 import logging
 from typing import Any, Dict, Iterable, List, Optional, cast
@@ -19,6 +18,7 @@ from homeassistant.core import Event, callback, split_entity_id, valid_entity_id
 from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from homeassistant.loader import bind_hass
 from homeassistant.util import ensure_unique_string, slugify
+from homeassistant.util.indexed_dict import IndexedDict
 from homeassistant.util.yaml import load_yaml
 
 from .typing import HomeAssistantType
@@ -77,13 +77,25 @@ class RegistryEntry:
         return self.disabled_by is not None
 
 
+class EntityRegistryItems(IndexedDict):
+    """Registry entries by entity ID, indexed by unique ID, config entry and device."""
+
+    INDEXES = ("unique_id", "config_entry_id", "device_id")
+
+    def index_keys(self, name, value):
+        """Return the keys of an entry in an index."""
+        if name == "unique_id":
+            return ((value.domain, value.platform, value.unique_id),)
+        return (getattr(value, name),)
+
+
 class EntityRegistry:
     """Class to hold a registry of entities."""
 
     def __init__(self, hass: HomeAssistantType):
         """Initialize the registry."""
         self.hass = hass
-        self.entities: Dict[str, RegistryEntry]
+        self.entities: EntityRegistryItems
         self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_removed
@@ -104,14 +116,8 @@ class EntityRegistry:
         self, domain: str, platform: str, unique_id: str
     ) -> Optional[str]:
         """Check if an entity_id is currently registered."""
-        for entity in self.entities.values():
-            if (
-                entity.domain == domain
-                and entity.platform == platform
-                and entity.unique_id == unique_id
-            ):
-                return entity.entity_id
-        return None
+        entity_ids = self.entities.lookup("unique_id", (domain, platform, unique_id))
+        return entity_ids[0] if entity_ids else None
 
     @callback
     def async_generate_entity_id(
@@ -277,20 +283,11 @@ class EntityRegistry:
             entity_id = changes["entity_id"] = new_entity_id
 
         if new_unique_id is not _UNDEF:
-            conflict = next(
-                (
-                    entity
-                    for entity in self.entities.values()
-                    if entity.unique_id == new_unique_id
-                    and entity.domain == old.domain
-                    and entity.platform == old.platform
-                ),
-                None,
-            )
+            conflict = self.async_get_entity_id(old.domain, old.platform, new_unique_id)
             if conflict:
                 raise ValueError(
                     "Unique id '{}' is already in use by '{}'".format(
-                        new_unique_id, conflict.entity_id
+                        new_unique_id, conflict
                     )
                 )
             changes["unique_id"] = new_unique_id
@@ -319,7 +316,7 @@ class EntityRegistry:
             old_conf_load_func=load_yaml,
             old_conf_migrate_func=_async_migrate,
         )
-        entities: Dict[str, RegistryEntry] = OrderedDict()
+        entities = EntityRegistryItems()
 
         if data is not None:
             for entity in data["entities"]:
@@ -363,11 +360,7 @@ class EntityRegistry:
     @callback
     def async_clear_config_entry(self, config_entry: str) -> None:
         """Clear config entry from registry entries."""
-        for entity_id in [
-            entity_id
-            for entity_id, entry in self.entities.items()
-            if config_entry == entry.config_entry_id
-        ]:
+        for entity_id in self.entities.lookup("config_entry_id", config_entry):
             self.async_remove(entity_id)
 
 
@@ -399,9 +392,15 @@ def async_entries_for_device(
     registry: EntityRegistry, device_id: str
 ) -> List[RegistryEntry]:
     """Return entries that match a device."""
-    return [
-        entry for entry in registry.entities.values() if entry.device_id == device_id
-    ]
+    return registry.entities.lookup_values("device_id", device_id)
+
+
+@callback
+def async_entries_for_config_entry(
+    registry: EntityRegistry, config_entry_id: str
+) -> List[RegistryEntry]:
+    """Return entries that match a config entry."""
+    return registry.entities.lookup_values("config_entry_id", config_entry_id)
 
 
 async def _async_migrate(entities: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
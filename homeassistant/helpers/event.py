@@ -1,14 +1,35 @@
 """Helpers for listening to events."""
 from datetime import datetime, timedelta
 import functools as ft
-from typing import Any, Callable, Dict, Iterable, Optional, Union, cast
+import heapq
+from itertools import count
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 import attr
 
 from homeassistant.loader import bind_hass
 from homeassistant.helpers.sun import get_astral_event_next
-from homeassistant.helpers.template import Template
-from homeassistant.core import HomeAssistant, callback, CALLBACK_TYPE, Event, State
+from homeassistant.helpers.template import RenderInfo, Template
+from homeassistant.core import (
+    HomeAssistant,
+    callback,
+    CALLBACK_TYPE,
+    Event,
+    State,
+    split_entity_id,
+)
 from homeassistant.const import (
     ATTR_NOW,
     EVENT_STATE_CHANGED,
@@ -22,6 +43,11 @@ from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
 
 
+# Minimum time between template re-renders caused by whole domains or all states
+TEMPLATE_RATE_LIMIT = timedelta(seconds=1)
+
+DATA_TIME_SCHEDULE = "time_pattern_schedule"
+
 # PyLint does not like the use of threaded_listener_factory
 # pylint: disable=invalid-name
 
@@ -123,23 +149,164 @@ def async_track_template(
 
     # Local variable to keep track of if the action has already been triggered
     already_triggered = False
+    # Dynamic templates that access no state are checked on every state change
+    unsub_all: Optional[CALLBACK_TYPE] = None
 
     @callback
-    def template_condition_listener(entity_id: str, from_s: State, to_s: State) -> None:
+    def render() -> bool:
+        """Render the template and follow the states it depends on."""
+        nonlocal unsub_all
+        info = template.async_render_to_info(variables)
+        tracker.async_set_render_infos([info])
+        if info.is_static or info.entities or info.domains or info.all_states:
+            if unsub_all is not None:
+                unsub_all()
+                unsub_all = None
+        elif unsub_all is None:
+            unsub_all = hass.bus.async_listen(
+                EVENT_STATE_CHANGED, template_condition_listener
+            )
+        return condition.async_template_from_info(info)
+
+    @callback
+    def template_condition_listener(event: Event) -> None:
         """Check if condition is correct and run action."""
         nonlocal already_triggered
-        template_result = condition.async_template(hass, template, variables)
+        template_result = render()
 
         # Check to see if template returns true
         if template_result and not already_triggered:
             already_triggered = True
-            hass.async_run_job(action, entity_id, from_s, to_s)
+            hass.async_run_job(
+                action,
+                event.data.get("entity_id"),
+                event.data.get("old_state"),
+                event.data.get("new_state"),
+            )
         elif not template_result:
             already_triggered = False
 
-    return async_track_state_change(
-        hass, template.extract_entities(variables), template_condition_listener
-    )
+    @callback
+    def async_remove() -> None:
+        """Stop tracking the template."""
+        tracker.async_remove()
+        if unsub_all is not None:
+            unsub_all()
+
+    tracker = TrackRenderInfo(hass, template_condition_listener)
+    render()
+    return async_remove
+
+
+class TrackRenderInfo:
+    """Listen to the state changes that affect the last render of templates.
+
+    After every render, the RenderInfo of the tracked templates is passed to
+    async_set_render_infos. The action then runs for changes of the entities
+    they accessed and for entities added to or removed from the domains they
+    iterated. Renders that accessed no state are not affected by any state
+    change and are not listened for. Runs caused by whole domains or all
+    states are limited to one per rate_limit.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        action: Callable[[Event], None],
+        rate_limit: timedelta = TEMPLATE_RATE_LIMIT,
+    ) -> None:
+        """Initialize the tracker."""
+        self.hass = hass
+        self._action = action
+        self._rate_limit = rate_limit
+        self._entities: FrozenSet[str] = frozenset()
+        self._domains: FrozenSet[str] = frozenset()
+        self._all_states = False
+        self._last_run: Optional[datetime] = None
+        self._delayed_event: Optional[Event] = None
+        self._unsub_state: Optional[CALLBACK_TYPE] = None
+        self._unsub_delayed: Optional[CALLBACK_TYPE] = None
+
+    @callback
+    def async_set_render_infos(self, infos: Iterable[RenderInfo]) -> None:
+        """Follow the states the latest renders depend on."""
+        entities: Set[str] = set()
+        domains: Set[str] = set()
+        self._all_states = False
+        for info in infos:
+            entities.update(info.entities)
+            domains.update(info.domains)
+            self._all_states = self._all_states or info.all_states
+
+        self._entities = frozenset(entities)
+        self._domains = frozenset(domains)
+
+        if not (self._entities or self._domains or self._all_states):
+            if self._unsub_state is not None:
+                self._unsub_state()
+                self._unsub_state = None
+        elif self._unsub_state is None:
+            self._unsub_state = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_state_changed
+            )
+
+    @callback
+    def async_remove(self) -> None:
+        """Stop listening to state changes."""
+        if self._unsub_state is not None:
+            self._unsub_state()
+            self._unsub_state = None
+        if self._unsub_delayed is not None:
+            self._unsub_delayed()
+            self._unsub_delayed = None
+        self._delayed_event = None
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Run the action if the change affects the templates."""
+        entity_id = event.data["entity_id"]
+        if entity_id in self._entities:
+            self._async_run(event)
+            return
+
+        if (
+            event.data.get("old_state") is None or event.data.get("new_state") is None
+        ) and (self._all_states or split_entity_id(entity_id)[0] in self._domains):
+            self._async_run_limited(event)
+
+    @callback
+    def _async_run_limited(self, event: Event) -> None:
+        """Run the action at most once per rate limit."""
+        if self._unsub_delayed is not None:
+            self._delayed_event = event
+            return
+
+        now = dt_util.utcnow()
+        if self._last_run is None or now - self._last_run >= self._rate_limit:
+            self._async_run(event)
+            return
+
+        @callback
+        def run_delayed(_: datetime) -> None:
+            """Run the action for the last change after the rate limit."""
+            self._unsub_delayed = None
+            self._async_run(cast(Event, self._delayed_event))
+
+        self._delayed_event = event
+
+        self._unsub_delayed = async_track_point_in_utc_time(
+            self.hass, run_delayed, self._last_run + self._rate_limit
+        )
+
+    @callback
+    def _async_run(self, event: Event) -> None:
+        """Run the action."""
+        if self._unsub_delayed is not None:
+            self._unsub_delayed()
+            self._unsub_delayed = None
+        self._delayed_event = None
+        self._last_run = dt_util.utcnow()
+        self.hass.async_run_job(self._action, event)
 
 
 track_template = threaded_listener_factory(async_track_template)
@@ -417,42 +584,128 @@ def async_track_utc_time_change(
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
     matching_hours = dt_util.parse_time_expression(hour, 0, 23)
 
-    next_time = None
+    schedule = hass.data.get(DATA_TIME_SCHEDULE)
+    if schedule is None:
+        schedule = hass.data[DATA_TIME_SCHEDULE] = _TimePatternSchedule(hass)
+
+    return schedule.async_add(
+        _TimePattern(action, matching_seconds, matching_minutes, matching_hours, local)
+    )
+
 
-    def calculate_next(now: datetime) -> None:
-        """Calculate and set the next time the trigger should fire."""
-        nonlocal next_time
+class _TimePattern:
+    """Time pattern listener and the next time it fires."""
 
-        localized_now = dt_util.as_local(now) if local else now
-        next_time = dt_util.find_next_time_expression_time(
-            localized_now, matching_seconds, matching_minutes, matching_hours
+    __slots__ = ("action", "seconds", "minutes", "hours", "local", "next_time")
+
+    def __init__(
+        self,
+        action: Callable[..., None],
+        seconds: List[int],
+        minutes: List[int],
+        hours: List[int],
+        local: bool,
+    ) -> None:
+        """Initialize the listener."""
+        self.action = action
+        self.seconds = seconds
+        self.minutes = minutes
+        self.hours = hours
+        self.local = local
+        self.next_time: Optional[datetime] = None
+
+    def calculate_next(self, now: datetime) -> datetime:
+        """Calculate and set the next time the pattern matches."""
+        localized_now = dt_util.as_local(now) if self.local else now
+        self.next_time = dt_util.find_next_time_expression_time(
+            localized_now, self.seconds, self.minutes, self.hours
         )
+        return self.next_time
 
-    # Make sure rolling back the clock doesn't prevent the timer from
-    # triggering.
-    last_now: Optional[datetime] = None
 
-    @callback
-    def pattern_time_change_listener(event: Event) -> None:
-        """Listen for matching time_changed events."""
-        nonlocal next_time, last_now
+class _TimePatternSchedule:
+    """Time pattern listeners ordered by the next time they fire.
 
-        now = event.data[ATTR_NOW]
+    A single time_changed listener compares the time with the first entry
+    of a heap, so a second in which no pattern matches costs one comparison
+    however many patterns are tracked. Fired listeners are pushed back with
+    their next time. Listeners added since the last time event calculate
+    their next time from the next one.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the schedule."""
+        self.hass = hass
+        self._heap: List[Tuple[datetime, int, _TimePattern]] = []
+        self._pending: List[Tuple[int, _TimePattern]] = []
+        self._order: Dict[_TimePattern, int] = {}
+        self._counter = count()
+        self._last_now: Optional[datetime] = None
+        self._unsub: Optional[CALLBACK_TYPE] = None
 
-        if last_now is None or now < last_now:
-            # Time rolled back or next time not yet calculated
-            calculate_next(now)
+    @callback
+    def async_add(self, pattern: _TimePattern) -> CALLBACK_TYPE:
+        """Add a time pattern listener."""
+        order = next(self._counter)
+        self._order[pattern] = order
+        self._pending.append((order, pattern))
+
+        if self._unsub is None:
+            self._unsub = self.hass.bus.async_listen(
+                EVENT_TIME_CHANGED, self._async_time_changed
+            )
 
-        last_now = now
+        @callback
+        def async_remove() -> None:
+            """Remove the listener, it leaves the heap when it is reached."""
+            del self._order[pattern]
+            if not self._order and self._unsub is not None:
+                self._unsub()
+                self._unsub = None
+                self._heap.clear()
+                self._pending.clear()
+                self._last_now = None
+
+        return async_remove
+
+    def _push(self, order: int, pattern: _TimePattern, now: datetime) -> None:
+        """Schedule a listener at the first match at or after now."""
+        heapq.heappush(self._heap, (pattern.calculate_next(now), order, pattern))
 
-        if next_time <= now:
-            hass.async_run_job(action, dt_util.as_local(now) if local else now)
-            calculate_next(now + timedelta(seconds=1))
+    @callback
+    def _async_time_changed(self, event: Event) -> None:
+        """Run the listeners whose next time has come."""
+        now = event.data[ATTR_NOW]
+
+        # Make sure rolling back the clock doesn't prevent the timers from
+        # triggering.
+        if self._last_now is not None and now < self._last_now:
+            self._heap = []
+            for pattern, order in self._order.items():
+                self._push(order, pattern, now)
+            self._pending.clear()
+        self._last_now = now
+
+        if self._pending:
+            for order, pattern in self._pending:
+                if pattern in self._order:
+                    self._push(order, pattern, now)
+            self._pending.clear()
+
+        heap = self._heap
+        fired = []
+        while heap and heap[0][0] <= now:
+            _, order, pattern = heapq.heappop(heap)
+            if pattern not in self._order:
+                continue
+            fired.append((order, pattern))
+            self.hass.async_run_job(
+                pattern.action, dt_util.as_local(now) if pattern.local else now
+            )
 
-    # We can't use async_track_point_in_utc_time here because it would
-    # break in the case that the system time abruptly jumps backwards.
-    # Our custom last_now logic takes care of resolving that scenario.
-    return hass.bus.async_listen(EVENT_TIME_CHANGED, pattern_time_change_listener)
+        for order, pattern in fired:
+            if pattern in self._order:
+                self._push(order, pattern, now + timedelta(seconds=1))
 
 
 track_utc_time_change = threaded_listener_factory(async_track_utc_time_change)
@@ -0,0 +1,259 @@
+"""Fan out bus events to streaming clients with a single encode per event."""
+import asyncio
+from collections import deque
+import json
+import logging
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Set
+
+from homeassistant.const import EVENT_TIME_CHANGED, MATCH_ALL
+from homeassistant.core import CALLBACK_TYPE, Event, callback
+from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.typing import HomeAssistantType
+from homeassistant.loader import bind_hass
+
+# mypy: allow-untyped-calls, allow-untyped-defs
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_EVENT_FANOUT = "event_fanout"
+
+# What to do when the buffer of a client is full
+POLICY_DROP_OLDEST = "drop_oldest"
+POLICY_DISCONNECT = "disconnect"
+
+DEFAULT_BUFFER_SIZE = 512
+
+TargetType = Callable[[Event, str], None]
+
+
+@bind_hass
+@callback
+def async_get_fanout(hass: HomeAssistantType) -> "EventFanout":
+    """Return the event fanout of this instance."""
+    fanout = hass.data.get(DATA_EVENT_FANOUT)
+    if fanout is None:
+        fanout = hass.data[DATA_EVENT_FANOUT] = EventFanout(hass)
+    return fanout
+
+
+class _Subscription:
+    """A target with its server side filters."""
+
+    __slots__ = ["target", "event_types", "entity_ids", "event_filter"]
+
+    def __init__(
+        self,
+        target: TargetType,
+        event_types: Optional[Set[str]],
+        entity_ids: Optional[Set[str]],
+        event_filter: Optional[Callable[[Event], bool]],
+    ) -> None:
+        """Initialize the subscription."""
+        self.target = target
+        self.event_types = event_types
+        self.entity_ids = entity_ids
+        self.event_filter = event_filter
+
+    def matches(self, event: Event) -> bool:
+        """Return if the event passes the filters."""
+        if self.event_types is not None and event.event_type not in self.event_types:
+            return False
+        if (
+            self.entity_ids is not None
+            and event.data.get("entity_id") not in self.entity_ids
+        ):
+            return False
+        return self.event_filter is None or self.event_filter(event)
+
+
+class EventFanout:
+    """Share one bus listener and one JSON encode per event between clients.
+
+    Events of type time_changed are never sent to MATCH_ALL subscriptions.
+    """
+
+    def __init__(self, hass: HomeAssistantType) -> None:
+        """Initialize the fanout."""
+        self.hass = hass
+        self._subscriptions: Dict[str, List[_Subscription]] = {}
+        self._unsub_listeners: Dict[str, CALLBACK_TYPE] = {}
+        self._buffers: Set["EventBuffer"] = set()
+        self._last_event: Optional[Event] = None
+        self._last_encoded: Optional[str] = None
+        self.events = 0
+        self.encodes = 0
+
+    @callback
+    def async_subscribe(
+        self,
+        target: TargetType,
+        event_type: str = MATCH_ALL,
+        *,
+        event_types: Optional[Iterable[str]] = None,
+        entity_ids: Optional[Iterable[str]] = None,
+        event_filter: Optional[Callable[[Event], bool]] = None,
+    ) -> CALLBACK_TYPE:
+        """Subscribe a target to events.
+
+        The target is called with the event and its JSON encoding.
+        """
+        subscription = _Subscription(
+            target,
+            set(event_types) if event_types is not None else None,
+            set(entity_ids) if entity_ids is not None else None,
+            event_filter,
+        )
+        subscriptions = self._subscriptions.setdefault(event_type, [])
+        subscriptions.append(subscription)
+
+        if event_type not in self._unsub_listeners:
+
+            @callback
+            def dispatch(event: Event) -> None:
+                """Dispatch an event to the subscriptions."""
+                self._async_dispatch(event_type, event)
+
+            self._unsub_listeners[event_type] = self.hass.bus.async_listen(
+                event_type, dispatch
+            )
+
+        @callback
+        def unsubscribe() -> None:
+            """Remove the subscription."""
+            subscriptions.remove(subscription)
+            if not subscriptions:
+                self._subscriptions.pop(event_type)
+                self._unsub_listeners.pop(event_type)()
+
+        return unsubscribe
+
+    @callback
+    def async_track_buffer(self, buffer: "EventBuffer") -> None:
+        """Include the metrics of a client buffer in the stats."""
+        self._buffers.add(buffer)
+
+    @callback
+    def async_untrack_buffer(self, buffer: "EventBuffer") -> None:
+        """Stop including the metrics of a client buffer in the stats."""
+        self._buffers.discard(buffer)
+
+    @callback
+    def _async_dispatch(self, event_type: str, event: Event) -> None:
+        """Encode an event once and pass it to the matching subscriptions."""
+        if event_type == MATCH_ALL and event.event_type == EVENT_TIME_CHANGED:
+            return
+
+        self.events += 1
+        encoded = None
+        for subscription in list(self._subscriptions.get(event_type, ())):
+            if not subscription.matches(event):
+                continue
+
+            if encoded is None:
+                encoded = self._async_encode(event)
+                if encoded is None:
+                    return
+
+            subscription.target(event, encoded)
+
+    @callback
+    def _async_encode(self, event: Event) -> Optional[str]:
+        """Return the JSON encoding of an event, reusing the last one."""
+        if event is self._last_event:
+            return self._last_encoded
+
+        try:
+            encoded = json.dumps(event, cls=JSONEncoder, allow_nan=False)
+        except (ValueError, TypeError) as err:
+            _LOGGER.error("Unable to serialize event to JSON: %s\n%s", err, event)
+            encoded = None
+
+        self.encodes += 1
+        self._last_event = event
+        self._last_encoded = encoded
+        return encoded
+
+    @callback
+    def async_stats(self) -> Dict[str, Any]:
+        """Return counters of the fanout and its buffered clients."""
+        return {
+            "events": self.events,
+            "encodes": self.encodes,
+            "subscriptions": sum(len(subs) for subs in self._subscriptions.values()),
+            "clients": [buffer.stats for buffer in self._buffers],
+            "lagging_clients": sum(1 for buffer in self._buffers if buffer.lagging),
+        }
+
+
+class EventBuffer:
+    """Bounded buffer of encoded events for a streaming client."""
+
+    def __init__(
+        self, size: int = DEFAULT_BUFFER_SIZE, policy: str = POLICY_DROP_OLDEST
+    ) -> None:
+        """Initialize the buffer."""
+        self.size = size
+        self.policy = policy
+        self.closed = False
+        self.delivered = 0
+        self.dropped = 0
+        self.max_lag = 0
+        self._buffer: Deque[str] = deque()
+        self._wakeup = asyncio.Event()
+
+    @property
+    def lag(self) -> int:
+        """Return the number of events waiting to be sent."""
+        return len(self._buffer)
+
+    @property
+    def lagging(self) -> bool:
+        """Return if the client is falling behind."""
+        return len(self._buffer) > self.size // 2
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Return the counters of this client."""
+        return {
+            "policy": self.policy,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "lag": self.lag,
+            "max_lag": self.max_lag,
+        }
+
+    @callback
+    def async_put(self, event: Event, encoded: str) -> None:
+        """Add an encoded event, applying the overflow policy."""
+        if self.closed:
+            return
+
+        if len(self._buffer) >= self.size:
+            self.dropped += 1
+            if self.policy == POLICY_DISCONNECT:
+                _LOGGER.warning("Client exceeded %s pending events", self.size)
+                self._buffer.clear()
+                self.async_close()
+                return
+            self._buffer.popleft()
+
+        self._buffer.append(encoded)
+        self.max_lag = max(self.max_lag, len(self._buffer))
+        self._wakeup.set()
+
+    @callback
+    def async_close(self) -> None:
+        """Close the buffer, events already buffered are still returned."""
+        self.closed = True
+        self._wakeup.set()
+
+    async def async_get(self) -> Optional[str]:
+        """Return the next encoded event or None once closed."""
+        while not self._buffer:
+            if self.closed:
+                return None
+            self._wakeup.clear()
+            await self._wakeup.wait()
+
+        self.delivered += 1
+        return self._buffer.popleft()
@@ -0,0 +1,270 @@
+"""Batch bus events and export them to external services from a thread."""
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, EVENT_STATE_CHANGED
+from homeassistant.core import Event, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.typing import HomeAssistantType
+
+# mypy: allow-untyped-calls, allow-untyped-defs
+
+_LOGGER = logging.getLogger(__name__)
+
+# What to do when the queue is full
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
+
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_BATCH_TIMEOUT = 1
+DEFAULT_QUEUE_SIZE = 10000
+DEFAULT_MAX_TRIES = 3
+
+RETRY_DELAY = 1
+MAX_RETRY_DELAY = 30
+SHUTDOWN_TIMEOUT = 10
+# Seconds between logging the counters
+STATS_LOG_INTERVAL = 300
+
+EncoderType = Callable[[Event], Optional[Iterable[Any]]]
+
+
+class ExportError(HomeAssistantError):
+    """Error raised by a transport when a batch should be retried."""
+
+
+class Transport:
+    """Deliver batches of encoded items to a service.
+
+    Methods are only called from the exporter thread, so implementations may
+    block and keep their connection open between batches.
+    """
+
+    def send(self, batch: List[Any]) -> None:
+        """Send a batch, raising ExportError if it should be retried."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Close the connection to the service."""
+
+
+class BatchingExporter(threading.Thread):
+    """Queue events, encode them and send them to a transport in batches.
+
+    The encoder turns an event into a list of items, or None to skip it.
+    Items are collected until batch_size items are pending or batch_timeout
+    seconds have passed since the first one, and then handed to the
+    transport. Failed batches are retried with exponential backoff. When the
+    queue is full either the oldest or the newest event is dropped.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistantType,
+        name: str,
+        encoder: EncoderType,
+        transport: Transport,
+        *,
+        event_types: Iterable[str] = (EVENT_STATE_CHANGED,),
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        batch_timeout: float = DEFAULT_BATCH_TIMEOUT,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        max_tries: int = DEFAULT_MAX_TRIES,
+        drop_policy: str = DROP_OLDEST,
+    ) -> None:
+        """Initialize the exporter."""
+        super().__init__(name=name, daemon=True)
+        self.encoder = encoder
+        self.transport = transport
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        self.max_tries = max_tries
+        self.drop_policy = drop_policy
+        self.queue: "queue.Queue[Optional[Tuple[float, Event]]]" = queue.Queue(
+            maxsize=queue_size
+        )
+        self.shutdown = False
+        self._stopping = threading.Event()
+        self.sent = 0
+        self.batches = 0
+        self.dropped = 0
+        self.failed = 0
+        self.retries = 0
+        self.max_lag = 0.0
+        self._write_errors = 0
+        self._logged_losses = 0
+        self._next_stats_log = time.monotonic() + STATS_LOG_INTERVAL
+
+        # Integrations create exporters in their sync setup, bus.listen runs
+        # async_listen in the event loop for them
+        for event_type in event_types:
+            hass.bus.listen(event_type, self.event_listener)
+        hass.bus.listen_once(EVENT_HOMEASSISTANT_STOP, self.stop)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Return the counters of this exporter."""
+        return {
+            "queued": self.queue.qsize(),
+            "sent": self.sent,
+            "batches": self.batches,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "retries": self.retries,
+            "max_lag": round(self.max_lag, 3),
+        }
+
+    def log_stats(self) -> None:
+        """Log the counters, as a warning if items were lost since last time."""
+        stats = self.stats
+        losses = self.dropped + self.failed
+        level = logging.WARNING if losses > self._logged_losses else logging.DEBUG
+        self._logged_losses = losses
+        _LOGGER.log(
+            level,
+            "%s: %d queued, %d sent, %d dropped, %d failed, max lag %s seconds",
+            self.name,
+            stats["queued"],
+            stats["sent"],
+            stats["dropped"],
+            stats["failed"],
+            stats["max_lag"],
+        )
+
+    @callback
+    def event_listener(self, event: Event) -> None:
+        """Queue an event, applying the drop policy if the queue is full.
+
+        Runs in the event loop, the queue never blocks.
+        """
+        item = (time.monotonic(), event)
+        try:
+            self.queue.put_nowait(item)
+            return
+        except queue.Full:
+            pass
+
+        self.dropped += 1
+        if self.dropped == 1:
+            _LOGGER.warning("%s: Queue is full, dropping events", self.name)
+        if self.drop_policy == DROP_NEWEST:
+            return
+        self._drop_oldest()
+        try:
+            self.queue.put_nowait(item)
+        except queue.Full:
+            pass
+
+    def _drop_oldest(self) -> None:
+        """Remove the oldest queued event."""
+        try:
+            self.queue.get_nowait()
+        except queue.Empty:
+            return
+        self.queue.task_done()
+
+    def stop(self, event: Optional[Event] = None) -> None:
+        """Send the queued events and stop the thread."""
+        self._stopping.set()
+        while True:
+            try:
+                self.queue.put_nowait(None)
+                break
+            except queue.Full:
+                self.dropped += 1
+                self._drop_oldest()
+        if self.is_alive():
+            self.join(SHUTDOWN_TIMEOUT)
+
+    def get_batch(self) -> Tuple[int, List[Any]]:
+        """Return the number of events taken and a batch of encoded items."""
+        count = 0
+        batch: List[Any] = []
+        first_queued = None
+        deadline = None
+
+        try:
+            while len(batch) < self.batch_size:
+                if deadline is None:
+                    item = self.queue.get()
+                else:
+                    item = self.queue.get(timeout=max(deadline - time.monotonic(), 0))
+                count += 1
+
+                if item is None:
+                    self.shutdown = True
+                    break
+
+                queued, event = item
+                if first_queued is None:
+                    first_queued = queued
+                    deadline = time.monotonic() + self.batch_timeout
+
+                try:
+                    items = self.encoder(event)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("%s: Failed to encode %s", self.name, event)
+                    continue
+
+                if items:
+                    batch.extend(items)
+        except queue.Empty:
+            pass
+
+        if first_queued is not None:
+            self.max_lag = max(self.max_lag, time.monotonic() - first_queued)
+
+        return count, batch
+
+    def send(self, batch: List[Any]) -> None:
+        """Send a batch to the transport, retrying with backoff."""
+        for attempt in range(self.max_tries):
+            try:
+                self.transport.send(batch)
+                break
+            except ExportError as err:
+                if attempt + 1 == self.max_tries:
+                    if not self._write_errors:
+                        _LOGGER.error("%s: Write error: %s", self.name, err)
+                    self._write_failed(batch)
+                    return
+                self.retries += 1
+                _LOGGER.debug("%s: Retrying after error: %s", self.name, err)
+                self._stopping.wait(min(RETRY_DELAY * 2 ** attempt, MAX_RETRY_DELAY))
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("%s: Unexpected error sending batch", self.name)
+                self._write_failed(batch)
+                return
+
+        if self._write_errors:
+            _LOGGER.error("%s: Resumed, lost %d items", self.name, self._write_errors)
+            self._write_errors = 0
+        self.sent += len(batch)
+        self.batches += 1
+        _LOGGER.debug("%s: Sent %d items", self.name, len(batch))
+
+    def _write_failed(self, batch: List[Any]) -> None:
+        """Account for a batch that could not be sent."""
+        self._write_errors += len(batch)
+        self.failed += len(batch)
+
+    def run(self) -> None:
+        """Process queued events until stopped."""
+        while not self.shutdown:
+            count, batch = self.get_batch()
+            if batch:
+                self.send(batch)
+            for _ in range(count):
+                self.queue.task_done()
+            if time.monotonic() >= self._next_stats_log:
+                self._next_stats_log = time.monotonic() + STATS_LOG_INTERVAL
+                self.log_stats()
+        self.log_stats()
+        self.transport.close()
+
+    def block_till_done(self) -> None:
+        """Block till all queued events are processed."""
+        self.queue.join()
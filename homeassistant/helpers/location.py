@@ -29,11 +29,29 @@ def closest(
     """
     with_location = [state for state in states if has_location(state)]
 
-    if not with_location:
-        return None
+    if len(with_location) < 2:
+        return with_location[0] if with_location else None
+
+    # Only states that can be the closest by great circle distance need the
+    # exact distance
+    approx = [
+        loc_util.haversine(
+            state.attributes[ATTR_LATITUDE],
+            state.attributes[ATTR_LONGITUDE],
+            latitude,
+            longitude,
+        )
+        for state in with_location
+    ]
+    bound = min(approx) * (1 + loc_util.HAVERSINE_ERROR) + 1
+    candidates = [
+        state
+        for state, dist in zip(with_location, approx)
+        if dist * (1 - loc_util.HAVERSINE_ERROR) - 1 <= bound
+    ]
 
     return min(
-        with_location,
+        candidates,
         key=lambda state: loc_util.distance(
             state.attributes.get(ATTR_LATITUDE),
             state.attributes.get(ATTR_LONGITUDE),
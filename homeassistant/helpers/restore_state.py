@@ -2,7 +2,7 @@
 import asyncio
 import logging
 from datetime import timedelta, datetime
-from typing import Any, Dict, List, Set, Optional
+from typing import Any, Dict, List, Set, Optional, Tuple
 
 from homeassistant.core import (
     HomeAssistant,
@@ -28,11 +28,16 @@ DATA_RESTORE_STATE_TASK = "restore_state_task"
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = "core.restore_state"
+STORAGE_KEY_DELTA = "core.restore_state_delta"
 STORAGE_VERSION = 1
 
 # How long between periodically saving the current states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
 
+# How long between saving a full snapshot of the states to disk. Dumps in
+# between only save the states that changed since the last snapshot.
+STATE_SNAPSHOT_INTERVAL = timedelta(hours=24)
+
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
@@ -80,6 +85,15 @@ class RestoreStateData:
                     _LOGGER.error("Error loading last states", exc_info=exc)
                     stored_states = None
 
+                try:
+                    delta = await data.delta_store.async_load()
+                except HomeAssistantError as exc:
+                    _LOGGER.error("Error loading last state changes", exc_info=exc)
+                    delta = None
+
+                if delta:
+                    stored_states = _merge_delta(stored_states or [], delta)
+
                 if stored_states is None:
                     _LOGGER.debug("Not creating cache - no saved states found")
                     data.last_states = {}
@@ -112,8 +126,16 @@ class RestoreStateData:
         self.store: Store = Store(
             hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
         )
+        self.delta_store: Store = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY_DELTA, encoder=JSONEncoder
+        )
         self.last_states: Dict[str, StoredState] = {}
         self.entity_ids: Set[str] = set()
+        # entity_id -> (state, serialized state) as of the last dump
+        self._serialized: Dict[str, Tuple[State, Dict]] = {}
+        # entity_id -> state as written in the last snapshot
+        self._snapshot: Dict[str, State] = {}
+        self._snapshot_time: Optional[datetime] = None
 
     def async_get_stored_states(self) -> List[StoredState]:
         """Get the set of states which should be stored.
@@ -148,18 +170,89 @@ class RestoreStateData:
 
         return stored_states
 
-    async def async_dump_states(self) -> None:
-        """Save the current state machine to storage."""
+    async def async_dump_states(self, full: bool = False) -> None:
+        """Save the current state machine to storage.
+
+        Only states that changed since the last dump are serialized again,
+        and only states that changed since the last snapshot are written,
+        unless a full snapshot is requested or due.
+        """
         _LOGGER.debug("Dumping states")
+        now = dt_util.utcnow()
+        stored_states = self.async_get_stored_states()
+
+        dirty = [
+            stored_state.state
+            for stored_state in stored_states
+            if self._serialized.get(stored_state.state.entity_id, (None,))[0]
+            is not stored_state.state
+        ]
+        if dirty:
+            self._serialized.update(
+                await self.hass.async_add_executor_job(_serialize_states, dirty)
+            )
+
+        stored_ids = {stored_state.state.entity_id for stored_state in stored_states}
+        for entity_id in set(self._serialized) - stored_ids:
+            del self._serialized[entity_id]
+
+        changed = [
+            stored_state
+            for stored_state in stored_states
+            if self._snapshot.get(stored_state.state.entity_id)
+            is not stored_state.state
+        ]
+        removed = [
+            entity_id for entity_id in self._snapshot if entity_id not in stored_ids
+        ]
+
+        if (
+            full
+            or self._snapshot_time is None
+            or now - self._snapshot_time >= STATE_SNAPSHOT_INTERVAL
+            or len(changed) + len(removed) > len(stored_states) // 2
+        ):
+            await self._async_save_snapshot(stored_states, now)
+            return
+
+        _LOGGER.debug("Saving %s changed states", len(changed))
+        try:
+            await self.delta_store.async_save(
+                {
+                    "last_seen": now,
+                    "changed": [self._as_dict(item) for item in changed],
+                    "removed": removed,
+                }
+            )
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error saving current states", exc_info=exc)
+
+    async def _async_save_snapshot(
+        self, stored_states: List[StoredState], now: datetime
+    ) -> None:
+        """Save all stored states as a new snapshot."""
         try:
             await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+                [self._as_dict(stored_state) for stored_state in stored_states]
             )
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
+            return
+
+        # A delta written before this snapshot is ignored on load, as it is
+        # older than the snapshot.
+        self._snapshot = {
+            stored_state.state.entity_id: stored_state.state
+            for stored_state in stored_states
+        }
+        self._snapshot_time = now
+
+    def _as_dict(self, stored_state: StoredState) -> Dict:
+        """Return a dict representation of a stored state from the cache."""
+        return {
+            "state": self._serialized[stored_state.state.entity_id][1],
+            "last_seen": stored_state.last_seen,
+        }
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
@@ -168,6 +261,9 @@ class RestoreStateData:
         def _async_dump_states(*_: Any) -> None:
             self.hass.async_create_task(self.async_dump_states())
 
+        def _async_dump_snapshot(*_: Any) -> None:
+            self.hass.async_create_task(self.async_dump_states(full=True))
+
         # Dump the initial states now. This helps minimize the risk of having
         # old states loaded by overwritting the last states once home assistant
         # has started and the old states have been read.
@@ -176,8 +272,8 @@ class RestoreStateData:
         # Dump states periodically
         async_track_time_interval(self.hass, _async_dump_states, STATE_DUMP_INTERVAL)
 
-        # Dump states when stopping hass
-        self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_dump_states)
+        # Dump a full snapshot when stopping hass
+        self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_dump_snapshot)
 
     @callback
     def async_restore_entity_added(self, entity_id: str) -> None:
@@ -201,6 +297,35 @@ class RestoreStateData:
         self.entity_ids.remove(entity_id)
 
 
+def _serialize_states(states: List[State]) -> Dict[str, Tuple[State, Dict]]:
+    """Serialize states to dicts.
+
+    Runs in the executor.
+    """
+    return {state.entity_id: (state, state.as_dict()) for state in states}
+
+
+def _merge_delta(stored_states: List[Dict], delta: Dict) -> List[Dict]:
+    """Apply the states changed since the snapshot to the snapshot."""
+
+    def as_datetime(value):
+        return dt_util.parse_datetime(value) if isinstance(value, str) else value
+
+    snapshot_time = max(
+        (as_datetime(item["last_seen"]) for item in stored_states), default=None
+    )
+    if snapshot_time is not None and as_datetime(delta["last_seen"]) < snapshot_time:
+        _LOGGER.debug("Ignoring state changes saved before the last snapshot")
+        return stored_states
+
+    merged = {item["state"]["entity_id"]: item for item in stored_states}
+    for entity_id in delta["removed"]:
+        merged.pop(entity_id, None)
+    for item in delta["changed"]:
+        merged[item["state"]["entity_id"]] = item
+    return list(merged.values())
+
+
 def _encode(value):
     """Little helper to JSON encode a value."""
     try:
@@ -4,6 +4,7 @@ import logging
 from contextlib import suppress
 from datetime import datetime
 from itertools import islice
+import time
 from typing import Optional, Sequence, Callable, Dict, List, Set, Tuple, Any
 
 import voluptuous as vol
@@ -33,6 +34,7 @@ from homeassistant.helpers.event import (
 from homeassistant.helpers.typing import ConfigType
 import homeassistant.util.dt as date_util
 from homeassistant.util.async_ import run_callback_threadsafe
+from homeassistant.util.metrics import Timing
 
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
@@ -148,6 +150,11 @@ class Script:
         )
         self._async_listener: List[CALLBACK_TYPE] = []
         self._config_cache: Dict[Set[Tuple], Callable[..., bool]] = {}
+        # Time spent in whole runs and in each step, including delays and waits
+        self.run_timing = Timing()
+        self.step_timings = [Timing() for _ in self.sequence]
+        self._run_started: Optional[float] = None
+        self._suspended: Optional[Tuple[int, float]] = None
         self._actions = {
             ACTION_DELAY: self._async_delay,
             ACTION_WAIT_TEMPLATE: self._async_wait_template,
@@ -180,23 +187,34 @@ class Script:
         if self._cur == -1:
             self._log("Running script")
             self._cur = 0
+            self._run_started = time.monotonic()
+        elif self._suspended is not None:
+            # The delay or wait that suspended the script is over
+            step, started = self._suspended
+            self.step_timings[step].add(time.monotonic() - started)
+            self._suspended = None
 
         # Unregister callback if we were in a delay or wait but turn on is
         # called again. In that case we just continue execution.
         self._async_remove_listener()
 
         for cur, action in islice(enumerate(self.sequence), self._cur, None):
+            started = time.monotonic()
             try:
                 await self._handle_action(action, variables, context)
             except _SuspendScript:
                 # Store next step to take and notify change listeners
                 self._cur = cur + 1
+                self._suspended = (cur, started)
                 if self._change_listener:
                     self.hass.async_add_job(self._change_listener)
                 return
             except _StopScript:
+                self.step_timings[cur].add(time.monotonic() - started)
                 break
             except Exception:
+                self.step_timings[cur].add(time.monotonic() - started, True)
+                self._async_finish_run(True)
                 # Store the step that had an exception
                 self._exception_step = cur
                 # Set script to not running
@@ -204,13 +222,41 @@ class Script:
                 self.last_action = None
                 # Pass exception on.
                 raise
+            self.step_timings[cur].add(time.monotonic() - started)
 
         # Set script to not-running.
+        self._async_finish_run()
         self._cur = -1
         self.last_action = None
         if self._change_listener:
             self.hass.async_add_job(self._change_listener)
 
+    @callback
+    def _async_finish_run(self, error: bool = False) -> None:
+        """Record the time a run took."""
+        if self._run_started is not None:
+            self.run_timing.add(time.monotonic() - self._run_started, error)
+            self._run_started = None
+        self._suspended = None
+
+    @callback
+    def async_metrics(self) -> Dict[str, Any]:
+        """Return the timing of runs and of each step."""
+        return {
+            "runs": self.run_timing.as_dict(),
+            "steps": [
+                {
+                    "step": step + 1,
+                    "type": _determine_action(action),
+                    "alias": action.get(CONF_ALIAS),
+                    **timing.as_dict(),
+                }
+                for step, (action, timing) in enumerate(
+                    zip(self.sequence, self.step_timings)
+                )
+            ],
+        }
+
     def stop(self) -> None:
         """Stop running script."""
         run_callback_threadsafe(self.hass.loop, self.async_stop).result()
@@ -220,6 +266,7 @@ class Script:
         if self._cur == -1:
             return
 
+        self._async_finish_run()
         self._cur = -1
         self._async_remove_listener()
         if self._change_listener:
@@ -7,7 +7,7 @@ import random
 import re
 from datetime import datetime
 from functools import wraps
-from typing import Any, Dict, Iterable, List, Optional, Union
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Union
 
 import jinja2
 from jinja2 import contextfilter, contextfunction
@@ -47,7 +47,7 @@ _RE_GET_ENTITIES = re.compile(
     r"\((?:[\ \'\"]?))([\w]+\.[\w]+)|([\w]+))",
     re.I | re.M,
 )
-_RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{")
+_RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 
 
 @bind_hass
@@ -145,6 +145,26 @@ class RenderInfo:
             raise self._exception  # pylint: disable=raising-bad-type
         return self._result
 
+    @property
+    def entities(self) -> FrozenSet[str]:
+        """Entities whose state was accessed by the render."""
+        return frozenset(self._entities)
+
+    @property
+    def domains(self) -> FrozenSet[str]:
+        """Domains whose states were iterated by the render."""
+        return getattr(self, "_domains", frozenset())
+
+    @property
+    def all_states(self) -> bool:
+        """Return if the render iterated all states."""
+        return self._all_states
+
+    @property
+    def is_static(self) -> bool:
+        """Return if the template has no expressions or statements."""
+        return self.template.is_static
+
     def _freeze(self) -> None:
         self._entities = frozenset(self._entities)
         if self._all_states:
@@ -171,6 +191,11 @@ class Template:
         self._compiled = None
         self.hass = hass
 
+    @property
+    def is_static(self) -> bool:
+        """Return if the template has no expressions or statements."""
+        return _RE_JINJA_DELIMITERS.search(self.template) is None
+
     @property
     def _env(self):
         if self.hass is None:
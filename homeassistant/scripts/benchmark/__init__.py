@@ -1,6 +1,7 @@
 """Script to run benchmarks."""
 import argparse
 import asyncio
+from collections import deque
 from contextlib import suppress
 from datetime import datetime
 import logging
@@ -186,3 +187,137 @@ def _logbook_filtering(hass, last_changed, last_updated):
     list(logbook.humanify(None, yield_events(event)))
 
     return timer() - start
+
+
+@benchmark
+async def statistics_window(hass):
+    """Update statistics over a window of 10000 samples."""
+    from homeassistant.components.statistics.window import SampleWindow
+
+    window = SampleWindow(10 ** 4)
+
+    def read():
+        """Read the statistics."""
+        return (
+            window.mean,
+            window.median,
+            window.stdev,
+            window.variance,
+            window.total,
+            window.min,
+            window.max,
+            window.last - window.first,
+        )
+
+    return _statistics_benchmark(window.append, read)
+
+
+@benchmark
+async def statistics_recompute(hass):
+    """Update statistics over 10000 samples by recomputing them."""
+    import statistics
+
+    states = deque(maxlen=10 ** 4)
+    ages = deque(maxlen=10 ** 4)
+
+    def add(value, now):
+        """Add a sample."""
+        states.append(value)
+        ages.append(now)
+
+    def read():
+        """Recompute the statistics."""
+        return (
+            statistics.mean(states),
+            statistics.median(states),
+            statistics.stdev(states),
+            statistics.variance(states),
+            sum(states),
+            min(states),
+            max(states),
+            states[-1] - states[0],
+        )
+
+    return _statistics_benchmark(add, read)
+
+
+def _statistics_benchmark(add, read):
+    """Fill a window and time updates for a hundred more samples."""
+    now = dt_util.utcnow()
+    values = [(i * 7919 % 1000) / 10 for i in range(10 ** 4 + 100)]
+
+    for value in values[: 10 ** 4]:
+        add(value, now)
+
+    start = timer()
+
+    for value in values[10 ** 4 :]:
+        add(value, now)
+        read()
+
+    return timer() - start
+
+
+@benchmark
+async def registry_startup(hass):
+    """Register 3000 entities of 600 devices on a first start and a restart."""
+    from homeassistant.helpers import device_registry, entity_registry
+
+    dev_reg = device_registry.DeviceRegistry(hass)
+    dev_reg.devices = device_registry.DeviceRegistryItems()
+    ent_reg = entity_registry.EntityRegistry(hass)
+    ent_reg.entities = entity_registry.EntityRegistryItems()
+
+    # Nothing is written to disk
+    dev_reg.async_schedule_save = ent_reg.async_schedule_save = lambda: None
+
+    start = timer()
+
+    for _ in range(2):
+        for device_index in range(600):
+            device = dev_reg.async_get_or_create(
+                config_entry_id="benchmark",
+                identifiers={("benchmark", str(device_index))},
+                connections={("mac", f"02:00:00:00:{device_index:04x}")},
+                name=f"Device {device_index}",
+            )
+            for entity_index in range(5):
+                ent_reg.async_get_or_create(
+                    "sensor",
+                    "benchmark",
+                    f"{device_index}-{entity_index}",
+                    device_id=device.id,
+                )
+
+    return timer() - start
+
+
+@benchmark
+async def group_members(hass):
+    """Change the members of nested groups of 500 lights and expand them."""
+    from homeassistant.components import group
+
+    entity_ids = [f"light.benchmark_{index}" for index in range(500)]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, "off")
+
+    async def add_group(object_id, members):
+        """Add a group without an entity component."""
+        entity = group.Group(hass, object_id, entity_ids=members)
+        entity.entity_id = f"group.{object_id}"
+        await entity.async_update_ha_state(True)
+        entity.async_start()
+
+    for index in range(5):
+        await add_group(f"lights_{index}", entity_ids[index::5])
+    await add_group("all_lights", [f"group.lights_{index}" for index in range(5)])
+    await hass.async_block_till_done()
+
+    start = timer()
+
+    for index in range(5000):
+        hass.states.async_set(entity_ids[index % 500], "on" if index % 3 else "off")
+        group.expand_entity_ids(hass, ["group.all_lights"])
+    await hass.async_block_till_done()
+
+    return timer() - start
@@ -333,10 +333,17 @@ def find_next_time_expression_time(
         # clocks are rolled forward, thus there are local times that do
         # not exist. In this case, we want to trigger on the next time
         # that *does* exist.
+        # Look for it on the naive time, which does not recurse any further.
         # In the worst case, this will run through all the seconds in the
         # time shift, but that's max 3600 operations for once per year
-        result = result.replace(tzinfo=tzinfo) + dt.timedelta(seconds=1)
-        return find_next_time_expression_time(result, seconds, minutes, hours)
+        while True:
+            result = find_next_time_expression_time(
+                result + dt.timedelta(seconds=1), seconds, minutes, hours
+            )
+            try:
+                return tzinfo.localize(result, is_dst=None)
+            except pytzexceptions.NonExistentTimeError:
+                pass
 
     result_dst = cast(dt.timedelta, result.dst())
     now_dst = cast(dt.timedelta, now.dst())
@@ -0,0 +1,70 @@
+"""Dictionary that keeps secondary indexes of its values."""
+from collections import UserDict
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+
+class IndexedDict(UserDict):
+    """Map ids to values and keep indexes of attributes of the values.
+
+    Subclasses name their indexes in INDEXES and return the keys a value has
+    in an index from index_keys. An index maps each key to the ids of the
+    values having it, in the order they got it. Indexes are updated when
+    values are set or deleted, so values must not be mutated in place.
+    """
+
+    INDEXES: Tuple[str, ...] = ()
+
+    def __init__(self, items: Optional[Dict[Hashable, Any]] = None) -> None:
+        """Initialize the dictionary."""
+        self.indexes: Dict[str, Dict[Hashable, Dict[Hashable, None]]] = {
+            name: {} for name in self.INDEXES
+        }
+        super().__init__(items)
+
+    def index_keys(self, name: str, value: Any) -> Iterable[Hashable]:
+        """Return the keys of a value in an index, None keys are skipped."""
+        raise NotImplementedError
+
+    def __setitem__(self, item_id: Hashable, value: Any) -> None:
+        """Set a value and update the indexes."""
+        old = self.data.get(item_id)
+        self.data[item_id] = value
+        for name, index in self.indexes.items():
+            new_keys = set(self.index_keys(name, value))
+            old_keys = set(self.index_keys(name, old)) if old is not None else set()
+            for key in old_keys - new_keys:
+                _discard(index, key, item_id)
+            for key in new_keys - old_keys:
+                if key is not None:
+                    index.setdefault(key, {})[item_id] = None
+
+    def __delitem__(self, item_id: Hashable) -> None:
+        """Delete a value and remove it from the indexes."""
+        value = self.data.pop(item_id)
+        for name, index in self.indexes.items():
+            for key in self.index_keys(name, value):
+                _discard(index, key, item_id)
+
+    def get(self, item_id: Hashable, default: Any = None) -> Any:
+        """Return a value or the default."""
+        return self.data.get(item_id, default)
+
+    def lookup(self, name: str, key: Hashable) -> List[Hashable]:
+        """Return the ids of the values with a key in an index."""
+        return list(self.indexes[name].get(key, ()))
+
+    def lookup_values(self, name: str, key: Hashable) -> List[Any]:
+        """Return the values with a key in an index."""
+        return [self.data[item_id] for item_id in self.indexes[name].get(key, ())]
+
+
+def _discard(
+    index: Dict[Hashable, Dict[Hashable, None]], key: Hashable, item_id: Hashable
+) -> None:
+    """Remove an id from the ids of a key."""
+    item_ids = index.get(key)
+    if item_ids is None:
+        return
+    item_ids.pop(item_id, None)
+    if not item_ids:
+        del index[key]
@@ -23,6 +23,11 @@ FLATTENING = 1 / 298.257223563
 # Axis b of the ellipsoid in meters.
 AXIS_B = 6356752.314245
 
+# Mean radius of the earth in meters, used for great circle distances
+EARTH_RADIUS = 6371008.8
+# Upper bound of the relative error of great circle distances on the ellipsoid
+HAVERSINE_ERROR = 0.01
+
 MILES_PER_KILOMETER = 0.621371
 MAX_ITERATIONS = 200
 CONVERGENCE_THRESHOLD = 1e-12
@@ -77,6 +82,24 @@ def distance(
     return result * 1000
 
 
+def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Calculate the great circle distance in meters between two points.
+
+    Cheaper than distance, and within HAVERSINE_ERROR of it plus a meter.
+
+    Async friendly.
+    """
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    sin_dphi = math.sin((phi2 - phi1) / 2)
+    sin_dlambda = math.sin(math.radians(lon2 - lon1) / 2)
+    a = (
+        sin_dphi * sin_dphi
+        + math.cos(phi1) * math.cos(phi2) * sin_dlambda * sin_dlambda
+    )
+    return 2 * EARTH_RADIUS * math.asin(min(1.0, math.sqrt(a)))
+
+
 # Author: https://github.com/maurycyp
 # Source: https://github.com/maurycyp/vincenty
 # License: https://github.com/maurycyp/vincenty/blob/master/LICENSE
@@ -0,0 +1,143 @@
+"""Cheap counters and histograms of execution times."""
+from bisect import bisect_left
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+# Upper bounds of the histogram buckets in seconds, the last bucket is open
+DEFAULT_BOUNDS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+)
+DEFAULT_WINDOW = 900.0
+DEFAULT_SLOTS = 15
+
+
+class RollingHistogram:
+    """Count durations in buckets over a sliding window of time.
+
+    The window is split in slots holding a counter per bucket. Adding a
+    duration increments one counter of the current slot and slots that fall
+    out of the window are cleared as time moves on, so adding is constant
+    time and reading only sums the slots.
+    """
+
+    def __init__(
+        self,
+        bounds: Sequence[float] = DEFAULT_BOUNDS,
+        window: float = DEFAULT_WINDOW,
+        slots: int = DEFAULT_SLOTS,
+    ) -> None:
+        """Initialize the histogram."""
+        self.bounds = tuple(bounds)
+        self.window = window
+        self._slot_length = window / slots
+        self._counts = [[0] * (len(self.bounds) + 1) for _ in range(slots)]
+        self._sums = [0.0] * slots
+        self._index = 0
+        self._epoch: Optional[int] = None
+
+    def _advance(self, now: float) -> None:
+        """Move to the slot of a point in time, clearing expired slots."""
+        epoch = int(now // self._slot_length)
+        if self._epoch is None:
+            self._epoch = epoch
+            return
+        for _ in range(min(epoch - self._epoch, len(self._counts))):
+            self._index = (self._index + 1) % len(self._counts)
+            counts = self._counts[self._index]
+            for bucket in range(len(counts)):
+                counts[bucket] = 0
+            self._sums[self._index] = 0.0
+        self._epoch = max(epoch, self._epoch)
+
+    def add(self, value: float, now: Optional[float] = None) -> None:
+        """Add a duration in seconds."""
+        self._advance(time.monotonic() if now is None else now)
+        self._counts[self._index][bisect_left(self.bounds, value)] += 1
+        self._sums[self._index] += value
+
+    def counts(self, now: Optional[float] = None) -> List[int]:
+        """Return the number of durations in each bucket within the window."""
+        self._advance(time.monotonic() if now is None else now)
+        return [sum(bucket) for bucket in zip(*self._counts)]
+
+    def as_dict(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """Return the buckets, their counts and estimated quantiles.
+
+        Quantiles are the upper bound of the bucket they fall in, or None if
+        they are in the open bucket or there are no durations.
+        """
+        counts = self.counts(now)
+        total = sum(counts)
+        result: Dict[str, Any] = {
+            "bounds": list(self.bounds),
+            "counts": counts,
+            "count": total,
+            "sum": round(sum(self._sums), 6),
+        }
+        for name, quantile in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99)):
+            result[name] = _quantile(self.bounds, counts, total, quantile)
+        return result
+
+
+def _quantile(
+    bounds: Sequence[float], counts: List[int], total: int, quantile: float
+) -> Optional[float]:
+    """Return the upper bound of the bucket a quantile falls in."""
+    if not total:
+        return None
+    rank = quantile * total
+    seen = 0
+    for bound, count in zip(bounds, counts):
+        seen += count
+        if seen >= rank:
+            return bound
+    return None
+
+
+class Timing:
+    """Count executions, failures and how long they took."""
+
+    __slots__ = ("count", "errors", "total", "max", "histogram")
+
+    def __init__(self) -> None:
+        """Initialize the timing."""
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.histogram = RollingHistogram()
+
+    def add(self, elapsed: float, error: bool = False) -> None:
+        """Record an execution that took elapsed seconds."""
+        self.count += 1
+        self.errors += error
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+        self.histogram.add(elapsed)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the totals and the histogram of the recent window."""
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total": round(self.total, 6),
+            "mean": round(self.total / self.count, 6) if self.count else None,
+            "max": round(self.max, 6),
+            "recent": self.histogram.as_dict(),
+        }
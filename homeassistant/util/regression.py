@@ -0,0 +1,127 @@
+"""Least squares fits over a sliding window of samples."""
+from array import array
+from typing import Any, Optional, Tuple
+
+
+class RollingRegression:
+    """Fit a trend to the last samples of a time series.
+
+    Samples are kept in a ring buffer of doubles. The sums needed for the
+    slope of a straight line fit are updated as samples are added and
+    evicted, so the slope is available in constant time. Times are stored
+    relative to the oldest sample when the sums were last recomputed, which
+    happens every time as many samples as fit in the window were evicted to
+    keep rounding errors in check.
+    """
+
+    def __init__(self, max_samples: int) -> None:
+        """Initialize the window."""
+        self.max_samples = max_samples
+        self._times = array("d", bytes(8 * max_samples))
+        self._values = array("d", bytes(8 * max_samples))
+        self._start = 0
+        self._count = 0
+        self._evicted = 0
+        self._origin = 0.0
+        self._sum_t = 0.0
+        self._sum_y = 0.0
+        self._sum_tt = 0.0
+        self._sum_ty = 0.0
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return self._count
+
+    def __bool__(self) -> bool:
+        """Return if there are samples."""
+        return self._count > 0
+
+    def __getitem__(self, index: int) -> Tuple[float, float]:
+        """Return a sample as a (time, value) tuple, oldest first."""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("sample index out of range")
+        index = (self._start + index) % self.max_samples
+        return self._origin + self._times[index], self._values[index]
+
+    def append(self, sample: Tuple[float, float]) -> None:
+        """Add a (time, value) sample, evicting the oldest when full."""
+        if self._count == self.max_samples:
+            self.popleft()
+        if not self._count:
+            self._origin = sample[0]
+
+        time = sample[0] - self._origin
+        value = sample[1]
+        index = (self._start + self._count) % self.max_samples
+        self._times[index] = time
+        self._values[index] = value
+        self._count += 1
+
+        self._sum_t += time
+        self._sum_y += value
+        self._sum_tt += time * time
+        self._sum_ty += time * value
+
+    def popleft(self) -> Tuple[float, float]:
+        """Remove and return the oldest sample."""
+        sample = self[0]
+        time = self._times[self._start]
+        value = self._values[self._start]
+        self._start = (self._start + 1) % self.max_samples
+        self._count -= 1
+        self._evicted += 1
+
+        if self._evicted >= self.max_samples or not self._count:
+            self._resync()
+        else:
+            self._sum_t -= time
+            self._sum_y -= value
+            self._sum_tt -= time * time
+            self._sum_ty -= time * value
+
+        return sample
+
+    def purge(self, cutoff: float) -> None:
+        """Remove the samples taken before a time."""
+        while self._count and self._origin + self._times[self._start] < cutoff:
+            self.popleft()
+
+    def _resync(self) -> None:
+        """Recompute the sums relative to the oldest sample."""
+        times, values = self._arrays()
+        shift = times[0] if self._count else 0.0
+        self._origin += shift
+        self._sum_t = self._sum_y = self._sum_tt = self._sum_ty = 0.0
+        for offset in range(self._count):
+            index = (self._start + offset) % self.max_samples
+            time = self._times[index] = times[offset] - shift
+            self._sum_t += time
+            self._sum_y += values[offset]
+            self._sum_tt += time * time
+            self._sum_ty += time * values[offset]
+        self._evicted = 0
+
+    def _arrays(self) -> Tuple[Any, Any]:
+        """Return the relative times and values of the samples in order."""
+        end = self._start + self._count
+        if end <= self.max_samples:
+            return (self._times[self._start : end], self._values[self._start : end])
+        end -= self.max_samples
+        return (
+            self._times[self._start :] + self._times[:end],
+            self._values[self._start :] + self._values[:end],
+        )
+
+    @property
+    def slope(self) -> Optional[float]:
+        """Return the slope of the least squares line through the samples.
+
+        Returns None if there are less than two distinct sample times.
+        """
+        count = self._count
+        denominator = count * self._sum_tt - self._sum_t * self._sum_t
+        if count < 2 or denominator <= 0:
+            return None
+        return (count * self._sum_ty - self._sum_t * self._sum_y) / denominator
@@ -1,7 +1,14 @@
 """Test report state."""
+from datetime import timedelta
+from unittest.mock import patch
+
 from homeassistant.components.alexa import state_report
+from homeassistant.util.dt import utcnow
+
 from . import TEST_URL, DEFAULT_CONFIG
 
+from tests.common import async_fire_time_changed
+
 
 async def test_report_state(hass, aioclient_mock):
     """Test proactive state reports."""
@@ -23,6 +30,8 @@ async def test_report_state(hass, aioclient_mock):
 
     # To trigger event listener
     await hass.async_block_till_done()
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
 
     assert len(aioclient_mock.mock_calls) == 1
     call = aioclient_mock.mock_calls
@@ -67,6 +76,8 @@ async def test_report_state_instance(hass, aioclient_mock):
 
     # To trigger event listener
     await hass.async_block_till_done()
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
 
     assert len(aioclient_mock.mock_calls) == 1
     call = aioclient_mock.mock_calls
@@ -85,6 +96,91 @@ async def test_report_state_instance(hass, aioclient_mock):
     assert call_json["event"]["endpoint"]["endpointId"] == "fan#test_fan"
 
 
+async def test_report_state_batched(hass, aioclient_mock):
+    """Test changes within the window are coalesced per entity."""
+    aioclient_mock.post(TEST_URL, text="", status=202)
+    attributes = {"friendly_name": "Test Contact Sensor", "device_class": "door"}
+
+    hass.states.async_set("binary_sensor.test_contact", "on", attributes)
+    hass.states.async_set("binary_sensor.test_window", "on", attributes)
+
+    unsub = await state_report.async_enable_proactive_mode(hass, DEFAULT_CONFIG)
+
+    hass.states.async_set("binary_sensor.test_contact", "off", attributes)
+    hass.states.async_set("binary_sensor.test_contact", "on", attributes)
+    hass.states.async_set("binary_sensor.test_contact", "off", attributes)
+    hass.states.async_set("binary_sensor.test_window", "off", attributes)
+    await hass.async_block_till_done()
+    assert len(aioclient_mock.mock_calls) == 0
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    assert len(aioclient_mock.mock_calls) == 2
+    endpoints = {
+        call[2]["event"]["endpoint"]["endpointId"]: call[2]
+        for call in aioclient_mock.mock_calls
+    }
+    assert set(endpoints) == {"binary_sensor#test_contact", "binary_sensor#test_window"}
+    assert (
+        endpoints["binary_sensor#test_contact"]["event"]["payload"]["change"][
+            "properties"
+        ][0]["value"]
+        == "NOT_DETECTED"
+    )
+
+    # Changes to attributes Alexa doesn't report are not sent, even when the
+    # properties are sampled at a later time
+    later = utcnow() + timedelta(seconds=10)
+    with patch("homeassistant.util.dt.utcnow", return_value=later):
+        hass.states.async_set(
+            "binary_sensor.test_contact", "off", {**attributes, "irrelevant": True}
+        )
+        await hass.async_block_till_done()
+        async_fire_time_changed(hass, later + timedelta(seconds=10))
+        await hass.async_block_till_done()
+
+    assert len(aioclient_mock.mock_calls) == 2
+
+    unsub()
+
+
+async def test_report_state_rate_limited(hass, aioclient_mock):
+    """Test an entity is not reported more often than the interval."""
+    aioclient_mock.post(TEST_URL, text="", status=202)
+    attributes = {"friendly_name": "Test Contact Sensor", "device_class": "door"}
+    hass.states.async_set("binary_sensor.test_contact", "on", attributes)
+
+    unsub = await state_report.async_enable_proactive_mode(hass, DEFAULT_CONFIG)
+
+    hass.states.async_set("binary_sensor.test_contact", "off", attributes)
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert len(aioclient_mock.mock_calls) == 1
+
+    hass.states.async_set("binary_sensor.test_contact", "on", attributes)
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert len(aioclient_mock.mock_calls) == 1
+
+    future = utcnow() + timedelta(seconds=state_report.ENTITY_REPORT_INTERVAL + 1)
+    with patch("homeassistant.util.dt.utcnow", return_value=future):
+        async_fire_time_changed(hass, future)
+        await hass.async_block_till_done()
+
+    assert len(aioclient_mock.mock_calls) == 2
+    assert (
+        aioclient_mock.mock_calls[1][2]["event"]["payload"]["change"]["properties"][0][
+            "value"
+        ]
+        == "DETECTED"
+    )
+
+    unsub()
+
+
 async def test_send_add_or_update_message(hass, aioclient_mock):
     """Test sending an AddOrUpdateReport message."""
     aioclient_mock.post(TEST_URL, text="")
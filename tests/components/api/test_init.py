@@ -1,6 +1,7 @@
 """The tests for the Home Assistant API component."""
 # pylint: disable=protected-access
 import asyncio
+from datetime import timedelta
 import json
 from unittest.mock import patch
 
@@ -10,8 +11,10 @@ import voluptuous as vol
 
 from homeassistant import const
 from homeassistant.bootstrap import DATA_LOGGING
+from homeassistant.components import api
 import homeassistant.core as ha
 from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 
 from tests.common import async_mock_service
 
@@ -593,3 +596,180 @@ async def test_api_call_service_bad_data(hass, mock_api_client):
         json={"hello": 5},
     )
     assert resp.status == 400
+
+
+async def test_states_snapshot(hass, mock_api_client):
+    """Test streaming a filtered snapshot of the states."""
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100, "other": 1})
+    hass.states.async_set("light.hall", "off")
+    hass.states.async_set("sensor.temperature", "20")
+
+    resp = await mock_api_client.get(const.URL_API_STATES_SNAPSHOT)
+    assert resp.status == 200
+    data = await resp.json()
+    assert not data["delta"]
+    assert data["removed"] == []
+    remote_data = [ha.State.from_dict(item) for item in data["states"]]
+    assert remote_data == hass.states.async_all()
+
+    resp = await mock_api_client.get(
+        const.URL_API_STATES_SNAPSHOT,
+        params={"domain": "light", "attributes": "brightness"},
+    )
+    data = await resp.json()
+    assert sorted(item["entity_id"] for item in data["states"]) == [
+        "light.hall",
+        "light.kitchen",
+    ]
+    assert {item["entity_id"]: item["attributes"] for item in data["states"]} == {
+        "light.hall": {},
+        "light.kitchen": {"brightness": 100},
+    }
+
+    resp = await mock_api_client.get(
+        const.URL_API_STATES_SNAPSHOT,
+        params={"entity_id": "sensor.temperature", "attributes": ""},
+    )
+    data = await resp.json()
+    assert [item["entity_id"] for item in data["states"]] == ["sensor.temperature"]
+
+
+async def test_states_snapshot_gzip(hass, mock_api_client):
+    """Test the snapshot is compressed for clients accepting gzip."""
+    for idx in range(600):
+        hass.states.async_set(f"sensor.test_{idx}", idx)
+
+    resp = await mock_api_client.get(
+        const.URL_API_STATES_SNAPSHOT, headers={"Accept-Encoding": "gzip"}
+    )
+    assert resp.status == 200
+    assert resp.headers["Content-Encoding"] == "gzip"
+    data = await resp.json()
+    assert len(data["states"]) == 600
+
+
+async def test_states_snapshot_versions(hass, mock_api_client):
+    """Test ETags and deltas of the snapshot."""
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.hall", "off")
+    await hass.async_block_till_done()
+
+    resp = await mock_api_client.get(const.URL_API_STATES_SNAPSHOT)
+    etag = resp.headers["ETag"]
+    version = (await resp.json())["version"]
+
+    resp = await mock_api_client.get(
+        const.URL_API_STATES_SNAPSHOT, headers={"If-None-Match": etag}
+    )
+    assert resp.status == 304
+
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_remove("light.hall")
+    await hass.async_block_till_done()
+
+    resp = await mock_api_client.get(
+        const.URL_API_STATES_SNAPSHOT, headers={"If-None-Match": etag}
+    )
+    assert resp.status == 200
+
+    resp = await mock_api_client.get(
+        const.URL_API_STATES_SNAPSHOT, params={"since_version": version}
+    )
+    data = await resp.json()
+    assert data["delta"]
+    assert [item["entity_id"] for item in data["states"]] == ["light.kitchen"]
+    assert data["removed"] == ["light.hall"]
+
+    # A version of another run returns the full snapshot
+    resp = await mock_api_client.get(
+        const.URL_API_STATES_SNAPSHOT, params={"since_version": "other-1"}
+    )
+    data = await resp.json()
+    assert not data["delta"]
+    assert len(data["states"]) == 1
+
+
+async def test_states_snapshot_filtered_etag(hass, mock_api_client):
+    """Test filtered snapshots do not share the ETag of the full snapshot."""
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("sensor.temperature", "20")
+    await hass.async_block_till_done()
+
+    resp = await mock_api_client.get(const.URL_API_STATES_SNAPSHOT)
+    etag = resp.headers["ETag"]
+
+    resp = await mock_api_client.get(
+        const.URL_API_STATES_SNAPSHOT,
+        params={"domain": "light"},
+        headers={"If-None-Match": etag},
+    )
+    assert resp.status == 200
+    filtered_etag = resp.headers["ETag"]
+    assert filtered_etag != etag
+
+    resp = await mock_api_client.get(
+        const.URL_API_STATES_SNAPSHOT,
+        params={"domain": "light"},
+        headers={"If-None-Match": filtered_etag},
+    )
+    assert resp.status == 304
+
+
+async def test_states_snapshot_naive_since(hass, mock_api_client):
+    """Test a since time without a time zone is in the configured time zone."""
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+    since = dt_util.as_local(dt_util.utcnow()) - timedelta(minutes=1)
+
+    resp = await mock_api_client.get(
+        const.URL_API_STATES_SNAPSHOT,
+        params={"since": since.replace(tzinfo=None).isoformat()},
+    )
+    assert resp.status == 200
+    data = await resp.json()
+    assert [item["entity_id"] for item in data["states"]] == ["light.kitchen"]
+
+
+async def test_states_snapshot_prunes_removals(hass):
+    """Test old removals are forgotten and older versions get no delta."""
+    tracker = await hass.async_add_executor_job(api.StateVersionTracker, hass)
+    token = tracker.token
+
+    with patch.object(api, "SNAPSHOT_MAX_REMOVED", 10):
+        for idx in range(11):
+            hass.states.async_set(f"sensor.test_{idx}", idx)
+            hass.states.async_remove(f"sensor.test_{idx}")
+        await hass.async_block_till_done()
+
+    assert len(tracker.removed) == 5
+    assert tracker.parse_token(token) is None
+    assert tracker.parse_token(tracker.token) == tracker.version
+
+
+async def test_stream_entity_filter_and_stats(hass, mock_api_client):
+    """Test filtering the stream on entities and reading its metrics."""
+    resp = await mock_api_client.get(
+        const.URL_API_STREAM, params={"entity_id": "light.kitchen"}
+    )
+    assert resp.status == 200
+
+    hass.states.async_set("light.hall", "on")
+    hass.states.async_set("light.kitchen", "on")
+
+    data = await _stream_next_event(resp.content)
+    assert data["data"]["entity_id"] == "light.kitchen"
+
+    resp = await mock_api_client.get(const.URL_API_STREAM_STATS)
+    assert resp.status == 200
+    stats = await resp.json()
+    assert len(stats["clients"]) == 1
+    assert stats["clients"][0]["delivered"] == 1
+    assert stats["lagging_clients"] == 0
+
+
+async def test_stream_invalid_overflow_policy(hass, mock_api_client):
+    """Test an unknown overflow policy is rejected."""
+    resp = await mock_api_client.get(
+        const.URL_API_STREAM, params={"overflow": "explode"}
+    )
+    assert resp.status == 400
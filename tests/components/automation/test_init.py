@@ -913,3 +913,115 @@ async def test_automation_restore_last_triggered_with_initial_state(hass):
     assert state
     assert state.state == STATE_ON
     assert state.attributes["last_triggered"] == time
+
+
+async def test_automation_metrics(hass, calls, hass_ws_client):
+    """Test trigger counts and timings of automations."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "alias": "hello",
+                "trigger": {"platform": "event", "event_type": "test_event"},
+                "condition": {
+                    "condition": "template",
+                    "value_template": "{{ trigger.event.data.run }}",
+                },
+                "action": [
+                    {"service": "test.automation"},
+                    {"service": "test.missing", "alias": "missing"},
+                ],
+            }
+        },
+    )
+
+    hass.bus.async_fire("test_event", {"run": False})
+    hass.bus.async_fire("test_event", {"run": True})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 5, "type": "automation/metrics"})
+    msg = await client.receive_json()
+
+    assert msg["success"]
+    metrics = msg["result"][0]
+    assert metrics["entity_id"] == "automation.hello"
+    assert metrics["triggers"] == 2
+    assert metrics["condition"]["count"] == 2
+    assert metrics["action"]["count"] == 1
+    assert metrics["action_errors"] == 1
+    assert [step["count"] for step in metrics["steps"]] == [1, 1]
+    assert [step["errors"] for step in metrics["steps"]] == [0, 1]
+    assert metrics["steps"][1]["alias"] == "missing"
+
+
+async def test_automation_metrics_include_delays(hass, calls):
+    """Test the action timing of automations covers delays of the script."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "alias": "hello",
+                "trigger": {"platform": "event", "event_type": "test_event"},
+                "action": [{"delay": {"seconds": 5}}, {"service": "test.automation"}],
+            }
+        },
+    )
+
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert len(calls) == 0
+
+    entity = hass.data[automation.DOMAIN].get_entity("automation.hello")
+    assert entity.async_metrics()["action"]["count"] == 0
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert entity.async_metrics()["action"]["count"] == 1
+
+
+async def test_automation_metrics_sensor(hass, calls):
+    """Test sensors with the metrics of automations."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "alias": "hello",
+                "trigger": {"platform": "event", "event_type": "test_event"},
+                "action": {"service": "test.automation"},
+            }
+        },
+    )
+    assert await async_setup_component(
+        hass,
+        "sensor",
+        {
+            "sensor": {
+                "platform": "automation",
+                "entities": ["automation.hello", "automation.missing"],
+            }
+        },
+    )
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.hello_action_time")
+    assert state.state == "unknown"
+    assert state.attributes["triggers"] == 0
+    assert state.attributes["unit_of_measurement"] == "ms"
+    assert hass.states.get("sensor.missing_action_time").state == "unknown"
+
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    await hass.helpers.entity_component.async_update_entity("sensor.hello_action_time")
+
+    state = hass.states.get("sensor.hello_action_time")
+    assert float(state.state) >= 0
+    assert state.attributes["triggers"] == 1
+    assert state.attributes["runs"] == 1
+    assert state.attributes["errors"] == 0
+    assert state.attributes["condition_mean_ms"] >= 0
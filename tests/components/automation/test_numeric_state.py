@@ -1228,3 +1228,36 @@ async def test_if_fires_on_entities_change_overlap_for_template(hass, calls):
         await hass.async_block_till_done()
         assert 2 == len(calls)
         assert "test.entity_2 - 0:00:10" == calls[1].data["some"]
+
+
+async def test_triggers_share_threshold_check(hass, calls):
+    """Test that triggers with the same thresholds check a change once."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "alias": f"automation {index}",
+                    "trigger": {
+                        "platform": "numeric_state",
+                        "entity_id": "test.entity",
+                        "below": 10,
+                    },
+                    "action": {"service": "test.automation"},
+                }
+                for index in range(3)
+            ]
+        },
+    )
+
+    with patch(
+        "homeassistant.components.automation.numeric_state.condition."
+        "async_numeric_state",
+        return_value=True,
+    ) as mock_check:
+        hass.states.async_set("test.entity", 9)
+        await hass.async_block_till_done()
+
+    assert len(mock_check.mock_calls) == 1
+    assert len(calls) == 3
@@ -0,0 +1,62 @@
+"""The tests for the state dispatch of automation triggers."""
+from homeassistant.components.automation.state_dispatch import async_track_trigger
+from homeassistant.const import EVENT_STATE_CHANGED
+
+
+async def test_dispatch_by_entity_and_key(hass):
+    """Test that predicates are shared per key and only matches are run."""
+    checks = []
+    runs = []
+
+    def predicate(entity_id, from_s, to_s):
+        checks.append(entity_id)
+        return to_s is not None and to_s.state == "on"
+
+    def action(name):
+        def run(entity_id, from_s, to_s, matched):
+            runs.append((name, entity_id, matched))
+
+        return run
+
+    remove_1 = async_track_trigger(
+        hass, ["light.Kitchen"], "on", predicate, action("first")
+    )
+    remove_2 = async_track_trigger(
+        hass, ["light.kitchen", "light.hall"], "on", predicate, action("second")
+    )
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == 1
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.hall", "off")
+    hass.states.async_set("light.garden", "on")
+    await hass.async_block_till_done()
+
+    assert checks == ["light.kitchen", "light.hall"]
+    assert sorted(runs) == [
+        ("first", "light.kitchen", True),
+        ("second", "light.kitchen", True),
+    ]
+
+    remove_1()
+    remove_2()
+    assert EVENT_STATE_CHANGED not in hass.bus.async_listeners()
+
+
+async def test_dispatch_notify_all(hass):
+    """Test that groups can ask to run for every change."""
+    runs = []
+
+    async_track_trigger(
+        hass,
+        ["sensor.temperature"],
+        "above_20",
+        lambda entity_id, from_s, to_s: float(to_s.state) > 20,
+        lambda entity_id, from_s, to_s, matched: runs.append(matched),
+        notify_all=True,
+    )
+
+    hass.states.async_set("sensor.temperature", 18)
+    hass.states.async_set("sensor.temperature", 22)
+    await hass.async_block_till_done()
+
+    assert runs == [False, True]
@@ -78,28 +78,41 @@ class TestDatadog(unittest.TestCase):
         )
         assert self.hass.bus.listen.called
 
+    @mock.patch.object(datadog, "BatchingExporter")
+    def _setup(self, config, mock_exporter):
+        """Set up the component and return a function exporting an event."""
+        assert setup_component(self.hass, datadog.DOMAIN, config)
+        assert mock_exporter.return_value.start.call_count == 1
+        assert mock_exporter.call_args[1]["event_types"] == (
+            EVENT_LOGBOOK_ENTRY,
+            EVENT_STATE_CHANGED,
+        )
+        _, _, encoder, transport = mock_exporter.call_args[0]
+
+        def handler_method(event):
+            """Encode and send a single event."""
+            items = encoder(event)
+            if items:
+                transport.send(items)
+
+        return handler_method
+
     @MockDependency("datadog")
     def test_logbook_entry(self, mock_datadog):
         """Test event listener."""
-        self.hass.bus.listen = mock.MagicMock()
         mock_client = mock_datadog.statsd
 
-        assert setup_component(
-            self.hass,
-            datadog.DOMAIN,
-            {datadog.DOMAIN: {"host": "host", "rate": datadog.DEFAULT_RATE}},
+        handler_method = self._setup(
+            {datadog.DOMAIN: {"host": "host", "rate": datadog.DEFAULT_RATE}}
         )
 
-        assert self.hass.bus.listen.called
-        handler_method = self.hass.bus.listen.call_args_list[0][0][1]
-
         event = {
             "domain": "automation",
             "entity_id": "sensor.foo.bar",
             "message": "foo bar biz",
             "name": "triggered something",
         }
-        handler_method(mock.MagicMock(data=event))
+        handler_method(mock.MagicMock(event_type=EVENT_LOGBOOK_ENTRY, data=event))
 
         assert mock_client.event.call_count == 1
         assert mock_client.event.call_args == mock.call(
@@ -113,24 +126,18 @@ class TestDatadog(unittest.TestCase):
     @MockDependency("datadog")
     def test_state_changed(self, mock_datadog):
         """Test event listener."""
-        self.hass.bus.listen = mock.MagicMock()
         mock_client = mock_datadog.statsd
 
-        assert setup_component(
-            self.hass,
-            datadog.DOMAIN,
+        handler_method = self._setup(
             {
                 datadog.DOMAIN: {
                     "host": "host",
                     "prefix": "ha",
                     "rate": datadog.DEFAULT_RATE,
                 }
-            },
+            }
         )
 
-        assert self.hass.bus.listen.called
-        handler_method = self.hass.bus.listen.call_args_list[1][0][1]
-
         valid = {"1": 1, "1.0": 1.0, STATE_ON: 1, STATE_OFF: 0}
 
         attributes = {"elevation": 3.2, "temperature": 5.0}
@@ -142,9 +149,17 @@ class TestDatadog(unittest.TestCase):
                 state=in_,
                 attributes=attributes,
             )
-            handler_method(mock.MagicMock(data={"new_state": state}))
+            handler_method(
+                mock.MagicMock(
+                    event_type=EVENT_STATE_CHANGED, data={"new_state": state}
+                )
+            )
 
             assert mock_client.gauge.call_count == 3
+            assert mock_client.open_buffer.call_count == 1
+            assert mock_client.close_buffer.call_count == 1
+            mock_client.open_buffer.reset_mock()
+            mock_client.close_buffer.reset_mock()
 
             for attribute, value in attributes.items():
                 mock_client.gauge.assert_has_calls(
@@ -169,6 +184,9 @@ class TestDatadog(unittest.TestCase):
 
         for invalid in ("foo", "", object):
             handler_method(
-                mock.MagicMock(data={"new_state": ha.State("domain.test", invalid, {})})
+                mock.MagicMock(
+                    event_type=EVENT_STATE_CHANGED,
+                    data={"new_state": ha.State("domain.test", invalid, {})},
+                )
             )
             assert not mock_client.gauge.called
@@ -1,8 +1,12 @@
 """The test for the data filter sensor platform."""
+from copy import copy
 from datetime import timedelta
+import random
 import unittest
 from unittest.mock import patch
 
+import pytest
+
 from homeassistant.components.filter.sensor import (
     LowPassFilter,
     OutlierFilter,
@@ -104,36 +108,26 @@ class TestFilterSensor(unittest.TestCase):
         t_2 = dt_util.utcnow() - timedelta(minutes=3)
 
         if missing:
-            fake_states = {}
+            fake_states = []
         else:
-            fake_states = {
-                "sensor.test_monitored": [
-                    ha.State("sensor.test_monitored", 18.0, last_changed=t_0),
-                    ha.State("sensor.test_monitored", 19.0, last_changed=t_1),
-                    ha.State("sensor.test_monitored", 18.2, last_changed=t_2),
-                ]
-            }
+            fake_states = [(t_2, "18.0"), (t_1, "19.0"), (t_0, "18.2")]
 
         with patch(
-            "homeassistant.components.history." "state_changes_during_period",
-            return_value=fake_states,
+            "homeassistant.components.history.get_last_states",
+            side_effect=lambda hass, requests: [fake_states for _ in requests],
         ):
-            with patch(
-                "homeassistant.components.history." "get_last_state_changes",
-                return_value=fake_states,
-            ):
-                with assert_setup_component(1, "sensor"):
-                    assert setup_component(self.hass, "sensor", config)
-
-                for value in self.values:
-                    self.hass.states.set(config["sensor"]["entity_id"], value.state)
-                    self.hass.block_till_done()
-
-                state = self.hass.states.get("sensor.test")
-                if missing:
-                    assert "18.05" == state.state
-                else:
-                    assert "17.05" == state.state
+            with assert_setup_component(1, "sensor"):
+                assert setup_component(self.hass, "sensor", config)
+
+            for value in self.values:
+                self.hass.states.set(config["sensor"]["entity_id"], value.state)
+                self.hass.block_till_done()
+
+            state = self.hass.states.get("sensor.test")
+            if missing:
+                assert "18.05" == state.state
+            else:
+                assert "17.05" == state.state
 
     def test_chain_history_missing(self):
         """Test if filter chaining works when recorder is enabled but the source is not recorded."""
@@ -151,31 +145,22 @@ class TestFilterSensor(unittest.TestCase):
                 "filters": [{"filter": "time_throttle", "window_size": "00:01"}],
             },
         }
-        t_0 = dt_util.utcnow() - timedelta(minutes=1)
-        t_1 = dt_util.utcnow() - timedelta(minutes=2)
-        t_2 = dt_util.utcnow() - timedelta(minutes=3)
+        t_0 = dt_util.utcnow() - timedelta(seconds=50)
+        t_1 = dt_util.utcnow() - timedelta(seconds=40)
+        t_2 = dt_util.utcnow() - timedelta(seconds=30)
 
-        fake_states = {
-            "sensor.test_monitored": [
-                ha.State("sensor.test_monitored", 18.0, last_changed=t_0),
-                ha.State("sensor.test_monitored", 19.0, last_changed=t_1),
-                ha.State("sensor.test_monitored", 18.2, last_changed=t_2),
-            ]
-        }
+        # All states fall in one throttle window, only the first one passes
+        fake_states = [(t_0, "18.0"), (t_1, "19.0"), (t_2, "18.2")]
         with patch(
-            "homeassistant.components.history." "state_changes_during_period",
-            return_value=fake_states,
+            "homeassistant.components.history.get_last_states",
+            side_effect=lambda hass, requests: [fake_states for _ in requests],
         ):
-            with patch(
-                "homeassistant.components.history." "get_last_state_changes",
-                return_value=fake_states,
-            ):
-                with assert_setup_component(1, "sensor"):
-                    assert setup_component(self.hass, "sensor", config)
+            with assert_setup_component(1, "sensor"):
+                assert setup_component(self.hass, "sensor", config)
 
-                self.hass.block_till_done()
-                state = self.hass.states.get("sensor.test")
-                assert "18.0" == state.state
+            self.hass.block_till_done()
+            state = self.hass.states.get("sensor.test")
+            assert "18.0" == state.state
 
     def test_outlier(self):
         """Test if outlier filter works."""
@@ -277,3 +262,60 @@ class TestFilterSensor(unittest.TestCase):
         for state in self.values:
             filtered = filt.filter_state(state)
         assert 21.5 == filtered.state
+
+    def _random_states(self, count, seconds=60):
+        """Return states with random values and intervals."""
+        rand = random.Random(7)
+        timestamp = dt_util.utcnow()
+        states = []
+        for _ in range(count):
+            value = rand.choice([rand.gauss(20, 2), rand.uniform(-50, 90)])
+            states.append(
+                ha.State("sensor.test_monitored", value, last_updated=timestamp)
+            )
+            timestamp += timedelta(seconds=rand.randint(1, seconds))
+        return states
+
+    def _assert_replay_matches(self, make_filter, states):
+        """Assert filtering all states at once matches one by one."""
+        expected = []
+        filt = make_filter()
+        for state in states:
+            expected.append(filt.filter_state(copy(state)).state)
+
+        filt = make_filter()
+        split = len(states) // 2
+        filtered = filt.filter_states(states[:split])
+        filtered += filt.filter_states(states[split:])
+        assert [state.state for state in filtered] == pytest.approx(expected)
+
+        # Filtering live after a replay continues from the replayed window
+        state = ha.State(
+            "sensor.test_monitored",
+            80,
+            last_updated=states[-1].last_updated + timedelta(seconds=1),
+        )
+        assert filt.filter_state(copy(state)).state == pytest.approx(
+            make_filter().filter_states(states + [state])[-1].state
+        )
+
+    def test_outlier_replay(self):
+        """Test outlier filtering of history matches live filtering."""
+        self._assert_replay_matches(
+            lambda: OutlierFilter(
+                window_size=25, precision=2, entity=None, radius=10.0
+            ),
+            self._random_states(500),
+        )
+
+    def test_time_sma_replay(self):
+        """Test time SMA filtering of history matches live filtering."""
+        self._assert_replay_matches(
+            lambda: TimeSMAFilter(
+                window_size=timedelta(minutes=10),
+                precision=2,
+                entity=None,
+                type="last",
+            ),
+            self._random_states(500),
+        )
@@ -1,4 +1,5 @@
 """Test Google report state."""
+from datetime import timedelta
 from unittest.mock import patch
 
 from homeassistant.components.google_assistant import report_state, error
@@ -39,6 +40,10 @@ async def test_report_state(hass, caplog):
     ) as mock_report:
         hass.states.async_set("light.kitchen", "on")
         await hass.async_block_till_done()
+        assert len(mock_report.mock_calls) == 0
+
+        async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))
+        await hass.async_block_till_done()
 
     assert len(mock_report.mock_calls) == 1
     assert mock_report.mock_calls[0][1][0] == {
@@ -54,6 +59,8 @@ async def test_report_state(hass, caplog):
             "light.kitchen", "on", {"irrelevant": "should_be_ignored"}
         )
         await hass.async_block_till_done()
+        async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))
+        await hass.async_block_till_done()
 
     assert len(mock_report.mock_calls) == 0
 
@@ -66,6 +73,8 @@ async def test_report_state(hass, caplog):
     ):
         hass.states.async_set("light.kitchen", "off")
         await hass.async_block_till_done()
+        async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))
+        await hass.async_block_till_done()
 
     assert "Not reporting state for light.kitchen: mock-error"
     assert len(mock_report.mock_calls) == 0
@@ -77,5 +86,84 @@ async def test_report_state(hass, caplog):
     ) as mock_report:
         hass.states.async_set("light.kitchen", "on")
         await hass.async_block_till_done()
+        async_fire_time_changed(hass, utcnow() + timedelta(seconds=10))
+        await hass.async_block_till_done()
 
     assert len(mock_report.mock_calls) == 0
+
+
+async def test_report_state_batched(hass):
+    """Test changes within the window are sent as one report."""
+    hass.states.async_set("light.ceiling", "off")
+    hass.states.async_set("switch.ac", "on")
+
+    with patch.object(
+        BASIC_CONFIG, "async_report_state", side_effect=mock_coro
+    ) as mock_report:
+        unsub = report_state.async_enable_report_state(hass, BASIC_CONFIG)
+
+        hass.states.async_set("light.ceiling", "on")
+        hass.states.async_set("switch.ac", "off")
+        hass.states.async_set("light.kitchen", "on")
+        # Reverted within the window, nothing to report
+        hass.states.async_set("switch.ac", "on")
+        await hass.async_block_till_done()
+        assert len(mock_report.mock_calls) == 0
+
+        async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))
+        await hass.async_block_till_done()
+
+    assert len(mock_report.mock_calls) == 1
+    assert mock_report.mock_calls[0][1][0] == {
+        "devices": {
+            "states": {
+                "light.ceiling": {"on": True, "online": True},
+                "light.kitchen": {"on": True, "online": True},
+            }
+        }
+    }
+
+    unsub()
+
+
+async def test_report_state_rate_limited(hass):
+    """Test an entity is not reported more often than the interval."""
+    hass.states.async_set("light.kitchen", "off")
+    now = utcnow()
+
+    with patch.object(
+        BASIC_CONFIG, "async_report_state", side_effect=mock_coro
+    ) as mock_report, patch("homeassistant.util.dt.utcnow", return_value=now):
+        unsub = report_state.async_enable_report_state(hass, BASIC_CONFIG)
+
+        hass.states.async_set("light.kitchen", "on")
+        await hass.async_block_till_done()
+        async_fire_time_changed(hass, now + timedelta(seconds=1))
+        await hass.async_block_till_done()
+        assert len(mock_report.mock_calls) == 1
+
+    now += timedelta(seconds=1)
+
+    with patch.object(
+        BASIC_CONFIG, "async_report_state", side_effect=mock_coro
+    ) as mock_report, patch("homeassistant.util.dt.utcnow", return_value=now):
+        hass.states.async_set("light.kitchen", "off")
+        await hass.async_block_till_done()
+        async_fire_time_changed(hass, now + timedelta(seconds=1))
+        await hass.async_block_till_done()
+        assert len(mock_report.mock_calls) == 0
+
+    now += timedelta(seconds=2)
+
+    with patch.object(
+        BASIC_CONFIG, "async_report_state", side_effect=mock_coro
+    ) as mock_report, patch("homeassistant.util.dt.utcnow", return_value=now):
+        async_fire_time_changed(hass, now)
+        await hass.async_block_till_done()
+
+    assert len(mock_report.mock_calls) == 1
+    assert mock_report.mock_calls[0][1][0] == {
+        "devices": {"states": {"light.kitchen": {"on": False, "online": True}}}
+    }
+
+    unsub()
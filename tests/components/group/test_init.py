@@ -350,6 +350,70 @@ class TestComponentsGroup(unittest.TestCase):
             "switch.test_2",
         ] == sorted(group.expand_entity_ids(self.hass, ["group.group_of_groups"]))
 
+    def test_expand_entity_ids_cached_until_members_change(self):
+        """Test that expansions of nested groups follow member changes."""
+        self.hass.states.set("light.test_1", STATE_ON)
+        lights = group.Group.create_group(self.hass, "light", ["light.test_1"])
+        group.Group.create_group(self.hass, "group_of_groups", ["group.light"])
+
+        assert ["light.test_1"] == group.expand_entity_ids(
+            self.hass, ["group.group_of_groups"]
+        )
+        cached = self.hass.data[group.DATA_EXPANDED]["group.group_of_groups"]
+
+        # The group state changes but its members do not
+        self.hass.states.set("light.test_1", STATE_OFF)
+        self.hass.block_till_done()
+        assert STATE_OFF == self.hass.states.get("group.light").state
+        assert ["light.test_1"] == group.expand_entity_ids(
+            self.hass, ["group.group_of_groups"]
+        )
+        assert cached is self.hass.data[group.DATA_EXPANDED]["group.group_of_groups"]
+
+        lights.update_tracked_entity_ids(["light.test_1", "light.test_2"])
+        assert ["light.test_1", "light.test_2"] == group.expand_entity_ids(
+            self.hass, ["group.group_of_groups"]
+        )
+
+        self.hass.states.set("group.light", STATE_ON, {"entity_id": ["light.test_3"]})
+        assert ["light.test_3"] == group.expand_entity_ids(
+            self.hass, ["group.group_of_groups"]
+        )
+
+    def test_group_state_counts_member_changes(self):
+        """Test the group state in any and all modes as members change."""
+        entity_ids = [f"light.test_{index}" for index in range(4)]
+        for entity_id in entity_ids:
+            self.hass.states.set(entity_id, STATE_OFF)
+        any_group = group.Group.create_group(self.hass, "any", entity_ids)
+        all_group = group.Group.create_group(self.hass, "all", entity_ids, mode=True)
+
+        def states():
+            self.hass.block_till_done()
+            return (
+                self.hass.states.get(any_group.entity_id).state,
+                self.hass.states.get(all_group.entity_id).state,
+            )
+
+        assert states() == (STATE_OFF, STATE_OFF)
+
+        self.hass.states.set("light.test_0", STATE_ON)
+        assert states() == (STATE_ON, STATE_OFF)
+
+        for entity_id in entity_ids[1:]:
+            self.hass.states.set(entity_id, STATE_ON)
+        assert states() == (STATE_ON, STATE_ON)
+
+        self.hass.states.set("light.test_3", "unavailable")
+        assert states() == (STATE_ON, STATE_OFF)
+
+        self.hass.states.remove("light.test_3")
+        assert states() == (STATE_ON, STATE_ON)
+
+        for entity_id in entity_ids[:3]:
+            self.hass.states.set(entity_id, STATE_OFF)
+        assert states() == (STATE_OFF, STATE_OFF)
+
     def test_set_assumed_state_based_on_tracked(self):
         """Test assumed state."""
         self.hass.states.set("light.Bowl", STATE_ON)
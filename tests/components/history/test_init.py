@@ -1,5 +1,6 @@
 """The tests the History component."""
 # pylint: disable=protected-access,invalid-name
+import asyncio
 from datetime import timedelta
 import unittest
 from unittest.mock import patch, sentinel
@@ -183,6 +184,35 @@ class TestComponentHistory(unittest.TestCase):
 
         assert states == hist[entity_id]
 
+    def test_get_last_states(self):
+        """Test preloading the last states of several entities at once."""
+        self.init_recorder()
+        start = dt_util.utcnow() - timedelta(minutes=5)
+        points = [start + timedelta(minutes=minute) for minute in range(4)]
+
+        for point, state in zip(points, ("1", "2", "2", "3")):
+            with patch(
+                "homeassistant.components.recorder.dt_util.utcnow", return_value=point
+            ):
+                self.hass.states.set("sensor.one", state, {"minute": str(point)})
+                self.hass.states.set("sensor.two", "on")
+                self.wait_recording_done()
+
+        requests = [
+            history.StatesRequest("sensor.one", number_of_states=3),
+            history.StatesRequest("sensor.one", number_of_states=3, changes_only=True),
+            history.StatesRequest("sensor.one", start_time=points[1]),
+            history.StatesRequest("sensor.two"),
+            history.StatesRequest("sensor.missing", number_of_states=3),
+        ]
+        one, changes, since, two, missing = history.get_last_states(self.hass, requests)
+
+        assert one == [(points[1], "2"), (points[2], "2"), (points[3], "3")]
+        assert changes == [(points[0], "1"), (points[1], "2"), (points[3], "3")]
+        assert since == [(points[1], "2"), (points[2], "2"), (points[3], "3")]
+        assert two == [(points[0], "on")]
+        assert missing == []
+
     def test_get_significant_states(self):
         """Test that only significant states are returned.
 
@@ -650,3 +680,31 @@ async def test_fetch_period_api_with_include_order(hass, hass_client):
         params={"filter_entity_id": "non.existing,something.else"},
     )
     assert response.status == 200
+
+
+async def test_async_get_last_states_batches_requests(hass):
+    """Test concurrent requests for states share one query."""
+    calls = []
+
+    def get_last_states(hass, requests):
+        calls.append(requests)
+        return [[(None, request.entity_id)] for request in requests]
+
+    with patch(
+        "homeassistant.components.history.get_last_states", side_effect=get_last_states,
+    ):
+        results = await asyncio.gather(
+            *(
+                history.async_get_last_states(
+                    hass, history.StatesRequest("sensor.test_{}".format(index))
+                )
+                for index in range(3)
+            )
+        )
+        assert results == [
+            [(None, "sensor.test_{}".format(index))] for index in range(3)
+        ]
+        assert len(calls) == 1
+
+        await history.async_get_last_states(hass, history.StatesRequest("sensor.x"))
+        assert len(calls) == 2
@@ -6,9 +6,12 @@ from unittest.mock import patch
 import pytest
 import pytz
 
-from homeassistant.const import STATE_UNKNOWN
+from homeassistant.const import EVENT_HOMEASSISTANT_START, STATE_UNKNOWN
 from homeassistant.setup import setup_component
-from homeassistant.components.history_stats.sensor import HistoryStatsSensor
+from homeassistant.components.history_stats.sensor import (
+    HistoryStatsSensor,
+    StateTimeline,
+)
 import homeassistant.core as ha
 from homeassistant.helpers.template import Template
 import homeassistant.util.dt as dt_util
@@ -150,6 +153,87 @@ class TestHistoryStatsSensor(unittest.TestCase):
         assert sensor3.state == 2
         assert sensor4.state == 50
 
+    def test_measure_future_end(self):
+        """Test the part of the period after now is not measured."""
+        t0 = dt_util.utcnow() - timedelta(minutes=30)
+        fake_states = {
+            "binary_sensor.test_id": [
+                ha.State("binary_sensor.test_id", "on", last_changed=t0)
+            ]
+        }
+
+        start = Template("{{ as_timestamp(now()) - 3600 }}", self.hass)
+        end = Template("{{ as_timestamp(now()) + 3600 }}", self.hass)
+        sensor = HistoryStatsSensor(
+            self.hass, "binary_sensor.test_id", "on", start, end, None, "time", "Test"
+        )
+
+        with patch(
+            "homeassistant.components.history.state_changes_during_period",
+            return_value=fake_states,
+        ), patch("homeassistant.components.history.get_state", return_value=None):
+            sensor.update()
+
+        assert sensor.state == 0.5
+
+    def test_incremental(self):
+        """Test live state changes are measured without querying history."""
+        self.init_recorder()
+        t0 = dt_util.utcnow() - timedelta(minutes=20)
+        fake_states = {
+            "binary_sensor.test_id": [
+                ha.State("binary_sensor.test_id", "on", last_changed=t0)
+            ]
+        }
+        config = {
+            "history": {},
+            "sensor": {
+                "platform": "history_stats",
+                "entity_id": "binary_sensor.test_id",
+                "state": "on",
+                "end": "{{ now() }}",
+                "duration": "01:00",
+                "type": "count",
+                "name": "Test",
+            },
+        }
+
+        with patch(
+            "homeassistant.components.history.state_changes_during_period",
+            return_value=fake_states,
+        ) as mock_changes, patch(
+            "homeassistant.components.history.get_state", return_value=None
+        ):
+            assert setup_component(self.hass, "sensor", config)
+            self.hass.bus.fire(EVENT_HOMEASSISTANT_START)
+            self.hass.block_till_done()
+            assert self.hass.states.get("sensor.test").state == "1"
+
+            for state in ["off", "on", "off"]:
+                self.hass.states.set("binary_sensor.test_id", state)
+                self.hass.block_till_done()
+
+        assert mock_changes.call_count == 1
+        state = self.hass.states.get("sensor.test")
+        assert state.state == "2"
+        assert state.attributes["value"] == "20m"
+
+    def test_timeline(self):
+        """Test measuring periods of a timeline."""
+        timeline = StateTimeline(100, True)
+        timeline.add(110, True)
+        timeline.add(130, False)
+        timeline.add(150, True)
+        timeline.add(170, False)
+
+        assert timeline.measure(100, 200) == (50, 1)
+        assert timeline.measure(120, 160) == (20, 1)
+        assert timeline.measure(140, 145) == (0, 0)
+
+        timeline.forget_before(160)
+        assert timeline.origin == 150
+        assert timeline.measure(160, 200) == (10, 0)
+
     def test_wrong_date(self):
         """Test when start or end value is not a timestamp or a date."""
         good = Template("{{ now() }}", self.hass)
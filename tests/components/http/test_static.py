@@ -0,0 +1,147 @@
+"""Test static file handling."""
+import gzip
+import mimetypes
+from unittest.mock import Mock
+
+from aiohttp import hdrs, web
+import pytest
+from yarl import URL
+
+from homeassistant.components.http import static
+from homeassistant.components.http.static import (
+    CachingStaticResource,
+    accepted_encodings,
+    load_static_file,
+)
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    """Return a folder with a script and a gzipped copy of it."""
+    content = b"console.log('hello');" * 10
+    (tmp_path / "app.js").write_bytes(content)
+    (tmp_path / "app.js.gz").write_bytes(gzip.compress(content))
+    (tmp_path / "plain.txt").write_bytes(b"plain")
+    return tmp_path
+
+
+@pytest.fixture
+async def static_client(aiohttp_client, static_dir):
+    """Return a client for an app serving the static folder."""
+    app = web.Application()
+    app.router.register_resource(CachingStaticResource("/static", str(static_dir)))
+    return await aiohttp_client(app)
+
+
+async def test_serves_precompressed_file(static_client):
+    """Test the gzip sibling is served to clients accepting gzip."""
+    resp = await static_client.get(
+        "/static/app.js", headers={hdrs.ACCEPT_ENCODING: "gzip, deflate"}
+    )
+    assert resp.status == 200
+    assert resp.headers[hdrs.CONTENT_ENCODING] == "gzip"
+    assert resp.headers[hdrs.CONTENT_TYPE] == mimetypes.guess_type("app.js")[0]
+    assert resp.headers[hdrs.VARY] == hdrs.ACCEPT_ENCODING
+    assert await resp.read() == b"console.log('hello');" * 10
+
+
+async def test_serves_identity_file(static_client):
+    """Test the file itself is served to clients not accepting an encoding."""
+    resp = await static_client.get(
+        "/static/app.js", headers={hdrs.ACCEPT_ENCODING: "br;q=0, identity"},
+    )
+    assert resp.status == 200
+    assert hdrs.CONTENT_ENCODING not in resp.headers
+    assert await resp.read() == b"console.log('hello');" * 10
+
+
+async def test_refused_gzip_not_substituted(static_client):
+    """Test the gzip sibling is not served to clients refusing gzip."""
+    resp = await static_client.get(
+        "/static/app.js", headers={hdrs.ACCEPT_ENCODING: "gzip;q=0, identity"},
+    )
+    assert resp.status == 200
+    assert hdrs.CONTENT_ENCODING not in resp.headers
+    assert resp.headers[hdrs.CONTENT_TYPE] == mimetypes.guess_type("app.js")[0]
+    assert await resp.read() == b"console.log('hello');" * 10
+
+
+async def test_etag_not_modified(static_client):
+    """Test a matching If-None-Match returns 304."""
+    resp = await static_client.get("/static/plain.txt")
+    assert resp.status == 200
+    etag = resp.headers[hdrs.ETAG]
+    assert etag.startswith('"')
+    assert hdrs.CACHE_CONTROL in resp.headers
+
+    resp = await static_client.get(
+        "/static/plain.txt", headers={hdrs.IF_NONE_MATCH: f'"other", {etag}'}
+    )
+    assert resp.status == 304
+    assert resp.headers[hdrs.ETAG] == etag
+    assert await resp.read() == b""
+
+
+async def test_etag_differs_per_encoding(static_client):
+    """Test encoded variants have their own ETag."""
+    resp = await static_client.get(
+        "/static/app.js", headers={hdrs.ACCEPT_ENCODING: "gzip"}
+    )
+    gzip_etag = resp.headers[hdrs.ETAG]
+    resp = await static_client.get(
+        "/static/app.js", headers={hdrs.ACCEPT_ENCODING: "identity"}
+    )
+    assert resp.headers[hdrs.ETAG] != gzip_etag
+
+
+async def test_resolution_is_cached(static_client, static_dir):
+    """Test path resolution and stat results are reused."""
+    resp = await static_client.get("/static/plain.txt")
+    etag = resp.headers[hdrs.ETAG]
+
+    (static_dir / "plain.txt").write_bytes(b"changed content")
+
+    resp = await static_client.get("/static/plain.txt")
+    assert resp.headers[hdrs.ETAG] == etag
+
+
+async def test_resolution_cache_is_bounded(static_client, static_dir, monkeypatch):
+    """Test spellings of a path share an entry and old entries are dropped."""
+    monkeypatch.setattr(static, "MAX_STATIC_FILES", 1)
+    resource = next(iter(static_client.server.app.router.resources()))
+
+    (static_dir / "sub").mkdir()
+    (static_dir / "sub" / "plain.txt").write_bytes(b"plain")
+
+    await static_client.get("/static/sub/plain.txt")
+    resp = await static_client.get(URL("/static/sub//plain.txt", encoded=True))
+    assert resp.status == 200
+    assert list(resource._static_files) == ["sub/plain.txt"]
+
+    await static_client.get("/static/app.js")
+    assert list(resource._static_files) == ["app.js"]
+
+
+async def test_not_found(static_client):
+    """Test missing files and directory traversal are rejected."""
+    resp = await static_client.get("/static/missing.js")
+    assert resp.status == 404
+
+    resp = await static_client.get("/static/../test_static.py")
+    assert resp.status in (403, 404)
+
+
+def test_prefers_brotli(static_dir):
+    """Test the brotli sibling is preferred over gzip."""
+    (static_dir / "app.js.br").write_bytes(b"brotli")
+    static_file = load_static_file(static_dir / "app.js")
+
+    encoding, path, _ = static_file.select(
+        accepted_encodings(Mock(headers={hdrs.ACCEPT_ENCODING: "gzip, br"}))
+    )
+    assert encoding == "br"
+    assert path == static_dir / "app.js.br"
+
+    encoding, path, _ = static_file.select({"gzip"})
+    assert encoding == "gzip"
+    assert path == static_dir / "app.js.gz"
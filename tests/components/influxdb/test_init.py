@@ -750,3 +750,125 @@ class TestInfluxDB(unittest.TestCase):
             assert mock_client.return_value.write_points.call_count == 0
 
         mock_client.return_value.write_points.reset_mock()
+
+
+def _thread(spool=None):
+    """Return an InfluxDB thread writing to a mock client."""
+    influx = mock.Mock()
+    thread = influxdb.InfluxThread(
+        mock.Mock(), influx, lambda event: {"value": event}, 0, spool
+    )
+    return thread, influx
+
+
+def test_spool_during_outage(tmp_path):
+    """Test points are spooled while the database is down and written after."""
+    import influxdb as influxdb_client
+
+    spool = influxdb.Spool(str(tmp_path), 1024 * 1024)
+    thread, influx = _thread(spool)
+    influx.write_points.side_effect = influxdb_client.exceptions.InfluxDBServerError(
+        "down"
+    )
+
+    assert not thread.write_to_influxdb([{"value": 1}])
+    thread.spool_events([{"value": 1}])
+    thread.spool_events([{"value": 2}])
+    assert spool.pending == 2
+
+    # Still down, the points stay in the spool
+    thread.write_spooled()
+    assert spool.pending == 2
+
+    influx.write_points.side_effect = None
+    thread.write_spooled()
+    assert influx.write_points.call_args == mock.call([{"value": 1}, {"value": 2}])
+    assert spool.pending == 0
+    assert thread.stats["written"] == 2
+    assert thread.stats["catch_up_rate"] > 0
+
+
+def test_adaptive_batch_size():
+    """Test full batches grow while writes are fast and shrink when slow."""
+    thread, _ = _thread()
+    assert thread.batch_size == influxdb.BATCH_BUFFER_SIZE
+
+    thread._adapt_batch_size(influxdb.BATCH_BUFFER_SIZE, 0.01)
+    assert thread.batch_size == 2 * influxdb.BATCH_BUFFER_SIZE
+
+    # Partial batches mean there is no backlog
+    thread._adapt_batch_size(10, 0.01)
+    assert thread.batch_size == 2 * influxdb.BATCH_BUFFER_SIZE
+
+    for _ in range(20):
+        thread._adapt_batch_size(thread.batch_size, 0.01)
+    assert thread.batch_size == influxdb.MAX_BATCH_SIZE
+
+    thread._adapt_batch_size(thread.batch_size, 3 * influxdb.TARGET_WRITE_TIME)
+    assert thread.batch_size == influxdb.MAX_BATCH_SIZE // 2
+
+
+def test_spooled_events_never_too_old(tmp_path):
+    """Test old events are kept when they can be spooled."""
+    thread, _ = _thread(influxdb.Spool(str(tmp_path), 1024 * 1024))
+    thread.queue.put((0, 1))
+    thread.queue.put(None)
+
+    with mock.patch(
+        "homeassistant.components.influxdb.time.monotonic", return_value=1000
+    ):
+        assert thread.get_events_json() == (2, [{"value": 1}])
+
+
+def test_rejected_spooled_batch(tmp_path):
+    """Test a spooled batch the database rejects does not block the spool."""
+    import influxdb as influxdb_client
+
+    spool = influxdb.Spool(str(tmp_path), 1024 * 1024)
+    thread, influx = _thread(spool)
+    thread.batch_size = 1
+    thread.spool_events([{"value": "bad"}])
+    thread.spool_events([{"value": 2}])
+
+    influx.write_points.side_effect = influxdb_client.exceptions.InfluxDBClientError(
+        "field type conflict", 400
+    )
+    thread.write_spooled()
+    assert spool.pending == 1
+    assert thread.stats["rejected"] == 1
+
+    influx.write_points.side_effect = None
+    thread.write_spooled()
+    assert influx.write_points.call_args == mock.call([{"value": 2}])
+    assert spool.pending == 0
+    assert thread.stats["written"] == 1
+
+
+def test_rejected_events_not_spooled(tmp_path):
+    """Test events the database rejects are dropped instead of spooled."""
+    import influxdb as influxdb_client
+
+    thread, influx = _thread(influxdb.Spool(str(tmp_path), 1024 * 1024))
+    influx.write_points.side_effect = influxdb_client.exceptions.InfluxDBClientError(
+        "bad request", 400
+    )
+
+    assert thread.write_to_influxdb([{"value": 1}])
+    assert influx.write_points.call_count == 1
+    assert thread.stats["rejected"] == 1
+    assert thread.stats["spooled"] == 0
+
+
+def test_rejected_events_retried_without_spool():
+    """Test events the database rejects are retried when nothing is spooled."""
+    import influxdb as influxdb_client
+
+    thread, influx = _thread()
+    influx.write_points.side_effect = influxdb_client.exceptions.InfluxDBClientError(
+        "bad request", 400
+    )
+
+    with mock.patch.object(influxdb.time, "sleep"):
+        assert not thread.write_to_influxdb([{"value": 1}])
+    assert influx.write_points.call_count == thread.max_tries + 1
+    assert thread.stats["rejected"] == 0
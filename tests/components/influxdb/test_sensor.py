@@ -0,0 +1,103 @@
+"""The tests for the InfluxDB sensor."""
+import unittest
+from unittest import mock
+
+from influxdb.resultset import ResultSet
+
+from homeassistant.components.influxdb.sensor import (
+    DATA_INFLUX_CLIENTS,
+    PLATFORM_SCHEMA,
+    setup_platform,
+)
+from homeassistant.const import STATE_UNKNOWN
+
+from tests.common import get_test_home_assistant
+
+
+def _result(value):
+    """Return the result of a statement returning a single value."""
+    return ResultSet(
+        {
+            "series": [
+                {"name": "m", "columns": ["time", "value"], "values": [[0, value]]}
+            ]
+        }
+    )
+
+
+@mock.patch("influxdb.InfluxDBClient")
+class TestInfluxDBSensor(unittest.TestCase):
+    """Test the InfluxDB sensor."""
+
+    def setUp(self):
+        """Set up things to be run when tests are started."""
+        self.hass = get_test_home_assistant()
+
+    def tearDown(self):
+        """Stop everything that was started."""
+        self.hass.stop()
+
+    def _setup(self, queries):
+        """Set up the sensor platform with queries and update the sensors."""
+        config = PLATFORM_SCHEMA({"platform": "influxdb", "queries": queries})
+        add_entities = mock.Mock()
+        setup_platform(self.hass, config, add_entities)
+        sensors = add_entities.call_args[0][0]
+        for sensor in sensors:
+            sensor.update()
+        return {sensor.name: sensor.state for sensor in sensors}
+
+    def test_queries_grouped(self, mock_client):
+        """Test queries sharing a database run in a single request."""
+        mock_client.return_value.query.side_effect = [
+            ResultSet({}),
+            [
+                _result(1.5),
+                ResultSet({"error": "bad query"}, raise_errors=False),
+                ResultSet({}),
+            ],
+        ]
+
+        states = self._setup(
+            [
+                {"name": "one", "measurement": "m", "where": "a = 1"},
+                {"name": "two", "measurement": "m", "where": "a = 2"},
+                {"name": "three", "measurement": "m", "where": "a = 3"},
+            ]
+        )
+
+        assert mock_client.call_count == 1
+        assert len(self.hass.data[DATA_INFLUX_CLIENTS]) == 1
+        assert mock_client.return_value.query.call_count == 2
+        assert mock_client.return_value.query.call_args == mock.call(
+            "select mean(value) as value from m where a = 1;"
+            "select mean(value) as value from m where a = 2;"
+            "select mean(value) as value from m where a = 3",
+            raise_errors=False,
+        )
+        assert states == {"one": 1.5, "two": STATE_UNKNOWN, "three": STATE_UNKNOWN}
+
+    def test_client_per_database(self, mock_client):
+        """Test a client and request per database."""
+        mock_client.return_value.query.side_effect = [
+            ResultSet({}),
+            ResultSet({}),
+            _result(1),
+            _result(2),
+        ]
+
+        states = self._setup(
+            [
+                {"name": "one", "measurement": "m", "where": "a = 1"},
+                {
+                    "name": "two",
+                    "measurement": "m",
+                    "where": "a = 2",
+                    "database": "other",
+                },
+            ]
+        )
+
+        assert mock_client.call_count == 2
+        assert mock_client.return_value.query.call_count == 4
+        assert states == {"one": 1, "two": 2}
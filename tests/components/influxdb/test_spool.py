@@ -0,0 +1,80 @@
+"""The tests for the InfluxDB spool."""
+from datetime import datetime
+import os
+
+from homeassistant.components.influxdb.spool import Spool
+import homeassistant.util.dt as dt_util
+
+
+def _points(start, count):
+    """Return points with increasing values."""
+    return [
+        {"measurement": "m", "fields": {"value": value}}
+        for value in range(start, start + count)
+    ]
+
+
+def test_append_read_commit(tmp_path):
+    """Test points are returned in order and removed once committed."""
+    spool = Spool(str(tmp_path), 1024 * 1024)
+    spool.append(_points(0, 3))
+    spool.append(_points(3, 2))
+    assert spool.pending == 5
+
+    assert spool.read(2) == _points(0, 2)
+    # Not committed, the same points are returned again
+    assert spool.read(2) == _points(0, 2)
+    spool.commit()
+    assert spool.pending == 3
+
+    assert spool.read(10) == _points(2, 3)
+    spool.commit()
+    assert spool.pending == 0
+    assert spool.read(10) == []
+    assert os.listdir(str(tmp_path)) == []
+
+
+def test_serializes_time(tmp_path):
+    """Test point times are stored as ISO strings."""
+    spool = Spool(str(tmp_path), 1024 * 1024)
+    time = datetime(2019, 10, 1, 12, tzinfo=dt_util.UTC)
+    spool.append([{"measurement": "m", "time": time, "fields": {}}])
+    assert spool.read(1)[0]["time"] == time.isoformat()
+
+
+def test_segments_and_size_bound(tmp_path):
+    """Test the oldest segments are dropped when the spool is full."""
+    spool = Spool(str(tmp_path), 400, segment_size=100)
+    for start in range(0, 40, 4):
+        spool.append(_points(start, 4))
+
+    assert spool.size <= 400
+    assert spool.dropped > 0
+    assert spool.pending + spool.dropped == 40
+
+    # The newest points are kept
+    points = []
+    while spool.pending:
+        points.extend(spool.read(3))
+        spool.commit()
+    assert points == _points(40 - len(points), len(points))
+
+
+def test_reload(tmp_path):
+    """Test spooled points survive a restart and corrupt lines are skipped."""
+    spool = Spool(str(tmp_path), 1024 * 1024)
+    spool.append(_points(0, 2))
+    spool.close()
+
+    segment = os.path.join(str(tmp_path), os.listdir(str(tmp_path))[0])
+    with open(segment, "ab") as fil:
+        fil.write(b'{"measurement": ')
+
+    spool = Spool(str(tmp_path), 1024 * 1024)
+    assert spool.pending == 3
+    assert spool.read(10) == _points(0, 2)
+    spool.commit()
+    assert spool.pending == 0
+
+    spool.append(_points(5, 1))
+    assert spool.read(10) == _points(5, 1)
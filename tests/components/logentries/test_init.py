@@ -1,11 +1,14 @@
 """The tests for the Logentries component."""
-
+import json
 import unittest
 from unittest import mock
 
+import pytest
+
 from homeassistant.setup import setup_component
 import homeassistant.components.logentries as logentries
 from homeassistant.const import STATE_ON, STATE_OFF, EVENT_STATE_CHANGED
+from homeassistant.helpers.exporter import ExportError
 
 from tests.common import get_test_home_assistant
 
@@ -37,22 +40,18 @@ class TestLogentries(unittest.TestCase):
         assert self.hass.bus.listen.called
         assert EVENT_STATE_CHANGED == self.hass.bus.listen.call_args_list[0][0][0]
 
-    def _setup(self, mock_requests):
-        """Test the setup."""
-        self.mock_post = mock_requests.post
-        self.mock_request_exception = Exception
-        mock_requests.exceptions.RequestException = self.mock_request_exception
+    @mock.patch.object(logentries, "BatchingExporter")
+    def _setup(self, mock_exporter):
+        """Set up the component and return its encoder and transport."""
         config = {"logentries": {"token": "token"}}
-        self.hass.bus.listen = mock.MagicMock()
-        setup_component(self.hass, logentries.DOMAIN, config)
-        self.handler_method = self.hass.bus.listen.call_args_list[0][0][1]
+        assert setup_component(self.hass, logentries.DOMAIN, config)
+        assert mock_exporter.return_value.start.call_count == 1
+        _, _, encoder, transport = mock_exporter.call_args[0]
+        return encoder, transport
 
-    @mock.patch.object(logentries, "requests")
-    @mock.patch("json.dumps")
-    def test_event_listener(self, mock_dump, mock_requests):
-        """Test event listener."""
-        mock_dump.side_effect = lambda x: x
-        self._setup(mock_requests)
+    def test_event_encoder(self):
+        """Test events are encoded as log lines."""
+        encoder, _ = self._setup()
 
         valid = {"1": 1, "1.0": 1.0, STATE_ON: 1, STATE_OFF: 0, "foo": "foo"}
         for in_, out in valid.items():
@@ -73,9 +72,25 @@ class TestLogentries(unittest.TestCase):
                 "host": "https://webhook.logentries.com/noformat/" "logs/token",
                 "event": body,
             }
-            self.handler_method(event)
-            assert self.mock_post.call_count == 1
-            assert self.mock_post.call_args == mock.call(
-                payload["host"], data=payload, timeout=10
-            )
-            self.mock_post.reset_mock()
+            assert [json.loads(line) for line in encoder(event)] == [payload]
+
+        assert encoder(mock.MagicMock(data={"new_state": None})) is None
+
+    @mock.patch.object(logentries, "requests")
+    def test_transport(self, mock_requests):
+        """Test a batch is posted in a single request."""
+        mock_requests.exceptions.RequestException = Exception
+        _, transport = self._setup()
+        session = mock_requests.Session.return_value
+
+        transport.send(["line 1", "line 2"])
+        assert session.post.call_count == 1
+        assert session.post.call_args == mock.call(
+            "https://webhook.logentries.com/noformat/logs/token",
+            data="line 1\nline 2",
+            timeout=10,
+        )
+
+        session.post.side_effect = Exception
+        with pytest.raises(ExportError):
+            transport.send(["line 1"])
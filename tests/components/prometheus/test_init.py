@@ -1,5 +1,8 @@
 """The tests for the Prometheus exporter."""
 import asyncio
+from unittest.mock import patch
+
+import prometheus_client as prometheus_client_lib
 import pytest
 
 from homeassistant.const import ENERGY_KILO_WATT_HOUR, DEVICE_CLASS_POWER
@@ -114,3 +117,59 @@ def test_view(prometheus_client):  # pylint: disable=redefined-outer-name
         'entity="sensor.wind_direction",'
         'friendly_name="Wind Direction"} 25.0' in body
     )
+
+
+async def test_view_gzip(prometheus_client):  # pylint: disable=redefined-outer-name
+    """Test the exposition is compressed for clients accepting gzip."""
+    resp = await prometheus_client.get(
+        prometheus.API_ENDPOINT, headers={"Accept-Encoding": "gzip"}
+    )
+    assert resp.status == 200
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert "temperature_c" in await resp.text()
+
+
+async def test_removed_entity_series(hass, prometheus_client):
+    """Test series of removed or renamed entities are dropped."""
+    hass.states.async_set(
+        "sensor.living_room", "21", {"unit_of_measurement": "°C", "friendly_name": "A"}
+    )
+    await hass.async_block_till_done()
+
+    body = await (await prometheus_client.get(prometheus.API_ENDPOINT)).text()
+    assert 'entity="sensor.living_room",friendly_name="A"} 21.0' in body
+
+    hass.states.async_set(
+        "sensor.living_room", "22", {"unit_of_measurement": "°C", "friendly_name": "B"}
+    )
+    await hass.async_block_till_done()
+
+    body = await (await prometheus_client.get(prometheus.API_ENDPOINT)).text()
+    assert 'friendly_name="A"' not in body
+    assert 'entity="sensor.living_room",friendly_name="B"} 22.0' in body
+
+    hass.states.async_remove("sensor.living_room")
+    await hass.async_block_till_done()
+
+    body = await (await prometheus_client.get(prometheus.API_ENDPOINT)).text()
+    assert "sensor.living_room" not in body
+    assert "sensor.outside_temperature" in body
+
+
+async def test_render_cached(hass, prometheus_client):
+    """Test only metric families with changed series are rendered again."""
+    await prometheus_client.get(prometheus.API_ENDPOINT)
+
+    with patch(
+        "prometheus_client.generate_latest", wraps=prometheus_client_lib.generate_latest
+    ) as mock_render:
+        await prometheus_client.get(prometheus.API_ENDPOINT)
+        # Once for the process metrics, nothing changed since the first scrape
+        assert mock_render.call_count == 1
+
+        hass.states.async_set("switch.fan", "on")
+        await hass.async_block_till_done()
+        await prometheus_client.get(prometheus.API_ENDPOINT)
+
+    # The process metrics, switch_state and state_change families
+    assert mock_render.call_count == 4
@@ -398,3 +398,23 @@ async def test_async_get_descriptions_script(hass):
         descriptions[script.DOMAIN]["test2"]["fields"]["param"]["example"]
         == "param_example"
     )
+
+
+async def test_script_metrics(hass, hass_ws_client):
+    """Test reading the metrics of scripts."""
+    assert await async_setup_component(
+        hass, "script", {"script": {"test": {"sequence": [{"event": "test_event"}]}}},
+    )
+
+    await hass.services.async_call("script", "test", blocking=True)
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 5, "type": "script/metrics"})
+    msg = await client.receive_json()
+
+    assert msg["success"]
+    metrics = msg["result"][0]
+    assert metrics["entity_id"] == "script.test"
+    assert metrics["runs"]["count"] == 1
+    assert metrics["steps"][0]["type"] == "event"
+    assert metrics["steps"][0]["count"] == 1
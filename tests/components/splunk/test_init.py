@@ -3,10 +3,13 @@ import json
 import unittest
 from unittest import mock
 
+import pytest
+
 from homeassistant.setup import setup_component
 import homeassistant.components.splunk as splunk
 from homeassistant.const import STATE_ON, STATE_OFF, EVENT_STATE_CHANGED
 from homeassistant.helpers import state as state_helper
+from homeassistant.helpers.exporter import ExportError
 import homeassistant.util.dt as dt_util
 from homeassistant.core import State
 
@@ -55,21 +58,19 @@ class TestSplunk(unittest.TestCase):
         assert self.hass.bus.listen.called
         assert EVENT_STATE_CHANGED == self.hass.bus.listen.call_args_list[0][0][0]
 
-    def _setup(self, mock_requests):
-        """Test the setup."""
-        self.mock_post = mock_requests.post
-        self.mock_request_exception = Exception
-        mock_requests.exceptions.RequestException = self.mock_request_exception
-        config = {"splunk": {"host": "host", "token": "secret", "port": 8088}}
-
-        self.hass.bus.listen = mock.MagicMock()
-        setup_component(self.hass, splunk.DOMAIN, config)
-        self.handler_method = self.hass.bus.listen.call_args_list[0][0][1]
+    @mock.patch.object(splunk, "BatchingExporter")
+    def _setup(self, config, mock_exporter):
+        """Set up the component and return its encoder and transport."""
+        assert setup_component(self.hass, splunk.DOMAIN, config)
+        assert mock_exporter.return_value.start.call_count == 1
+        _, _, encoder, transport = mock_exporter.call_args[0]
+        return encoder, transport
 
-    @mock.patch.object(splunk, "requests")
-    def test_event_listener(self, mock_requests):
-        """Test event listener."""
-        self._setup(mock_requests)
+    def test_event_encoder(self):
+        """Test events are encoded for the event collector."""
+        encoder, _ = self._setup(
+            {"splunk": {"host": "host", "token": "secret", "port": 8088}}
+        )
 
         now = dt_util.now()
         valid = {"1": 1, "1.0": 1.0, STATE_ON: 1, STATE_OFF: 0, "foo": "foo"}
@@ -103,37 +104,52 @@ class TestSplunk(unittest.TestCase):
                 "host": "http://host:8088/services/collector/event",
                 "event": body,
             }
-            self.handler_method(event)
-            assert self.mock_post.call_count == 1
-            assert self.mock_post.call_args == mock.call(
-                payload["host"],
-                data=json.dumps(payload),
-                headers={"Authorization": "Splunk secret"},
-                timeout=10,
-                verify=True,
-            )
-            self.mock_post.reset_mock()
-
-    def _setup_with_filter(self):
-        """Test the setup."""
-        config = {
-            "splunk": {
-                "host": "host",
-                "token": "secret",
-                "port": 8088,
-                "filter": {
-                    "exclude_domains": ["excluded_domain"],
-                    "exclude_entities": ["other_domain.excluded_entity"],
-                },
-            }
-        }
+            assert encoder(event) == [json.dumps(payload)]
 
-        setup_component(self.hass, splunk.DOMAIN, config)
+        assert encoder(mock.MagicMock(data={"new_state": None})) is None
 
-    @mock.patch.object(splunk, "post_request")
-    def test_splunk_entityfilter(self, mock_requests):
-        """Test event listener."""
-        self._setup_with_filter()
+    @mock.patch.object(splunk, "requests")
+    def test_transport(self, mock_requests):
+        """Test a batch is posted in a single request over one session."""
+        mock_requests.exceptions.RequestException = Exception
+        _, transport = self._setup(
+            {"splunk": {"host": "host", "token": "secret", "port": 8088}}
+        )
+        session = mock_requests.Session.return_value
+        assert session.headers.update.call_args == mock.call(
+            {"Authorization": "Splunk secret"}
+        )
+
+        transport.send(['{"event": 1}', '{"event": 2}'])
+        transport.send(['{"event": 3}'])
+        assert mock_requests.Session.call_count == 1
+        assert session.post.call_count == 2
+        assert session.post.call_args_list[0] == mock.call(
+            "http://host:8088/services/collector/event",
+            data='{"event": 1}\n{"event": 2}',
+            timeout=10,
+            verify=True,
+        )
+
+        session.post.side_effect = Exception
+        with pytest.raises(ExportError):
+            transport.send(['{"event": 1}'])
+
+    def test_splunk_entityfilter(self):
+        """Test the entity filter of the encoder."""
+        encoder, _ = self._setup(
+            {
+                "splunk": {
+                    "host": "host",
+                    "token": "secret",
+                    "port": 8088,
+                    "filter": {
+                        "exclude_domains": ["excluded_domain"],
+                        "exclude_entities": ["other_domain.excluded_entity"],
+                    },
+                }
+            }
+        )
 
         testdata = [
             {"entity_id": "other_domain.other_entity", "filter_expected": False},
@@ -142,12 +158,27 @@ class TestSplunk(unittest.TestCase):
         ]
 
         for test in testdata:
-            mock_state_change_event(self.hass, State(test["entity_id"], "on"))
-            self.hass.block_till_done()
+            event = mock.MagicMock(
+                data={"new_state": State(test["entity_id"], "on")}, time_fired=12345
+            )
 
             if test["filter_expected"]:
-                assert not splunk.post_request.called
+                assert encoder(event) is None
             else:
-                assert splunk.post_request.called
+                assert encoder(event)
+
+    def test_exporter_receives_events(self):
+        """Test state changes are sent through the exporter."""
+        with mock.patch.object(splunk, "requests") as mock_requests:
+            assert setup_component(
+                self.hass,
+                splunk.DOMAIN,
+                {"splunk": {"host": "host", "token": "secret"}},
+            )
+            mock_state_change_event(self.hass, State("light.kitchen", "on"))
+            self.hass.block_till_done()
+            self.hass.stop()
 
-            splunk.post_request.reset_mock()
+        session = mock_requests.Session.return_value
+        assert session.post.call_count == 1
+        assert '"entity_id": "kitchen"' in session.post.call_args[1]["data"]
@@ -1,10 +1,15 @@
 """The test for the sql sensor platform."""
 import unittest
+from unittest.mock import patch
 
 import pytest
 import voluptuous as vol
 
-from homeassistant.components.sql.sensor import validate_sql_select
+from homeassistant.components.sql.sensor import (
+    DATA_SQL_SESSIONMAKERS,
+    SQLQueryGroup,
+    validate_sql_select,
+)
 from homeassistant.const import STATE_UNKNOWN
 from homeassistant.setup import setup_component
 
@@ -67,3 +72,34 @@ class TestSQLSensor(unittest.TestCase):
 
         state = self.hass.states.get("sensor.count_tables")
         assert state.state == STATE_UNKNOWN
+
+    def test_queries_share_session(self):
+        """Test the queries of a platform run together once per update."""
+        config = {
+            "sensor": {
+                "platform": "sql",
+                "db_url": "sqlite://",
+                "queries": [
+                    {"name": "five", "query": "SELECT 5 as value", "column": "value"},
+                    {"name": "six", "query": "SELECT 6 as value", "column": "value"},
+                    {
+                        "name": "broken",
+                        "query": "SELECT * value FROM sqlite_master;",
+                        "column": "value",
+                    },
+                ],
+            }
+        }
+
+        with patch(
+            "homeassistant.components.sql.sensor.SQLQueryGroup._run",
+            side_effect=SQLQueryGroup._run,
+            autospec=True,
+        ) as mock_run:
+            assert setup_component(self.hass, "sensor", config)
+
+        assert mock_run.call_count == 1
+        assert list(self.hass.data[DATA_SQL_SESSIONMAKERS]) == ["sqlite://"]
+        assert self.hass.states.get("sensor.five").state == "5"
+        assert self.hass.states.get("sensor.six").state == "6"
+        assert self.hass.states.get("sensor.broken").state == STATE_UNKNOWN
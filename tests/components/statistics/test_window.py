@@ -0,0 +1,63 @@
+"""The tests for the statistics sample window."""
+from datetime import datetime, timedelta
+import random
+import statistics
+
+import pytest
+
+from homeassistant.components.statistics.window import SampleWindow
+from homeassistant.util import dt as dt_util
+
+START = datetime(2019, 10, 1, tzinfo=dt_util.UTC)
+
+
+def _assert_matches(window, values):
+    """Assert the window statistics match those computed from scratch."""
+    assert window.values() == values
+    assert len(window) == len(values)
+    assert window.total == pytest.approx(sum(values))
+    assert window.mean == pytest.approx(statistics.mean(values))
+    assert window.median == statistics.median(values)
+    assert window.min == min(values)
+    assert window.max == max(values)
+    assert window.first == values[0]
+    assert window.last == values[-1]
+    if len(values) > 1:
+        assert window.variance == pytest.approx(statistics.variance(values))
+        assert window.stdev == pytest.approx(statistics.stdev(values))
+
+
+def test_matches_statistics_module():
+    """Test statistics stay correct while the window rotates."""
+    rand = random.Random(42)
+    window = SampleWindow(25)
+    values = []
+
+    for i in range(200):
+        value = round(rand.uniform(-50, 50), rand.choice((0, 1, 3)))
+        window.append(value, START + timedelta(seconds=i))
+        values = (values + [value])[-25:]
+        _assert_matches(window, values)
+
+    assert window.min_age == START + timedelta(seconds=175)
+    assert window.max_age == START + timedelta(seconds=199)
+
+
+def test_purge():
+    """Test removing samples by age."""
+    window = SampleWindow(10)
+    for i, value in enumerate([3, 1, 4, 1, 5, 9, 2, 6]):
+        window.append(value, START + timedelta(minutes=i))
+
+    window.purge(START + timedelta(minutes=5))
+    _assert_matches(window, [9, 2, 6])
+
+    window.purge(START + timedelta(hours=1))
+    assert len(window) == 0
+    with pytest.raises(ValueError):
+        window.mean
+
+    window.append(7, START)
+    _assert_matches(window, [7])
+    with pytest.raises(ValueError):
+        window.variance
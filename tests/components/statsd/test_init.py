@@ -63,17 +63,28 @@ class TestStatsd(unittest.TestCase):
         )
         assert self.hass.bus.listen.called
 
+    @mock.patch.object(statsd, "BatchingExporter")
+    def _setup(self, config, mock_exporter):
+        """Set up the component and return a function exporting an event."""
+        assert setup_component(self.hass, statsd.DOMAIN, config)
+        assert mock_exporter.return_value.start.call_count == 1
+        _, _, encoder, transport = mock_exporter.call_args[0]
+
+        def handler_method(event):
+            """Encode and send a single event."""
+            transport.send(encoder(event))
+
+        return handler_method
+
     @mock.patch("statsd.StatsClient")
-    def test_event_listener_defaults(self, mock_client):
+    def test_event_listener_defaults(self, mock_statsd):
         """Test event listener."""
         config = {"statsd": {"host": "host", "value_mapping": {"custom": 3}}}
 
         config["statsd"][statsd.CONF_RATE] = statsd.DEFAULT_RATE
 
-        self.hass.bus.listen = mock.MagicMock()
-        setup_component(self.hass, statsd.DOMAIN, config)
-        assert self.hass.bus.listen.called
-        handler_method = self.hass.bus.listen.call_args_list[0][0][1]
+        handler_method = self._setup(config)
+        mock_client = mock_statsd.return_value.pipeline
 
         valid = {"1": 1, "1.0": 1.0, "custom": 3, STATE_ON: 1, STATE_OFF: 0}
         for in_, out in valid.items():
@@ -99,16 +110,14 @@ class TestStatsd(unittest.TestCase):
             assert mock_client.return_value.incr.called
 
     @mock.patch("statsd.StatsClient")
-    def test_event_listener_attr_details(self, mock_client):
+    def test_event_listener_attr_details(self, mock_statsd):
         """Test event listener."""
         config = {"statsd": {"host": "host", "log_attributes": True}}
 
         config["statsd"][statsd.CONF_RATE] = statsd.DEFAULT_RATE
 
-        self.hass.bus.listen = mock.MagicMock()
-        setup_component(self.hass, statsd.DOMAIN, config)
-        assert self.hass.bus.listen.called
-        handler_method = self.hass.bus.listen.call_args_list[0][0][1]
+        handler_method = self._setup(config)
+        mock_client = mock_statsd.return_value.pipeline
 
         valid = {"1": 1, "1.0": 1.0, STATE_ON: 1, STATE_OFF: 0}
         for in_, out in valid.items():
@@ -137,3 +146,18 @@ class TestStatsd(unittest.TestCase):
             )
             assert not mock_client.return_value.gauge.called
             assert mock_client.return_value.incr.called
+
+    @mock.patch("statsd.StatsClient")
+    def test_batch_single_pipeline(self, mock_statsd):
+        """Test a batch of metrics is sent through one pipeline."""
+        config = {"statsd": {"host": "host"}}
+        handler_method = self._setup(config)
+        pipe = mock_statsd.return_value.pipeline.return_value
+
+        handler_method(
+            mock.MagicMock(data={"new_state": ha.State("domain.test", "1", {})})
+        )
+
+        assert mock_statsd.return_value.pipeline.call_count == 1
+        assert pipe.send.call_count == 1
+        assert not mock_statsd.return_value.gauge.called
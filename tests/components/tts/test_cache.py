@@ -0,0 +1,70 @@
+"""The tests for the TTS caches."""
+from homeassistant.components.tts.cache import FileCache, MemoryCache
+
+
+def test_memory_cache_lru_eviction():
+    """Test the memory cache evicts least recently used voices."""
+    cache = MemoryCache(max_size=10)
+
+    assert cache.set("a", "a.mp3", b"1234") == []
+    assert cache.set("b", "b.mp3", b"1234") == []
+    assert cache.get("a") == ("a.mp3", b"1234")
+
+    assert cache.set("c", "c.mp3", b"1234") == ["b"]
+    assert "a" in cache
+    assert "b" not in cache
+    assert cache.size == 8
+    assert cache.get("b") is None
+    assert cache.stats == {
+        "entries": 2,
+        "size": 8,
+        "max_size": 10,
+        "hits": 1,
+        "misses": 1,
+        "evictions": 1,
+    }
+
+
+def test_memory_cache_keeps_oversized_entry():
+    """Test the newest voice is kept even if it exceeds the bound."""
+    cache = MemoryCache(max_size=2)
+
+    cache.set("a", "a.mp3", b"1")
+    assert cache.set("b", "b.mp3", b"1234") == ["a"]
+    assert cache.get("b") == ("b.mp3", b"1234")
+
+
+def test_file_cache_lru_eviction():
+    """Test the file cache evicts least recently used files."""
+    cache = FileCache(max_size=10)
+
+    assert cache.add("a", "a.mp3", 4) == []
+    assert cache.add("b", "b.mp3", 4) == []
+    assert cache.get("a") == "a.mp3"
+    assert cache.add("c", "c.mp3", 4) == ["b.mp3"]
+    assert cache.peek("b") is None
+    assert cache.size == 8
+
+    assert cache.pop("a") == "a.mp3"
+    assert cache.size == 4
+    assert cache.clear() == ["c.mp3"]
+    assert cache.size == 0
+
+
+def test_file_cache_index_round_trip():
+    """Test the file cache index survives serialization."""
+    cache = FileCache()
+    cache.add("a", "a.mp3", 4)
+    cache.add("b", "b.mp3", 5)
+    cache.get("b")
+    cache.get("b")
+    cache.get("a")
+
+    restored = FileCache(max_size=5)
+    assert restored.load_list(cache.as_list()) == ["b.mp3"]
+    assert restored.peek("a") == "a.mp3"
+
+    restored = FileCache()
+    restored.load_list(cache.as_list())
+    assert restored.most_used(1) == ["b"]
+    assert restored.most_used(5) == ["b", "a"]
@@ -1,7 +1,9 @@
 """The tests for the TTS component."""
 import ctypes
+import hashlib
 import os
 import shutil
+import tempfile
 from unittest.mock import patch, PropertyMock
 
 import pytest
@@ -17,16 +19,26 @@ from homeassistant.components.media_player.const import (
     ATTR_MEDIA_CONTENT_TYPE,
     DOMAIN as DOMAIN_MP,
 )
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.setup import setup_component, async_setup_component
+from homeassistant.util.json import load_json, save_json
 
 from tests.common import (
     get_test_home_assistant,
     get_test_instance_port,
     assert_setup_component,
+    async_mock_service,
     mock_service,
 )
 
 
+@pytest.fixture(autouse=True)
+def tmp_config_dir(request, tmp_path):
+    """Keep the cache folder of tests using hass in a temporary config dir."""
+    if "hass" in request.fixturenames:
+        request.getfixturevalue("hass").config.config_dir = str(tmp_path)
+
+
 @pytest.fixture(autouse=True)
 def mutagen_mock():
     """Mock writing tags."""
@@ -43,6 +55,7 @@ class TestTTS:
     def setup_method(self):
         """Set up things to be run when tests are started."""
         self.hass = get_test_home_assistant()
+        self.hass.config.config_dir = tempfile.mkdtemp()
         self.demo_provider = DemoProvider("en")
         self.default_tts_cache = self.hass.config.path(tts.DEFAULT_CACHE_DIR)
 
@@ -55,9 +68,7 @@ class TestTTS:
     def teardown_method(self):
         """Stop everything that was started."""
         self.hass.stop()
-
-        if os.path.isdir(self.default_tts_cache):
-            shutil.rmtree(self.default_tts_cache)
+        shutil.rmtree(self.hass.config.config_dir)
 
     def test_setup_component_demo(self):
         """Set up the demo platform with defaults."""
@@ -646,3 +657,145 @@ async def test_setup_component_and_web_get_url_bad_config(hass, hass_client):
 
     req = await client.post(url, json=data)
     assert req.status == 400
+
+
+async def test_cache_index_saved_and_preloaded(hass, hass_client):
+    """Test the file cache index is persisted and used to preload voices."""
+    tts_cache = hass.config.path(tts.DEFAULT_CACHE_DIR)
+    index_file = os.path.join(tts_cache, tts.INDEX_FILENAME)
+    filename = "265944c108cbb00b2a621be5930513e03a0bb2cd_en_-_demo.mp3"
+    config = {tts.DOMAIN: {"platform": "demo", "preload": 1}}
+    calls = async_mock_service(hass, DOMAIN_MP, SERVICE_PLAY_MEDIA)
+
+    await async_setup_component(hass, tts.DOMAIN, config)
+    client = await hass_client()
+
+    for _ in range(2):
+        await hass.services.async_call(
+            tts.DOMAIN,
+            "demo_say",
+            {tts.ATTR_MESSAGE: "I person is on front of your door."},
+            blocking=True,
+        )
+        await hass.async_block_till_done()
+    assert len(calls) == 2
+
+    req = await client.get(f"/api/tts_proxy/{filename}")
+    assert req.status == 200
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+
+    index = load_json(index_file)
+    assert index["version"] == tts.INDEX_VERSION
+    assert [entry["filename"] for entry in index["entries"]] == [filename]
+    assert index["entries"][0]["hits"] == 1
+
+    manager = tts.SpeechManager(hass)
+    await manager.async_init_cache(
+        True, tts.DEFAULT_CACHE_DIR, tts.DEFAULT_TIME_MEMORY, "", preload=1
+    )
+    await hass.async_block_till_done()
+
+    assert manager.cache_stats["file"]["entries"] == 1
+    assert manager.cache_stats["memory"]["entries"] == 1
+
+
+async def test_cache_index_reconciled_with_folder(hass, hass_client):
+    """Test the index drops missing files and adds files it does not list."""
+    tts_cache = hass.config.path(tts.DEFAULT_CACHE_DIR)
+    filename = "265944c108cbb00b2a621be5930513e03a0bb2cd_en_-_demo.mp3"
+    missing = "aaaa44c108cbb00b2a621be5930513e03a0bb2cd_en_-_demo.mp3"
+
+    os.mkdir(tts_cache)
+    with open(os.path.join(tts_cache, filename), "wb") as voice_file:
+        voice_file.write(b"voice")
+    save_json(
+        os.path.join(tts_cache, tts.INDEX_FILENAME),
+        {
+            "version": tts.INDEX_VERSION,
+            "entries": [
+                {
+                    "key": "aaaa44c108cbb00b2a621be5930513e03a0bb2cd_en_-_demo",
+                    "filename": missing,
+                    "size": 5,
+                }
+            ],
+        },
+    )
+
+    await async_setup_component(hass, tts.DOMAIN, {tts.DOMAIN: {"platform": "demo"}})
+    client = await hass_client()
+
+    req = await client.get(f"/api/tts_proxy/{filename}")
+    assert req.status == 200
+    assert await req.read() == b"voice"
+
+    req = await client.get(f"/api/tts_proxy/{missing}")
+    assert req.status == 404
+
+    req = await client.get("/api/tts_cache")
+    stats = await req.json()
+    assert stats["file"]["entries"] == 1
+    assert stats["file"]["size"] == 5
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+
+    index = load_json(os.path.join(tts_cache, tts.INDEX_FILENAME))
+    assert [entry["filename"] for entry in index["entries"]] == [filename]
+
+
+async def test_cache_index_sizes_used(hass, hass_client):
+    """Test the sizes of indexed files are taken from the index."""
+    tts_cache = hass.config.path(tts.DEFAULT_CACHE_DIR)
+    filename = "265944c108cbb00b2a621be5930513e03a0bb2cd_en_-_demo.mp3"
+
+    os.mkdir(tts_cache)
+    with open(os.path.join(tts_cache, filename), "wb") as voice_file:
+        voice_file.write(b"voice")
+    save_json(
+        os.path.join(tts_cache, tts.INDEX_FILENAME),
+        {
+            "version": tts.INDEX_VERSION,
+            "entries": [
+                {
+                    "key": "265944c108cbb00b2a621be5930513e03a0bb2cd_en_-_demo",
+                    "filename": filename,
+                    "size": 100,
+                }
+            ],
+        },
+    )
+
+    with patch("os.path.getsize") as mock_getsize:
+        await async_setup_component(
+            hass, tts.DOMAIN, {tts.DOMAIN: {"platform": "demo"}}
+        )
+    assert not mock_getsize.called
+
+    client = await hass_client()
+    req = await client.get("/api/tts_cache")
+    stats = await req.json()
+    assert stats["file"]["entries"] == 1
+    assert stats["file"]["size"] == 100
+
+
+async def test_cache_size_evicts_files(hass):
+    """Test the file cache removes least recently used files."""
+    tts_cache = hass.config.path(tts.DEFAULT_CACHE_DIR)
+    async_mock_service(hass, DOMAIN_MP, SERVICE_PLAY_MEDIA)
+    _, demo_data = DemoProvider("en").get_tts_audio("bla", "en")
+    config = {tts.DOMAIN: {"platform": "demo", "cache_size": len(demo_data) + 1}}
+
+    await async_setup_component(hass, tts.DOMAIN, config)
+
+    for message in ("first message", "second message"):
+        await hass.services.async_call(
+            tts.DOMAIN, "demo_say", {tts.ATTR_MESSAGE: message}, blocking=True
+        )
+        await hass.async_block_till_done()
+
+    voices = [name for name in os.listdir(tts_cache) if name.endswith(".mp3")]
+    assert len(voices) == 1
+    assert voices[0].startswith(hashlib.sha1(b"second message").hexdigest())
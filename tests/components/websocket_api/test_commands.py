@@ -10,6 +10,7 @@ from homeassistant.components.websocket_api.auth import (
 )
 from homeassistant.components.websocket_api import const
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.setup import async_setup_component
 
 from tests.common import async_mock_service
@@ -185,6 +186,31 @@ async def test_subscribe_unsubscribe_events(hass, websocket_client):
     assert sum(hass.bus.async_listeners().values()) == init_count
 
 
+async def test_subscribe_events_entity_filter(hass, websocket_client):
+    """Test subscribing to events of specific entities."""
+    await websocket_client.send_json(
+        {
+            "id": 5,
+            "type": "subscribe_events",
+            "event_type": "state_changed",
+            "entity_id": "light.kitchen",
+        }
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    hass.states.async_set("light.hall", "on")
+    hass.states.async_set("light.kitchen", "on")
+
+    with timeout(3):
+        msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 5
+    assert msg["type"] == "event"
+    assert msg["event"]["data"]["entity_id"] == "light.kitchen"
+
+
 async def test_get_states(hass, websocket_client):
     """Test get_states command."""
     hass.states.async_set("greeting.hello", "world")
@@ -246,6 +272,23 @@ async def test_ping(websocket_client):
     assert msg["type"] == "pong"
 
 
+async def test_dispatcher_stats(hass, websocket_client, hass_admin_user):
+    """Test reading the dispatcher stats."""
+    async_dispatcher_connect(hass, ("test_signal", 1), lambda: None)
+
+    await websocket_client.send_json({"id": 5, "type": "dispatcher_stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["test_signal"]["listeners"] == 1
+    assert msg["result"]["test_signal"]["latency"]["count"] == 0
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 6, "type": "dispatcher_stats"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
 async def test_call_service_context_with_user(hass, aiohttp_client, hass_access_token):
     """Test that the user is set in the service call context."""
     assert await async_setup_component(hass, "websocket_api", {})
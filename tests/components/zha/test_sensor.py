@@ -1,4 +1,6 @@
 """Test zha sensor."""
+from unittest.mock import patch
+
 import zigpy.zcl.clusters.general as general
 import zigpy.zcl.clusters.homeautomation as homeautomation
 import zigpy.zcl.clusters.measurement as measurement
@@ -190,3 +192,28 @@ def assert_state(hass, device_info, state, unit_of_measurement):
     hass_state = hass.states.get(device_info["entity_id"])
     assert hass_state.state == state
     assert hass_state.attributes.get("unit_of_measurement") == unit_of_measurement
+
+
+async def test_sensor_reports_coalesced(hass, config_entry, zha_gateway):
+    """Test that a burst of reports writes the state of a sensor once."""
+    cluster_id = measurement.TemperatureMeasurement.cluster_id
+    device_info = (
+        await async_build_devices(hass, zha_gateway, config_entry, [cluster_id])
+    )[cluster_id]
+    await async_enable_traffic(hass, zha_gateway, [device_info["zha_device"]])
+    entity_id = device_info["entity_id"]
+
+    entity_ref = zha_gateway.get_entity_reference(entity_id)
+    assert entity_ref.reference_id == entity_id
+    assert entity_ref.zha_device is device_info["zha_device"]
+
+    hdr = make_zcl_header(zcl_f.Command.Report_Attributes)
+    with patch.object(
+        hass.states, "async_set", wraps=hass.states.async_set
+    ) as mock_set:
+        for value in (2100, 2200, 2300):
+            device_info["cluster"].handle_message(hdr, [[make_attribute(0, value)]])
+        await hass.async_block_till_done()
+
+    writes = [call[1][1] for call in mock_set.mock_calls if call[1][0] == entity_id]
+    assert writes == ["23.0"]
@@ -1,7 +1,7 @@
 """Test zone component."""
 
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from homeassistant import setup
 from homeassistant.components import zone
@@ -244,3 +244,71 @@ async def test_core_config_update(hass):
     assert home_updated.name == "Updated Name"
     assert home_updated.attributes["latitude"] == 10
     assert home_updated.attributes["longitude"] == 20
+
+
+async def test_active_zone_follows_zone_changes(hass):
+    """Test the zone index and remembered results follow zone changes."""
+    hass.states.async_set(
+        "zone.office",
+        "zoning",
+        {"latitude": 32.88, "longitude": -117.23, "radius": 250},
+    )
+    await hass.async_block_till_done()
+
+    assert zone.async_active_zone(hass, 32.88, -117.23).entity_id == "zone.office"
+    assert zone.async_active_zone(hass, 52.37, 4.89) is None
+
+    hass.states.async_set(
+        "zone.office", "zoning", {"latitude": 52.37, "longitude": 4.89, "radius": 250}
+    )
+    await hass.async_block_till_done()
+
+    assert zone.async_active_zone(hass, 32.88, -117.23) is None
+    assert zone.async_active_zone(hass, 52.37, 4.89).entity_id == "zone.office"
+
+    hass.states.async_remove("zone.office")
+    await hass.async_block_till_done()
+
+    assert zone.async_active_zone(hass, 52.37, 4.89) is None
+
+
+async def test_active_zone_matches_all_zones(hass):
+    """Test the zone index and prefilter find the zones an exhaustive search finds."""
+    for index in range(40):
+        hass.states.async_set(
+            "zone.zone_{}".format(index),
+            "zoning",
+            {
+                "latitude": 40 + index * 0.013 % 0.4,
+                "longitude": -74 + index * 0.029 % 0.5,
+                "radius": 200 + index * 173 % 3000,
+                "passive": index % 7 == 0,
+            },
+        )
+    # A zone that does not fit the grid
+    hass.states.async_set(
+        "zone.huge", "zoning", {"latitude": 40.5, "longitude": -74.5, "radius": 60000},
+    )
+    await hass.async_block_till_done()
+
+    zones = [
+        hass.states.get(entity_id)
+        for entity_id in sorted(hass.states.async_entity_ids("zone"))
+    ]
+    for index in range(200):
+        latitude = 39.8 + index * 0.0037 % 0.8
+        longitude = -74.2 + index * 0.0061 % 0.9
+        radius = index % 3 * 100
+        with patch("homeassistant.components.zone.zone.is_outside", return_value=False):
+            expected = zone.zone.closest_zone(zones, latitude, longitude, radius)
+        assert zone.async_active_zone(hass, latitude, longitude, radius) == expected
+
+
+async def test_active_zone_near_cell_edge(hass):
+    """Test a zone is found from a point in the next cell of the grid."""
+    hass.states.async_set(
+        "zone.edge", "zoning", {"latitude": 0.1, "longitude": 0.25896, "radius": 1000},
+    )
+    await hass.async_block_till_done()
+
+    assert zone.async_active_zone(hass, 0.1, 0.24999).entity_id == "zone.edge"
@@ -176,3 +176,107 @@ async def test_if_numeric_state_not_raise_on_unavailable(hass):
         hass.states.async_set("sensor.temperature", "unknown")
         assert not test(hass)
         assert len(logwarn.mock_calls) == 0
+
+
+async def test_and_condition_compiled(hass):
+    """Test that nested and conditions are flattened and sorted by cost."""
+    test = await condition.async_from_config(
+        hass,
+        {
+            "condition": "and",
+            "conditions": [
+                {"condition": "template", "value_template": "{{ true }}"},
+                {"condition": "template", "value_template": "true"},
+                {
+                    "condition": "and",
+                    "conditions": [
+                        {
+                            "condition": "state",
+                            "entity_id": "sensor.temperature",
+                            "state": "100",
+                        }
+                    ],
+                },
+            ],
+        },
+    )
+
+    assert [check.description for check in test.conditions] == [
+        "state sensor.temperature",
+        "template {{ true }}",
+    ]
+
+    hass.states.async_set("sensor.temperature", 120)
+    with patch("homeassistant.helpers.condition.async_template") as mock_template:
+        assert not test(hass)
+    assert not mock_template.mock_calls
+    assert test.failed == "state sensor.temperature"
+
+    hass.states.async_set("sensor.temperature", 100)
+    assert test(hass)
+
+
+async def test_constant_conditions(hass):
+    """Test that static templates decide and/or conditions when compiled."""
+    test = await condition.async_from_config(
+        hass,
+        {
+            "condition": "or",
+            "conditions": [
+                {
+                    "condition": "state",
+                    "entity_id": "sensor.temperature",
+                    "state": "100",
+                },
+                {"condition": "template", "value_template": " True\n"},
+            ],
+        },
+    )
+    assert test.constant is True
+    assert test(hass)
+
+    test = await condition.async_from_config(
+        hass,
+        {
+            "condition": "and",
+            "conditions": [
+                {"condition": "template", "value_template": "false"},
+                {
+                    "condition": "state",
+                    "entity_id": "sensor.temperature",
+                    "state": "100",
+                },
+            ],
+        },
+    )
+    assert test.constant is False
+    assert not test(hass)
+
+
+async def test_or_condition_failed(hass):
+    """Test that or conditions test the others if one raises."""
+    test = await condition.async_from_config(
+        hass,
+        {
+            "condition": "or",
+            "conditions": [
+                {"condition": "sun", "after": "sunset"},
+                {
+                    "condition": "state",
+                    "entity_id": "sensor.temperature",
+                    "state": "100",
+                },
+            ],
+        },
+    )
+
+    hass.states.async_set("sensor.temperature", 120)
+    with patch(
+        "homeassistant.helpers.condition.sun", side_effect=ValueError
+    ) as mock_sun:
+        assert not test(hass)
+        assert len(mock_sun.mock_calls) == 1
+        assert test.failed == "or (state sensor.temperature, sun)"
+
+        hass.states.async_set("sensor.temperature", 100)
+        assert test(hass)
@@ -479,3 +479,51 @@ async def test_loading_race_condition(hass):
 
         mock_load.assert_called_once_with()
         assert results[0] == results[1]
+
+
+async def test_indexes_follow_updates(registry):
+    """Test lookups by identifier, connection, config entry and area."""
+    entry = registry.async_get_or_create(
+        config_entry_id="1234",
+        connections={(device_registry.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+        identifiers={("bridgeid", "0123")},
+    )
+    entry = registry.async_update_device(
+        entry.id, area_id="12345A", new_identifiers={("bridgeid", "4567")}
+    )
+
+    assert registry.async_get_device({("bridgeid", "0123")}, set()) is None
+    assert registry.async_get_device({("bridgeid", "4567")}, set()) == entry
+    assert (
+        registry.async_get_device(
+            set(), {(device_registry.CONNECTION_NETWORK_MAC, "12:34:56:ab:cd:ef")}
+        )
+        == entry
+    )
+    assert device_registry.async_entries_for_area(registry, "12345A") == [entry]
+    assert device_registry.async_entries_for_config_entry(registry, "1234") == [entry]
+
+    registry.async_clear_config_entry("1234")
+
+    assert registry.async_get_device({("bridgeid", "4567")}, set()) is None
+    assert device_registry.async_entries_for_area(registry, "12345A") == []
+    assert device_registry.async_entries_for_config_entry(registry, "1234") == []
+
+
+async def test_get_device_returns_first_registered(registry):
+    """Test the first registered device wins when several match."""
+    first = registry.async_get_or_create(
+        config_entry_id="1234", identifiers={("bridgeid", "0123")}
+    )
+    registry.async_get_or_create(
+        config_entry_id="1234",
+        connections={(device_registry.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+    )
+
+    assert (
+        registry.async_get_device(
+            {("bridgeid", "0123")},
+            {(device_registry.CONNECTION_NETWORK_MAC, "12:34:56:ab:cd:ef")},
+        ).id
+        == first.id
+    )
@@ -4,6 +4,9 @@ import asyncio
 from homeassistant.core import callback
 from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
+    async_dispatcher_send,
+    async_dispatcher_send_many,
+    async_dispatcher_stats,
     dispatcher_send,
     dispatcher_connect,
 )
@@ -153,3 +156,50 @@ async def test_callback_exception_gets_logged(hass, caplog):
     await hass.async_block_till_done()
 
     assert "Exception in bad_handler when dispatching 'test': ('bad',)" in caplog.text
+
+
+async def test_tuple_signals_and_send_many(hass):
+    """Test sending many tuple signals at once."""
+    calls = []
+
+    @callback
+    def handler(*args):
+        """Record calls."""
+        calls.append(args)
+
+    unsub = async_dispatcher_connect(hass, ("test", 1), handler)
+    async_dispatcher_connect(hass, ("test", 2), handler)
+
+    async_dispatcher_send_many(
+        hass, [(("test", 1), ("one",)), (("test", 2), (2, "two")), (("test", 3), ())]
+    )
+    await hass.async_block_till_done()
+    assert calls == [("one",), (2, "two")]
+
+    unsub()
+    async_dispatcher_send(hass, ("test", 1), "again")
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+
+async def test_dispatcher_stats(hass):
+    """Test listener counts and latency of signal families."""
+
+    @callback
+    def handler(*args):
+        """Handle a signal."""
+
+    async_dispatcher_connect(hass, ("test", 1), handler)
+    async_dispatcher_connect(hass, ("test", 2), handler)
+    unsub = async_dispatcher_connect(hass, "other", handler)
+    unsub()
+
+    async_dispatcher_send(hass, ("test", 1))
+    async_dispatcher_send(hass, ("test", 2))
+    await hass.async_block_till_done()
+
+    stats = async_dispatcher_stats(hass)
+    assert stats["test"]["listeners"] == 2
+    assert stats["test"]["latency"]["count"] == 2
+    # Families without listeners are forgotten
+    assert "other" not in stats
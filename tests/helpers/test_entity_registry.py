@@ -418,3 +418,38 @@ async def test_disabled_by_system_options(registry):
         "light", "hue", "BBBB", config_entry=mock_config, disabled_by="user"
     )
     assert entry2.disabled_by == "user"
+
+
+async def test_indexes_follow_updates(registry):
+    """Test lookups by unique id, config entry and device after changes."""
+    mock_config = MockConfigEntry(domain="light", entry_id="mock-id-1")
+    entry = registry.async_get_or_create(
+        "light", "hue", "5678", config_entry=mock_config, device_id="device-1"
+    )
+    other = registry.async_get_or_create("light", "hue", "1234", device_id="device-1")
+
+    assert entity_registry.async_entries_for_device(registry, "device-1") == [
+        entry,
+        other,
+    ]
+    assert entity_registry.async_entries_for_config_entry(registry, "mock-id-1") == [
+        entry
+    ]
+
+    entry = registry.async_update_entity(
+        entry.entity_id, new_entity_id="light.renamed", new_unique_id="9012"
+    )
+    registry.async_get_or_create("light", "hue", "1234", device_id="device-2")
+
+    assert registry.async_get_entity_id("light", "hue", "5678") is None
+    assert registry.async_get_entity_id("light", "hue", "9012") == "light.renamed"
+    assert entity_registry.async_entries_for_device(registry, "device-1") == [entry]
+    assert entity_registry.async_entries_for_config_entry(registry, "mock-id-1") == [
+        entry
+    ]
+
+    registry.async_remove("light.renamed")
+
+    assert registry.async_get_entity_id("light", "hue", "9012") is None
+    assert entity_registry.async_entries_for_device(registry, "device-1") == []
+    assert entity_registry.async_entries_for_config_entry(registry, "mock-id-1") == []
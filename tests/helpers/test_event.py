@@ -10,8 +10,9 @@ import pytest
 from homeassistant.core import callback
 from homeassistant.setup import async_setup_component
 import homeassistant.core as ha
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import EVENT_STATE_CHANGED, MATCH_ALL
 from homeassistant.helpers.event import (
+    TrackRenderInfo,
     async_call_later,
     async_track_point_in_time,
     async_track_point_in_utc_time,
@@ -233,6 +234,123 @@ async def test_track_template(hass):
     assert len(wildercard_runs) == 2
 
 
+async def test_track_render_info(hass):
+    """Test following the states accessed by the last render."""
+    template = Template(
+        "{% if states.input_boolean.switch.state == 'on' %}"
+        "{{ states.sensor.one.state }}{% else %}{{ states.sensor.two.state }}"
+        "{% endif %}",
+        hass,
+    )
+    hass.states.async_set("input_boolean.switch", "off")
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("sensor.two", "2")
+    results = []
+
+    @ha.callback
+    def render(event=None):
+        info = template.async_render_to_info()
+        tracker.async_set_render_infos([info])
+        results.append(info.result)
+
+    tracker = TrackRenderInfo(hass, render)
+    render()
+
+    hass.states.async_set("sensor.one", "11")
+    await hass.async_block_till_done()
+    assert results == ["2"]
+
+    hass.states.async_set("sensor.two", "22")
+    await hass.async_block_till_done()
+    assert results == ["2", "22"]
+
+    hass.states.async_set("input_boolean.switch", "on")
+    await hass.async_block_till_done()
+    assert results == ["2", "22", "11"]
+
+    hass.states.async_set("sensor.two", "2")
+    await hass.async_block_till_done()
+    assert results == ["2", "22", "11"]
+
+    hass.states.async_set("sensor.one", "1")
+    await hass.async_block_till_done()
+    assert results == ["2", "22", "11", "1"]
+
+    tracker.async_remove()
+    hass.states.async_set("sensor.one", "111")
+    await hass.async_block_till_done()
+    assert results == ["2", "22", "11", "1"]
+
+
+async def test_track_render_info_rate_limit(hass):
+    """Test that changes to iterated domains are rate limited."""
+    template = Template("{{ states.sensor | count }}", hass)
+    hass.states.async_set("sensor.one", "1")
+    results = []
+
+    events = []
+
+    @ha.callback
+    def render(event=None):
+        info = template.async_render_to_info()
+        tracker.async_set_render_infos([info])
+        results.append(info.result)
+        events.append(event and event.data["entity_id"])
+
+    tracker = TrackRenderInfo(hass, render)
+    render()
+
+    # Only entities being added or removed affect the count
+    hass.states.async_set("sensor.one", "11")
+    hass.states.async_set("light.one", "on")
+    await hass.async_block_till_done()
+    assert results == ["1"]
+
+    hass.states.async_set("sensor.two", "2")
+    await hass.async_block_till_done()
+    assert results == ["1", "2"]
+
+    hass.states.async_set("sensor.three", "3")
+    hass.states.async_remove("sensor.one")
+    await hass.async_block_till_done()
+    assert results == ["1", "2"]
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert results == ["1", "2", "2"]
+    # The delayed run gets the latest of the changes
+    assert events == [None, "sensor.two", "sensor.one"]
+
+    tracker.async_remove()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=4))
+    hass.states.async_set("sensor.four", "4")
+    await hass.async_block_till_done()
+    assert results == ["1", "2", "2"]
+
+
+async def test_track_render_info_no_states(hass):
+    """Test that renders accessing no states do not listen to state changes."""
+    results = []
+
+    @ha.callback
+    def render(event=None):
+        infos = [
+            Template("static", hass).async_render_to_info(),
+            Template("{{ 1 + 1 }}", hass).async_render_to_info(),
+        ]
+        tracker.async_set_render_infos(infos)
+        results.append(event)
+
+    listeners = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    tracker = TrackRenderInfo(hass, render, rate_limit=timedelta(0))
+    render()
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners
+
+    hass.states.async_set("sensor.one", "1")
+    await hass.async_block_till_done()
+    assert results == [None]
+
+
 async def test_track_same_state_simple_trigger(hass):
     """Test track_same_change with trigger simple."""
     thread_runs = []
@@ -796,6 +914,88 @@ async def test_periodic_task_leaving_dst(hass):
     unsub()
 
 
+async def test_periodic_task_minutes_across_dst(hass):
+    """Test a periodic task with a pattern matching inside the dst shifts."""
+    tz = dt_util.get_time_zone("Europe/Vienna")
+    dt_util.set_default_time_zone(tz)
+    specific_runs = []
+
+    unsub = async_track_time_change(
+        hass, lambda x: specific_runs.append(x), minute="/30", second=0
+    )
+
+    # Entering DST, 2:00 and 2:30 do not exist
+    for hour, minute in ((1, 30), (1, 59), (3, 0), (3, 15)):
+        _send_time_changed(hass, tz.localize(datetime(2018, 3, 25, hour, minute)))
+        await hass.async_block_till_done()
+    assert [run.strftime("%H:%M%z") for run in specific_runs] == [
+        "01:30+0100",
+        "03:00+0200",
+    ]
+
+    # Leaving DST, 2:00 and 2:30 happen twice
+    specific_runs.clear()
+    for minute, is_dst in ((0, True), (30, True), (0, False), (30, False)):
+        _send_time_changed(
+            hass, tz.localize(datetime(2018, 10, 28, 2, minute), is_dst=is_dst)
+        )
+        await hass.async_block_till_done()
+    assert [run.strftime("%H:%M%z") for run in specific_runs] == [
+        "02:00+0200",
+        "02:30+0200",
+        "02:00+0100",
+        "02:30+0100",
+    ]
+
+    unsub()
+
+
+async def test_periodic_tasks_share_schedule(hass):
+    """Test that idle seconds do not calculate the next times of patterns."""
+    specific_runs = []
+
+    unsubs = [
+        async_track_utc_time_change(
+            hass,
+            lambda x, index=index: specific_runs.append(index),
+            minute=index,
+            second=0,
+        )
+        for index in range(10)
+    ]
+    assert hass.bus.async_listeners()[ha.EVENT_TIME_CHANGED] == 1
+
+    _send_time_changed(hass, datetime(2014, 5, 24, 12, 0, 0, tzinfo=dt_util.UTC))
+    await hass.async_block_till_done()
+    assert specific_runs == [0]
+
+    with patch(
+        "homeassistant.helpers.event.dt_util.find_next_time_expression_time",
+        wraps=dt_util.find_next_time_expression_time,
+    ) as mock_find:
+        for second in range(1, 60):
+            _send_time_changed(
+                hass, datetime(2014, 5, 24, 12, 0, second, tzinfo=dt_util.UTC)
+            )
+        await hass.async_block_till_done()
+        assert len(mock_find.mock_calls) == 0
+
+        _send_time_changed(hass, datetime(2014, 5, 24, 12, 1, 0, tzinfo=dt_util.UTC))
+        await hass.async_block_till_done()
+        assert len(mock_find.mock_calls) == 1
+    assert specific_runs == [0, 1]
+
+    unsubs[2]()
+    _send_time_changed(hass, datetime(2014, 5, 24, 12, 3, 0, tzinfo=dt_util.UTC))
+    await hass.async_block_till_done()
+    assert specific_runs == [0, 1, 3]
+
+    for unsub in unsubs:
+        if unsub is not unsubs[2]:
+            unsub()
+    assert ha.EVENT_TIME_CHANGED not in hass.bus.async_listeners()
+
+
 async def test_call_later(hass):
     """Test calling an action later."""
 
@@ -0,0 +1,95 @@
+"""Test the event fanout helper."""
+import json
+from unittest.mock import patch
+
+from homeassistant.const import EVENT_TIME_CHANGED
+from homeassistant.helpers.event_fanout import (
+    POLICY_DISCONNECT,
+    EventBuffer,
+    async_get_fanout,
+)
+
+
+async def test_single_encode_per_event(hass):
+    """Test an event is encoded once for all subscriptions."""
+    fanout = async_get_fanout(hass)
+    received = []
+    init_count = sum(hass.bus.async_listeners().values())
+
+    unsubs = [
+        fanout.async_subscribe(lambda event, encoded: received.append(encoded)),
+        fanout.async_subscribe(lambda event, encoded: received.append(encoded)),
+        fanout.async_subscribe(
+            lambda event, encoded: received.append(encoded), "test_event"
+        ),
+    ]
+    assert sum(hass.bus.async_listeners().values()) == init_count + 2
+
+    with patch(
+        "homeassistant.helpers.event_fanout.json.dumps", wraps=json.dumps
+    ) as mock_dumps:
+        hass.bus.async_fire("test_event", {"hello": "world"})
+        hass.bus.async_fire(EVENT_TIME_CHANGED)
+        await hass.async_block_till_done()
+
+    assert mock_dumps.call_count == 1
+    assert len(received) == 3
+    assert json.loads(received[0])["data"] == {"hello": "world"}
+    assert fanout.async_stats()["encodes"] == 1
+
+    for unsub in unsubs:
+        unsub()
+    assert sum(hass.bus.async_listeners().values()) == init_count
+
+
+async def test_filters(hass):
+    """Test server side event type and entity filters."""
+    fanout = async_get_fanout(hass)
+    received = []
+
+    fanout.async_subscribe(
+        lambda event, encoded: received.append(event),
+        event_types=["state_changed"],
+        entity_ids=["light.kitchen"],
+    )
+
+    hass.bus.async_fire("other_event", {"entity_id": "light.kitchen"})
+    hass.states.async_set("light.hall", "on")
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+
+    assert len(received) == 1
+    assert received[0].data["entity_id"] == "light.kitchen"
+
+
+async def test_buffer_drops_oldest(hass):
+    """Test a full buffer drops the oldest events."""
+    buffer = EventBuffer(size=2)
+    for idx in range(3):
+        buffer.async_put(None, str(idx))
+
+    assert buffer.dropped == 1
+    assert buffer.max_lag == 2
+    assert buffer.lagging
+    assert await buffer.async_get() == "1"
+    assert await buffer.async_get() == "2"
+
+    buffer.async_close()
+    assert await buffer.async_get() is None
+    assert buffer.stats == {
+        "policy": "drop_oldest",
+        "delivered": 2,
+        "dropped": 1,
+        "lag": 0,
+        "max_lag": 2,
+    }
+
+
+async def test_buffer_disconnects(hass):
+    """Test a full buffer disconnects the client with the disconnect policy."""
+    buffer = EventBuffer(size=2, policy=POLICY_DISCONNECT)
+    for idx in range(3):
+        buffer.async_put(None, str(idx))
+
+    assert buffer.closed
+    assert await buffer.async_get() is None
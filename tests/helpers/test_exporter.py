@@ -0,0 +1,168 @@
+"""Test the batching exporter helper."""
+from unittest.mock import Mock, patch
+
+import pytest
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event
+from homeassistant.helpers import exporter
+
+from tests.common import get_test_home_assistant
+
+
+class MockTransport(exporter.Transport):
+    """Transport recording the batches it receives."""
+
+    def __init__(self, failures=0, error=exporter.ExportError):
+        """Initialize the transport."""
+        self.batches = []
+        self.failures = failures
+        self.error = error
+        self.closed = False
+
+    def send(self, batch):
+        """Record a batch or fail."""
+        if self.failures:
+            self.failures -= 1
+            raise self.error("mock failure")
+        self.batches.append(list(batch))
+
+    def close(self):
+        """Record the close."""
+        self.closed = True
+
+
+def _encoder(event):
+    """Encode an event as its value, skipping None."""
+    value = event.data.get("value")
+    return None if value is None else [value]
+
+
+def _exporter(transport, **kwargs):
+    """Return an exporter listening on a mock instance."""
+    return exporter.BatchingExporter(
+        Mock(), "Test", _encoder, transport, batch_timeout=0, **kwargs
+    )
+
+
+def _event(value):
+    """Return an event with a value."""
+    return Event(EVENT_STATE_CHANGED, {"value": value})
+
+
+def test_batch_size():
+    """Test batches are limited in size and skipped events are dropped."""
+    exp = _exporter(MockTransport(), batch_size=2)
+    for value in (1, None, 2, 3):
+        exp.event_listener(_event(value))
+
+    assert exp.get_batch() == (3, [1, 2])
+    assert exp.get_batch() == (1, [3])
+    assert exp.stats["max_lag"] >= 0
+
+
+def test_drop_oldest():
+    """Test the oldest event is dropped when the queue is full."""
+    exp = _exporter(MockTransport(), queue_size=2)
+    for value in (1, 2, 3):
+        exp.event_listener(_event(value))
+
+    assert exp.dropped == 1
+    assert exp.get_batch() == (2, [2, 3])
+
+
+def test_drop_newest():
+    """Test new events are dropped when the queue is full."""
+    exp = _exporter(MockTransport(), queue_size=2, drop_policy=exporter.DROP_NEWEST)
+    for value in (1, 2, 3):
+        exp.event_listener(_event(value))
+
+    assert exp.dropped == 1
+    assert exp.get_batch() == (2, [1, 2])
+
+
+def test_retry_with_backoff():
+    """Test failed batches are retried with increasing delays."""
+    transport = MockTransport(failures=2)
+    exp = _exporter(transport, max_tries=3)
+
+    with patch.object(exp._stopping, "wait") as mock_wait:
+        exp.send([1, 2])
+
+    assert [call[0][0] for call in mock_wait.call_args_list] == [1, 2]
+    assert transport.batches == [[1, 2]]
+    assert exp.stats["sent"] == 2
+    assert exp.stats["retries"] == 2
+    assert exp.stats["failed"] == 0
+
+
+def test_give_up_after_max_tries(caplog):
+    """Test a batch is dropped after the last try."""
+    transport = MockTransport(failures=5)
+    exp = _exporter(transport, max_tries=2)
+
+    with patch.object(exp._stopping, "wait"):
+        exp.send([1, 2])
+        assert exp.failed == 2
+        assert "Write error: mock failure" in caplog.text
+
+        transport.failures = 0
+        exp.send([3])
+
+    assert transport.batches == [[3]]
+    assert "Resumed, lost 2 items" in caplog.text
+
+
+def test_unexpected_error_not_retried():
+    """Test unexpected transport errors drop the batch right away."""
+    transport = MockTransport(failures=1, error=ValueError)
+    exp = _exporter(transport)
+
+    with patch.object(exp._stopping, "wait") as mock_wait:
+        exp.send([1])
+
+    assert not mock_wait.called
+    assert exp.failed == 1
+
+
+def test_thread_flushes_on_stop():
+    """Test the thread exports queued events and closes on stop."""
+    hass = get_test_home_assistant()
+    transport = MockTransport()
+    exp = exporter.BatchingExporter(hass, "Test", _encoder, transport)
+    exp.start()
+
+    hass.bus.fire(EVENT_STATE_CHANGED, {"value": 1})
+    hass.bus.fire(EVENT_STATE_CHANGED, {"value": 2})
+    hass.block_till_done()
+    hass.stop()
+
+    assert not exp.is_alive()
+    # The listener runs in the event loop, so events keep their order
+    assert transport.batches == [[1, 2]]
+    assert transport.closed
+
+
+@pytest.mark.parametrize("policy", [exporter.DROP_OLDEST, exporter.DROP_NEWEST])
+def test_stop_with_full_queue(policy):
+    """Test stopping always makes room for the stop marker."""
+    exp = _exporter(MockTransport(), queue_size=1, drop_policy=policy)
+    exp.event_listener(_event(1))
+    exp.stop()
+
+    assert exp.get_batch() == (1, [])
+    assert exp.shutdown
+
+
+def test_log_stats(caplog):
+    """Test counters are logged as a warning only after new losses."""
+    exp = _exporter(MockTransport(), queue_size=1)
+    exp.event_listener(_event(1))
+    exp.event_listener(_event(2))
+
+    exp.log_stats()
+    assert caplog.records[-1].levelname == "WARNING"
+    assert "Test: 1 queued, 0 sent, 1 dropped, 0 failed" in caplog.text
+
+    exp.log_stats()
+    assert caplog.records[-1].levelname == "DEBUG"
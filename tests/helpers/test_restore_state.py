@@ -1,11 +1,12 @@
 """The tests for the Restore component."""
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from asynctest import patch
 
 from homeassistant.const import EVENT_HOMEASSISTANT_START
 from homeassistant.core import CoreState, State
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import restore_state
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.restore_state import (
     RestoreStateData,
@@ -13,6 +14,7 @@ from homeassistant.helpers.restore_state import (
     StoredState,
     DATA_RESTORE_STATE_TASK,
     STORAGE_KEY,
+    STORAGE_KEY_DELTA,
 )
 from homeassistant.util import dt as dt_util
 
@@ -44,6 +46,7 @@ async def test_caching_data(hass):
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
         state = await entity.async_get_last_state()
+        await hass.async_block_till_done()
 
     assert state is not None
     assert state.entity_id == "input_boolean.b1"
@@ -264,3 +267,100 @@ async def test_restoring_invalid_entity_id(hass, hass_storage):
 
     state = await entity.async_get_last_state()
     assert state is None
+
+
+async def test_dump_only_changed_states(hass, hass_storage):
+    """Test that dumps after the snapshot only write changed states."""
+    for entity_id in ("input_boolean.b0", "input_boolean.b1"):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = entity_id
+        await entity.async_internal_added_to_hass()
+        hass.states.async_set(entity_id, "on")
+
+    data = await RestoreStateData.async_get_instance(hass)
+    await hass.async_block_till_done()
+    await data.async_dump_states(full=True)
+
+    snapshot = hass_storage[STORAGE_KEY]["data"]
+    assert len(snapshot) == 2
+
+    hass.states.async_set("input_boolean.b1", "off")
+
+    with patch(
+        "homeassistant.helpers.restore_state._serialize_states",
+        wraps=restore_state._serialize_states,
+    ) as mock_serialize:
+        await data.async_dump_states()
+
+    # Only the changed state is serialized again
+    assert [state.entity_id for state in mock_serialize.mock_calls[0][1][0]] == [
+        "input_boolean.b1"
+    ]
+
+    # The snapshot is untouched and the change is written as a delta
+    assert hass_storage[STORAGE_KEY]["data"] == snapshot
+    delta = hass_storage[STORAGE_KEY_DELTA]["data"]
+    assert delta["removed"] == []
+    assert len(delta["changed"]) == 1
+    assert delta["changed"][0]["state"]["entity_id"] == "input_boolean.b1"
+    assert delta["changed"][0]["state"]["state"] == "off"
+
+    # Nothing changed, nothing to serialize
+    with patch(
+        "homeassistant.helpers.restore_state._serialize_states"
+    ) as mock_serialize:
+        await data.async_dump_states()
+    assert not mock_serialize.called
+
+
+async def test_load_snapshot_with_delta(hass, hass_storage):
+    """Test restoring a snapshot with the changes saved after it."""
+    snapshot_time = dt_util.utcnow() - timedelta(hours=1)
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": [
+            StoredState(State("input_boolean.b0", "on"), snapshot_time).as_dict(),
+            StoredState(State("input_boolean.b1", "on"), snapshot_time).as_dict(),
+        ],
+    }
+    hass_storage[STORAGE_KEY_DELTA] = {
+        "version": 1,
+        "key": STORAGE_KEY_DELTA,
+        "data": {
+            "last_seen": dt_util.utcnow().isoformat(),
+            "changed": [
+                StoredState(
+                    State("input_boolean.b1", "off"), dt_util.utcnow()
+                ).as_dict()
+            ],
+            "removed": ["input_boolean.b0"],
+        },
+    }
+
+    data = await RestoreStateData.async_get_instance(hass)
+    assert list(data.last_states) == ["input_boolean.b1"]
+    assert data.last_states["input_boolean.b1"].state.state == "off"
+
+
+async def test_load_ignores_outdated_delta(hass, hass_storage):
+    """Test a delta saved before the snapshot is not applied."""
+    now = dt_util.utcnow()
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": [StoredState(State("input_boolean.b0", "on"), now).as_dict()],
+    }
+    hass_storage[STORAGE_KEY_DELTA] = {
+        "version": 1,
+        "key": STORAGE_KEY_DELTA,
+        "data": {
+            "last_seen": (now - timedelta(hours=1)).isoformat(),
+            "changed": [],
+            "removed": ["input_boolean.b0"],
+        },
+    }
+
+    data = await RestoreStateData.async_get_instance(hass)
+    assert data.last_states["input_boolean.b0"].state.state == "on"
@@ -235,6 +235,51 @@ async def test_delay(hass):
     assert events[1].context is context
 
 
+async def test_step_metrics(hass):
+    """Test that runs and steps are counted and timed."""
+    event = "test_event"
+    script_obj = script.Script(
+        hass,
+        cv.SCRIPT_SCHEMA(
+            [
+                {"event": event},
+                {"delay": {"seconds": 5}, "alias": "wait a bit"},
+                {"condition": "template", "value_template": "{{ false }}"},
+                {"service": "test.missing"},
+            ]
+        ),
+    )
+
+    await script_obj.async_run()
+    await hass.async_block_till_done()
+    assert script_obj.async_metrics()["runs"]["count"] == 0
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+    await hass.async_block_till_done()
+
+    metrics = script_obj.async_metrics()
+    assert metrics["runs"]["count"] == 1
+    assert metrics["runs"]["errors"] == 0
+    assert [step["type"] for step in metrics["steps"]] == [
+        "event",
+        "delay",
+        "condition",
+        "call_service",
+    ]
+    assert metrics["steps"][1]["alias"] == "wait a bit"
+    assert [step["count"] for step in metrics["steps"]] == [1, 1, 1, 0]
+    assert metrics["steps"][1]["total"] > 0
+
+    script_obj = script.Script(hass, cv.SCRIPT_SCHEMA([{"service": "test.missing"}]))
+    with pytest.raises(exceptions.ServiceNotFound):
+        await script_obj.async_run()
+
+    metrics = script_obj.async_metrics()
+    assert metrics["runs"]["count"] == 1
+    assert metrics["runs"]["errors"] == 1
+    assert metrics["steps"][0]["errors"] == 1
+
+
 async def test_delay_template(hass):
     """Test the delay as a template."""
     event = "test_event"
@@ -243,6 +243,14 @@ def test_find_next_time_expression_time_dst():
         tz.localize(datetime(2018, 3, 26, 1, 50, 0)), 2, 30, 0
     )
 
+    assert tz.localize(datetime(2018, 3, 26, 2, 0, 0)) == find(
+        tz.localize(datetime(2018, 3, 25, 1, 50, 0)), 2, "*", "*"
+    )
+
+    assert tz.localize(datetime(2018, 3, 25, 3, 0, 0)) == find(
+        tz.localize(datetime(2018, 3, 25, 1, 50, 1)), "*", "/10", 0
+    )
+
     # Leaving DST, clocks are rolled back
     assert tz.localize(datetime(2018, 10, 28, 2, 30, 0), is_dst=False) == find(
         tz.localize(datetime(2018, 10, 28, 2, 5, 0), is_dst=False), 2, 30, 0
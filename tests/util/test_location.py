@@ -132,3 +132,18 @@ async def test_ip_api_query_raises(raising_session):
     """Test ip api query when the request to API fails."""
     info = await location_util._get_ip_api(raising_session)
     assert info is None
+
+
+def test_haversine_bounds_distance():
+    """Test the great circle distance stays within its bound of the exact one."""
+    points = [
+        (COORDINATES_PARIS, COORDINATES_NEW_YORK),
+        ((0.0, 0.0), (0.0, 0.001)),
+        ((89.5, 10.0), (88.0, -170.0)),
+        ((-33.9, 151.2), (-33.91, 151.21)),
+        ((52.37, 4.89), (52.37, 4.89)),
+    ]
+    for point1, point2 in points:
+        exact = location_util.distance(*point1, *point2)
+        approx = location_util.haversine(*point1, *point2)
+        assert abs(exact - approx) <= exact * location_util.HAVERSINE_ERROR + 1
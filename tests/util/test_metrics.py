@@ -0,0 +1,56 @@
+"""Test Home Assistant execution metrics utility functions."""
+from homeassistant.util.metrics import RollingHistogram, Timing
+
+
+def test_rolling_histogram_buckets():
+    """Test counting durations in buckets."""
+    histogram = RollingHistogram(bounds=(0.1, 1.0), window=60, slots=6)
+
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.add(value, now=0)
+
+    assert histogram.counts(now=0) == [2, 1, 1]
+    result = histogram.as_dict(now=0)
+    assert result["count"] == 4
+    assert result["sum"] == 2.65
+    assert result["p50"] == 0.1
+    assert result["p90"] is None
+
+
+def test_rolling_histogram_window():
+    """Test that durations leave the histogram with the window."""
+    histogram = RollingHistogram(bounds=(1.0,), window=60, slots=6)
+
+    histogram.add(0.5, now=5)
+    histogram.add(0.5, now=35)
+    assert histogram.counts(now=59) == [2, 0]
+    assert histogram.counts(now=60) == [1, 0]
+    assert histogram.counts(now=95) == [0, 0]
+
+    histogram.add(2, now=1000)
+    assert histogram.counts(now=1000) == [0, 1]
+    assert histogram.as_dict(now=1000)["sum"] == 2
+
+
+def test_rolling_histogram_empty():
+    """Test an empty histogram."""
+    result = RollingHistogram().as_dict()
+    assert result["count"] == 0
+    assert result["p50"] is None
+
+
+def test_timing():
+    """Test counting executions and their duration."""
+    timing = Timing()
+    assert timing.as_dict()["mean"] is None
+
+    timing.add(0.2)
+    timing.add(0.4, True)
+
+    result = timing.as_dict()
+    assert result["count"] == 2
+    assert result["errors"] == 1
+    assert result["total"] == 0.6
+    assert result["mean"] == 0.3
+    assert result["max"] == 0.4
+    assert result["recent"]["count"] == 2
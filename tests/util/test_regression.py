@@ -0,0 +1,61 @@
+"""Test the rolling regression."""
+import random
+
+import pytest
+
+from homeassistant.util.regression import RollingRegression
+
+START = 1570000000.0
+
+
+def _samples(count):
+    """Return noisy samples of a line taken at random intervals."""
+    rand = random.Random(3)
+    time = START
+    samples = []
+    for _ in range(count):
+        time += rand.uniform(1, 30)
+        samples.append((time, 0.05 * (time - START) + rand.gauss(20, 1)))
+    return samples
+
+
+def _fit_slope(samples):
+    """Return the slope of a least squares line through the samples."""
+    mean_t = sum(time for time, _ in samples) / len(samples)
+    mean_y = sum(value for _, value in samples) / len(samples)
+    return sum((time - mean_t) * (value - mean_y) for time, value in samples) / sum(
+        (time - mean_t) ** 2 for time, _ in samples
+    )
+
+
+def test_slope_matches_fit():
+    """Test the slope stays equal to a fit of the window as it slides."""
+    regression = RollingRegression(20)
+    window = []
+
+    for sample in _samples(100):
+        regression.append(sample)
+        window = (window + [sample])[-20:]
+        if len(window) < 2:
+            assert regression.slope is None
+            continue
+        assert regression.slope == pytest.approx(_fit_slope(window))
+
+    assert len(regression) == 20
+    assert regression[0] == pytest.approx(window[0])
+    assert regression[-1] == pytest.approx(window[-1])
+
+
+def test_purge():
+    """Test removing samples by time."""
+    regression = RollingRegression(10)
+    for time in range(8):
+        regression.append((START + time, 2 * time))
+
+    regression.purge(START + 5)
+    assert len(regression) == 3
+    assert regression.slope == pytest.approx(2)
+
+    regression.purge(START + 100)
+    assert not regression
+    assert regression.slope is None